@@ -0,0 +1,82 @@
+"""
+Benchmark handing off telegrams to the connection thread of KNXIPInterfaceThreaded.
+
+Compares sends per second of the current implementation with the previous one
+that waited for a threading.Event in an executor thread for every telegram.
+The KNX/IP connection is replaced by a stub so only the thread bridge is measured.
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+from xknx import XKNX
+from xknx.io import ConnectionConfig
+from xknx.io.knxip_interface import KNXIPInterfaceThreaded
+
+SENDS = 5000
+BURST = 50
+
+
+class StubInterface:
+    """Stub for the KNX/IP connection running in the connection thread."""
+
+    async def send_telegram(self, telegram):
+        """Pretend to send a telegram."""
+
+    async def disconnect(self):
+        """Pretend to disconnect."""
+
+
+class LegacyKNXIPInterfaceThreaded(KNXIPInterfaceThreaded):
+    """KNXIPInterfaceThreaded with the previous thread bridge."""
+
+    async def _await_from_connection_thread(self, coro):
+        """Await coroutine in different thread."""
+        fut = asyncio.run_coroutine_threadsafe(coro, self._thread_loop)
+        finished = threading.Event()
+
+        def fut_finished_cb(_: concurrent.futures.Future) -> None:
+            """Fire threading.Event when the future is finished."""
+            finished.set()
+
+        fut.add_done_callback(fut_finished_cb)
+        # wait on that event in an executor, yielding control to _main_loop
+        await self._main_loop.run_in_executor(None, finished.wait)
+        return fut.result()
+
+    async def send_telegram(self, telegram):
+        """Send telegram to connected device."""
+        return await self._await_from_connection_thread(
+            self._interface.send_telegram(telegram)
+        )
+
+
+async def measure(interface_class, concurrent_sends: int) -> float:
+    """Return sends per second."""
+    interface = interface_class(XKNX(), ConnectionConfig(threaded=True))
+    # replace the KNX/IP connection to only measure the thread bridge
+    interface._interface = StubInterface()  # pylint: disable=protected-access
+    start = time.perf_counter()
+    for _ in range(SENDS // concurrent_sends):
+        await asyncio.gather(
+            *(interface.send_telegram(None) for _ in range(concurrent_sends))
+        )
+    duration = time.perf_counter() - start
+    await interface.stop()
+    return SENDS / duration
+
+
+async def main():
+    """Run the benchmark."""
+    for concurrent_sends in (1, BURST):
+        legacy = await measure(LegacyKNXIPInterfaceThreaded, concurrent_sends)
+        current = await measure(KNXIPInterfaceThreaded, concurrent_sends)
+        print(
+            f"{concurrent_sends:>3} concurrent sends: "
+            f"legacy {legacy:>9.0f} sends/s, "
+            f"current {current:>9.0f} sends/s ({current / legacy:.1f}x)"
+        )
+
+
+asyncio.run(main())
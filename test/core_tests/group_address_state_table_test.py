@@ -0,0 +1,145 @@
+"""Unit test for GroupAddressStateTable."""
+from multiprocessing import shared_memory
+import os
+import struct
+
+import pytest
+
+from xknx import XKNX
+from xknx.core import GroupAddressStateTable
+from xknx.core.group_address_state_table import (
+    RECORD_FORMAT,
+    RECORD_SIZE,
+    TABLE_SIZE,
+    GroupAddressState,
+)
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
+
+
+class TestGroupAddressStateTable:
+    """Test class for GroupAddressStateTable."""
+
+    def test_update_get(self):
+        """Test storing and looking up states."""
+        table = GroupAddressStateTable()
+        assert len(table.buffer) == TABLE_SIZE == RECORD_SIZE * 65536
+        assert table.get(GroupAddress("1/2/3")) is None
+
+        table.update(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueWrite(DPTBinary(1)),
+                source_address=IndividualAddress("1.1.5"),
+            )
+        )
+        table.update(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueResponse(DPTBinary(0)),
+                source_address=IndividualAddress("1.1.6"),
+            )
+        )
+        table.update(
+            Telegram(
+                destination_address=GroupAddress("31/7/255"),
+                payload=GroupValueWrite(DPTArray((0x0C, 0x1A))),
+            )
+        )
+        # ignored
+        table.update(
+            Telegram(
+                destination_address=GroupAddress("1/2/4"), payload=GroupValueRead()
+            )
+        )
+        table.update(
+            Telegram(
+                destination_address=GroupAddress("1/2/5"),
+                payload=GroupValueWrite(DPTArray(tuple(range(17)))),
+            )
+        )
+        assert table.oversized == 1
+        assert len(table) == 2
+
+        state = table.get(GroupAddress("1/2/3"))
+        assert state.payload == DPTBinary(0)
+        assert state.source_address == IndividualAddress("1.1.6")
+        assert state.updates == 2
+        assert table.get(GroupAddress("31/7/255")).payload == DPTArray((0x0C, 0x1A))
+        assert [
+            (group_address, state.payload) for group_address, state in table.items()
+        ] == [
+            (GroupAddress("1/2/3"), DPTBinary(0)),
+            (GroupAddress("31/7/255"), DPTArray((0x0C, 0x1A))),
+        ]
+
+        # records can be read from the buffer directly
+        offset = GroupAddress("31/7/255").raw * RECORD_SIZE
+        record = struct.unpack_from(RECORD_FORMAT, table.buffer, offset)
+        assert record[1:5] == (1, 0, 2, 2)
+        assert record[5][:2] == b"\x0c\x1a"
+
+        table.clear()
+        assert len(table) == 0
+        assert table.get(GroupAddress("1/2/3")) is None
+
+    async def test_telegram_queue(self):
+        """Test the table is updated by processed telegrams."""
+        xknx = XKNX()
+        table = xknx.telegram_queue.state_table = GroupAddressStateTable()
+        await xknx.telegram_queue.process_telegram_incoming(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueWrite(DPTBinary(1)),
+                source_address=IndividualAddress("1.1.5"),
+            )
+        )
+        assert table.get(GroupAddress("1/2/3")) == GroupAddressState(
+            payload=DPTBinary(1),
+            timestamp=table.get(GroupAddress("1/2/3")).timestamp,
+            source_address=IndividualAddress("1.1.5"),
+            updates=1,
+        )
+
+    def test_shared_memory(self):
+        """Test placing the table in shared memory."""
+        name = f"xknx_test_{os.getpid()}"
+        table = GroupAddressStateTable(shared_memory_name=name)
+        assert table.shared_memory_name == name
+        table.update(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                payload=GroupValueWrite(DPTArray((0x01,))),
+            )
+        )
+        reader = shared_memory.SharedMemory(name=name)
+        try:
+            record = struct.unpack_from(
+                RECORD_FORMAT, reader.buf, GroupAddress("1/2/3").raw * RECORD_SIZE
+            )
+            assert record[1] == 1
+            assert record[5][0] == 0x01
+        finally:
+            reader.close()
+
+        # views of the buffer held by a consumer prevent closing
+        view = table.buffer
+        with pytest.raises(BufferError):
+            table.close()
+        assert table.shared_memory_name == name
+        table.update(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                payload=GroupValueWrite(DPTArray((0x02,))),
+            )
+        )
+        assert table.get(GroupAddress("1/2/3")).updates == 2
+        assert view[GroupAddress("1/2/3").raw * RECORD_SIZE + 16] == 0x02
+        view.release()
+
+        table.close()
+        assert table.shared_memory_name is None
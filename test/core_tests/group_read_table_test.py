@@ -0,0 +1,66 @@
+"""Unit test for GroupReadTable."""
+import asyncio
+
+import pytest
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueRead, GroupValueResponse
+
+
+class TestGroupReadTable:
+    """Test class for GroupReadTable."""
+
+    async def test_concurrent_reads(self, time_travel):
+        """Test concurrent reads of one group address share a GroupValueRead."""
+        xknx = XKNX()
+        table = xknx.group_read_table
+        group_address = GroupAddress("1/2/3")
+        response = Telegram(
+            destination_address=group_address,
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueResponse(DPTBinary(1)),
+        )
+        reads = [asyncio.create_task(table.read(group_address)) for _ in range(3)]
+        await time_travel(0)
+        assert table.in_flight(group_address)
+        # a read without waiting for the result joins too
+        await table.send_group_read(group_address)
+
+        assert xknx.telegrams.qsize() == 1
+        assert xknx.telegrams.get_nowait() == Telegram(
+            destination_address=group_address, payload=GroupValueRead()
+        )
+        assert xknx.request_correlator.pending == 1
+        # cancelling one reader doesn't affect the others
+        reads[0].cancel()
+        await xknx.telegram_queue.process_telegram_incoming(response)
+
+        assert await reads[1] == response
+        assert await reads[2] == response
+        with pytest.raises(asyncio.CancelledError):
+            await reads[0]
+        assert not table.in_flight(group_address)
+        assert not xknx.request_correlator.pending
+        assert table.reads_sent == 1
+        assert table.reads_saved == 3
+
+        # next read sends a new GroupValueRead
+        await table.send_group_read(group_address)
+        assert xknx.telegrams.qsize() == 1
+        assert table.reads_sent == 2
+
+    async def test_read_timeout(self, time_travel):
+        """Test all readers receive None on timeout."""
+        xknx = XKNX()
+        table = xknx.group_read_table
+        group_address = GroupAddress("1/2/3")
+        first = asyncio.create_task(table.read(group_address, timeout_in_seconds=1))
+        await time_travel(0.5)
+        second = asyncio.create_task(table.read(group_address, timeout_in_seconds=5))
+        await time_travel(0.5)
+        assert await first is None
+        assert await second is None
+        assert not table.in_flight(group_address)
+        assert xknx.telegrams.qsize() == 1
@@ -0,0 +1,190 @@
+"""Unit test for OutgoingJournal."""
+import asyncio
+import logging
+from unittest.mock import AsyncMock, Mock
+
+from xknx import XKNX
+from xknx.core import OutgoingJournal, XknxConnectionState
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, Telegram
+from xknx.telegram.address import InternalGroupAddress
+from xknx.telegram.apci import GroupValueRead, GroupValueWrite
+
+
+def _write(group_address: str, value: int) -> Telegram:
+    """Return an outgoing GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=GroupAddress(group_address),
+        payload=GroupValueWrite(DPTBinary(value)),
+    )
+
+
+class TestOutgoingJournal:
+    """Test class for OutgoingJournal."""
+
+    async def test_coalesce_and_order(self):
+        """Test writes to the same group address replace each other."""
+        journal = OutgoingJournal()
+        read = Telegram(
+            destination_address=GroupAddress("1/0/3"), payload=GroupValueRead()
+        )
+        for telegram in (
+            _write("1/0/1", 0),
+            _write("1/0/2", 1),
+            read,
+            read,
+            _write("1/0/1", 1),
+        ):
+            journal.add(telegram)
+        assert len(journal) == 4
+        assert journal.coalesced == 1
+        assert journal.flush() == [_write("1/0/2", 1), read, read, _write("1/0/1", 1)]
+        assert journal.replayed == 4
+        assert not journal.flush()
+
+        # an older telegram doesn't replace a newer one
+        journal.add(_write("1/0/1", 1))
+        journal.add(_write("1/0/1", 0), queued=-1)
+        assert journal.flush() == [_write("1/0/1", 1)]
+
+        journal.coalesce = False
+        journal.add(_write("1/0/1", 0))
+        journal.add(_write("1/0/1", 1))
+        assert len(journal) == 2
+
+    async def test_ttl(self, time_travel, caplog):
+        """Test expired telegrams are dropped."""
+        journal = OutgoingJournal(ttl=5, ttl_overrides={GroupAddress("1/0/2"): 20})
+        journal.add(_write("1/0/1", 1))
+        journal.add(_write("1/0/2", 1))
+        await time_travel(4)
+        journal.add(_write("1/0/3", 1))
+        await time_travel(2)
+        assert journal.flush() == [_write("1/0/2", 1), _write("1/0/3", 1)]
+        assert journal.expired == 1
+        assert journal.replayed == 2
+        assert caplog.record_tuples == [
+            (
+                "xknx.log",
+                logging.WARNING,
+                f"Dropping telegram recorded while the connection was lost: {_write('1/0/1', 1)}",
+            )
+        ]
+
+
+class TestTelegramQueueJournal:
+    """Test recording outgoing telegrams in TelegramQueue while disconnected."""
+
+    async def test_outage(self):
+        """Test telegrams are recorded during an outage and flushed on reconnect."""
+        xknx = XKNX()
+        xknx.rate_limit = 0
+        xknx.telegram_queue.journal = OutgoingJournal()
+        xknx.knxip_interface = AsyncMock()
+        send_telegram = xknx.knxip_interface.send_telegram
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        await xknx.telegram_queue.start()
+
+        xknx.telegrams.put_nowait(_write("1/0/1", 0))
+        await xknx.telegrams.join()
+        assert send_telegram.call_count == 1
+
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.DISCONNECTED
+        )
+        internal = Telegram(
+            destination_address=InternalGroupAddress("i-test"),
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        for telegram in (_write("1/0/1", 1), _write("1/0/2", 1), _write("1/0/1", 0)):
+            xknx.telegrams.put_nowait(telegram)
+        xknx.telegrams.put_nowait(internal)
+        await xknx.telegrams.join()
+        assert send_telegram.call_count == 1
+        assert len(xknx.telegram_queue.journal) == 2
+        assert xknx.telegram_queue.journal.coalesced == 1
+
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        await xknx.telegrams.join()
+        assert [call.args[0] for call in send_telegram.call_args_list[1:]] == [
+            _write("1/0/2", 1),
+            _write("1/0/1", 0),
+        ]
+        assert xknx.telegram_queue.journal.replayed == 2
+        await xknx.telegram_queue.stop()
+
+    async def test_outage_with_queued_telegrams(self, time_travel):
+        """Test telegrams queued or being sent when the connection is lost are recorded."""
+        xknx = XKNX()
+        xknx.rate_limit = 0
+        xknx.telegram_queue.journal = OutgoingJournal(
+            ttl=5, ttl_overrides={GroupAddress("1/0/2"): 20}
+        )
+        connected = asyncio.Event()
+        sent = []
+
+        async def send_telegram(telegram):
+            await connected.wait()
+            sent.append(telegram)
+
+        xknx.knxip_interface = Mock(send_telegram=send_telegram)
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        await xknx.telegram_queue.start()
+        for telegram in (_write("1/0/1", 1), _write("1/0/2", 1), _write("1/0/3", 1)):
+            xknx.telegrams.put_nowait(telegram)
+        await time_travel(4)
+        assert xknx.telegram_queue.outgoing_queue.qsize() == 2
+
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.DISCONNECTED
+        )
+        await time_travel(0)
+        assert len(xknx.telegram_queue.journal) == 3
+        assert xknx.telegram_queue.outgoing_queue.empty()
+        # TTL counts from the time telegrams were queued
+        await time_travel(2)
+        connected.set()
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        await xknx.telegrams.join()
+        assert sent == [_write("1/0/2", 1)]
+        assert xknx.telegram_queue.journal.expired == 2
+        await xknx.telegram_queue.stop()
+
+    async def test_no_journal_before_connected(self):
+        """Test telegrams are sent if the connection was never established."""
+        xknx = XKNX()
+        xknx.rate_limit = 0
+        xknx.telegram_queue.journal = OutgoingJournal()
+        xknx.knxip_interface = AsyncMock()
+        await xknx.telegram_queue.start()
+        xknx.telegrams.put_nowait(_write("1/0/1", 1))
+        await xknx.telegrams.join()
+        xknx.knxip_interface.send_telegram.assert_called_once()
+        assert not xknx.telegram_queue.journal
+        await xknx.telegram_queue.stop()
+
+    async def test_journal_disabled_by_default(self):
+        """Test telegrams are sent during an outage without a journal."""
+        xknx = XKNX()
+        xknx.rate_limit = 0
+        xknx.knxip_interface = AsyncMock()
+        assert xknx.telegram_queue.journal is None
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.DISCONNECTED
+        )
+        await xknx.telegram_queue.start()
+        xknx.telegrams.put_nowait(_write("1/0/1", 1))
+        await xknx.telegrams.join()
+        xknx.knxip_interface.send_telegram.assert_called_once()
+        await xknx.telegram_queue.stop()
@@ -1,6 +1,6 @@
 """Unit test for payload reader."""
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from xknx import XKNX
 from xknx.core import PayloadReader
@@ -11,18 +11,7 @@ from xknx.telegram.apci import MemoryRead, MemoryResponse
 class TestPayloadReader:
     """Test class for payload reader."""
 
-    def create_telegram_queue_mock(self, xknx: XKNX, response_telegram: Telegram):
-        """Create a TelegramQueue mock that returns a specific response telegram."""
-        xknx.telegram_queue = MagicMock()
-
-        def _register_telegram_received_cb(func):
-            asyncio.create_task(func(response_telegram))
-
-        xknx.telegram_queue.register_telegram_received_cb.side_effect = (
-            _register_telegram_received_cb
-        )
-
-    async def test_payload_reader_send_success(self):
+    async def test_payload_reader_send_success(self, time_travel):
         """Test payload reader: successful send."""
         xknx = XKNX()
 
@@ -35,17 +24,34 @@ class TestPayloadReader:
             direction=TelegramDirection.INCOMING,
             payload=response_payload,
         )
-
-        self.create_telegram_queue_mock(xknx, response_telegram)
+        other_device_telegram = Telegram(
+            source_address=IndividualAddress("1.2.4"),
+            direction=TelegramDirection.INCOMING,
+            payload=response_payload,
+        )
+        other_payload_telegram = Telegram(
+            source_address=destination_address,
+            direction=TelegramDirection.INCOMING,
+            payload=MemoryRead(0xAABB, 3),
+        )
 
         payload_reader = PayloadReader(xknx, destination_address)
-
-        payload = await payload_reader.send(
-            request_payload, response_class=MemoryResponse
+        send_task = asyncio.create_task(
+            payload_reader.send(request_payload, response_class=MemoryResponse)
         )
+        await time_travel(0)
+        assert xknx.telegrams.qsize() == 1
+        await xknx.telegram_queue.process_telegram_incoming(other_device_telegram)
+        await xknx.telegram_queue.process_telegram_incoming(other_payload_telegram)
+        await time_travel(0)
+        assert not send_task.done()
+        await xknx.telegram_queue.process_telegram_incoming(response_telegram)
 
         # Response is received.
-        assert payload == response_payload
+        assert await send_task == response_payload
+        assert payload_reader.received_payload == response_payload
+        await time_travel(0)
+        assert not xknx.request_correlator.pending
 
     @patch("logging.Logger.warning")
     async def test_payload_reader_send_timeout(self, logger_warning_mock):
@@ -0,0 +1,106 @@
+"""Unit test for RequestCorrelator."""
+import asyncio
+
+from xknx.core import RequestCorrelator
+from xknx.dpt import DPTBinary
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import (
+    APCI,
+    DeviceDescriptorResponse,
+    GroupValueResponse,
+    MemoryResponse,
+)
+
+
+class TestRequestCorrelator:
+    """Test class for RequestCorrelator."""
+
+    async def test_group_response(self):
+        """Test resolving group reads by destination address."""
+        correlator = RequestCorrelator()
+        first = correlator.expect_group_response(GroupAddress("1/2/3"), 2)
+        second = correlator.expect_group_response(GroupAddress("1/2/3"), 2)
+        other = correlator.expect_group_response(GroupAddress("1/2/4"), 2)
+        telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueResponse(DPTBinary(1)),
+        )
+        correlator.process(telegram)
+        assert first.result() == telegram
+        assert second.result() == telegram
+        assert not other.done()
+        other.cancel()
+        await asyncio.sleep(0)
+        assert correlator.pending == 0
+
+    async def test_response_by_source_and_class(self):
+        """Test resolving management requests by source address and payload class."""
+        correlator = RequestCorrelator()
+        address = IndividualAddress("1.1.1")
+        memory = correlator.expect_response(address, MemoryResponse, 2)
+        base_class = correlator.expect_response(address, APCI, 2)
+        any_payload = correlator.expect_response(IndividualAddress("1.1.2"), None, 2)
+        assert correlator.pending == 3
+
+        descriptor_response = Telegram(
+            destination_address=IndividualAddress("0.0.1"),
+            source_address=address,
+            direction=TelegramDirection.INCOMING,
+            payload=DeviceDescriptorResponse(),
+        )
+        correlator.process(descriptor_response)
+        assert not memory.done()
+        assert base_class.result() == descriptor_response
+
+        memory_response = Telegram(
+            destination_address=IndividualAddress("0.0.1"),
+            source_address=address,
+            direction=TelegramDirection.INCOMING,
+            payload=MemoryResponse(0, 1, b"\x00"),
+        )
+        # outgoing telegrams don't resolve management requests
+        memory_response.direction = TelegramDirection.OUTGOING
+        correlator.process(memory_response)
+        assert not memory.done()
+        memory_response.direction = TelegramDirection.INCOMING
+        correlator.process(memory_response)
+        assert memory.result() == memory_response
+
+        assert not any_payload.done()
+        any_telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            source_address=IndividualAddress("1.1.2"),
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueResponse(DPTBinary(0)),
+        )
+        correlator.process(any_telegram)
+        assert any_payload.result() == any_telegram
+        await asyncio.sleep(0)
+        assert correlator.pending == 0
+
+    async def test_timeouts(self, time_travel):
+        """Test timeouts are driven by a single timer."""
+        correlator = RequestCorrelator()
+        slow = correlator.expect_group_response(GroupAddress("1/2/3"), 5)
+        fast = correlator.expect_group_response(GroupAddress("1/2/4"), 1)
+        resolved = correlator.expect_response(IndividualAddress("1.1.1"), None, 2)
+        timer = correlator._timer
+        assert timer.when() == correlator._timeouts[0][0]
+
+        correlator.process(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                source_address=IndividualAddress("1.1.1"),
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueResponse(DPTBinary(0)),
+            )
+        )
+        assert resolved.done()
+        assert slow.done()
+
+        await time_travel(1)
+        assert fast.result() is None
+        assert correlator.pending == 0
+        # timeouts of resolved requests don't keep the timer running
+        assert correlator._timer is None
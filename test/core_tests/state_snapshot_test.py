@@ -0,0 +1,168 @@
+"""Unit test for StateSnapshot."""
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from xknx import XKNX
+from xknx.core import StateSnapshot, XknxConnectionState
+from xknx.core.state_snapshot import SnapshotEntry, decode_snapshot, encode_snapshot
+from xknx.devices import Sensor, Switch
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.exceptions import XKNXException
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
+
+
+class TestStateSnapshot:
+    """Test class for StateSnapshot."""
+
+    def test_encode_decode(self):
+        """Test binary representation of snapshot entries."""
+        entries = {
+            GroupAddress("1/2/3"): SnapshotEntry(1700000000.5, DPTBinary(1)),
+            GroupAddress("31/7/255"): SnapshotEntry(
+                1700000001.0, DPTArray((0x0C, 0x1A))
+            ),
+            GroupAddress("0/0/1"): SnapshotEntry(1700000002.0, DPTArray(())),
+        }
+        data = encode_snapshot(entries)
+        # header 14 bytes, entries 12 bytes + payload
+        assert len(data) == 14 + 13 + 14 + 12
+        assert decode_snapshot(data) == entries
+
+        with pytest.raises(XKNXException):
+            decode_snapshot(b"XKNX")
+        with pytest.raises(XKNXException):
+            decode_snapshot(b"NOTASNAP" + data[8:])
+        with pytest.raises(XKNXException):
+            decode_snapshot(data[:-1])
+
+    async def test_save_load(self, tmp_path):
+        """Test recording, saving and loading a snapshot."""
+        xknx = XKNX()
+        path = tmp_path / "state.bin"
+        snapshot = StateSnapshot(xknx, path)
+        snapshot.record(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueWrite(DPTBinary(1)),
+            )
+        )
+        snapshot.record(
+            Telegram(
+                destination_address=GroupAddress("1/2/4"),
+                payload=GroupValueResponse(DPTArray((0x01, 0x02))),
+            )
+        )
+        snapshot.record(
+            Telegram(
+                destination_address=GroupAddress("1/2/5"), payload=GroupValueRead()
+            )
+        )
+        assert len(snapshot) == 2
+        await snapshot.save()
+        assert snapshot.saves == 1
+        assert list(tmp_path.iterdir()) == [path]
+        # unchanged snapshots are not written
+        await snapshot.save()
+        assert snapshot.saves == 1
+
+        loaded = StateSnapshot(xknx, path)
+        await loaded.load()
+        assert loaded._entries == snapshot._entries
+
+        # invalid files are ignored
+        path.write_bytes(b"invalid")
+        await loaded.load()
+        assert len(loaded) == 2
+
+    async def test_restore(self, time_travel):
+        """Test restoring values and skipping initial reads of recent values."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        after_update = AsyncMock()
+        switch = Switch(
+            xknx,
+            "switch",
+            group_address="1/1/1",
+            group_address_state="1/1/2",
+            sync_state="expire 10",
+            device_updated_cb=after_update,
+        )
+        sensor = Sensor(
+            xknx,
+            "sensor",
+            group_address_state="1/1/3",
+            sync_state="expire 10",
+            value_type="temperature",
+            device_updated_cb=after_update,
+        )
+        snapshot = StateSnapshot(xknx, "unused")
+        now = time.time()
+        snapshot._entries = {
+            # newer value of a second group address of the same RemoteValue wins
+            GroupAddress("1/1/1"): SnapshotEntry(now - 60, DPTBinary(1)),
+            GroupAddress("1/1/2"): SnapshotEntry(now - 120, DPTBinary(0)),
+            GroupAddress("1/1/3"): SnapshotEntry(now - 20 * 60, DPTArray((0x0C, 0x1A))),
+            GroupAddress("1/1/4"): SnapshotEntry(now, DPTBinary(1)),
+        }
+        snapshot.restore()
+        assert snapshot.restored == 2
+        assert switch.state is True
+        assert sensor.resolve_state() == 21.0
+        after_update.assert_not_called()
+
+        reads = []
+        for remote_value in (switch.switch, sensor.sensor_value):
+
+            async def read_state(wait_for_result, remote_value=remote_value):
+                reads.append(remote_value)
+
+            remote_value.read_state = read_state
+
+        xknx.state_updater.start()
+        await time_travel(0)
+        # the sensor value is older than its update interval
+        assert reads == [sensor.sensor_value]
+        await time_travel(9 * 60)
+        assert reads == [sensor.sensor_value, switch.switch]
+        xknx.state_updater.stop()
+
+        # restored values are only considered for the first start
+        reads.clear()
+        xknx.state_updater.start()
+        await time_travel(1)
+        assert len(reads) == 2
+        xknx.state_updater.stop()
+
+    async def test_start_stop(self, time_travel):
+        """Test recording processed telegrams and saving periodically."""
+        xknx = XKNX()
+        snapshot = StateSnapshot(xknx, "unused", save_interval=10)
+        snapshot.load = AsyncMock()
+        snapshot.save = AsyncMock()
+        xknx.task_registry.start()
+        await snapshot.start()
+        await xknx.telegram_queue.process_telegram_incoming(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueWrite(DPTBinary(1)),
+            )
+        )
+        assert len(snapshot) == 1
+        snapshot.load.assert_awaited_once()
+        snapshot.save.assert_not_awaited()
+        await time_travel(10)
+        snapshot.save.assert_awaited_once()
+        await time_travel(10)
+        assert snapshot.save.await_count == 2
+
+        # saved on stop
+        await snapshot.stop()
+        assert snapshot.save.await_count == 3
+        assert not xknx.task_registry.tasks
+        assert not xknx.telegram_queue.telegram_received_cbs
+        xknx.task_registry.stop()
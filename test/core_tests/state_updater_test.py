@@ -1,11 +1,17 @@
 """Unit test for StateUpdater."""
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
 
 from xknx import XKNX
 from xknx.core import XknxConnectionState
-from xknx.core.state_updater import StateTrackerType, _StateTracker
+from xknx.core.state_updater import (
+    InitProgress,
+    ReadConcurrency,
+    StateTrackerType,
+    _StateTracker,
+)
 from xknx.remote_value import RemoteValue
 from xknx.telegram import GroupAddress
 
@@ -226,3 +232,279 @@ class TestStateUpdater:
             xknx.state_updater._workers[id(remote_value)].tracker_type
             == expected_tracker_type
         )
+
+    @pytest.mark.parametrize(
+        "tracker_option,expected_reads",
+        [
+            # reads at 0, 10 minutes after the postponing update at 5 and 10 later
+            ("expire 10", [0, 15, 25]),
+            # updates don't postpone periodic reads
+            ("every 10", [0, 10, 20]),
+            ("init", [0]),
+        ],
+    )
+    async def test_tracker_deadlines(self, time_travel, tracker_option, expected_reads):
+        """Test read deadlines of tracker types."""
+        xknx = XKNX()
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        remote_value = RemoteValue(
+            xknx, sync_state=tracker_option, group_address_state=GroupAddress("1/1/1")
+        )
+        reads = []
+
+        async def read_state(wait_for_result):
+            reads.append(minutes)
+            remote_value.telegram = Mock()
+
+        minutes = 0
+        with patch.object(remote_value, "read_state", side_effect=read_state):
+            xknx.state_updater.start()
+            await time_travel(0)
+            for minutes in range(1, 30):
+                await time_travel(60)
+                if minutes == 5:
+                    xknx.state_updater.update_received(remote_value)
+            xknx.state_updater.stop()
+        assert reads == expected_reads
+
+    async def test_parallel_reads(self, time_travel):
+        """Test due reads are processed by a bounded number of workers."""
+        xknx = XKNX()
+        xknx.state_updater.init_bus_load = 0
+        # fixed concurrency
+        xknx.state_updater.read_concurrency.minimum = 2
+        xknx.state_updater.read_concurrency.maximum = 2
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        remote_values = [
+            RemoteValue(
+                xknx, sync_state="init", group_address_state=GroupAddress(f"1/1/{i}")
+            )
+            for i in range(5)
+        ]
+        running = []
+        done = []
+
+        async def read_state(remote_value):
+            running.append(remote_value)
+            await asyncio.sleep(1)
+            running.remove(remote_value)
+            done.append(remote_value)
+
+        for remote_value in remote_values:
+            remote_value.read_state = Mock(
+                side_effect=lambda wait_for_result, rv=remote_value: read_state(rv)
+            )
+        tasks_before = len(asyncio.all_tasks())
+        xknx.state_updater.start()
+        await time_travel(0)
+        assert len(running) == 2
+        # one scheduler and two read workers - independent of tracked values
+        assert len(asyncio.all_tasks()) == tasks_before + 3
+        await time_travel(1)
+        assert len(running) == 2
+        assert len(done) == 2
+        await time_travel(1)
+        assert len(done) == 4
+        await time_travel(1)
+        assert not running
+        assert done == remote_values
+        # stopped trackers are not read again
+        xknx.state_updater.stop()
+        xknx.state_updater.start()
+        xknx.state_updater.unregister_remote_value(remote_values[0])
+        await time_travel(0)
+        assert len(running) == 2
+        assert remote_values[0] not in running
+        xknx.state_updater.stop()
+        await time_travel(0)
+        assert len(asyncio.all_tasks()) == tasks_before
+
+    async def test_init_campaign(self, time_travel):
+        """Test initial reads are ordered, paced and skipped when updated."""
+        xknx = XKNX()
+        # 2 reads per second
+        xknx.state_updater.init_bus_load = 10
+        xknx.state_updater.init_priority = lambda remote_value: (
+            remote_value.feature_name != "priority"
+        )
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        remote_values = [
+            RemoteValue(
+                xknx,
+                sync_state="expire 10",
+                group_address_state=GroupAddress(f"1/1/{i}"),
+                feature_name="priority" if i == 3 else None,
+            )
+            for i in range(5)
+        ]
+        reads = []
+        for remote_value in remote_values:
+
+            async def read_state(wait_for_result, remote_value=remote_value):
+                reads.append(remote_value)
+                remote_value.telegram = Mock()
+
+            remote_value.read_state = read_state
+
+        xknx.state_updater.start()
+        await time_travel(0)
+        assert reads == [remote_values[3]]
+        assert xknx.state_updater.init_progress == InitProgress(
+            total=5, read=1, skipped=0, eta=2
+        )
+        assert xknx.state_updater.init_progress.remaining == 4
+        # passively updated during the campaign
+        xknx.state_updater.update_received(remote_values[1])
+        await time_travel(0.5)
+        assert reads == [remote_values[3], remote_values[0]]
+        await time_travel(0.5)
+        assert reads == [remote_values[3], remote_values[0], remote_values[2]]
+        await time_travel(0.5)
+        assert reads == [
+            remote_values[3],
+            remote_values[0],
+            remote_values[2],
+            remote_values[4],
+        ]
+        assert xknx.state_updater.init_progress == InitProgress(
+            total=5, read=4, skipped=1, eta=0
+        )
+        # skipped value is tracked from the time it was updated
+        await time_travel(10 * 60 - 1.5)
+        assert len(reads) == 6
+        assert remote_values[1] in reads[4:]
+        assert remote_values[3] in reads[4:]
+        xknx.state_updater.stop()
+
+    async def test_adaptive_read_concurrency(self, time_travel):
+        """Test additive increase and multiplicative decrease of concurrent reads."""
+        concurrency = ReadConcurrency(initial=2, minimum=1, maximum=4)
+        assert concurrency.limit == 2
+        # about one increase per `limit` successful reads
+        concurrency.read_finished(0, 0.1, True, 0)
+        assert concurrency.limit == 2
+        concurrency.read_finished(0, 0.1, True, 0)
+        assert concurrency.limit == 3
+        for _ in range(10):
+            concurrency.read_finished(1, 1.1, True, 0)
+        assert concurrency.limit == 4
+        assert concurrency.history[-1] == (1.1, 4)
+
+        # timeout halves the limit
+        concurrency.read_finished(2, 4, False, 0)
+        assert concurrency.limit == 2
+        assert concurrency.timeouts == 1
+        # reads started before the decrease don't decrease again
+        concurrency.read_finished(3, 5, False, 0)
+        assert concurrency.limit == 2
+        # slow reads and a full outgoing queue are congestion too
+        concurrency.read_finished(5, 7, True, 0)
+        assert concurrency.limit == 1
+        concurrency.read_finished(8, 8.1, True, 20)
+        assert concurrency.limit == 1
+        assert [limit for _, limit in concurrency.history] == [3, 4, 2, 1]
+        assert concurrency.reads == 16
+        assert concurrency.timeout_rate == 2 / 16
+
+    async def test_read_workers_follow_limit(self, time_travel):
+        """Test read workers are started and stopped with the concurrency limit."""
+        xknx = XKNX()
+        xknx.state_updater.init_bus_load = 0
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        concurrency = xknx.state_updater.read_concurrency
+        scheduler = xknx.state_updater._scheduler
+        remote_values = [
+            RemoteValue(
+                xknx, sync_state="init", group_address_state=GroupAddress(f"1/1/{i}")
+            )
+            for i in range(4)
+        ]
+
+        async def read_state(wait_for_result):
+            # no response
+            await asyncio.sleep(1)
+
+        for remote_value in remote_values:
+            remote_value.read_state = read_state
+        # not registered yet
+        late_values = remote_values[2:]
+        for remote_value in late_values:
+            xknx.state_updater.unregister_remote_value(remote_value)
+
+        tasks_before = len(asyncio.all_tasks())
+        concurrency.limit = 4
+        xknx.state_updater.start()
+        await time_travel(0)
+        assert sorted(scheduler._read_workers) == [0, 1, 2, 3]
+        assert scheduler._idle_workers == {2, 3}
+        # first timeout halves the limit - idle workers above it are cancelled
+        await time_travel(1)
+        assert concurrency.limit == 2
+        assert sorted(scheduler._read_workers) == [0, 1]
+        assert len(asyncio.all_tasks()) == tasks_before + 3
+
+        # reading workers above a decreased limit exit after their read
+        for remote_value in late_values:
+            xknx.state_updater.register_remote_value(remote_value, "init")
+        await time_travel(0)
+        assert not scheduler._idle_workers
+        await time_travel(1)
+        assert concurrency.limit == 1
+        assert sorted(scheduler._read_workers) == [0]
+        # workers are started when the limit increases
+        concurrency.read_finished(9, 9.1, True, 0)
+        scheduler._adjust_read_workers()
+        await time_travel(0)
+        assert concurrency.limit == 2
+        assert scheduler._idle_workers == {0, 1}
+        xknx.state_updater.stop()
+        await time_travel(0)
+        assert len(asyncio.all_tasks()) == tasks_before
+
+    async def test_dead_group_addresses(self, time_travel):
+        """Test back-off for not responding group addresses."""
+        xknx = XKNX()
+        xknx.state_updater._scheduler.max_read_backoff = 50 * 60
+        xknx.state_updater.init_bus_load = 0
+        xknx.connection_manager._state = XknxConnectionState.CONNECTED
+        dead_value = RemoteValue(
+            xknx, sync_state="expire 10", group_address_state=GroupAddress("1/1/1")
+        )
+        recovering_value = RemoteValue(
+            xknx, sync_state="expire 10", group_address_state=GroupAddress("1/1/2")
+        )
+        dead_reads = []
+        recovering_reads = []
+
+        async def dead_read_state(wait_for_result):
+            dead_reads.append(minutes)
+
+        async def recovering_read_state(wait_for_result):
+            recovering_reads.append(minutes)
+            if len(recovering_reads) > 1:
+                recovering_value.telegram = Mock()
+
+        dead_value.read_state = dead_read_state
+        recovering_value.read_state = recovering_read_state
+        minutes = 0
+        xknx.state_updater.start()
+        await time_travel(0)
+        assert [
+            dead.group_address for dead in xknx.state_updater.dead_group_addresses
+        ] == [
+            GroupAddress("1/1/1"),
+            GroupAddress("1/1/2"),
+        ]
+        for minutes in range(1, 300):
+            await time_travel(60)
+            if minutes == 115:
+                xknx.state_updater.update_received(dead_value)
+
+        # doubled interval up to max_read_backoff - no reads after passive update
+        assert dead_reads == [0, 20, 60, 110]
+        assert recovering_reads[:3] == [0, 20, 30]
+        (dead,) = xknx.state_updater.dead_group_addresses
+        assert dead.group_address == GroupAddress("1/1/1")
+        assert dead.timeouts == 4
+        assert dead.passive
+        xknx.state_updater.stop()
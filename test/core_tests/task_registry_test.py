@@ -1,5 +1,6 @@
 """Unit test for task registry."""
 import asyncio
+from unittest.mock import AsyncMock
 
 from xknx import XKNX
 from xknx.core import XknxConnectionState
@@ -18,7 +19,7 @@ class TestTaskRegistry:
 
         async def callback() -> None:
             """Reset tasks."""
-            xknx.task_registry.tasks = []
+            xknx.task_registry.tasks = {}
 
         task = xknx.task_registry.register(
             name="test",
@@ -29,6 +30,23 @@ class TestTaskRegistry:
         await xknx.task_registry.block_till_done()
         assert len(xknx.task_registry.tasks) == 0
 
+    async def test_block_till_done_timers(self, time_travel):
+        """Test waiting for delayed calls but not for periodic ones."""
+        xknx = XKNX()
+        timers = xknx.task_registry.timers
+        delayed = AsyncMock()
+        periodic = AsyncMock()
+        timers.call_later("delayed", 10, delayed)
+        timers.call_periodic("periodic", 60, periodic)
+
+        waiter = asyncio.create_task(xknx.task_registry.block_till_done())
+        await time_travel(5)
+        assert not waiter.done()
+        await time_travel(5)
+        assert waiter.done()
+        delayed.assert_awaited_once()
+        timers.stop()
+
     async def test_unregister(self):
         """Test unregister after register."""
 
@@ -0,0 +1,109 @@
+"""Unit test for TelegramStream."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from xknx import XKNX
+from xknx.core import StreamOverflow
+from xknx.dpt import DPTBinary
+from xknx.exceptions import XKNXException
+from xknx.telegram import AddressFilter, GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueWrite
+
+
+def _telegram(group_address, direction=TelegramDirection.INCOMING):
+    """Return a GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=GroupAddress(group_address),
+        direction=direction,
+        payload=GroupValueWrite(DPTBinary(1)),
+    )
+
+
+class TestTelegramStream:
+    """Test class for TelegramStream."""
+
+    async def test_stream(self):
+        """Test iterating filtered telegrams."""
+        xknx = XKNX()
+        queue = xknx.telegram_queue
+        all_stream = queue.stream()
+        filtered = queue.stream(filters=["1/2/*"])
+        by_address = queue.stream(group_addresses=[GroupAddress("2/0/0")])
+        outgoing = queue.stream(filters=["2/*/*"], match_for_outgoing=True)
+        assert len(queue.streams) == 4
+
+        telegrams = [
+            _telegram("1/2/3"),
+            _telegram("2/0/0"),
+            _telegram("2/0/1", TelegramDirection.OUTGOING),
+        ]
+        for telegram in telegrams:
+            await queue._run_telegram_received_cbs(telegram)
+
+        assert len(all_stream) == 2
+        assert [telegram async for telegram in _take(filtered, 1)] == telegrams[:1]
+        assert await by_address.__anext__() == telegrams[1]
+        assert len(outgoing) == 2
+
+        async with outgoing:
+            pass
+        # buffered telegrams can be consumed after closing
+        assert [telegram async for telegram in outgoing] == telegrams[1:]
+        assert len(queue.streams) == 3
+
+        assert [telegram async for telegram in _take(all_stream, 2)] == telegrams[:2]
+        consumer = asyncio.create_task(all_stream.__anext__())
+        await asyncio.sleep(0)
+        assert not consumer.done()
+        await queue._run_telegram_received_cbs(telegrams[0])
+        assert await consumer == telegrams[0]
+
+        # closing ends iteration of waiting consumers
+        consumer = asyncio.create_task(all_stream.__anext__())
+        await asyncio.sleep(0)
+        all_stream.close()
+        with pytest.raises(StopAsyncIteration):
+            await consumer
+        assert len(queue.streams) == 2
+
+    async def test_overflow(self):
+        """Test dropping telegrams when the buffer is full."""
+        xknx = XKNX()
+        queue = xknx.telegram_queue
+        drop_oldest = queue.stream(maxsize=2)
+        drop_newest = queue.stream(maxsize=2, overflow=StreamOverflow.DROP_NEWEST)
+        telegrams = [_telegram(f"1/2/{i}") for i in range(4)]
+        for telegram in telegrams:
+            await queue._run_telegram_received_cbs(telegram)
+
+        drop_oldest.close()
+        drop_newest.close()
+        assert drop_oldest.received == drop_newest.received == 4
+        assert drop_oldest.dropped == drop_newest.dropped == 2
+        assert [telegram async for telegram in drop_oldest] == telegrams[2:]
+        assert [telegram async for telegram in drop_newest] == telegrams[:2]
+
+        with pytest.raises(XKNXException):
+            queue.stream(maxsize=0)
+        assert len(queue.streams) == 0
+
+    async def test_shared_filter_pass(self):
+        """Test streams with the same filters share one evaluation per telegram."""
+        xknx = XKNX()
+        queue = xknx.telegram_queue
+        streams = [queue.stream(filters=["1/*/*", "2/*/*"]) for _ in range(3)]
+        streams.append(queue.stream(filters=[AddressFilter("2/*/*"), "1/*/*"]))
+        with patch.object(
+            AddressFilter, "match", autospec=True, return_value=True
+        ) as match:
+            await queue._run_telegram_received_cbs(_telegram("1/2/3"))
+        match.assert_called_once()
+        assert all(len(stream) == 1 for stream in streams)
+
+
+async def _take(stream, count):
+    """Yield `count` telegrams of `stream`."""
+    for _ in range(count):
+        yield await stream.__anext__()
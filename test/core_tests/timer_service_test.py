@@ -0,0 +1,122 @@
+"""Unit test for TimerService."""
+import asyncio
+from unittest.mock import AsyncMock
+
+from xknx import XKNX
+from xknx.core import TimerService, XknxConnectionState
+
+
+class TestTimerService:
+    """Test class for TimerService."""
+
+    async def test_call_later(self, time_travel):
+        """Test delayed calls, replacing and cancelling timers."""
+        timers = TimerService()
+        callback = AsyncMock()
+        replaced = AsyncMock()
+        timers.call_later("first", 10, callback)
+        timers.call_later("second", 5, replaced)
+        assert len(timers) == 2
+        # a timer with the same name replaces the existing one
+        timers.call_later("second", 5, callback)
+        assert len(timers) == 2
+
+        await time_travel(5)
+        callback.assert_awaited_once()
+        replaced.assert_not_awaited()
+        assert len(timers) == 1
+        assert "first" in timers
+
+        timers.cancel("first")
+        await time_travel(10)
+        callback.assert_awaited_once()
+        assert len(timers) == 0
+        assert timers._handle is None
+
+    async def test_reschedule(self, time_travel):
+        """Test moving the next call of a timer."""
+        timers = TimerService()
+        callback = AsyncMock()
+        timer = timers.call_later("debounce", 1, callback)
+        await time_travel(0.5)
+        assert timers.reschedule("debounce", 1)
+        await time_travel(0.5)
+        callback.assert_not_awaited()
+        await time_travel(0.5)
+        callback.assert_awaited_once()
+        assert not timer.active
+        assert not timers.reschedule("debounce", 1)
+
+    async def test_call_periodic(self, time_travel):
+        """Test periodic calls and errors in callbacks."""
+        timers = TimerService()
+        calls = 0
+
+        async def callback():
+            nonlocal calls
+            calls += 1
+            raise ValueError
+
+        timer = timers.call_periodic("periodic", 60, callback)
+        await time_travel(0)
+        assert calls == 1
+        for expected in range(2, 5):
+            await time_travel(60)
+            assert calls == expected
+        assert timer.active
+        timer.cancel()
+        await time_travel(60)
+        assert calls == 4
+        assert len(timers) == 0
+
+    async def test_await_timer(self, time_travel):
+        """Test waiting for a delayed call."""
+        timers = TimerService()
+        callback = AsyncMock()
+        timer = timers.call_later("delayed", 1, callback)
+
+        async def wait():
+            await timer
+
+        waiter = asyncio.create_task(wait())
+        await time_travel(0)
+        assert not waiter.done()
+        await time_travel(1)
+        assert waiter.done()
+        callback.assert_awaited_once()
+        # finished timers don't block
+        await timer
+
+    async def test_task_registry(self, time_travel):
+        """Test timers of the task registry are paused while disconnected."""
+        xknx = XKNX()
+        xknx.task_registry.start()
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        timers = xknx.task_registry.timers
+        callback = AsyncMock()
+        other = AsyncMock()
+        timers.call_periodic("periodic", 60, callback, restart_after_reconnect=True)
+        timers.call_later("delayed", 30, other)
+        await time_travel(0)
+        assert callback.await_count == 1
+
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.DISCONNECTED
+        )
+        await time_travel(60)
+        assert callback.await_count == 1
+        other.assert_awaited_once()
+        await xknx.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        await time_travel(0)
+        assert callback.await_count == 2
+
+        # unregister cancels timers too
+        xknx.task_registry.unregister("periodic")
+        assert len(timers) == 0
+        timers.call_later("delayed", 30, other)
+        xknx.task_registry.stop()
+        assert len(timers) == 0
@@ -1,6 +1,6 @@
 """Unit test for value reader."""
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -14,7 +14,7 @@ from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWri
 class TestValueReader:
     """Test class for value reader."""
 
-    async def test_value_reader_read_success(self):
+    async def test_value_reader_read_success(self, time_travel):
         """Test value reader: successfull read."""
         xknx = XKNX()
         test_group_address = GroupAddress("0/0/0")
@@ -25,30 +25,33 @@ class TestValueReader:
         )
 
         value_reader = ValueReader(xknx, test_group_address)
+        read_task = asyncio.create_task(value_reader.read())
+        await time_travel(0)
+        # request is pending
+        assert xknx.request_correlator.pending == 1
         # receive the response
-        await value_reader.telegram_received(response_telegram)
+        await xknx.telegram_queue.process_telegram_incoming(response_telegram)
         # and yield the result
-        successfull_read = await value_reader.read()
+        successfull_read = await read_task
 
         # GroupValueRead telegram is still in the queue because we are not actually processing it
         assert xknx.telegrams.qsize() == 1
-        # Callback was removed again
-        assert not xknx.telegram_queue.telegram_received_cbs
+        # Request was removed again
+        await time_travel(0)
+        assert not xknx.request_correlator.pending
         # Telegram was received
         assert value_reader.received_telegram == response_telegram
         # Successfull read() returns the telegram
         assert successfull_read == response_telegram
 
     @patch("logging.Logger.warning")
-    async def test_value_reader_read_timeout(self, logger_warning_mock):
+    async def test_value_reader_read_timeout(self, logger_warning_mock, time_travel):
         """Test value reader: read timeout."""
         xknx = XKNX()
         value_reader = ValueReader(xknx, GroupAddress("0/0/0"))
-        value_reader.response_received_event.wait = MagicMock(
-            side_effect=asyncio.TimeoutError()
-        )
-
-        timed_out_read = await value_reader.read()
+        read_task = asyncio.create_task(value_reader.read())
+        await time_travel(2)
+        timed_out_read = await read_task
 
         # GroupValueRead telegram is still in the queue because we are not actually processing it
         assert xknx.telegrams.qsize() == 1
@@ -58,27 +61,28 @@ class TestValueReader:
             2.0,
             GroupAddress("0/0/0"),
         )
-        # Callback was removed again
-        assert not xknx.telegram_queue.telegram_received_cbs
+        # Request was removed again
+        assert not xknx.request_correlator.pending
         # No telegram was received
         assert value_reader.received_telegram is None
         # Unsuccessfull read() returns None
         assert timed_out_read is None
 
-    async def test_value_reader_read_cancelled(self):
+    async def test_value_reader_read_cancelled(self, time_travel):
         """Test value reader: read cancelled."""
         xknx = XKNX()
         value_reader = ValueReader(xknx, GroupAddress("0/0/0"))
-        value_reader.response_received_event.wait = MagicMock(
-            side_effect=asyncio.CancelledError()
-        )
+        read_task = asyncio.create_task(value_reader.read())
+        await time_travel(0)
+        read_task.cancel()
         with pytest.raises(asyncio.CancelledError):
-            await value_reader.read()
+            await read_task
 
         # GroupValueRead telegram is still in the queue because we are not actually processing it
         assert xknx.telegrams.qsize() == 1
-        # Callback was removed again
-        assert not xknx.telegram_queue.telegram_received_cbs
+        # Request was removed again
+        await time_travel(0)
+        assert not xknx.request_correlator.pending
         # No telegram was received
         assert value_reader.received_telegram is None
 
@@ -94,18 +98,13 @@ class TestValueReader:
             destination_address=GroupAddress("0/0/0"), payload=GroupValueRead()
         )
 
-    async def test_value_reader_telegram_received(self):
-        """Test value reader: telegram_received."""
+    async def test_value_reader_telegram_received(self, time_travel):
+        """Test value reader: only responses and writes to the group address are accepted."""
         xknx = XKNX()
         test_group_address = GroupAddress("0/0/0")
-        expected_telegram_1 = Telegram(
-            destination_address=test_group_address,
-            direction=TelegramDirection.INCOMING,
-            payload=GroupValueResponse(DPTBinary(1)),
-        )
-        expected_telegram_2 = Telegram(
+        expected_telegram = Telegram(
             destination_address=test_group_address,
-            direction=TelegramDirection.INCOMING,
+            direction=TelegramDirection.OUTGOING,
             payload=GroupValueWrite(DPTBinary(1)),
         )
         telegram_wrong_address = Telegram(
@@ -120,19 +119,13 @@ class TestValueReader:
         )
 
         value_reader = ValueReader(xknx, test_group_address)
-
-        await value_reader.telegram_received(telegram_wrong_address)
-        assert value_reader.received_telegram is None
-        assert not value_reader.response_received_event.is_set()
-
-        await value_reader.telegram_received(telegram_wrong_type)
-        assert value_reader.received_telegram is None
-        assert not value_reader.response_received_event.is_set()
-
-        await value_reader.telegram_received(expected_telegram_1)
-        assert value_reader.received_telegram == expected_telegram_1
-        assert value_reader.response_received_event.is_set()
-
-        await value_reader.telegram_received(expected_telegram_2)
-        assert value_reader.received_telegram == expected_telegram_2
-        assert value_reader.response_received_event.is_set()
+        read_task = asyncio.create_task(value_reader.read())
+        await time_travel(0)
+
+        await xknx.telegram_queue.process_telegram_incoming(telegram_wrong_address)
+        await xknx.telegram_queue.process_telegram_incoming(telegram_wrong_type)
+        await time_travel(0)
+        assert not read_task.done()
+        # outgoing writes to the group address are accepted
+        xknx.request_correlator.process(expected_telegram)
+        assert await read_task == expected_telegram
@@ -165,8 +165,8 @@ class TestBinarySensor:
             payload=GroupValueWrite(DPTBinary(1)),
         )
         await switch.process(telegram)
-        # no _context_task started because ignore_internal_state is False
-        assert switch._context_task is None
+        # no _context_timer started because ignore_internal_state is False
+        assert switch._context_timer is None
         async_after_update_callback.assert_called_once_with(switch)
 
         async_after_update_callback.reset_mock()
@@ -197,7 +197,7 @@ class TestBinarySensor:
         await switch.process(telegram)
         async_after_update_callback.assert_not_called()
         assert switch.counter == 1
-        await switch._context_task
+        await switch._context_timer
         async_after_update_callback.assert_called_with(switch)
         # once with counter 1 and once with counter 0
         assert async_after_update_callback.call_count == 2
@@ -210,7 +210,7 @@ class TestBinarySensor:
         assert switch.counter == 2
         async_after_update_callback.assert_not_called()
 
-        await switch._context_task
+        await switch._context_timer
         async_after_update_callback.assert_called_with(switch)
         # once with counter 2 and once with counter 0
         assert async_after_update_callback.call_count == 2
@@ -235,8 +235,8 @@ class TestBinarySensor:
             payload=GroupValueWrite(DPTBinary(1)),
         )
         await switch.process(telegram)
-        # no _context_task started because context_timeout is False
-        assert switch._context_task is None
+        # no _context_timer started because context_timeout is False
+        assert switch._context_timer is None
         async_after_update_callback.assert_called_once_with(switch)
 
         async_after_update_callback.reset_mock()
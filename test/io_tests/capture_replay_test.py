@@ -0,0 +1,133 @@
+"""Unit test for replaying recorded KNX/IP frames."""
+import asyncio
+from unittest.mock import patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io.capture import CaptureRecorder
+from xknx.io.capture_replay import CaptureReplay, telegram_from_frame
+from xknx.knxip import (
+    HPAI,
+    CEMIFrame,
+    CEMIMessageCode,
+    KNXIPFrame,
+    RoutingIndication,
+    SearchRequest,
+    TunnellingRequest,
+)
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueWrite
+
+
+def _telegram(index: int) -> Telegram:
+    """Return an incoming GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=GroupAddress(f"1/0/{index}"),
+        direction=TelegramDirection.INCOMING,
+        payload=GroupValueWrite(DPTBinary(1)),
+        source_address=IndividualAddress("1.1.10"),
+    )
+
+
+def _routing_indication(index: int) -> bytes:
+    """Return a raw RoutingIndication frame."""
+    return KNXIPFrame.init_from_body(
+        RoutingIndication(
+            cemi=CEMIFrame.init_from_telegram(
+                _telegram(index), src_addr=IndividualAddress("1.1.10")
+            )
+        )
+    ).to_knx()
+
+
+async def _record(path: str) -> None:
+    """Record frames 0 s, 1 s and 3 s after start."""
+    search_request = KNXIPFrame.init_from_body(
+        SearchRequest(discovery_endpoint=HPAI("192.168.1.1", 3671))
+    ).to_knx()
+    recorder = CaptureRecorder(path)
+    with patch(
+        "xknx.io.capture.time.monotonic_ns",
+        side_effect=[0, 0, 10**9, 10**9, 2 * 10**9, 3 * 10**9],
+    ):
+        await recorder.start()
+        remote = ("10.0.0.1", 3671)
+        recorder.record(_routing_indication(1), False, remote, False)
+        recorder.record(_routing_indication(2), False, remote, False)
+        recorder.record(_routing_indication(9), True, remote, False)
+        recorder.record(search_request, False, remote, False)
+        recorder.record(_routing_indication(3), False, remote, False)
+    await recorder.stop()
+
+
+class TestCaptureReplay:
+    """Test class for CaptureReplay."""
+
+    def test_telegram_from_frame(self):
+        """Test parsing telegrams from raw frames."""
+        assert telegram_from_frame(_routing_indication(1)) == _telegram(1)
+        tunnelling_request = KNXIPFrame.init_from_body(
+            TunnellingRequest(
+                communication_channel_id=1,
+                sequence_counter=0,
+                pdu=CEMIFrame.init_from_telegram(
+                    _telegram(2), src_addr=IndividualAddress("1.1.10")
+                ),
+            )
+        )
+        assert telegram_from_frame(tunnelling_request.to_knx()) == _telegram(2)
+        tunnelling_request.body.pdu.code = CEMIMessageCode.L_DATA_CON
+        assert telegram_from_frame(tunnelling_request.to_knx()) is None
+        assert telegram_from_frame(b"\x06\x10\x00") is None
+
+    async def test_replay_timing(self, tmp_path, time_travel):
+        """Test replaying with scaled inter-arrival times."""
+        path = str(tmp_path / "knx.cap")
+        await _record(path)
+        xknx = XKNX()
+        received = []
+        xknx.telegram_queue.register_telegram_received_cb(
+            lambda telegram: asyncio.sleep(0, received.append(telegram))
+        )
+        await xknx.telegram_queue.start()
+
+        replay = CaptureReplay(xknx, path, speed=2)
+        task = asyncio.create_task(replay.run())
+        # the capture file is read by the executor
+        while not received:
+            await asyncio.sleep(0)
+        await time_travel(0)
+        assert received == [_telegram(1)]
+        await time_travel(0.5)
+        assert received == [_telegram(1), _telegram(2)]
+        await time_travel(0.5)
+        assert len(received) == 2
+        await time_travel(0.5)
+        assert received == [_telegram(1), _telegram(2), _telegram(3)]
+        statistics = await task
+
+        assert statistics.frames == 5
+        assert statistics.telegrams == 3
+        assert statistics.skipped == 2
+        assert statistics.parse_latency.count == 3
+        assert statistics.schedule_lag.count == 3
+        assert statistics.queue_latency.count == 3
+        assert not replay._fed_times
+        await xknx.telegram_queue.stop()
+
+    async def test_replay_as_fast_as_possible(self, tmp_path):
+        """Test replaying without delays."""
+        path = str(tmp_path / "knx.cap")
+        await _record(path)
+        xknx = XKNX()
+        await xknx.telegram_queue.start()
+        statistics = await CaptureReplay(xknx, path, speed=None).run()
+        assert statistics.telegrams == 3
+        assert statistics.schedule_lag.count == 0
+        assert statistics.queue_latency.count == 3
+        assert statistics.duration < 1
+        assert statistics.throughput > 3
+        assert "telegrams=3" in str(statistics)
+        # replay callback is removed
+        assert not xknx.telegram_queue.telegram_received_cbs
+        await xknx.telegram_queue.stop()
@@ -0,0 +1,174 @@
+"""Unit test for recording KNX/IP frames."""
+import asyncio
+import os
+import struct
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from xknx.exceptions import XKNXException
+from xknx.io.capture import CapturedFrame, CaptureRecorder, read_capture
+from xknx.io.transport import TCPTransport, UDPTransport
+from xknx.knxip import HPAI, KNXIPFrame, SearchRequest
+
+SEARCH_REQUEST = KNXIPFrame.init_from_body(
+    SearchRequest(discovery_endpoint=HPAI("192.168.1.1", 3671))
+)
+# TunnellingRequest with L_DATA_IND GroupValueWrite
+TUNNELLING_REQUEST = bytes.fromhex(
+    "0610 0420 0017 04 02 21 00 2900bcd011162916030080 0c 3f"
+)
+
+
+class TestCaptureRecorder:
+    """Test class for CaptureRecorder."""
+
+    async def test_record_transports(self, tmp_path):
+        """Test recording frames of UDP and TCP transports."""
+        path = str(tmp_path / "knx.cap")
+        recorder = CaptureRecorder(path)
+        udp_transport = UDPTransport(
+            local_addr=("192.168.1.1", 0), remote_addr=("192.168.1.2", 3671)
+        )
+        udp_transport.transport = Mock()
+        tcp_transport = TCPTransport(remote_addr=("192.168.1.3", 3671))
+        tcp_transport.transport = Mock()
+
+        # not recorded
+        udp_transport.send(SEARCH_REQUEST)
+        await recorder.start()
+        assert recorder.running
+        udp_transport.send(SEARCH_REQUEST)
+        udp_transport.data_received_callback(TUNNELLING_REQUEST, ("192.168.1.2", 3671))
+        # two frames in one TCP segment
+        tcp_transport.data_received_callback(TUNNELLING_REQUEST * 2)
+        tcp_transport.send(SEARCH_REQUEST)
+        await recorder.stop()
+        assert not recorder.running
+        # not recorded
+        udp_transport.send(SEARCH_REQUEST)
+
+        frames = list(read_capture(path))
+        assert recorder.frames == len(frames) == 5
+        assert [frame[1:] for frame in frames] == [
+            (True, False, ("192.168.1.2", 3671), SEARCH_REQUEST.to_knx()),
+            (False, False, ("192.168.1.2", 3671), TUNNELLING_REQUEST),
+            (False, True, ("192.168.1.3", 3671), TUNNELLING_REQUEST),
+            (False, True, ("192.168.1.3", 3671), TUNNELLING_REQUEST),
+            (True, True, ("192.168.1.3", 3671), SEARCH_REQUEST.to_knx()),
+        ]
+        assert all(
+            first.timestamp <= second.timestamp
+            for first, second in zip(frames, frames[1:])
+        )
+
+    async def test_blocks_and_rotation(self, tmp_path):
+        """Test writing blocks and rotating files by size."""
+        path = str(tmp_path / "knx.cap")
+        with open(path, "wb") as file:
+            file.write(b"previous")
+        recorder = CaptureRecorder(path, block_size=100, max_bytes=200, backup_count=2)
+        await recorder.start()
+        for _ in range(20):
+            recorder.record(TUNNELLING_REQUEST, False, ("10.0.0.1", 3671), False)
+        await recorder.stop()
+
+        assert os.path.getsize(path) <= 200
+        assert not os.path.exists(f"{path}.3")
+        frames = list(read_capture(f"{path}.1")) + list(read_capture(path))
+        assert 0 < len(frames) < 20
+        assert all(
+            frame
+            == CapturedFrame(
+                frame.timestamp, False, False, ("10.0.0.1", 3671), TUNNELLING_REQUEST
+            )
+            for frame in frames
+        )
+
+    async def test_periodic_flush(self, tmp_path, time_travel):
+        """Test incomplete blocks are handed to the writer periodically."""
+        recorder = CaptureRecorder(str(tmp_path / "knx.cap"), flush_interval=1)
+        await recorder.start()
+        recorder.record(TUNNELLING_REQUEST, False, ("10.0.0.1", 3671), False)
+        assert recorder._block_frames == 1
+        await time_travel(1)
+        assert recorder._block_frames == 0
+        assert not recorder._buffer
+        await recorder.stop()
+        assert len(list(read_capture(recorder.path))) == 1
+
+    async def test_record_from_threads(self, tmp_path):
+        """Test recording frames from other threads while flushing in the loop."""
+        path = str(tmp_path / "knx.cap")
+        recorder = CaptureRecorder(path, block_size=1024)
+        await recorder.start()
+        threads = [
+            threading.Thread(
+                target=_record_frames,
+                args=(recorder, ("192.168.1.2", 3671 + index), 2000),
+            )
+            for index in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            recorder.flush()
+            await asyncio.sleep(0)
+        for thread in threads:
+            thread.join()
+        await recorder.stop()
+
+        frames = list(read_capture(path))
+        assert recorder.frames == len(frames) == 8000
+        assert all(frame.raw == TUNNELLING_REQUEST for frame in frames)
+        for index in range(4):
+            assert sum(frame.remote_addr[1] == 3671 + index for frame in frames) == 2000
+
+    async def test_pcapng(self, tmp_path):
+        """Test writing pcapng files."""
+        path = str(tmp_path / "knx.pcapng")
+        recorder = CaptureRecorder(path, pcapng=True)
+        await recorder.start()
+        recorder.record(TUNNELLING_REQUEST, False, ("10.0.0.1", 3671), False)
+        recorder.record(SEARCH_REQUEST.to_knx(), True, ("10.0.0.1", 50000), False)
+        await recorder.stop()
+
+        with open(path, "rb") as file:
+            data = file.read()
+        blocks = []
+        offset = 0
+        while offset < len(data):
+            block_type, length = struct.unpack_from("<II", data, offset)
+            assert struct.unpack_from("<I", data, offset + length - 4)[0] == length
+            blocks.append((block_type, data[offset : offset + length]))
+            offset += length
+        assert [block_type for block_type, _ in blocks] == [0x0A0D0D0A, 1, 6, 6]
+        # IPv4 link type
+        assert struct.unpack_from("<H", blocks[1][1], 8)[0] == 228
+
+        def packet(block: bytes) -> bytes:
+            captured_length = struct.unpack_from("<I", block, 20)[0]
+            return block[28 : 28 + captured_length]
+
+        incoming = packet(blocks[2][1])
+        assert incoming[12:16] == bytes([10, 0, 0, 1])  # source ip
+        assert struct.unpack_from(">HH", incoming, 20) == (3671, 3671)
+        assert incoming[28:] == TUNNELLING_REQUEST
+        outgoing = packet(blocks[3][1])
+        assert outgoing[16:20] == bytes([10, 0, 0, 1])  # destination ip
+        assert struct.unpack_from(">HH", outgoing, 20) == (3671, 50000)
+        assert outgoing[28:] == SEARCH_REQUEST.to_knx()
+
+    def test_read_invalid_file(self, tmp_path):
+        """Test reading a file that is no capture file."""
+        path = tmp_path / "invalid.cap"
+        path.write_bytes(b"no capture file at all")
+        with pytest.raises(XKNXException):
+            list(read_capture(str(path)))
+
+
+def _record_frames(recorder, remote_addr, count):
+    """Record frames from a thread of a transport."""
+    for _ in range(count):
+        recorder.record(TUNNELLING_REQUEST, False, remote_addr, False)
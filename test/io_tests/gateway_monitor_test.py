@@ -0,0 +1,197 @@
+"""Unit test for KNX/IP GatewayMonitor."""
+from unittest.mock import AsyncMock, patch
+
+from xknx import XKNX
+from xknx.exceptions import CommunicationError
+from xknx.io import (
+    ConnectionConfig,
+    GatewayEvent,
+    GatewayEventType,
+    GatewayMonitor,
+    GatewayScanFilter,
+)
+from xknx.io.gateway_scanner import GatewayDescriptor
+from xknx.io.knxip_interface import KNXIPInterface
+from xknx.knxip.dib import TunnelingSlotStatus
+from xknx.telegram import IndividualAddress
+
+
+def _gateway(
+    ip_addr: str, free_slots: int | None = None, routing: bool = False
+) -> GatewayDescriptor:
+    """Return a GatewayDescriptor with `free_slots` of 4 tunnelling slots free."""
+    gateway = GatewayDescriptor(
+        ip_addr=ip_addr,
+        port=3671,
+        local_ip="10.1.1.2",
+        local_interface="en0",
+        name=f"KNX-Interface {ip_addr}",
+        supports_tunnelling=True,
+        supports_routing=routing,
+    )
+    gateway.tunnelling_requires_secure = False
+    if free_slots is not None:
+        gateway.tunnelling_slots = {
+            IndividualAddress(f"1.1.{index + 1}"): TunnelingSlotStatus(
+                usable=True, authorized=False, free=index < free_slots
+            )
+            for index in range(4)
+        }
+    return gateway
+
+
+class TestGatewayMonitor:
+    """Test class for GatewayMonitor objects."""
+
+    async def test_events(self):
+        """Test reporting appeared, changed and disappeared devices."""
+        events: list[GatewayEvent] = []
+        monitor = GatewayMonitor(XKNX(), max_missed_responses=2)
+        monitor.register_gateway_event_cb(events.append)
+
+        with patch(
+            "xknx.io.gateway_monitor.GatewayScanner.scan",
+            return_value=[_gateway("10.1.1.10", free_slots=4)],
+        ), patch(
+            "xknx.io.gateway_monitor.request_description", return_value=None
+        ) as request_description_mock:
+            await monitor.scan()
+        request_description_mock.assert_not_called()
+        assert events == [
+            GatewayEvent(
+                GatewayEventType.APPEARED, monitor.gateways[("10.1.1.10", 3671)]
+            )
+        ]
+        events.clear()
+
+        # DescriptionResponse without slot information - keep known slots
+        description = _gateway("10.1.1.10")
+        description.local_interface = ""
+        with patch(
+            "xknx.io.gateway_monitor.request_description", return_value=description
+        ):
+            await monitor.refresh()
+        assert not events
+        gateway = monitor.gateways[("10.1.1.10", 3671)]
+        assert gateway.local_interface == "en0"
+        assert len(gateway.tunnelling_slots) == 4
+
+        with patch(
+            "xknx.io.gateway_monitor.request_description",
+            return_value=_gateway("10.1.1.10", free_slots=1),
+        ):
+            await monitor.refresh()
+        assert len(events) == 1
+        assert events[0].event_type is GatewayEventType.SLOTS_CHANGED
+        assert events[0].previous is gateway
+        events.clear()
+
+        with patch("xknx.io.gateway_monitor.request_description", return_value=None):
+            await monitor.refresh()
+            assert not events
+            await monitor.refresh()
+        assert len(events) == 1
+        assert events[0].event_type is GatewayEventType.DISAPPEARED
+        assert not monitor.gateways
+        events.clear()
+
+        # disappeared devices are still queried
+        with patch(
+            "xknx.io.gateway_monitor.request_description",
+            return_value=_gateway("10.1.1.10", free_slots=1),
+        ):
+            await monitor.refresh()
+        assert len(events) == 1
+        assert events[0].event_type is GatewayEventType.APPEARED
+
+        monitor.unregister_gateway_event_cb(events.append)
+        assert not monitor._gateway_event_cbs
+
+    async def test_monitor_loop(self, time_travel):
+        """Test periodic DescriptionRequests and scans."""
+        monitor = GatewayMonitor(XKNX(), interval=10, scan_interval=30)
+        with patch(
+            "xknx.io.gateway_monitor.GatewayScanner.scan",
+            return_value=[_gateway("10.1.1.10")],
+        ) as scan_mock, patch(
+            "xknx.io.gateway_monitor.request_description",
+            return_value=_gateway("10.1.1.10"),
+        ) as request_description_mock:
+            await monitor.start()
+            assert monitor.running
+            assert scan_mock.call_count == 1
+            await time_travel(10)
+            await time_travel(10)
+            assert request_description_mock.call_count == 2
+            assert scan_mock.call_count == 1
+            await time_travel(10)
+            assert scan_mock.call_count == 2
+            assert request_description_mock.call_count == 2
+            await monitor.stop()
+            assert not monitor.running
+
+    def test_least_loaded_gateways(self):
+        """Test ordering devices by free tunnelling slots."""
+        monitor = GatewayMonitor(XKNX())
+        for gateway in (
+            _gateway("10.1.1.10", free_slots=1),
+            _gateway("10.1.1.11"),
+            _gateway("10.1.1.12", free_slots=3),
+            _gateway("10.1.1.13", free_slots=0),
+            _gateway("10.1.1.14", free_slots=0, routing=True),
+        ):
+            monitor.gateways[(gateway.ip_addr, gateway.port)] = gateway
+        assert [gateway.ip_addr for gateway in monitor.least_loaded_gateways()] == [
+            "10.1.1.12",
+            "10.1.1.10",
+            "10.1.1.11",
+            "10.1.1.14",
+        ]
+        assert [
+            gateway.ip_addr
+            for gateway in monitor.least_loaded_gateways(
+                GatewayScanFilter(routing=True)
+            )
+        ] == ["10.1.1.14"]
+
+    async def test_start_automatic_with_monitor(self):
+        """Test connecting to the least loaded monitored device first."""
+        xknx = XKNX()
+        monitor = GatewayMonitor(xknx)
+        for gateway in (
+            _gateway("10.1.1.10", free_slots=1),
+            _gateway("10.1.1.11", free_slots=2),
+        ):
+            monitor.gateways[(gateway.ip_addr, gateway.port)] = gateway
+        interface = KNXIPInterface(xknx, ConnectionConfig(gateway_monitor=monitor))
+
+        async def scanned_gateways():
+            yield _gateway("10.1.1.11")
+            yield _gateway("10.1.1.20")
+
+        with patch(
+            "xknx.io.knxip_interface.KNXIPInterface._start_tunnelling_udp",
+            new_callable=AsyncMock,
+        ) as start_tunnelling_udp_mock, patch(
+            "xknx.io.knxip_interface.GatewayScanner.async_scan",
+            return_value=scanned_gateways(),
+        ):
+            await interface._start_automatic()
+        start_tunnelling_udp_mock.assert_called_once_with(
+            gateway_ip="10.1.1.11", gateway_port=3671
+        )
+
+        # all monitored devices fail - scanned devices are tried, known ones only once
+        with patch(
+            "xknx.io.knxip_interface.KNXIPInterface._start_tunnelling_udp",
+            new_callable=AsyncMock,
+            side_effect=[CommunicationError("test")] * 2 + [None],
+        ) as start_tunnelling_udp_mock, patch(
+            "xknx.io.knxip_interface.GatewayScanner.async_scan",
+            return_value=scanned_gateways(),
+        ):
+            await interface._start_automatic()
+        assert [
+            call.kwargs["gateway_ip"]
+            for call in start_tunnelling_udp_mock.call_args_list
+        ] == ["10.1.1.11", "10.1.1.10", "10.1.1.20"]
@@ -1,12 +1,13 @@
 """Unit test for KNX/IP gateway scanner."""
 import asyncio
+import time
 from unittest.mock import Mock, create_autospec, patch
 
 import pytest
 
 from xknx import XKNX
 from xknx.exceptions import XKNXException
-from xknx.io import GatewayScanFilter, GatewayScanner
+from xknx.io import GatewayScanCache, GatewayScanFilter, GatewayScanner
 from xknx.io.gateway_scanner import GatewayDescriptor
 from xknx.io.transport import UDPTransport
 from xknx.knxip import (
@@ -301,6 +302,116 @@ class TestGatewayScanner:
         assert isinstance(frame_2.body, SearchRequest)
         assert frame_1.body.discovery_endpoint == HPAI(ip_addr="10.1.1.2", port=56789)
 
+    @patch("xknx.io.gateway_scanner.UDPTransport.connect")
+    @patch("xknx.io.gateway_scanner.UDPTransport.send")
+    async def test_scan_all_interfaces(
+        self,
+        udp_transport_send_mock,
+        udp_transport_connect_mock,
+        time_travel,
+    ):
+        """Test searching on all interfaces concurrently and yielding devices once."""
+        xknx = XKNX()
+        gateway_scanner = GatewayScanner(xknx, all_interfaces=True)
+        local_ips = [
+            Mock(ip="127.0.0.1", nice_name="lo"),
+            Mock(ip="10.1.1.2", nice_name="en0"),
+            Mock(ip="192.168.42.50", nice_name="en1"),
+        ]
+        found = []
+
+        async def test():
+            async for gateway in gateway_scanner.async_scan():
+                found.append(gateway)
+
+        with patch("xknx.io.util.get_local_ips", return_value=local_ips), patch(
+            "xknx.io.gateway_scanner.UDPTransport.getsockname",
+            return_value=("10.1.1.2", 56789),
+        ), patch(
+            "xknx.io.gateway_scanner.UDPTransport.register_callback"
+        ) as register_callback_mock:
+            scan_task = asyncio.create_task(test())
+            await time_travel(0)
+            # loopback is skipped
+            assert udp_transport_connect_mock.call_count == 2
+            assert udp_transport_send_mock.call_count == 4
+            callbacks = [call.args[0] for call in register_callback_mock.call_args_list]
+            for callback, local_ip in zip(callbacks, ["10.1.1.2", "192.168.42.50"]):
+                udp_transport_mock = Mock()
+                udp_transport_mock.local_addr = (local_ip, 56789)
+                callback(
+                    fake_router_search_response(),
+                    HPAI("192.168.42.10", 3671),
+                    udp_transport_mock,
+                )
+            await time_travel(gateway_scanner.timeout_in_seconds)
+            await scan_task
+        # same device found on both interfaces is yielded once
+        assert len(found) == 1
+        assert found[0].ip_addr == "192.168.42.10"
+
+    @patch("xknx.io.gateway_scanner.UDPTransport.connect")
+    @patch("xknx.io.gateway_scanner.UDPTransport.send")
+    async def test_scan_cache(
+        self,
+        udp_transport_send_mock,
+        udp_transport_connect_mock,
+        time_travel,
+        tmp_path,
+    ):
+        """Test caching scan results."""
+        xknx = XKNX()
+        cache_path = str(tmp_path / "gateways.json")
+        cache = GatewayScanCache(ttl=60, path=cache_path)
+        gateway_scanner = GatewayScanner(xknx, local_ip="192.168.42.50", cache=cache)
+        udp_transport_mock = Mock()
+        udp_transport_mock.local_addr = ("192.168.42.50", 56789)
+
+        with patch(
+            "xknx.io.gateway_scanner.UDPTransport.getsockname",
+            return_value=("192.168.42.50", 56789),
+        ), patch(
+            "xknx.io.gateway_scanner.UDPTransport.register_callback"
+        ) as register_callback_mock:
+            scan_task = asyncio.create_task(gateway_scanner.scan())
+            await time_travel(0)
+            register_callback_mock.call_args.args[0](
+                fake_router_search_response(),
+                HPAI("192.168.42.10", 3671),
+                udp_transport_mock,
+            )
+            await time_travel(gateway_scanner.timeout_in_seconds)
+            scanned_gateways = await scan_task
+            assert len(scanned_gateways) == 1
+        assert udp_transport_connect_mock.call_count == 1
+
+        # new process - cache is loaded from file; no network scan
+        cache = GatewayScanCache(ttl=60, path=cache_path)
+        gateway_scanner = GatewayScanner(xknx, cache=cache)
+        gateways = []
+        async for gateway in gateway_scanner.async_scan():
+            gateways.append(gateway)
+            break
+        assert str(gateways[0]) == str(self.gateway_desc_both)
+        assert gateways[0].as_dict() == scanned_gateways[0].as_dict()
+        assert udp_transport_connect_mock.call_count == 1
+        assert await GatewayScanner(xknx, cache=cache).scan() == gateways
+        assert udp_transport_connect_mock.call_count == 1
+        # cached gateways of other interfaces are not used
+        assert cache.gateways(local_ip="10.1.1.2") == []
+
+        # expired
+        with patch("time.time", return_value=time.time() + 61):
+            assert GatewayScanCache(ttl=60, path=cache_path).gateways() == []
+            assert cache.gateways() == []
+
+    def test_scan_cache_invalid_file(self, tmp_path):
+        """Test loading an invalid cache file."""
+        cache_path = tmp_path / "gateways.json"
+        cache_path.write_text("invalid")
+        assert GatewayScanCache(path=str(cache_path)).gateways() == []
+        assert GatewayScanCache(path=str(tmp_path / "missing.json")).gateways() == []
+
 
 def fake_router_search_response() -> KNXIPFrame:
     """Return the KNXIPFrame of a KNX/IP Router with a SearchResponse body."""
@@ -0,0 +1,235 @@
+"""Unit test for KNX/IP GatewaySimulator."""
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import ConnectionConfig, ConnectionType, GatewaySimulator, SecureConfig
+from xknx.io.gateway_simulator import tp1_transmission_time
+from xknx.knxip import (
+    HPAI,
+    CEMIFrame,
+    CEMIMessageCode,
+    ConnectRequest,
+    KNXIPFrame,
+    RoutingIndication,
+    SessionRequest,
+    SessionStatus,
+    TunnellingRequest,
+)
+from xknx.knxip.knxip_enum import SecureSessionStatusCode
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueWrite
+
+CLIENT_1 = ("192.168.1.10", 50001)
+
+
+def _telegram(index: int = 0) -> Telegram:
+    """Return a GroupValueWrite telegram."""
+    return Telegram(
+        destination_address=GroupAddress(f"1/0/{index}"),
+        payload=GroupValueWrite(DPTBinary(index % 2)),
+        source_address=IndividualAddress("1.1.10"),
+    )
+
+
+class TestGatewaySimulator:
+    """Test class for GatewaySimulator objects."""
+
+    def test_tp1_transmission_time(self):
+        """Test calculating the bus time of a frame."""
+        cemi = CEMIFrame.init_from_telegram(_telegram())
+        # 9 octets - about 49 telegrams per second
+        assert tp1_transmission_time(cemi) == pytest.approx(0.0203, abs=0.0001)
+        assert tp1_transmission_time(cemi, baudrate=19200) == pytest.approx(
+            0.01016, abs=0.0001
+        )
+
+    def _mocked_simulator(self, **kwargs) -> GatewaySimulator:
+        """Return a GatewaySimulator with mocked UDP transport."""
+        simulator = GatewaySimulator(tcp=False, **kwargs)
+        simulator.udp_transport.send = Mock()
+        simulator.udp_transport.transport = Mock()
+        simulator.udp_transport.getsockname = Mock(return_value=("127.0.0.1", 3671))
+        simulator.udp_transport.register_callback(simulator.request_received)
+        return simulator
+
+    def _connect(self, simulator: GatewaySimulator) -> None:
+        """Connect a UDP client."""
+        simulator.udp_transport.data_received_callback(
+            KNXIPFrame.init_from_body(
+                ConnectRequest(
+                    control_endpoint=HPAI(*CLIENT_1), data_endpoint=HPAI(*CLIENT_1)
+                )
+            ).to_knx(),
+            CLIENT_1,
+        )
+
+    async def test_bus_timing_and_latency(self, time_travel):
+        """Test bus bandwidth and L_DATA_CON latency."""
+        telegram_received_cb = Mock()
+        simulator = self._mocked_simulator(
+            confirmation_latency=0.1, telegram_received_cb=telegram_received_cb
+        )
+        simulator._bus_task = asyncio.create_task(simulator._bus_loop())
+        self._connect(simulator)
+        sendto = simulator.udp_transport.transport.sendto
+
+        request = TunnellingRequest(
+            communication_channel_id=1,
+            sequence_counter=0,
+            pdu=CEMIFrame.init_from_telegram(
+                _telegram(), code=CEMIMessageCode.L_DATA_REQ
+            ),
+        )
+        simulator.udp_transport.data_received_callback(
+            KNXIPFrame.init_from_body(request).to_knx(), CLIENT_1
+        )
+        # ACK is sent immediately
+        assert simulator.udp_transport.send.call_count == 2
+        # 20 ms bus time
+        await time_travel(0.019)
+        telegram_received_cb.assert_not_called()
+        await time_travel(0.002)
+        telegram_received_cb.assert_called_once()
+        sendto.assert_not_called()
+        await time_travel(0.1)
+        confirmation = KNXIPFrame()
+        confirmation.from_knx(sendto.call_args[0][0])
+        assert confirmation.body.pdu.code == CEMIMessageCode.L_DATA_CON
+
+        # bus is a bottleneck for simulated device traffic of 100 telegrams per second
+        sendto.reset_mock()
+        simulator.generate_traffic(rate=100, telegram_factory=_telegram, count=100)
+        for _ in range(1000):
+            await time_travel(0.001)
+        assert 45 <= sendto.call_count < 50
+        for _ in range(1100):
+            await time_travel(0.001)
+        assert sendto.call_count == 100
+        indication = KNXIPFrame()
+        indication.from_knx(sendto.call_args[0][0])
+        assert indication.body.pdu.code == CEMIMessageCode.L_DATA_IND
+        assert indication.body.pdu.src_addr == IndividualAddress("1.1.10")
+        assert indication.body.pdu.dst_addr == GroupAddress("1/0/99")
+        await simulator.stop()
+
+    async def test_packet_loss(self):
+        """Test dropping datagrams."""
+        simulator = self._mocked_simulator(packet_loss=1.0, bus_baudrate=None)
+        self._connect(simulator)
+        assert not simulator.connections
+        simulator.packet_loss = 0.0
+        self._connect(simulator)
+        assert len(simulator.connections) == 1
+
+        simulator.packet_loss = 1.0
+        simulator._frame_transmitted(CEMIFrame.init_from_telegram(_telegram()), None)
+        simulator.udp_transport.transport.sendto.assert_not_called()
+
+    async def test_routing(self):
+        """Test forwarding routing indications to tunnelling clients and back."""
+        simulator = self._mocked_simulator(routing=True, bus_baudrate=None)
+        simulator.routing_transport.send = Mock()
+        self._connect(simulator)
+        sendto = simulator.udp_transport.transport.sendto
+
+        cemi = CEMIFrame.init_from_telegram(_telegram())
+        simulator._routing_indication_received(
+            KNXIPFrame.init_from_body(RoutingIndication(cemi=cemi)),
+            HPAI(),
+            simulator.routing_transport,
+        )
+        cemi, origin = simulator._bus_queue.get_nowait()
+        simulator._frame_transmitted(cemi, origin)
+        # not sent back to routing
+        simulator.routing_transport.send.assert_not_called()
+        assert sendto.call_count == 1
+
+        simulator.send_telegram(_telegram(1))
+        cemi, origin = simulator._bus_queue.get_nowait()
+        simulator._frame_transmitted(cemi, origin)
+        routing_frame = simulator.routing_transport.send.call_args[0][0]
+        assert routing_frame.body.cemi.dst_addr == GroupAddress("1/0/1")
+        assert sendto.call_count == 2
+
+    def test_secure_session_ids(self):
+        """Test secure session ids are reused and exhausted sessions are refused."""
+        simulator = GatewaySimulator(secure_user_passwords={2: "user"})
+        session_1 = simulator.create_tcp_transport(CLIENT_1)
+        session_2 = simulator.create_tcp_transport(CLIENT_1)
+        assert (session_1.session_id, session_2.session_id) == (1, 2)
+        simulator.transport_closed(session_1)
+        assert simulator.create_tcp_transport(CLIENT_1).session_id == 1
+
+        simulator._secure_sessions.update(dict.fromkeys(range(1, 0xFFFF)))
+        refused = simulator.create_tcp_transport(CLIENT_1)
+        assert refused.session_id == 0
+        refused.transport = Mock()
+        refused.handle_knxipframe(
+            KNXIPFrame.init_from_body(SessionRequest(ecdh_client_public_key=bytes(32))),
+            HPAI(*CLIENT_1),
+        )
+        status = KNXIPFrame()
+        status.from_knx(refused.transport.write.call_args[0][0])
+        assert status.body == SessionStatus(status=SecureSessionStatusCode.STATUS_CLOSE)
+        refused.transport.close.assert_called_once()
+        assert not refused.initialized
+
+    @pytest.mark.parametrize(
+        "connection_type,secure_config",
+        [
+            (ConnectionType.TUNNELING, None),
+            (ConnectionType.TUNNELING_TCP, None),
+            (
+                ConnectionType.TUNNELING_TCP_SECURE,
+                SecureConfig(
+                    user_id=2,
+                    user_password="user",
+                    device_authentication_password="device",
+                ),
+            ),
+        ],
+    )
+    async def test_tunnel_end_to_end(self, connection_type, secure_config):
+        """Test connecting XKNX to the simulator over loopback."""
+        bus_telegrams = []
+        simulator = GatewaySimulator(
+            local_port=0,
+            individual_addresses=["1.1.240"],
+            secure_user_passwords={2: "user"} if secure_config else None,
+            device_authentication_password="device" if secure_config else None,
+            telegram_received_cb=bus_telegrams.append,
+        )
+        await simulator.start()
+
+        xknx = XKNX(
+            connection_config=ConnectionConfig(
+                connection_type=connection_type,
+                gateway_ip="127.0.0.1",
+                gateway_port=simulator.local_port,
+                local_ip="127.0.0.1",
+                secure_config=secure_config,
+            ),
+            rate_limit=0,
+        )
+        received_telegrams = []
+        xknx.telegram_queue.register_telegram_received_cb(received_telegrams.append)
+        await xknx.start()
+        try:
+            assert xknx.current_address == IndividualAddress("1.1.240")
+            await xknx.knxip_interface.send_telegram(_telegram(5))
+            assert bus_telegrams[0].destination_address == GroupAddress("1/0/5")
+            assert bus_telegrams[0].source_address == IndividualAddress("1.1.240")
+
+            simulator.send_telegram(_telegram(6))
+            await simulator._bus_queue.join()
+            await asyncio.sleep(0.05)
+            telegram = received_telegrams[0]
+            assert telegram.direction == TelegramDirection.INCOMING
+            assert telegram.destination_address == GroupAddress("1/0/6")
+        finally:
+            await xknx.stop()
+            await simulator.stop()
@@ -1,25 +1,33 @@
 """Unit test for KNX/IP Interface."""
+import asyncio
 import os
 import threading
-from unittest.mock import DEFAULT, Mock, patch
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
 import pytest
 
 from xknx import XKNX
+from xknx.core import XknxConnectionState
 from xknx.exceptions.exception import (
     CommunicationError,
     InterfaceWithUserIdNotFound,
     InvalidSecureConfiguration,
+    XKNXException,
 )
 from xknx.io import (
     ConnectionConfig,
     ConnectionType,
     GatewayDescriptor,
+    GatewayRoute,
+    MultiGatewayInterface,
     SecureConfig,
     knx_interface_factory,
 )
+from xknx.io.knxip_interface import KNXIPInterfaceThreaded
 from xknx.io.routing import Routing
 from xknx.io.tunnel import SecureTunnel, TCPTunnel, UDPTunnel
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+from xknx.telegram.apci import GroupValueRead
 
 
 class TestKNXIPInterface:
@@ -196,19 +204,90 @@ class TestKNXIPInterface:
         ) as connect_routing_mock, patch(
             "xknx.io.routing.Routing.send_telegram",
             side_effect=assert_thread,
-            return_value="test",
         ) as send_telegram_mock, patch(
             "xknx.io.routing.Routing.disconnect", side_effect=assert_thread
         ) as disconnect_routing_mock:
             interface = knx_interface_factory(self.xknx, connection_config)
             await interface.start()
             connect_routing_mock.assert_called_once_with()
-            assert await interface.send_telegram(telegram_mock) == "test"
+            await interface.send_telegram(telegram_mock)
             send_telegram_mock.assert_called_once_with(telegram_mock)
             await interface.stop()
             disconnect_routing_mock.assert_called_once_with()
             assert interface._interface is None
 
+    async def test_threaded_send_telegram_batch(self):
+        """Test handing off concurrently sent telegrams to the connection thread."""
+        sent_telegrams = []
+
+        async def send_telegram(telegram):
+            """Send telegram in connection thread."""
+            if telegram == "fail":
+                raise CommunicationError("test")
+            sent_telegrams.append((telegram, threading.get_ident()))
+
+        connection_config = ConnectionConfig(
+            connection_type=ConnectionType.ROUTING,
+            local_ip="127.0.0.1",
+            threaded=True,
+        )
+        with patch("xknx.io.routing.Routing.connect"), patch(
+            "xknx.io.routing.Routing.send_telegram", side_effect=send_telegram
+        ), patch("xknx.io.routing.Routing.disconnect"):
+            interface = knx_interface_factory(self.xknx, connection_config)
+            await interface.start()
+            # hold back the wake-up so the connection thread can't pick up telegrams
+            # before all of them are queued
+            with patch.object(
+                interface._thread_loop, "call_soon_threadsafe"
+            ) as call_soon_threadsafe_mock:
+                sends = asyncio.gather(
+                    *(interface.send_telegram(index) for index in range(5)),
+                    interface.send_telegram("fail"),
+                    return_exceptions=True,
+                )
+                await asyncio.sleep(0)
+            # one wake-up of the connection thread for all telegrams
+            call_soon_threadsafe_mock.assert_called_once_with(
+                interface._send_batch_received
+            )
+            interface._thread_loop.call_soon_threadsafe(interface._send_batch_received)
+            results = await sends
+            assert results[:5] == [None] * 5
+            assert isinstance(results[5], CommunicationError)
+            assert [telegram for telegram, _ in sent_telegrams] == list(range(5))
+            assert sent_telegrams[0][1] == interface.connection_thread.ident
+            await interface.stop()
+
+    async def test_threaded_stop_fails_pending_sends(self):
+        """Test stopping a threaded connection fails telegrams not sent yet."""
+        sending = threading.Event()
+
+        async def send_telegram(telegram):
+            """Send telegram in connection thread - never finishes."""
+            sending.set()
+            await asyncio.sleep(60)
+
+        connection_config = ConnectionConfig(
+            connection_type=ConnectionType.ROUTING,
+            local_ip="127.0.0.1",
+            threaded=True,
+        )
+        with patch("xknx.io.routing.Routing.connect"), patch(
+            "xknx.io.routing.Routing.send_telegram", side_effect=send_telegram
+        ), patch("xknx.io.routing.Routing.disconnect"):
+            interface = knx_interface_factory(self.xknx, connection_config)
+            await interface.start()
+            sends = asyncio.gather(
+                interface.send_telegram(1),
+                interface.send_telegram(2),
+                return_exceptions=True,
+            )
+            await asyncio.get_running_loop().run_in_executor(None, sending.wait)
+            await interface.stop()
+            results = await asyncio.wait_for(sends, timeout=1)
+            assert all(isinstance(result, CommunicationError) for result in results)
+
     async def test_start_secure_connection_knx_keys(self):
         """Test starting a secure connection from a knxkeys file."""
         gateway_ip = "192.168.1.1"
@@ -373,3 +452,190 @@ class TestKNXIPInterface:
         with pytest.raises(InvalidSecureConfiguration):
             interface = knx_interface_factory(self.xknx, connection_config)
             await interface.start()
+
+
+class TestMultiGatewayInterface:
+    """Test class for MultiGatewayInterface objects."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX()
+        self.connection_config = ConnectionConfig(
+            connection_type=ConnectionType.MULTI_GATEWAY,
+            gateway_routes=[
+                GatewayRoute(
+                    ConnectionConfig(
+                        connection_type=ConnectionType.TUNNELING_TCP,
+                        gateway_ip="10.1.0.2",
+                    ),
+                    address_filters=["1/*/*", "2/0/*"],
+                    rate_limit=0,
+                    name="Line 1",
+                ),
+                GatewayRoute(
+                    ConnectionConfig(
+                        connection_type=ConnectionType.TUNNELING_TCP,
+                        gateway_ip="10.2.0.2",
+                    ),
+                    rate_limit=0,
+                ),
+            ],
+        )
+
+    async def test_routing_table(self):
+        """Test routing telegrams to connections."""
+        interface = knx_interface_factory(self.xknx, self.connection_config)
+        assert isinstance(interface, MultiGatewayInterface)
+        line_1, default = interface.connections
+        assert line_1.name == "Line 1"
+        assert default.name == "Gateway 2"
+
+        def _telegram(address):
+            return Telegram(destination_address=address, payload=GroupValueRead())
+
+        assert interface.connection_for(_telegram(GroupAddress("1/2/3"))) is line_1
+        assert interface.connection_for(_telegram(GroupAddress("2/0/3"))) is line_1
+        assert interface.connection_for(_telegram(GroupAddress("2/1/3"))) is default
+        assert (
+            interface.connection_for(_telegram(IndividualAddress("1.1.1"))) is default
+        )
+        # cached lookup
+        assert interface._route_cache[GroupAddress("1/2/3").raw] is line_1
+        assert interface.connection_for(_telegram(GroupAddress("1/2/3"))) is line_1
+
+    async def test_no_default_route(self):
+        """Test sending to unrouted group address without default route."""
+        self.connection_config.gateway_routes.pop()
+        interface = knx_interface_factory(self.xknx, self.connection_config)
+        with pytest.raises(CommunicationError):
+            await interface.send_telegram(
+                Telegram(
+                    destination_address=GroupAddress("3/0/0"), payload=GroupValueRead()
+                )
+            )
+
+    async def test_nested_multi_gateway(self):
+        """Test invalid nested MULTI_GATEWAY route."""
+        self.connection_config.gateway_routes.append(
+            GatewayRoute(self.connection_config)
+        )
+        with pytest.raises(XKNXException):
+            knx_interface_factory(self.xknx, self.connection_config)
+
+    async def test_start_send_stop(self):
+        """Test sending telegrams over separate connections."""
+        interface = knx_interface_factory(self.xknx, self.connection_config)
+        line_1, default = interface.connections
+        telegram_1 = Telegram(
+            destination_address=GroupAddress("1/0/1"), payload=GroupValueRead()
+        )
+        telegram_2 = Telegram(
+            destination_address=GroupAddress("5/0/1"), payload=GroupValueRead()
+        )
+        with patch("xknx.io.tunnel.TCPTunnel.connect") as connect_mock, patch(
+            "xknx.io.tunnel.TCPTunnel.send_telegram"
+        ) as send_mock, patch("xknx.io.tunnel.TCPTunnel.disconnect") as disconnect_mock:
+            await interface.start()
+            assert connect_mock.call_count == 2
+            assert line_1.interface._interface.connection_manager is (
+                line_1.connection_manager
+            )
+            assert line_1.interface._interface.gateway_ip == "10.1.0.2"
+            assert default.interface._interface.gateway_ip == "10.2.0.2"
+
+            await interface.send_telegram(telegram_1)
+            await interface.send_telegram(telegram_2)
+            await line_1.outgoing_queue.join()
+            await default.outgoing_queue.join()
+            assert send_mock.call_count == 2
+            send_mock.assert_any_call(telegram_1)
+            send_mock.assert_any_call(telegram_2)
+
+            await interface.stop()
+            assert disconnect_mock.call_count == 2
+
+    async def test_start_fails(self):
+        """Test starting fails if no connection can be established."""
+        interface = knx_interface_factory(self.xknx, self.connection_config)
+        with patch(
+            "xknx.io.tunnel.TCPTunnel.connect",
+            side_effect=CommunicationError("Error"),
+        ), patch("xknx.io.tunnel.TCPTunnel.disconnect") as disconnect_mock:
+            with pytest.raises(CommunicationError):
+                await interface.start()
+            assert disconnect_mock.call_count == 2
+
+    async def test_start_one_connection_fails(self, time_travel):
+        """Test a connection failing at start is retried in the background."""
+        interface = knx_interface_factory(self.xknx, self.connection_config)
+        with patch(
+            "xknx.io.tunnel.TCPTunnel.connect",
+            side_effect=[
+                True,
+                CommunicationError("Error"),
+                CommunicationError("Error"),
+                True,
+            ],
+        ) as connect_mock, patch("xknx.io.tunnel.TCPTunnel.disconnect"):
+            await interface.start()
+            assert connect_mock.call_count == 2
+            default = interface.connections[1]
+            default.interface.send_telegram = AsyncMock()
+            telegram = Telegram(destination_address=GroupAddress("3/0/0"))
+            await interface.send_telegram(telegram)
+            # first retry after auto_reconnect_wait, then the wait time is doubled
+            await time_travel(3)
+            assert connect_mock.call_count == 3
+            await time_travel(5)
+            assert connect_mock.call_count == 3
+            # telegrams wait in the queue of the connection until it is established
+            default.interface.send_telegram.assert_not_awaited()
+            assert default.outgoing_queue.qsize() == 1
+            await time_travel(1)
+            assert connect_mock.call_count == 4
+            default.interface.send_telegram.assert_awaited_once_with(telegram)
+            await time_travel(60)
+            assert connect_mock.call_count == 4
+            await interface.stop()
+
+    async def test_threaded_route(self):
+        """Test a route with a threaded connection."""
+        self.connection_config.gateway_routes[0].connection_config.threaded = True
+        interface = knx_interface_factory(self.xknx, self.connection_config)
+        line_1, default = interface.connections
+        assert isinstance(line_1.interface, KNXIPInterfaceThreaded)
+        assert line_1.interface.connection_manager is line_1.connection_manager
+        assert not isinstance(default.interface, KNXIPInterfaceThreaded)
+        with patch("xknx.io.tunnel.TCPTunnel.connect") as connect_mock, patch(
+            "xknx.io.tunnel.TCPTunnel.disconnect"
+        ):
+            await interface.start()
+            assert connect_mock.call_count == 2
+            await interface.stop()
+        assert not line_1.interface.connection_thread.is_alive()
+
+    async def test_connection_state(self):
+        """Test combined connection state of all connections."""
+        interface = knx_interface_factory(self.xknx, self.connection_config)
+        line_1, default = interface.connections
+        for connection in interface.connections:
+            connection.connection_manager.register_connection_state_changed_cb(
+                interface._connection_state_changed
+            )
+        await line_1.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTING
+        )
+        assert self.xknx.connection_manager.state == XknxConnectionState.CONNECTING
+        await default.connection_manager.connection_state_changed(
+            XknxConnectionState.CONNECTED
+        )
+        assert self.xknx.connection_manager.state == XknxConnectionState.CONNECTED
+        await default.connection_manager.connection_state_changed(
+            XknxConnectionState.DISCONNECTED
+        )
+        assert self.xknx.connection_manager.state == XknxConnectionState.CONNECTING
+        await line_1.connection_manager.connection_state_changed(
+            XknxConnectionState.DISCONNECTED
+        )
+        assert self.xknx.connection_manager.state == XknxConnectionState.DISCONNECTED
@@ -0,0 +1,77 @@
+"""Unit test for KNX/IP Routing."""
+import asyncio
+from unittest.mock import Mock, patch
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.io import Routing
+from xknx.knxip import HPAI, KNXIPFrame, RoutingBusy, RoutingLostMessage
+from xknx.telegram import GroupAddress, Telegram
+from xknx.telegram.apci import GroupValueWrite
+
+
+class TestRouting:
+    """Test class for KNX/IP Routing."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX()
+        self.routing = Routing(
+            self.xknx, telegram_received_callback=Mock(), local_ip="192.168.1.2"
+        )
+        self.routing.udp_transport.send = Mock()
+        self.telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+
+    def _receive(self, body):
+        """Pass a frame to the routing transport."""
+        self.routing.udp_transport.handle_knxipframe(
+            KNXIPFrame.init_from_body(body), HPAI("192.168.1.3", 3671)
+        )
+
+    @patch("random.random", Mock(return_value=0.5))
+    async def test_routing_busy(self, time_travel):
+        """Test pausing and slowing down after ROUTING_BUSY."""
+        send = self.routing.udp_transport.send
+        flow_control = self.routing.flow_control
+        await self.routing.send_telegram(self.telegram)
+        assert send.call_count == 1
+        assert flow_control.effective_rate is None
+
+        self._receive(RoutingBusy(wait_time=100))
+        # repeated frames within 10 ms don't increment the busy counter
+        self._receive(RoutingBusy(wait_time=20))
+        assert flow_control.busy_events == 2
+        assert flow_control.busy_counter() == 1
+        assert flow_control.effective_rate == 0
+
+        task = asyncio.create_task(self.routing.send_telegram(self.telegram))
+        # wait time 100 ms + random 0.5 * 1 * 50 ms
+        await time_travel(0.124)
+        assert send.call_count == 1
+        await time_travel(0.001)
+        assert send.call_count == 2
+        await task
+        # slowed down to 25 telegrams per second
+        assert flow_control.effective_rate == 25
+        task = asyncio.create_task(self.routing.send_telegram(self.telegram))
+        await time_travel(0.039)
+        assert send.call_count == 2
+        await time_travel(0.001)
+        assert send.call_count == 3
+        await task
+        # recovers 100 ms after sending was resumed
+        await time_travel(0.05)
+        assert flow_control.busy_counter() == 1
+        await time_travel(0.02)
+        assert flow_control.busy_counter() == 0
+        assert flow_control.effective_rate is None
+
+    def test_routing_lost_message(self):
+        """Test counting lost messages."""
+        self._receive(RoutingLostMessage(lost_messages=3))
+        self._receive(RoutingLostMessage(lost_messages=2))
+        assert self.routing.flow_control.lost_messages == 5
@@ -5,7 +5,11 @@ from unittest.mock import Mock, patch
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 import pytest
 
-from xknx.exceptions import CommunicationError, CouldNotParseKNXIP
+from xknx.exceptions import (
+    CommunicationError,
+    CouldNotParseKNXIP,
+    KNXSecureValidationError,
+)
 from xknx.io.const import SESSION_KEEPALIVE_RATE
 from xknx.io.secure_session import SecureSession
 from xknx.knxip import (
@@ -17,6 +21,11 @@ from xknx.knxip import (
     SessionStatus,
 )
 from xknx.knxip.knxip_enum import SecureSessionStatusCode
+from xknx.secure.ip_secure import (
+    SessionCipher,
+    derive_device_authentication_password,
+    derive_user_password,
+)
 
 
 class TestSecureSession:
@@ -56,6 +65,9 @@ class TestSecureSession:
         )
         self.patch_message_tag.start()
 
+        # derive keys once so `connect()` doesn't wait for the executor
+        derive_user_password(self.mock_user_password)
+        derive_device_authentication_password(self.mock_device_authentication_password)
         self.session = SecureSession(
             remote_addr=self.mock_addr,
             user_id=self.mock_user_id,
@@ -190,6 +202,40 @@ class TestSecureSession:
         with pytest.raises(CouldNotParseKNXIP):
             self.session.handle_knxipframe(secure_wrapper_frame, HPAI(*self.mock_addr))
 
+    def test_encrypt_frames(self):
+        """Test encrypting multiple frames in one call and decrypting them again."""
+        self.session.session_id = self.mock_session_id
+        self.session._cipher = SessionCipher(bytes(range(16)))
+        plain_frames = [
+            KNXIPFrame.init_from_body(
+                SessionStatus(status=SecureSessionStatusCode.STATUS_KEEPALIVE)
+            ),
+            KNXIPFrame.init_from_body(
+                SessionStatus(status=SecureSessionStatusCode.STATUS_CLOSE)
+            ),
+        ]
+        encrypted_frames = self.session.encrypt_frames(plain_frames)
+        assert [frame.body.sequence_information for frame in encrypted_frames] == [
+            bytes.fromhex("00 00 00 00 00 00"),
+            bytes.fromhex("00 00 00 00 00 01"),
+        ]
+        # same result as encrypting one by one
+        self.session._sequence_number = 0
+        assert encrypted_frames == [
+            self.session.encrypt_frame(frame) for frame in plain_frames
+        ]
+        for encrypted_frame, plain_frame in zip(encrypted_frames, plain_frames):
+            raw_frame = KNXIPFrame()
+            raw_frame.from_knx(encrypted_frame.to_knx())
+            assert self.session.decrypt_frame(raw_frame) == plain_frame
+        # the MAC is verified against the header bytes as received
+        raw = bytearray(encrypted_frames[0].to_knx())
+        raw[4] = 0x01  # ignored when parsing the total length
+        tampered_frame = KNXIPFrame()
+        tampered_frame.from_knx(bytes(raw))
+        with pytest.raises(KNXSecureValidationError):
+            self.session.decrypt_frame(tampered_frame)
+
     @patch("xknx.io.transport.tcp_transport.TCPTransport.connect")
     @patch("xknx.io.transport.tcp_transport.TCPTransport.send")
     @patch(
@@ -315,7 +361,7 @@ class TestSecureSession:
         time_travel,
     ):
         """Test handling initializing session without verifying server authenticity."""
-        self.session._device_authentication_code = None
+        self.session._device_authentication_password = None
         connect_task = asyncio.create_task(self.session.connect())
         await time_travel(0)
         mock_super_send.reset_mock()
@@ -7,6 +7,7 @@ import pytest
 from xknx import XKNX
 from xknx.dpt import DPTArray
 from xknx.io import UDPTunnel
+from xknx.io.const import HEARTBEAT_RATE, HEARTBEAT_RATE_MIN
 from xknx.io.gateway_scanner import GatewayDescriptor
 from xknx.knxip import (
     HPAI,
@@ -209,3 +210,67 @@ class TestUDPTunnel:
         assert isinstance(task.result(), GatewayDescriptor)
         assert self.tunnel.transport.send.call_count == 1
         await task
+
+    @patch("xknx.io.tunnel.random.random", return_value=0)
+    async def test_tunnel_reconnect_backoff_and_failover(self, _random, time_travel):
+        """Test reconnecting with exponential back-off to alternative gateways."""
+        tunnel = UDPTunnel(
+            self.xknx,
+            gateway_ip="192.168.1.2",
+            gateway_port=3671,
+            local_ip="192.168.1.1",
+            auto_reconnect_wait=3,
+            alternative_gateways=[("192.168.1.3", 3671)],
+        )
+        tunnel._initial_connection = False
+        tunnel.transport.connect = AsyncMock(side_effect=[OSError, OSError, None])
+        tunnel.transport.getsockname = Mock(return_value=("192.168.1.1", 12345))
+        tunnel.transport.stop = Mock()
+        tunnel._connect_request = AsyncMock(return_value=True)
+
+        tunnel._tunnel_lost()
+        await time_travel(3)
+        assert tunnel.transport.connect.call_count == 1
+        assert tunnel.transport.remote_addr == ("192.168.1.2", 3671)
+        # fail over to the alternative device after the base wait time
+        await time_travel(3)
+        assert tunnel.transport.connect.call_count == 2
+        assert tunnel.transport.remote_addr == ("192.168.1.3", 3671)
+        # second round waits twice as long
+        await time_travel(5)
+        assert tunnel.transport.connect.call_count == 2
+        await time_travel(1)
+        assert tunnel.transport.connect.call_count == 3
+        assert tunnel.transport.remote_addr == ("192.168.1.2", 3671)
+
+        assert tunnel.reconnect_metrics.reconnects == 1
+        assert tunnel.reconnect_metrics.failed_attempts == 2
+        assert tunnel.reconnect_metrics.last_duration == pytest.approx(12, abs=0.1)
+        assert tunnel._reconnect_attempts == 0
+        # reconnected tunnels are checked more often
+        assert tunnel._heartbeat_rate == HEARTBEAT_RATE_MIN
+        tunnel.stop_heartbeat()
+        await time_travel(0)
+
+    async def test_tunnel_missing_confirmation_triggers_heartbeat(self, time_travel):
+        """Test a missing L_DATA_CON triggers a ConnectionStateRequest."""
+        self.tunnel._connectionstate_request = AsyncMock(return_value=True)
+        self.tunnel.start_heartbeat()
+        await time_travel(0)
+        assert self.tunnel._heartbeat_rate == HEARTBEAT_RATE
+
+        test_telegram = Telegram(payload=GroupValueWrite(DPTArray((1,))))
+        await asyncio.gather(
+            self.tunnel._wait_for_tunnelling_request_confirmation(
+                asyncio.sleep(0), test_telegram
+            ),
+            time_travel(3),
+        )
+        await time_travel(0)
+        self.tunnel._connectionstate_request.assert_awaited_once()
+        # interval is increased again after successful heartbeats
+        assert self.tunnel._heartbeat_rate == HEARTBEAT_RATE_MIN * 2
+        await time_travel(HEARTBEAT_RATE_MIN * 2)
+        assert self.tunnel._connectionstate_request.await_count == 2
+        self.tunnel.stop_heartbeat()
+        await time_travel(0)
@@ -0,0 +1,284 @@
+"""Unit test for KNX/IP TunnellingServer."""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from xknx import XKNX
+from xknx.dpt import DPTBinary
+from xknx.exceptions import CommunicationError
+from xknx.io import TunnellingServer
+from xknx.knxip import (
+    HPAI,
+    CEMIFlags,
+    CEMIFrame,
+    CEMIMessageCode,
+    ConnectionStateRequest,
+    ConnectionStateResponse,
+    ConnectRequest,
+    ConnectResponse,
+    DisconnectRequest,
+    DisconnectResponse,
+    ErrorCode,
+    KNXIPFrame,
+    TunnellingAck,
+    TunnellingRequest,
+)
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueWrite
+
+CLIENT_1 = ("192.168.1.10", 50001)
+CLIENT_2 = ("192.168.1.11", 50002)
+
+
+class TestTunnellingServer:
+    """Test class for TunnellingServer objects."""
+
+    def setup_method(self):
+        """Set up test class."""
+        # pylint: disable=attribute-defined-outside-init
+        self.xknx = XKNX()
+        self.xknx.current_address = IndividualAddress("1.1.250")
+        self.server = TunnellingServer(
+            self.xknx,
+            local_ip="192.168.1.2",
+            tcp=False,
+            individual_addresses=["1.1.251", "1.1.252"],
+        )
+        self.udp_transport = self.server.udp_transport
+        self.udp_transport.send = Mock()
+        self.udp_transport.transport = Mock()
+        self.udp_transport.getsockname = Mock(return_value=("192.168.1.2", 3671))
+        self.udp_transport.register_callback(self.server.request_received)
+
+    def _receive(self, body, source):
+        """Pass a frame from a client to the server."""
+        self.udp_transport.data_received_callback(
+            KNXIPFrame.init_from_body(body).to_knx(), source
+        )
+
+    def _connect(self, source) -> ConnectResponse:
+        """Connect a client and return the ConnectResponse."""
+        self.udp_transport.send.reset_mock()
+        self._receive(
+            ConnectRequest(control_endpoint=HPAI(*source), data_endpoint=HPAI(*source)),
+            source,
+        )
+        (knxipframe,) = self.udp_transport.send.call_args[0]
+        assert self.udp_transport.send.call_args[1] == {"addr": source}
+        return knxipframe.body
+
+    async def test_connect_disconnect(self):
+        """Test connecting and disconnecting clients."""
+        response_1 = self._connect(CLIENT_1)
+        assert response_1.status_code == ErrorCode.E_NO_ERROR
+        assert response_1.communication_channel == 1
+        assert response_1.identifier == IndividualAddress("1.1.251").raw
+        assert response_1.data_endpoint == HPAI("192.168.1.2", 3671)
+
+        response_2 = self._connect(CLIENT_2)
+        assert response_2.communication_channel == 2
+        assert response_2.identifier == IndividualAddress("1.1.252").raw
+        # no more individual addresses
+        response_3 = self._connect(("192.168.1.12", 50003))
+        assert response_3.status_code == ErrorCode.E_NO_MORE_CONNECTIONS
+        assert len(self.server.connections) == 2
+
+        self.udp_transport.send.reset_mock()
+        self._receive(
+            ConnectionStateRequest(
+                communication_channel_id=1, control_endpoint=HPAI(*CLIENT_1)
+            ),
+            CLIENT_1,
+        )
+        response = self.udp_transport.send.call_args[0][0].body
+        assert response == ConnectionStateResponse(communication_channel_id=1)
+        self._receive(
+            ConnectionStateRequest(
+                communication_channel_id=5, control_endpoint=HPAI(*CLIENT_1)
+            ),
+            CLIENT_1,
+        )
+        response = self.udp_transport.send.call_args[0][0].body
+        assert response.status_code == ErrorCode.E_CONNECTION_ID
+
+        self._receive(
+            DisconnectRequest(
+                communication_channel_id=1, control_endpoint=HPAI(*CLIENT_1)
+            ),
+            CLIENT_1,
+        )
+        response = self.udp_transport.send.call_args[0][0].body
+        assert response == DisconnectResponse(communication_channel_id=1)
+        assert list(self.server.connections) == [2]
+        # free address is reused
+        assert self._connect(CLIENT_1).identifier == IndividualAddress("1.1.251").raw
+
+    async def test_route_back_connect(self):
+        """Test client behind NAT using route back HPAIs."""
+        self._receive(ConnectRequest(), CLIENT_1)
+        assert self.udp_transport.send.call_args[1] == {"addr": CLIENT_1}
+        assert self.server.connections[1].data_endpoint == CLIENT_1
+
+    async def test_tunnelling_request(self):
+        """Test sending a telegram from a client and forwarding to other clients."""
+        self._connect(CLIENT_1)
+        self._connect(CLIENT_2)
+        self.udp_transport.send.reset_mock()
+
+        telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        cemi = CEMIFrame.init_from_telegram(telegram, code=CEMIMessageCode.L_DATA_REQ)
+        request = TunnellingRequest(
+            communication_channel_id=1, sequence_counter=0, pdu=cemi
+        )
+        self._receive(request, CLIENT_1)
+        ack = self.udp_transport.send.call_args[0][0].body
+        assert ack == TunnellingAck(communication_channel_id=1, sequence_counter=0)
+        queued_telegram = self.xknx.telegrams.get_nowait()
+        assert queued_telegram.direction == TelegramDirection.OUTGOING
+        assert queued_telegram.destination_address == GroupAddress("1/2/3")
+        assert queued_telegram.source_address == IndividualAddress("1.1.251")
+        # repeated frame is acknowledged but not queued again
+        self._receive(request, CLIENT_1)
+        assert self.udp_transport.send.call_count == 2
+        assert self.xknx.telegrams.empty()
+
+        # telegram was sent by TelegramQueue
+        sendto = self.udp_transport.transport.sendto
+        await self.server._telegram_processed(queued_telegram)
+        assert sendto.call_count == 2
+        confirmation_raw, addr = sendto.call_args_list[0][0]
+        assert addr == CLIENT_1
+        confirmation = KNXIPFrame()
+        confirmation.from_knx(confirmation_raw)
+        assert confirmation.body.communication_channel_id == 1
+        assert confirmation.body.pdu.code == CEMIMessageCode.L_DATA_CON
+        indication_raw, addr = sendto.call_args_list[1][0]
+        assert addr == CLIENT_2
+        indication = KNXIPFrame()
+        indication.from_knx(indication_raw)
+        assert indication.body.communication_channel_id == 2
+        assert indication.body.sequence_counter == 0
+        assert indication.body.pdu.code == CEMIMessageCode.L_DATA_IND
+        assert indication.body.pdu.src_addr == IndividualAddress("1.1.251")
+        assert indication.body.pdu.telegram.destination_address == GroupAddress("1/2/3")
+
+    async def test_send_failed(self):
+        """Test confirming a telegram that could not be sent with an error."""
+        self._connect(CLIENT_1)
+        self.xknx.knxip_interface = Mock(
+            send_telegram=AsyncMock(side_effect=CommunicationError("Not connected"))
+        )
+        self.xknx.telegram_queue.register_telegram_send_failed_cb(
+            self.server._telegram_send_failed
+        )
+        await self.xknx.telegram_queue.start()
+
+        telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            payload=GroupValueWrite(DPTBinary(1)),
+        )
+        cemi = CEMIFrame.init_from_telegram(telegram, code=CEMIMessageCode.L_DATA_REQ)
+        self._receive(
+            TunnellingRequest(communication_channel_id=1, sequence_counter=0, pdu=cemi),
+            CLIENT_1,
+        )
+        await self.xknx.telegrams.join()
+        self.xknx.knxip_interface.send_telegram.assert_awaited_once()
+        sendto = self.udp_transport.transport.sendto
+        confirmation_raw, addr = sendto.call_args[0]
+        assert addr == CLIENT_1
+        confirmation = KNXIPFrame()
+        confirmation.from_knx(confirmation_raw)
+        assert confirmation.body.pdu.code == CEMIMessageCode.L_DATA_CON
+        assert confirmation.body.pdu.flags & CEMIFlags.CONFIRM_ERROR
+        assert not self.server._pending_confirmations
+        await self.xknx.telegram_queue.stop()
+
+    async def test_pending_confirmation_released(self):
+        """Test pending confirmations are removed with their telegram."""
+        self._connect(CLIENT_1)
+        cemi = CEMIFrame.init_from_telegram(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                payload=GroupValueWrite(DPTBinary(1)),
+            ),
+            code=CEMIMessageCode.L_DATA_REQ,
+        )
+        self._receive(
+            TunnellingRequest(communication_channel_id=1, sequence_counter=0, pdu=cemi),
+            CLIENT_1,
+        )
+        assert len(self.server._pending_confirmations) == 1
+        # dropped without being processed
+        self.xknx.telegrams.get_nowait()
+        assert not self.server._pending_confirmations
+
+    async def test_forward_bus_telegram(self):
+        """Test forwarding telegrams from the bus to all clients."""
+        self._connect(CLIENT_1)
+        self._connect(CLIENT_2)
+        sendto = self.udp_transport.transport.sendto
+
+        telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            direction=TelegramDirection.INCOMING,
+            payload=GroupValueWrite(DPTBinary(1)),
+            source_address=IndividualAddress("1.1.5"),
+        )
+        await self.server._telegram_processed(telegram)
+        await self.server._telegram_processed(telegram)
+        assert sendto.call_count == 4
+        raw_1, addr_1 = sendto.call_args_list[0][0]
+        raw_2, addr_2 = sendto.call_args_list[1][0]
+        raw_3, _ = sendto.call_args_list[2][0]
+        assert (addr_1, addr_2) == (CLIENT_1, CLIENT_2)
+        # same cEMI - only connection header differs
+        assert raw_1[10:] == raw_2[10:]
+        assert raw_1[7] == 1 and raw_2[7] == 2
+        # sequence counter per client
+        assert raw_1[8] == 0 and raw_3[8] == 1
+
+        # outgoing telegram from xknx itself uses the upstream address
+        sendto.reset_mock()
+        await self.server._telegram_processed(
+            Telegram(
+                destination_address=GroupAddress("1/2/3"),
+                direction=TelegramDirection.OUTGOING,
+                payload=GroupValueWrite(DPTBinary(0)),
+            )
+        )
+        indication = KNXIPFrame()
+        indication.from_knx(sendto.call_args[0][0])
+        assert indication.body.pdu.src_addr == IndividualAddress("1.1.250")
+
+    async def test_heartbeat_timeout(self, time_travel):
+        """Test removing clients without heartbeat."""
+        self._connect(CLIENT_1)
+        self._connect(CLIENT_2)
+        self.server._alive_task = asyncio.create_task(self.server._check_alive_loop())
+        await time_travel(60)
+        self._receive(
+            ConnectionStateRequest(
+                communication_channel_id=2, control_endpoint=HPAI(*CLIENT_2)
+            ),
+            CLIENT_2,
+        )
+        await time_travel(70)
+        assert list(self.server.connections) == [2]
+        knxipframe = self.udp_transport.send.call_args[0][0]
+        assert isinstance(knxipframe.body, DisconnectRequest)
+        assert knxipframe.body.communication_channel_id == 1
+        assert self.udp_transport.send.call_args[1] == {"addr": CLIENT_1}
+        await self.server.stop()
+
+    async def test_stop(self):
+        """Test stopping the server disconnects all clients."""
+        self._connect(CLIENT_1)
+        self.udp_transport.send.reset_mock()
+        await self.server.stop()
+        assert not self.server.connections
+        knxipframe = self.udp_transport.send.call_args[0][0]
+        assert isinstance(knxipframe.body, DisconnectRequest)
+        assert self.udp_transport.send.call_args[1] == {"addr": CLIENT_1}
@@ -18,6 +18,7 @@ class TestKNXIPHeader:
         assert header.service_type_ident == KNXIPServiceType.TUNNELLING_ACK
         assert header.b4_reserve == 0
         assert header.total_length == 10
+        assert header.raw == raw
         assert header.to_knx() == raw
 
     def test_set_length(self):
@@ -0,0 +1,37 @@
+"""Unit test for KNX/IP RoutingBusy objects."""
+import pytest
+
+from xknx.exceptions import CouldNotParseKNXIP
+from xknx.knxip import KNXIPFrame, RoutingBusy
+
+
+class TestKNXIPRoutingBusy:
+    """Test class for KNX/IP RoutingBusy objects."""
+
+    def test_routing_busy(self):
+        """Test parsing and streaming routing busy KNX/IP packet."""
+        raw = bytes.fromhex(
+            "06 10 05 32 00 0C"  # KNXnet/IP header
+            "06"  # structure length
+            "01"  # device state - KNX fault
+            "00 64"  # wait time 100 ms
+            "00 00"  # control field
+        )
+        knxipframe = KNXIPFrame()
+        knxipframe.from_knx(raw)
+
+        assert isinstance(knxipframe.body, RoutingBusy)
+        assert knxipframe.body.device_state == 1
+        assert knxipframe.body.wait_time == 100
+        assert knxipframe.body.control_field == 0
+        assert knxipframe.to_knx() == raw
+
+        routing_busy = RoutingBusy(device_state=1, wait_time=100)
+        knxipframe2 = KNXIPFrame.init_from_body(routing_busy)
+        assert knxipframe2.to_knx() == raw
+
+    def test_from_knx_wrong_length(self):
+        """Test parsing routing busy with wrong structure length."""
+        raw = bytes.fromhex("06 10 05 32 00 0C 04 00 00 64 00 00")
+        with pytest.raises(CouldNotParseKNXIP):
+            KNXIPFrame().from_knx(raw)
@@ -0,0 +1,35 @@
+"""Unit test for KNX/IP RoutingLostMessage objects."""
+import pytest
+
+from xknx.exceptions import CouldNotParseKNXIP
+from xknx.knxip import KNXIPFrame, RoutingLostMessage
+
+
+class TestKNXIPRoutingLostMessage:
+    """Test class for KNX/IP RoutingLostMessage objects."""
+
+    def test_routing_lost_message(self):
+        """Test parsing and streaming routing lost message KNX/IP packet."""
+        raw = bytes.fromhex(
+            "06 10 05 31 00 0A"  # KNXnet/IP header
+            "04"  # structure length
+            "00"  # device state
+            "00 05"  # lost messages
+        )
+        knxipframe = KNXIPFrame()
+        knxipframe.from_knx(raw)
+
+        assert isinstance(knxipframe.body, RoutingLostMessage)
+        assert knxipframe.body.device_state == 0
+        assert knxipframe.body.lost_messages == 5
+        assert knxipframe.to_knx() == raw
+
+        routing_lost_message = RoutingLostMessage(lost_messages=5)
+        knxipframe2 = KNXIPFrame.init_from_body(routing_lost_message)
+        assert knxipframe2.to_knx() == raw
+
+    def test_from_knx_wrong_length(self):
+        """Test parsing routing lost message with wrong length."""
+        raw = bytes.fromhex("06 10 05 31 00 0B 04 00 00 05 00")
+        with pytest.raises(CouldNotParseKNXIP):
+            KNXIPFrame().from_knx(raw)
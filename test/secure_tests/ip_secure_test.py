@@ -3,6 +3,7 @@
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 
 from xknx.secure.ip_secure import (
+    SessionCipher,
     calculate_message_authentication_code_cbc,
     decrypt_ctr,
     derive_device_authentication_password,
@@ -69,6 +70,67 @@ class TestIPSecure:
             "bd 0a 29 4b 95 25 54 b2 35 39 20 4c 22 71 d2 6b"
         )
 
+    def test_session_cipher(self):
+        """Test SessionCipher against the routing example in AN159v06."""
+        cipher = SessionCipher(
+            bytes.fromhex("00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f")
+        )
+        counter_0 = bytes.fromhex("c0 c1 c2 c3 c4 c5 00 fa 12 34 56 78 af fe ff 00")
+        payload = bytes.fromhex("06 10 05 30 00 11 29 00 bc d0 11 59 0a de 01 00 81")
+        encrypted_payload = bytes.fromhex(
+            "b7 ee 7e 8a 1c 2f 7b ba be c7 75 fd 6e 10 d0 bc 4b"
+        )
+        mac_cbc = bytes.fromhex("bd 0a 29 4b 95 25 54 b2 35 39 20 4c 22 71 d2 6b")
+        encrypted_mac = bytes.fromhex("72 12 a0 3a aa e4 9d a8 56 89 77 4c 1d 2b 4d a4")
+
+        assert (
+            cipher.calculate_message_authentication_code_cbc(
+                additional_data=bytes.fromhex("06 10 09 50 00 37 00 00"),
+                payload=payload,
+                block_0=bytes.fromhex(
+                    "c0 c1 c2 c3 c4 c5 00 fa 12 34 56 78 af fe 00 11"
+                ),
+            )
+            == mac_cbc
+        )
+        assert cipher.encrypt_data_ctr(
+            counter_0=counter_0, mac_cbc=mac_cbc, payload=payload
+        ) == (encrypted_payload, encrypted_mac)
+        assert cipher.decrypt_ctr(
+            counter_0=counter_0, mac=encrypted_mac, payload=encrypted_payload
+        ) == (payload, mac_cbc)
+        # cipher state is reused for subsequent calls
+        assert cipher.decrypt_ctr(
+            counter_0=counter_0, mac=encrypted_mac, payload=encrypted_payload
+        ) == (payload, mac_cbc)
+
+    def test_session_cipher_batch(self):
+        """Test SessionCipher encrypting multiple frames at once."""
+        key = bytes.fromhex("00 01 02 03 04 05 06 07 08 09 0a 0b 0c 0d 0e 0f")
+        cipher = SessionCipher(key)
+        frames = [
+            (
+                bytes.fromhex("c0 c1 c2 c3 c4 c5 00 fa 12 34 56 78 af fe ff 00"),
+                bytes(16),
+                bytes(range(40)),
+            ),
+            (
+                # counter wraps around at 2^128
+                bytes.fromhex("ff ff ff ff ff ff ff ff ff ff ff ff ff ff ff ff"),
+                bytes(range(16)),
+                b"",
+            ),
+            (
+                bytes.fromhex("00 00 00 00 00 00 00 00 00 00 00 00 00 00 ff 00"),
+                bytes(range(16, 32)),
+                bytes(range(17)),
+            ),
+        ]
+        assert cipher.encrypt_data_ctr_batch(frames) == [
+            encrypt_data_ctr(key=key, counter_0=counter_0, mac_cbc=mac, payload=data)
+            for counter_0, mac, data in frames
+        ]
+
     def test_derive_device_authentication_password(self):
         """Test derive device authentication password."""
         assert derive_device_authentication_password("trustme") == bytes.fromhex(
@@ -1,11 +1,18 @@
 """Unit test for keyring reader."""
 import os
+from unittest.mock import patch
 
 import pytest
 
 from xknx.exceptions.exception import InvalidSecureConfiguration, InvalidSignature
 from xknx.secure import Keyring, load_key_ring
-from xknx.secure.keyring import XMLDevice, XMLInterface, verify_keyring_signature
+from xknx.secure.keyring import (
+    XMLDevice,
+    XMLInterface,
+    decrypt_aes128cbc,
+    verify_keyring_signature,
+)
+from xknx.telegram import GroupAddress, IndividualAddress
 
 
 class TestKeyRing:
@@ -41,6 +48,73 @@ class TestKeyRing:
         assert device is not None
         assert device.decrypted_authentication == "authenticationcode"
 
+    def test_keyring_lookups(self):
+        """Test indexed lookups of keyring items."""
+        keyring: Keyring = load_key_ring(self.keyring_test_file, "pwd")
+        interface = keyring.get_interface_by_individual_address(
+            IndividualAddress("1.1.1")
+        )
+        assert interface is keyring.get_interface_by_user_id(6)
+        assert [assigned_ga.address for assigned_ga in interface.group_addresses] == [
+            GroupAddress("1/1/1")
+        ]
+        assert keyring.get_interface_by_user_id(5).group_addresses == []
+        assert keyring.get_interface_by_user_id(1) is None
+        # interfaces without password are not added
+        assert (
+            keyring.get_interface_by_individual_address(IndividualAddress("1.1.12"))
+            is None
+        )
+
+        device = keyring.get_device_by_individual_address(IndividualAddress("1.1.0"))
+        assert device is keyring.get_device_by_interface(interface)
+        assert (
+            keyring.get_device_by_individual_address(IndividualAddress("9.9.9")) is None
+        )
+
+        assert keyring.get_group_address(GroupAddress("1/1/1")).key == (
+            "iA2KpI19ZlW0jseoXSycAg=="
+        )
+        assert keyring.get_group_address(GroupAddress("1/1/2")) is None
+
+    def test_lazy_decryption(self):
+        """Test secrets are decrypted when accessed."""
+        with patch(
+            "xknx.secure.keyring.decrypt_aes128cbc", wraps=decrypt_aes128cbc
+        ) as decrypt_mock:
+            keyring: Keyring = load_key_ring(self.testcase_file, "password")
+            decrypt_mock.assert_not_called()
+
+            interface = keyring.get_interface_by_user_id(4)
+            assert interface.decrypted_password == "user2"
+            assert decrypt_mock.call_count == 1
+            # decrypted value is cached
+            assert interface.decrypted_password == "user2"
+            assert decrypt_mock.call_count == 1
+
+            device = keyring.get_device_by_interface(interface)
+            assert device.decrypted_authentication == "authenticationcode"
+            assert decrypt_mock.call_count == 2
+
+    def test_lazy_decryption_wrong_password(self):
+        """Test decrypting secrets with a wrong password raises."""
+        keyring: Keyring = load_key_ring(self.testcase_file, "password")
+        keyring.decrypt("wrong_password")
+        with pytest.raises(InvalidSecureConfiguration):
+            _ = keyring.get_interface_by_user_id(3).decrypted_password
+
+    def test_lazy_decryption_invalid_data(self):
+        """Test decrypting invalid attribute data raises."""
+        keyring: Keyring = load_key_ring(self.testcase_file, "password")
+        device = keyring.devices[0]
+        device.tool_key = "not base64"
+        with pytest.raises(InvalidSecureConfiguration):
+            _ = device.decrypted_tool_key
+        # valid base64 but not a multiple of the AES block size
+        device.authentication = "AAAA"
+        with pytest.raises(InvalidSecureConfiguration):
+            _ = device.decrypted_authentication
+
     def test_verify_signature(self):
         """Test signature verification."""
         assert verify_keyring_signature(self.keyring_test_file, "pwd")
@@ -1,7 +1,16 @@
 """Tests for secure util primitives."""
+from unittest.mock import patch
+
 import pytest
 
-from xknx.secure.util import byte_pad, bytes_xor, sha256_hash
+from xknx.secure import util
+from xknx.secure.util import (
+    async_derive_key,
+    byte_pad,
+    bytes_xor,
+    derive_key,
+    sha256_hash,
+)
 
 
 @pytest.mark.parametrize(
@@ -82,3 +91,36 @@ def test_sha256_hash():
         "28 94 26 c2 91 25 35 ba 98 27 9a 4d 18 43 c4 87"
         "7f 6d 2d c3 7e 40 dc 4b eb fe 40 31 d4 73 3b 30"
     )
+
+
+def test_derive_key_cache():
+    """Test derived keys are cached by password and salt."""
+    # user password from example in KNX specification AN159v06
+    expected_key = bytes.fromhex("03 fc ed b6 66 60 25 1e c8 1a 1a 71 69 01 69 6a")
+    with patch.dict(util._derived_key_cache, clear=True):
+        assert derive_key(b"secret", salt=b"user-password.1.secure.ip.knx.org") == (
+            expected_key
+        )
+        assert len(util._derived_key_cache) == 1
+        # password is not stored in the cache
+        assert b"secret" not in b"".join(util._derived_key_cache)
+
+        with patch("xknx.secure.util.PBKDF2HMAC") as kdf_mock:
+            assert (
+                derive_key(b"secret", salt=b"user-password.1.secure.ip.knx.org")
+                == expected_key
+            )
+            kdf_mock.assert_not_called()
+            derive_key(b"secret", salt=b"other-salt")
+            kdf_mock.assert_called_once()
+
+
+async def test_async_derive_key():
+    """Test deriving keys in an executor."""
+    salt = b"user-password.1.secure.ip.knx.org"
+    with patch.dict(util._derived_key_cache, clear=True):
+        key = await async_derive_key(b"secret", salt=salt)
+        assert key == derive_key(b"secret", salt=salt)
+        with patch("asyncio.BaseEventLoop.run_in_executor") as executor_mock:
+            assert await async_derive_key(b"secret", salt=salt) == key
+            executor_mock.assert_not_called()
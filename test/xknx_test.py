@@ -1,4 +1,5 @@
 """Unit test for XKNX Module."""
+import logging
 import os
 from unittest.mock import AsyncMock, patch
 
@@ -7,17 +8,60 @@ import pytest
 from xknx import XKNX
 from xknx.exceptions import CommunicationError
 from xknx.io import ConnectionConfig, ConnectionType
+from xknx.io.util import LazyHex
+from xknx.xknx import LOG_NAMESPACES
 
 
 class TestXknxModule:
     """Test class for XKNX."""
 
+    @staticmethod
+    def _remove_log_handlers(log_directory: str) -> None:
+        """Close and remove the file handlers added by XKNX."""
+        for log_namespace in LOG_NAMESPACES:
+            _logger = logging.getLogger(log_namespace)
+            for handler in list(_logger.handlers):
+                if getattr(handler, "baseFilename", "").startswith(log_directory):
+                    handler.close()
+                    _logger.removeHandler(handler)
+
     def test_log_to_file(self):
         """Test logging enable."""
-        XKNX(log_directory="/tmp/")
+        xknx = XKNX(log_directory="/tmp/")
         assert os.path.isfile("/tmp/xknx.log")
+        assert xknx.log_listener is None
+        self._remove_log_handlers("/tmp/")
         os.remove("/tmp/xknx.log")
 
+    async def test_log_to_file_queued(self, tmp_path):
+        """Test logging to file from a background thread."""
+        xknx = XKNX(log_directory=str(tmp_path), log_queued=True)
+        listener = xknx.log_listener
+        xknx_logger = logging.getLogger("xknx.raw_socket")
+        assert listener.queue_handler in xknx_logger.handlers
+        xknx_logger.setLevel(logging.DEBUG)
+        xknx_logger.debug("Received: %s", LazyHex(b"\x06\x10"))
+
+        await xknx.stop()
+        # queued records are written when stopped; then the file handler is used directly
+        assert listener._thread is None
+        assert listener.queue_handler not in xknx_logger.handlers
+        assert listener.handlers[0] in xknx_logger.handlers
+        log = (tmp_path / "xknx.log").read_text(encoding="utf-8")
+        assert "| xknx.raw_socket | DEBUG | Received: 0610" in log
+        xknx_logger.debug("Stopped")
+        assert "| DEBUG | Stopped" in (tmp_path / "xknx.log").read_text(
+            encoding="utf-8"
+        )
+
+        listener.start()
+        listener.start()
+        assert listener.queue_handler in xknx_logger.handlers
+        listener.stop()
+        listener.stop()
+        xknx_logger.setLevel(logging.NOTSET)
+        self._remove_log_handlers(str(tmp_path))
+
     def test_log_to_file_when_dir_does_not_exist(self):
         """Test logging enable with non existent directory."""
         XKNX(log_directory="/xknx/is/fun")
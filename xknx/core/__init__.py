@@ -2,8 +2,15 @@
 # flake8: noqa
 from .connection_manager import ConnectionManager
 from .connection_state import XknxConnectionState
+from .group_address_state_table import GroupAddressStateTable
+from .group_read_table import GroupReadTable
+from .outgoing_journal import OutgoingJournal
 from .payload_reader import PayloadReader
+from .request_correlator import RequestCorrelator
+from .state_snapshot import StateSnapshot
 from .state_updater import StateUpdater
 from .task_registry import Task, TaskRegistry
 from .telegram_queue import TelegramQueue
+from .telegram_stream import StreamOverflow, TelegramStream
+from .timer_service import Timer, TimerService
 from .value_reader import ValueReader
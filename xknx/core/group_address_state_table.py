@@ -0,0 +1,190 @@
+"""
+Module for keeping the last state of every group address in one buffer.
+
+The GroupAddressStateTable holds a fixed size record for each of the 65536
+group addresses in a single contiguous buffer - the record of a group address
+is at offset `group_address.raw * RECORD_SIZE`. It is updated by TelegramQueue
+with every processed GroupValueWrite and GroupValueResponse (incoming and
+outgoing), including group addresses not used by any device.
+
+Record format (little endian, 32 bytes):
+* timestamp: unix time of the last update (float64)
+* updates: number of updates (uint32) - 0 if no value was received
+* source: raw individual address of the sender (uint16)
+* payload type: 1: DPTBinary, 2: DPTArray (uint8)
+* payload length (uint8)
+* payload: up to 16 bytes, zero padded
+
+`buffer` exposes the table as read-only memoryview without copying - eg. for
+`numpy.frombuffer()` with a structured dtype of RECORD_FORMAT. The buffer can be
+placed in `multiprocessing.shared_memory` so other local processes can read the
+current state of the bus by attaching to it by name. Records are not written
+atomically - readers in other processes may observe a record being written.
+"""
+from __future__ import annotations
+
+import logging
+from multiprocessing import shared_memory
+import struct
+import time
+from typing import Iterator, NamedTuple, cast
+
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.telegram import GroupAddress, IndividualAddress, Telegram
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
+
+logger = logging.getLogger("xknx.log")
+
+GROUP_ADDRESS_COUNT = 1 << 16
+RECORD_FORMAT = "<dIHBB16s"
+_RECORD = struct.Struct(RECORD_FORMAT)
+RECORD_SIZE = _RECORD.size
+TABLE_SIZE = RECORD_SIZE * GROUP_ADDRESS_COUNT
+MAX_PAYLOAD_LENGTH = 16
+# offset of the update counter within a record
+_UPDATES = struct.Struct("<I")
+_UPDATES_OFFSET = 8
+
+PAYLOAD_TYPE_BINARY = 1
+PAYLOAD_TYPE_ARRAY = 2
+
+
+class GroupAddressState(NamedTuple):
+    """Last state of a group address."""
+
+    payload: DPTArray | DPTBinary
+    timestamp: float
+    source_address: IndividualAddress
+    updates: int
+
+
+class GroupAddressStateTable:
+    """
+    Class for the last payload of all group addresses in a contiguous buffer.
+
+    Handles:
+    * shared_memory_name: Create the buffer in shared memory with this name.
+        The shared memory is unlinked on `close()`.
+
+    Telemetry:
+    * oversized: number of payloads not stored because they exceed MAX_PAYLOAD_LENGTH.
+    """
+
+    def __init__(self, shared_memory_name: str | None = None) -> None:
+        """Initialize GroupAddressStateTable class."""
+        self.oversized = 0
+        self._shared_memory: shared_memory.SharedMemory | None = None
+        self._buffer: memoryview
+        if shared_memory_name is None:
+            self._buffer = memoryview(bytearray(TABLE_SIZE))
+        else:
+            self._shared_memory = shared_memory.SharedMemory(
+                name=shared_memory_name, create=True, size=TABLE_SIZE
+            )
+            # size of the shared memory may be rounded up to pages
+            self._buffer = cast(memoryview, self._shared_memory.buf)[:TABLE_SIZE]
+            self._buffer[:] = bytes(TABLE_SIZE)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return number of group addresses with a value."""
+        return self._count
+
+    @property
+    def buffer(self) -> memoryview:
+        """Return the table as read-only memoryview."""
+        return self._buffer.toreadonly()
+
+    @property
+    def shared_memory_name(self) -> str | None:
+        """Return the name of the shared memory holding the table."""
+        return self._shared_memory.name if self._shared_memory is not None else None
+
+    def update(self, telegram: Telegram) -> None:
+        """Store the payload of a GroupValueWrite or GroupValueResponse."""
+        if not isinstance(telegram.destination_address, GroupAddress) or not isinstance(
+            telegram.payload, (GroupValueWrite, GroupValueResponse)
+        ):
+            return
+        payload = telegram.payload.value
+        if isinstance(payload, DPTBinary):
+            payload_type = PAYLOAD_TYPE_BINARY
+            raw = bytes((payload.value,))
+        elif isinstance(payload, DPTArray):
+            payload_type = PAYLOAD_TYPE_ARRAY
+            raw = bytes(payload.value)
+            if len(raw) > MAX_PAYLOAD_LENGTH:
+                self.oversized += 1
+                return
+        else:
+            return
+        offset = telegram.destination_address.raw * RECORD_SIZE
+        (updates,) = _UPDATES.unpack_from(self._buffer, offset + _UPDATES_OFFSET)
+        if not updates:
+            self._count += 1
+        _RECORD.pack_into(
+            self._buffer,
+            offset,
+            time.time(),
+            updates % 0xFFFFFFFF + 1,
+            telegram.source_address.raw if telegram.source_address else 0,
+            payload_type,
+            len(raw),
+            raw,
+        )
+
+    def get(self, group_address: GroupAddress) -> GroupAddressState | None:
+        """Return the last state of `group_address` or None if none was received."""
+        return self._unpack(
+            _RECORD.unpack_from(self._buffer, group_address.raw * RECORD_SIZE)
+        )
+
+    def items(self) -> Iterator[tuple[GroupAddress, GroupAddressState]]:
+        """Iterate group addresses with a value and their state."""
+        for raw_address, record in enumerate(_RECORD.iter_unpack(self._buffer)):
+            if (state := self._unpack(record)) is not None:
+                yield GroupAddress(raw_address), state
+
+    @staticmethod
+    def _unpack(
+        record: tuple[float, int, int, int, int, bytes]
+    ) -> GroupAddressState | None:
+        """Return the GroupAddressState of an unpacked record."""
+        timestamp, updates, source, payload_type, length, raw = record
+        if not updates:
+            return None
+        return GroupAddressState(
+            payload=DPTBinary(raw[0])
+            if payload_type == PAYLOAD_TYPE_BINARY
+            else DPTArray(raw[:length]),
+            timestamp=timestamp,
+            source_address=IndividualAddress(source),
+            updates=updates,
+        )
+
+    def clear(self) -> None:
+        """Remove all states."""
+        self._buffer[:] = bytes(TABLE_SIZE)
+        self._count = 0
+
+    def close(self) -> None:
+        """
+        Release and unlink the shared memory.
+
+        Views of `buffer` - and objects using them like numpy arrays - have to be
+        released before. Otherwise BufferError is raised and the table stays usable.
+        """
+        if self._shared_memory is None:
+            return
+        _mmap = self._buffer.obj
+        self._buffer.release()
+        try:
+            self._shared_memory.close()
+        except BufferError:
+            # the mapping is still open while views of it exist
+            self._buffer = memoryview(_mmap)[:TABLE_SIZE]
+            raise
+        self._shared_memory.unlink()
+        self._shared_memory = None
+        self._buffer = memoryview(bytearray(TABLE_SIZE))
+        self._count = 0
@@ -0,0 +1,91 @@
+"""
+Module for sharing GroupValueReads of the same group address.
+
+When a group address is read while a read of it is already in flight (eg. by
+multiple RemoteValues sharing a state address or by `Device.sync()` overlapping
+with the StateUpdater) no additional GroupValueRead is sent. All readers await
+the result of the first read - the first GroupValueResponse or GroupValueWrite
+received for the group address.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from xknx.telegram import Telegram
+from xknx.telegram.address import GroupAddress, InternalGroupAddress
+
+from .value_reader import ValueReader
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+logger = logging.getLogger("xknx.log")
+
+
+class GroupReadTable:
+    """
+    Class for de-duplicating concurrent reads of group addresses.
+
+    Telemetry:
+    * reads_sent: number of GroupValueReads sent.
+    * reads_saved: number of reads that joined a read in flight instead of sending.
+    """
+
+    def __init__(self, xknx: XKNX) -> None:
+        """Initialize GroupReadTable class."""
+        self.xknx = xknx
+        self.reads_sent = 0
+        self.reads_saved = 0
+        self._in_flight: dict[
+            GroupAddress | InternalGroupAddress, asyncio.Task[Telegram | None]
+        ] = {}
+
+    def in_flight(self, group_address: GroupAddress | InternalGroupAddress) -> bool:
+        """Return if a read of `group_address` is in flight."""
+        return group_address in self._in_flight
+
+    async def read(
+        self,
+        group_address: GroupAddress | InternalGroupAddress,
+        timeout_in_seconds: float = 2.0,
+    ) -> Telegram | None:
+        """
+        Read `group_address` and return the received telegram or None on timeout.
+
+        Joins a read in flight - its timeout applies.
+        """
+        if (task := self._in_flight.get(group_address)) is None:
+            task = self._in_flight[group_address] = asyncio.create_task(
+                self._read(group_address, timeout_in_seconds)
+            )
+            self.reads_sent += 1
+        else:
+            self.reads_saved += 1
+            logger.debug("Joining GroupValueRead in flight for %s", group_address)
+        # shield so cancelling one reader doesn't cancel the read of the others
+        return await asyncio.shield(task)
+
+    async def _read(
+        self,
+        group_address: GroupAddress | InternalGroupAddress,
+        timeout_in_seconds: float,
+    ) -> Telegram | None:
+        """Send GroupValueRead and wait for the response."""
+        try:
+            return await ValueReader(
+                self.xknx, group_address, timeout_in_seconds=timeout_in_seconds
+            ).read()
+        finally:
+            del self._in_flight[group_address]
+
+    async def send_group_read(
+        self, group_address: GroupAddress | InternalGroupAddress
+    ) -> None:
+        """Send a GroupValueRead without waiting for the response unless a read is in flight."""
+        if group_address in self._in_flight:
+            self.reads_saved += 1
+            return
+        self.reads_sent += 1
+        await ValueReader(self.xknx, group_address).send_group_read()
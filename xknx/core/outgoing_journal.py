@@ -0,0 +1,124 @@
+"""
+Module for holding back outgoing telegrams while the connection is lost.
+
+If an OutgoingJournal is set to `TelegramQueue.journal` and the connection to
+the KNX bus is lost after it was established, outgoing telegrams are recorded
+in the journal instead of being sent. Writes to
+the same group address replace each other - only the latest value is sent.
+When the connection is restored, telegrams that did not expire are flushed
+in the order they were recorded.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from typing import Hashable, NamedTuple
+
+from xknx.telegram import GroupAddress, Telegram
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
+
+logger = logging.getLogger("xknx.log")
+
+DEFAULT_JOURNAL_TTL = 10.0
+
+
+class _JournalEntry(NamedTuple):
+    """Telegram recorded in the OutgoingJournal."""
+
+    telegram: Telegram
+    deadline: float
+
+
+class OutgoingJournal:
+    """
+    Class for recording outgoing telegrams during connection outages.
+
+    Handles:
+    * ttl: Seconds a telegram stays valid after it was recorded.
+    * ttl_overrides: Group addresses with a different ttl.
+    * coalesce: Keep only the latest GroupValueWrite and GroupValueResponse
+        per group address.
+
+    Telemetry:
+    * expired: number of telegrams dropped because their ttl elapsed.
+    * coalesced: number of telegrams replaced by a newer telegram to the same group address.
+    * replayed: number of telegrams flushed after the connection was restored.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_JOURNAL_TTL,
+        ttl_overrides: dict[GroupAddress, float] | None = None,
+        coalesce: bool = True,
+    ) -> None:
+        """Initialize OutgoingJournal class."""
+        self.ttl = ttl
+        self.ttl_overrides = ttl_overrides or {}
+        self.coalesce = coalesce
+        self.expired = 0
+        self.coalesced = 0
+        self.replayed = 0
+        # dicts keep insertion order - coalesced entries are moved to the end
+        self._entries: dict[Hashable, _JournalEntry] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        """Return number of recorded telegrams."""
+        return len(self._entries)
+
+    def _key(self, telegram: Telegram) -> Hashable:
+        """Return the key for coalescing telegrams. Unique if not coalescable."""
+        if (
+            self.coalesce
+            and isinstance(telegram.destination_address, GroupAddress)
+            and isinstance(telegram.payload, (GroupValueWrite, GroupValueResponse))
+        ):
+            return telegram.destination_address
+        return next(self._counter)
+
+    def add(self, telegram: Telegram, queued: float | None = None) -> None:
+        """
+        Record an outgoing telegram.
+
+        `queued` is the loop time the telegram was queued to be sent - defaults to now.
+        """
+        ttl = (
+            self.ttl_overrides.get(telegram.destination_address, self.ttl)
+            if isinstance(telegram.destination_address, GroupAddress)
+            else self.ttl
+        )
+        if queued is None:
+            queued = asyncio.get_running_loop().time()
+        deadline = queued + ttl
+        key = self._key(telegram)
+        if (existing := self._entries.get(key)) is not None:
+            self.coalesced += 1
+            if existing.deadline > deadline:
+                # a newer telegram was already recorded
+                return
+            del self._entries[key]
+        self._entries[key] = _JournalEntry(telegram, deadline)
+
+    def flush(self) -> list[Telegram]:
+        """Return recorded telegrams that did not expire and clear the journal."""
+        now = asyncio.get_running_loop().time()
+        telegrams = []
+        for entry in self._entries.values():
+            if entry.deadline < now:
+                self.expired += 1
+                logger.warning(
+                    "Dropping telegram recorded while the connection was lost: %s",
+                    entry.telegram,
+                )
+                continue
+            telegrams.append(entry.telegram)
+        self._entries.clear()
+        self.replayed += len(telegrams)
+        return telegrams
+
+    def clear(self) -> None:
+        """Drop all recorded telegrams."""
+        if self._entries:
+            logger.debug("Dropping %s recorded telegrams", len(self._entries))
+        self._entries.clear()
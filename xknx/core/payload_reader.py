@@ -2,14 +2,13 @@
 Module for sending and receiving arbitrary payloads from the KNX bus.
 
 The module will
+* ... register a pending request for the address and response type in the RequestCorrelator.
 * ... send the payload to the selected address.
-* ... register a callback for receiving telegrams within telegram queue.
-* ... check if received telegrams have the correct type and address.
-* ... store the received telegram for further processing.
+* ... wait until the RequestCorrelator resolves the request with a received telegram.
+* ... store the received payload for further processing.
 """
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -34,15 +33,9 @@ class PayloadReader:
         """Initialize PayloadReader class."""
         self.xknx = xknx
         self.address = address
-        self.response_received_event = asyncio.Event()
         self.timeout_in_seconds = timeout_in_seconds
         self.received_payload: APCI | None = None
 
-    def reset(self) -> None:
-        """Reset reader for next send."""
-        self.response_received_event = asyncio.Event()
-        self.received_payload = None
-
     async def send(
         self, payload: APCI, response_class: type[APCI] | None = None
     ) -> APCI | None:
@@ -52,31 +45,25 @@ class PayloadReader:
         An optional `response_class` can be specified to wait for a specific
         APCI response payload.
         """
-        self.reset()
-
-        cb_obj = self.xknx.telegram_queue.register_telegram_received_cb(
-            lambda t: self.telegram_received(t, response_class)
+        self.received_payload = None
+        response = self.xknx.request_correlator.expect_response(
+            self.address, response_class, self.timeout_in_seconds
         )
-        await self.send_telegram(payload)
-
         try:
-            await asyncio.wait_for(
-                self.response_received_event.wait(),
-                timeout=self.timeout_in_seconds,
-            )
-        except asyncio.TimeoutError:
+            await self.send_telegram(payload)
+            telegram = await response
+        finally:
+            # cleanup to not leave the request pending (for asyncio.CancelledError)
+            response.cancel()
+        if telegram is None:
             logger.warning(
                 "Error: KNX bus did not respond in time (%s secs) to payload request for: %s",
                 self.timeout_in_seconds,
                 self.address,
             )
-        else:
-            return self.received_payload
-        finally:
-            # cleanup to not leave callbacks (for asyncio.CancelledError)
-            self.xknx.telegram_queue.unregister_telegram_received_cb(cb_obj)
-
-        return None
+            return None
+        self.received_payload = telegram.payload
+        return self.received_payload
 
     async def send_telegram(self, payload: APCI) -> None:
         """Send the telegram."""
@@ -87,17 +74,3 @@ class PayloadReader:
                 source_address=self.xknx.current_address,
             )
         )
-
-    async def telegram_received(
-        self, telegram: Telegram, response_class: type[APCI] | None = None
-    ) -> None:
-        """Test if telegram is of correct type and address, then trigger event."""
-        if self.address != telegram.source_address:
-            return
-        if not isinstance(telegram.payload, APCI):
-            return
-        if response_class:
-            if not isinstance(telegram.payload, response_class):
-                return
-        self.received_payload = telegram.payload
-        self.response_received_event.set()
@@ -0,0 +1,157 @@
+"""
+Module for correlating requests sent to the KNX bus with their responses.
+
+Requests register a future before they are sent:
+* group reads are keyed by destination group address and resolved by the next
+    GroupValueResponse or GroupValueWrite to it (incoming or outgoing).
+* management requests are keyed by the individual address of the device and
+    the expected APCI response class and resolved by the next incoming telegram
+    from this device with a matching payload.
+
+TelegramQueue passes every processed telegram to `process()` which looks up
+pending futures by key instead of offering the telegram to a callback per request.
+Timeouts of all requests are driven by a single timer of the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+import heapq
+import itertools
+import logging
+from typing import Hashable
+
+from xknx.telegram import Telegram, TelegramDirection
+from xknx.telegram.address import GroupAddress, IndividualAddress, InternalGroupAddress
+from xknx.telegram.apci import APCI, GroupValueResponse, GroupValueWrite
+
+logger = logging.getLogger("xknx.log")
+
+
+class RequestCorrelator:
+    """
+    Class for resolving pending requests by received telegrams.
+
+    Futures resolve to the matching Telegram or None if the timeout elapsed.
+    Cancelled futures are removed from the table.
+    """
+
+    def __init__(self) -> None:
+        """Initialize RequestCorrelator class."""
+        self._group_reads: dict[Hashable, list[asyncio.Future[Telegram | None]]] = {}
+        self._responses: dict[Hashable, list[asyncio.Future[Telegram | None]]] = {}
+        # deadline, sequence number as tie-breaker, future
+        self._timeouts: list[tuple[float, int, asyncio.Future[Telegram | None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def pending(self) -> int:
+        """Return number of pending requests."""
+        return sum(map(len, self._group_reads.values())) + sum(
+            map(len, self._responses.values())
+        )
+
+    def expect_group_response(
+        self,
+        group_address: GroupAddress | InternalGroupAddress,
+        timeout_in_seconds: float,
+    ) -> asyncio.Future[Telegram | None]:
+        """Return a future resolved by the next GroupValueResponse or GroupValueWrite."""
+        return self._add(self._group_reads, group_address, timeout_in_seconds)
+
+    def expect_response(
+        self,
+        address: GroupAddress | IndividualAddress,
+        response_class: type[APCI] | None,
+        timeout_in_seconds: float,
+    ) -> asyncio.Future[Telegram | None]:
+        """
+        Return a future resolved by the next incoming telegram from `address`.
+
+        If `response_class` is given, only telegrams with this payload type match.
+        """
+        return self._add(self._responses, (address, response_class), timeout_in_seconds)
+
+    def process(self, telegram: Telegram) -> None:
+        """Resolve requests waiting for `telegram`."""
+        if self._group_reads and isinstance(
+            telegram.payload, (GroupValueResponse, GroupValueWrite)
+        ):
+            self._resolve(
+                self._group_reads.pop(telegram.destination_address, None), telegram
+            )
+        if self._responses and telegram.direction is TelegramDirection.INCOMING:
+            source = telegram.source_address
+            self._resolve(self._responses.pop((source, None), None), telegram)
+            for response_class in type(telegram.payload).__mro__:
+                self._resolve(
+                    self._responses.pop((source, response_class), None), telegram
+                )
+
+    @staticmethod
+    def _resolve(
+        futures: list[asyncio.Future[Telegram | None]] | None, telegram: Telegram
+    ) -> None:
+        """Set the result of pending futures."""
+        if futures:
+            for future in futures:
+                if not future.done():
+                    future.set_result(telegram)
+
+    def _add(
+        self,
+        table: dict[Hashable, list[asyncio.Future[Telegram | None]]],
+        key: Hashable,
+        timeout_in_seconds: float,
+    ) -> asyncio.Future[Telegram | None]:
+        """Add a future to `table` and schedule its timeout."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Telegram | None] = loop.create_future()
+        table.setdefault(key, []).append(future)
+        future.add_done_callback(partial(self._discard, table, key))
+
+        deadline = loop.time() + timeout_in_seconds
+        heapq.heappush(self._timeouts, (deadline, next(self._sequence), future))
+        if self._timer is None or deadline < self._timer.when():
+            self._schedule_timer()
+        return future
+
+    @staticmethod
+    def _discard(
+        table: dict[Hashable, list[asyncio.Future[Telegram | None]]],
+        key: Hashable,
+        future: asyncio.Future[Telegram | None],
+    ) -> None:
+        """Remove a done future from the table. Future done callback."""
+        futures = table.get(key)
+        if futures and future in futures:
+            futures.remove(future)
+            if not futures:
+                del table[key]
+
+    def _schedule_timer(self) -> None:
+        """Set the timer to the earliest deadline of a pending future."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        timeouts = self._timeouts
+        while timeouts and timeouts[0][2].done():
+            heapq.heappop(timeouts)
+        if timeouts:
+            deadline = timeouts[0][0]
+            self._timer = asyncio.get_running_loop().call_at(
+                deadline, self._expire, deadline
+            )
+
+    def _expire(self, deadline: float) -> None:
+        """Resolve futures whose deadline passed with None. Timer callback."""
+        self._timer = None
+        # the loop may run timers up to its clock resolution early
+        now = max(asyncio.get_running_loop().time(), deadline)
+        timeouts = self._timeouts
+        while timeouts and timeouts[0][0] <= now:
+            future = heapq.heappop(timeouts)[2]
+            if not future.done():
+                future.set_result(None)
+        self._schedule_timer()
@@ -0,0 +1,260 @@
+"""
+Module for persisting the last state of group addresses for warm restarts.
+
+The StateSnapshot records the payload and time of the last GroupValueWrite or
+GroupValueResponse of every group address (incoming and outgoing). It is saved
+periodically to a compact binary file. The file is replaced atomically so a crash
+while saving never leaves a corrupt snapshot.
+
+When XKNX is started, values of the snapshot are restored into the RemoteValues
+of all devices before connecting. The StateUpdater doesn't read restored values
+younger than the update interval of their tracker when it is started.
+
+File format (big endian):
+* header: magic `XKNXSNP\\x00`, version (uint16), number of entries (uint32)
+* entries: group address (uint16), unix timestamp (float64),
+    payload type (uint8, 0: DPTBinary, 1: DPTArray), payload length (uint8), payload
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import logging
+import os
+import struct
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from xknx.dpt import DPTArray, DPTBinary
+from xknx.exceptions import XKNXException
+from xknx.telegram import GroupAddress, Telegram, TelegramDirection
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
+
+if TYPE_CHECKING:
+    from xknx.core.telegram_queue import TelegramQueue
+    from xknx.remote_value import RemoteValue
+    from xknx.xknx import XKNX
+
+logger = logging.getLogger("xknx.log")
+
+DEFAULT_SNAPSHOT_SAVE_INTERVAL = 60
+
+SNAPSHOT_MAGIC = b"XKNXSNP\x00"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct(">8sHI")
+_ENTRY = struct.Struct(">HdBB")
+_PAYLOAD_BINARY = 0
+_PAYLOAD_ARRAY = 1
+
+
+class SnapshotEntry(NamedTuple):
+    """Last payload of a group address."""
+
+    timestamp: float
+    payload: DPTArray | DPTBinary
+
+
+def encode_snapshot(entries: dict[GroupAddress, SnapshotEntry]) -> bytes:
+    """Return the binary representation of snapshot entries."""
+    parts = [_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(entries))]
+    for group_address, (timestamp, payload) in entries.items():
+        if isinstance(payload, DPTBinary):
+            raw = bytes((payload.value,))
+            payload_type = _PAYLOAD_BINARY
+        else:
+            raw = bytes(payload.value)
+            payload_type = _PAYLOAD_ARRAY
+        parts.append(
+            _ENTRY.pack(group_address.raw, timestamp, payload_type, len(raw)) + raw
+        )
+    return b"".join(parts)
+
+
+def decode_snapshot(data: bytes) -> dict[GroupAddress, SnapshotEntry]:
+    """Return snapshot entries decoded from `data`."""
+    try:
+        magic, version, count = _HEADER.unpack_from(data)
+    except struct.error as err:
+        raise XKNXException("Invalid snapshot: header too short") from err
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        raise XKNXException("Invalid snapshot: unsupported format")
+    entries: dict[GroupAddress, SnapshotEntry] = {}
+    offset = _HEADER.size
+    for _ in range(count):
+        try:
+            raw_address, timestamp, payload_type, length = _ENTRY.unpack_from(
+                data, offset
+            )
+        except struct.error as err:
+            raise XKNXException("Invalid snapshot: truncated") from err
+        offset += _ENTRY.size
+        raw = data[offset : offset + length]
+        if len(raw) != length:
+            raise XKNXException("Invalid snapshot: truncated")
+        offset += length
+        payload = (
+            DPTBinary(raw[0]) if payload_type == _PAYLOAD_BINARY else DPTArray(raw)
+        )
+        entries[GroupAddress(raw_address)] = SnapshotEntry(timestamp, payload)
+    return entries
+
+
+class StateSnapshot:
+    """
+    Class for saving and restoring the state of group addresses.
+
+    Handles:
+    * path: File the snapshot is saved to and restored from.
+    * save_interval: Seconds between saves. Unchanged snapshots are not saved.
+
+    Telemetry:
+    * saves: number of times the snapshot was written to disk.
+    * restored: number of RemoteValues restored on the last start.
+    """
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        path: str | os.PathLike[str],
+        save_interval: float = DEFAULT_SNAPSHOT_SAVE_INTERVAL,
+    ) -> None:
+        """Initialize StateSnapshot class."""
+        self.xknx = xknx
+        self.path = os.fspath(path)
+        self.save_interval = save_interval
+        self.saves = 0
+        self.restored = 0
+        self._entries: dict[GroupAddress, SnapshotEntry] = {}
+        self._changed = False
+        self._callback: TelegramQueue.Callback | None = None
+
+    def __len__(self) -> int:
+        """Return number of group addresses in the snapshot."""
+        return len(self._entries)
+
+    def record(self, telegram: Telegram) -> None:
+        """Record the payload of a GroupValueWrite or GroupValueResponse."""
+        if (
+            isinstance(telegram.destination_address, GroupAddress)
+            and isinstance(telegram.payload, (GroupValueWrite, GroupValueResponse))
+            and telegram.payload.value is not None
+        ):
+            self._entries[telegram.destination_address] = SnapshotEntry(
+                time.time(), telegram.payload.value
+            )
+            self._changed = True
+
+    async def _telegram_received(self, telegram: Telegram) -> None:
+        """Record processed telegrams. Callback for TelegramQueue."""
+        self.record(telegram)
+
+    async def load(self) -> None:
+        """Load the snapshot from disk. Keeps recorded entries if there is none."""
+        try:
+            data = await asyncio.get_running_loop().run_in_executor(
+                None, self._read_file
+            )
+            entries = decode_snapshot(data)
+        except FileNotFoundError:
+            logger.debug("No state snapshot found at %s", self.path)
+            return
+        except (OSError, XKNXException) as err:
+            logger.warning("Could not load state snapshot %s: %s", self.path, err)
+            return
+        entries.update(self._entries)
+        self._entries = entries
+
+    def _read_file(self) -> bytes:
+        """Read the snapshot file. Executed in a thread."""
+        with open(self.path, "rb") as snapshot_file:
+            return snapshot_file.read()
+
+    async def save(self) -> None:
+        """Write the snapshot to disk if it changed."""
+        if not self._changed:
+            return
+        self._changed = False
+        data = encode_snapshot(self._entries)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_file, data
+            )
+        except OSError as err:
+            self._changed = True
+            logger.warning("Could not save state snapshot %s: %s", self.path, err)
+            return
+        self.saves += 1
+
+    def _write_file(self, data: bytes) -> None:
+        """Replace the snapshot file atomically. Executed in a thread."""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as snapshot_file:
+            snapshot_file.write(data)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temp_path, self.path)
+
+    def restore(self) -> None:
+        """Restore snapshot values into RemoteValues of all devices."""
+        remote_values: dict[GroupAddress, list[RemoteValue[Any, Any]]] = {}
+        for device in self.xknx.devices:
+            # pylint: disable=protected-access
+            for remote_value in device._iter_remote_values():
+                for group_address in (
+                    remote_value.group_address,
+                    remote_value.group_address_state,
+                    *remote_value.passive_group_addresses,
+                ):
+                    if isinstance(group_address, GroupAddress):
+                        remote_values.setdefault(group_address, []).append(remote_value)
+
+        now = time.time()
+        restored = set()
+        # oldest first so the latest value of RemoteValues with multiple addresses wins
+        for group_address, (timestamp, payload) in sorted(
+            self._entries.items(), key=lambda item: item[1].timestamp
+        ):
+            if group_address not in remote_values:
+                continue
+            telegram = Telegram(
+                destination_address=group_address,
+                direction=TelegramDirection.INCOMING,
+                payload=GroupValueResponse(payload),
+                source_address=None,
+            )
+            telegram.timestamp = datetime.fromtimestamp(timestamp)
+            for remote_value in remote_values[group_address]:
+                if remote_value.restore(telegram):
+                    self.xknx.state_updater.restored(
+                        remote_value, max(now - timestamp, 0)
+                    )
+                    restored.add(id(remote_value))
+        self.restored = len(restored)
+        logger.debug(
+            "Restored %s values from state snapshot %s", self.restored, self.path
+        )
+
+    async def _save_loop(self) -> None:
+        """Save the snapshot periodically. Endless loop."""
+        while True:
+            await asyncio.sleep(self.save_interval)
+            await self.save()
+
+    async def start(self) -> None:
+        """Load and restore the snapshot and start recording."""
+        await self.load()
+        self.restore()
+        self._callback = self.xknx.telegram_queue.register_telegram_received_cb(
+            self._telegram_received, match_for_outgoing=True
+        )
+        self.xknx.task_registry.register(
+            name="xknx.state_snapshot", async_func=self._save_loop
+        ).start()
+
+    async def stop(self) -> None:
+        """Stop recording and save the snapshot."""
+        self.xknx.task_registry.unregister("xknx.state_snapshot")
+        if self._callback is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(self._callback)
+            self._callback = None
+        await self.save()
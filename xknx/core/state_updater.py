@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from enum import Enum
+import heapq
+import itertools
 import logging
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, NamedTuple, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, NamedTuple, Union
 
 from xknx.core import XknxConnectionState
 from xknx.remote_value import RemoteValue
+from xknx.telegram.address import DeviceGroupAddress
 
 if TYPE_CHECKING:
     from xknx.xknx import XKNX
@@ -17,6 +21,24 @@ logger = logging.getLogger("xknx.state_updater")
 
 DEFAULT_UPDATE_INTERVAL = 60
 MAX_UPDATE_INTERVAL = 1440
+# percentage of the bus capacity used for reading initial states
+DEFAULT_INIT_BUS_LOAD = 30
+# approximate number of short telegrams a TP1 line can transmit per second
+BUS_TELEGRAMS_PER_SECOND = 40
+# log initialization progress in steps of this percentage
+INIT_PROGRESS_LOG_STEP = 10
+# reads slower than this are considered a sign of congestion
+DEFAULT_TARGET_READ_LATENCY = 1.0
+# more outgoing telegrams waiting than this are considered a sign of congestion
+DEFAULT_MAX_OUTGOING_QUEUE_DEPTH = 10
+# factor applied to the read concurrency limit on congestion
+READ_CONCURRENCY_DECREASE = 0.5
+# number of read concurrency limit changes kept in history
+READ_CONCURRENCY_HISTORY = 100
+# maximum time between reads of a group address not responding - 1 day
+DEFAULT_MAX_READ_BACKOFF = MAX_UPDATE_INTERVAL * 60
+# consecutive timeouts after which passive updates stop reading a group address
+PASSIVE_AFTER_TIMEOUTS = 2
 
 
 class TrackerOptions(NamedTuple):
@@ -29,20 +51,93 @@ class TrackerOptions(NamedTuple):
 TrackerOptionType = Union[bool, int, float, str, TrackerOptions]
 
 
+class DeadGroupAddress:
+    """
+    State group address that did not respond to GroupValueRead.
+
+    Telemetry:
+    * timeouts: consecutive reads without response.
+    * last_timeout: loop time of the last read without response.
+    * passive: updated by telegrams from the bus - not read anymore.
+    """
+
+    def __init__(self, group_address: DeviceGroupAddress) -> None:
+        """Initialize DeadGroupAddress class."""
+        self.group_address = group_address
+        self.timeouts = 0
+        self.last_timeout = 0.0
+        self.passive = False
+
+    def __repr__(self) -> str:
+        """Return object as readable string."""
+        return (
+            f'<DeadGroupAddress group_address="{self.group_address}" '
+            f'timeouts="{self.timeouts}" passive="{self.passive}" />'
+        )
+
+
+class InitProgress(NamedTuple):
+    """Progress of reading initial states."""
+
+    total: int
+    read: int
+    skipped: int
+    eta: float
+
+    @property
+    def remaining(self) -> int:
+        """Return number of values not yet processed."""
+        return self.total - self.read - self.skipped
+
+
 class StateUpdater:
-    """Class for keeping the states of RemoteValues up to date."""
+    """
+    Class for keeping the states of RemoteValues up to date.
+
+    Deadlines of all trackers are kept by a single scheduler. Due reads are
+    processed by a pool of read workers. The number of concurrent reads starts at
+    `parallel_reads` and is adapted between `min_parallel_reads` and
+    `max_parallel_reads` (see ReadConcurrency).
+
+    Initial states are read in a paced campaign when the connection is established:
+    * init_bus_load: Percentage of the bus capacity used for initial reads.
+        0 reads all values without pacing.
+    * init_priority: Callable returning a sort key for a RemoteValue. Values with
+        lower keys are read first. Registration order is kept by default.
+    Values updated by received telegrams during the campaign are skipped.
+
+    Group addresses not responding to reads are read with exponential back-off up
+    to `max_read_backoff` seconds. If they are still updated by telegrams from the
+    bus they are not read anymore. See `dead_group_addresses`.
+    """
 
     def __init__(
         self,
         xknx: XKNX,
         default_tracker_option: TrackerOptionType,
         parallel_reads: int = 2,
+        init_bus_load: float = DEFAULT_INIT_BUS_LOAD,
+        init_priority: Callable[[RemoteValue[Any, Any]], Any] | None = None,
+        min_parallel_reads: int = 1,
+        max_parallel_reads: int = 10,
+        max_read_backoff: float = DEFAULT_MAX_READ_BACKOFF,
     ):
         """Initialize StateUpdater class."""
         self.xknx = xknx
         self.started = False
+        self.init_bus_load = init_bus_load
+        self.init_priority = init_priority
         self._workers: dict[int, _StateTracker] = {}
-        self._semaphore = asyncio.Semaphore(value=parallel_reads)
+        self.read_concurrency = ReadConcurrency(
+            initial=parallel_reads,
+            minimum=min_parallel_reads,
+            maximum=max_parallel_reads,
+        )
+        self._scheduler = _ReadScheduler(
+            concurrency=self.read_concurrency,
+            outgoing_queue_depth=xknx.telegram_queue.outgoing_queue.qsize,
+        )
+        self._scheduler.max_read_backoff = max_read_backoff
 
         # used to determine if a RemoteValue shall register a tracker by default
         self.default_use_updater = bool(default_tracker_option)
@@ -130,25 +225,24 @@ class StateUpdater:
     ) -> None:
         """Register a RemoteValue to initialize its state and/or track for expiration."""
 
-        async def read_state_mutex() -> None:
-            """Schedule to read the state from the KNX bus - one at a time."""
-            async with self._semaphore:
-                # wait until there is nothing else to send to the bus
-                await self.xknx.telegram_queue.outgoing_queue.join()
-                logger.debug(
-                    "StateUpdater reading %s for %s - %s",
-                    remote_value.group_address_state,
-                    remote_value.device_name,
-                    remote_value.feature_name,
-                )
-                # shield from cancellation so update_received() don't cancel the
-                # ValueReader leaving the telegram_received_cb until next telegram
-                await asyncio.shield(remote_value.read_state(wait_for_result=True))
+        async def read_state() -> bool:
+            """Read the state from the KNX bus. Return if a response was received."""
+            logger.debug(
+                "StateUpdater reading %s for %s - %s",
+                remote_value.group_address_state,
+                remote_value.device_name,
+                remote_value.feature_name,
+            )
+            last_telegram = remote_value.telegram
+            await remote_value.read_state(wait_for_result=True)
+            return remote_value.telegram is not last_telegram
 
         tracker_options = self.parse_tracker_options(tracker_options, str(remote_value))
         tracker = _StateTracker(
-            read_state_awaitable=read_state_mutex,
+            remote_value=remote_value,
+            read_state_awaitable=read_state,
             tracker_options=tracker_options,
+            scheduler=self._scheduler,
         )
         self._workers[id(remote_value)] = tracker
 
@@ -170,11 +264,42 @@ class StateUpdater:
         if self.started and id(remote_value) in self._workers:
             self._workers[id(remote_value)].update_received()
 
+    def restored(self, remote_value: RemoteValue[Any, Any], age: float) -> None:
+        """
+        Set the age of a value restored from a state snapshot.
+
+        The next start doesn't read values younger than their update interval.
+        """
+        if (tracker := self._workers.get(id(remote_value))) is not None:
+            tracker.restored_at = self._scheduler.time() - age
+
+    @property
+    def dead_group_addresses(self) -> list[DeadGroupAddress]:
+        """Return state group addresses that did not respond to their last read."""
+        return list(self._scheduler.dead_group_addresses.values())
+
+    @property
+    def init_progress(self) -> InitProgress:
+        """Return progress of reading initial states."""
+        return self._scheduler.init_progress()
+
     def _start(self) -> None:
         """Start internal StateUpdater. Initialize states."""
         logger.debug("StateUpdater initializing values")
         self.started = True
-        for worker in self._workers.values():
+        self._scheduler.init_read_interval = (
+            # a read takes two telegrams - GroupValueRead and GroupValueResponse
+            2 / (BUS_TELEGRAMS_PER_SECOND * self.init_bus_load / 100)
+            if self.init_bus_load > 0
+            else 0
+        )
+        workers: Iterable[_StateTracker] = self._workers.values()
+        if self.init_priority is not None:
+            init_priority = self.init_priority
+            workers = sorted(
+                workers, key=lambda worker: init_priority(worker.remote_value)
+            )
+        for worker in workers:
             worker.start()
 
     def _stop(self) -> None:
@@ -183,6 +308,7 @@ class StateUpdater:
         self.started = False
         for worker in self._workers.values():
             worker.stop()
+        self._scheduler.stop()
 
     def start(self) -> None:
         """Start StateUpdater."""
@@ -221,52 +347,410 @@ class StateTrackerType(Enum):
     PERIODICALLY = 3
 
 
+class ReadConcurrency:
+    """
+    Adaptive limit for concurrent state reads (additive increase, multiplicative decrease).
+
+    The limit is increased by one after `limit` reads below `target_latency`. A timeout, a read slower than `target_latency` or more than
+    `max_queue_depth` telegrams waiting in the outgoing queue multiply the limit
+    by READ_CONCURRENCY_DECREASE - at most once per round of reads started before
+    the last decrease.
+
+    Telemetry:
+    * limit: current number of concurrent reads.
+    * history: (loop time, limit) for the last changes of the limit.
+    * reads: number of finished reads.
+    * timeouts: number of reads without response.
+    * latency: moving average of read latency in seconds.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 10,
+        target_latency: float = DEFAULT_TARGET_READ_LATENCY,
+        max_queue_depth: int = DEFAULT_MAX_OUTGOING_QUEUE_DEPTH,
+    ) -> None:
+        """Initialize ReadConcurrency class."""
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.target_latency = target_latency
+        self.max_queue_depth = max_queue_depth
+        self.history: deque[tuple[float, int]] = deque(maxlen=READ_CONCURRENCY_HISTORY)
+        self.reads = 0
+        self.timeouts = 0
+        self.latency = 0.0
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self._successes = 0
+        self._last_decrease = float("-inf")
+
+    @property
+    def timeout_rate(self) -> float:
+        """Return ratio of reads without response."""
+        return self.timeouts / self.reads if self.reads else 0.0
+
+    def read_finished(
+        self, started: float, now: float, success: bool, queue_depth: int
+    ) -> None:
+        """Adapt the limit to the result of a read."""
+        latency = now - started
+        self.latency = latency if not self.reads else 0.8 * self.latency + 0.2 * latency
+        self.reads += 1
+        if not success:
+            self.timeouts += 1
+        if (
+            not success
+            or latency > self.target_latency
+            or queue_depth > self.max_queue_depth
+        ):
+            if started >= self._last_decrease:
+                # reads started before the last decrease don't reflect the new limit
+                self._last_decrease = now
+                self._set_limit(
+                    max(self.minimum, int(self.limit * READ_CONCURRENCY_DECREASE)), now
+                )
+        else:
+            self._successes += 1
+            if self._successes >= self.limit:
+                self._set_limit(min(self.maximum, self.limit + 1), now)
+
+    def _set_limit(self, limit: int, now: float) -> None:
+        """Set the limit."""
+        self._successes = 0
+        if limit != self.limit:
+            self.limit = limit
+            logger.debug("StateUpdater read concurrency changed to %s", self.limit)
+            self.history.append((now, self.limit))
+
+
 class _StateTracker:
-    """Keeps track of the age of the state from one RemoteValue."""
+    """
+    Keeps track of the age of the state from one RemoteValue.
+
+    The tracker doesn't run a task on its own. Its initial read is queued in the
+    init campaign of a _ReadScheduler; following reads are deadlines processed by
+    the scheduler. `deadline` is None while no read is scheduled - when stopped,
+    finished (INIT), waiting for its initial read or while a read is in progress.
+    """
 
     def __init__(
         self,
-        read_state_awaitable: Callable[[], Awaitable[None]],
+        remote_value: RemoteValue[Any, Any],
+        read_state_awaitable: Callable[[], Awaitable[bool]],
         tracker_options: TrackerOptions,
+        scheduler: _ReadScheduler,
     ):
         """Initialize StateTracker class."""
+        self.remote_value = remote_value
         self.tracker_type = tracker_options.tracker_type
         self.update_interval = tracker_options.update_interval_min * 60
-        self._read_state = read_state_awaitable
-        self._task: asyncio.Task[None] | None = None
+        self.read_state = read_state_awaitable
+        self.deadline: float | None = None
+        # a state was read or received since start()
+        self.initialized = False
+        # incremented on start and stop to invalidate scheduled and running reads
+        self.generation = 0
+        # loop time a value restored from a state snapshot was received
+        self.restored_at: float | None = None
+        self._scheduler = scheduler
 
     def start(self) -> None:
-        """Start StateTracker - read state on call."""
+        """Start StateTracker - queue initial read unless a recent value was restored."""
         self.stop()
-        self._task = asyncio.create_task(self._start_init())
-
-    async def _start_init(self) -> None:
-        """Initialize state, start update loop if appropriate."""
-        await self._read_state()
-        if self.tracker_type is not StateTrackerType.INIT:
-            self.reset()
-
-    def reset(self) -> None:
-        """Start / Restart StateTracker timer - wait for value to expire."""
-        self.stop()
-        self._task = asyncio.create_task(self._update_loop())
+        self.initialized = False
+        if self.restored_at is not None:
+            age = self._scheduler.time() - self.restored_at
+            # a restored value is only valid for the first start
+            self.restored_at = None
+            if age < self.update_interval:
+                self.initialized = True
+                if self.tracker_type is not StateTrackerType.INIT:
+                    self._scheduler.schedule(self, self.update_interval - age)
+                return
+        self._scheduler.queue_initial_read(self)
 
     def stop(self) -> None:
         """Stop StateTracker."""
-        if self._task:
-            self._task.cancel()
-            self._task = None
+        self.generation += 1
+        self.deadline = None
+
+    def _dead_group_address(self) -> DeadGroupAddress | None:
+        """Return the DeadGroupAddress of the state address if it didn't respond."""
+        if (group_address := self.remote_value.group_address_state) is None:
+            return None
+        return self._scheduler.dead_group_addresses.get(group_address)
+
+    @property
+    def passive(self) -> bool:
+        """Return if the group address is only updated passively and not read."""
+        dead = self._dead_group_address()
+        return dead is not None and dead.passive
 
     def update_received(self) -> None:
-        """Reset the timer if a telegram was received for a "expire" typed StateUpdater."""
-        if self.tracker_type == StateTrackerType.EXPIRE:
-            self.reset()
-
-    async def _update_loop(self) -> None:
-        """Wait for the update_interval to expire. Endless loop for updating states."""
-        # for StateUpdaterType.EXPIRE:
-        #   on successfull read the while loop gets canceled when the callback calls update_received()
-        #   when no telegram was received it will try again endlessly
+        """Postpone the next read if a telegram was received."""
+        dead = self._dead_group_address()
+        if dead is not None and not dead.passive:
+            if dead.timeouts >= PASSIVE_AFTER_TIMEOUTS:
+                logger.info(
+                    "StateUpdater: %s doesn't respond to GroupValueRead but is updated by the bus - not reading it anymore",
+                    dead.group_address,
+                )
+                dead.passive = True
+        if not self.initialized:
+            # the initial read is skipped
+            self.initialized = True
+            if self.tracker_type is not StateTrackerType.INIT and not self.passive:
+                self._scheduler.schedule(self, self.update_interval)
+        elif self.tracker_type is StateTrackerType.EXPIRE and self.deadline is not None:
+            # the scheduler moves its entry when it becomes due
+            self.deadline = self._scheduler.time() + self.update_interval
+
+    def read_finished(self, initial: bool, success: bool) -> None:
+        """Record the result and schedule the next read after a read has finished."""
+        delay = self.update_interval
+        if (group_address := self.remote_value.group_address_state) is not None:
+            dead_group_addresses = self._scheduler.dead_group_addresses
+            if success:
+                dead_group_addresses.pop(group_address, None)
+            else:
+                if (dead := dead_group_addresses.get(group_address)) is None:
+                    dead = dead_group_addresses[group_address] = DeadGroupAddress(
+                        group_address
+                    )
+                dead.timeouts += 1
+                dead.last_timeout = self._scheduler.time()
+                # exponential back-off - but never more often than update_interval
+                delay = min(
+                    self.update_interval * 2**dead.timeouts,
+                    max(self._scheduler.max_read_backoff, self.update_interval),
+                )
+        if initial:
+            if self.initialized:
+                # update received while reading - next read already scheduled
+                return
+            self.initialized = True
+        if self.tracker_type is not StateTrackerType.INIT and not self.passive:
+            self._scheduler.schedule(self, delay)
+
+
+class _ReadScheduler:
+    """
+    Single scheduler for the deadlines of all StateTrackers.
+
+    Deadlines are kept in a heap. Postponing a deadline only updates the tracker -
+    outdated heap entries are moved when they become due. Due trackers are handed
+    to read workers - one per allowed concurrent read. Workers are started and
+    stopped when `concurrency.limit` changes; idle workers above the limit are
+    cancelled, reading ones exit after their read. Tasks are started with the
+    first scheduled read.
+
+    Initial reads are handed to the workers in queued order, one every
+    `init_read_interval` seconds. Trackers initialized by a received telegram
+    in the meantime are skipped.
+
+    Group addresses not responding to reads are kept in `dead_group_addresses`
+    shared by all trackers. Passive ones are not read.
+    """
+
+    def __init__(
+        self, concurrency: ReadConcurrency, outgoing_queue_depth: Callable[[], int]
+    ) -> None:
+        """Initialize _ReadScheduler class."""
+        self.concurrency = concurrency
+        self._outgoing_queue_depth = outgoing_queue_depth
+        self.max_read_backoff: float = DEFAULT_MAX_READ_BACKOFF
+        self.dead_group_addresses: dict[DeviceGroupAddress, DeadGroupAddress] = {}
+        # deadline, sequence number as tie-breaker, tracker generation, tracker
+        self._heap: list[tuple[float, int, int, _StateTracker]] = []
+        self._sequence = itertools.count()
+        # tracker, generation, initial read
+        self._due: asyncio.Queue[tuple[_StateTracker, int, bool]] = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+        # read worker index -> task
+        self._read_workers: dict[int, asyncio.Task[None]] = {}
+        # indexes of read workers waiting for a due tracker
+        self._idle_workers: set[int] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self.init_read_interval = 0.0
+        self._init_queue: deque[tuple[_StateTracker, int]] = deque()
+        self._init_task: asyncio.Task[None] | None = None
+        self._init_total = 0
+        self._init_read = 0
+        self._init_skipped = 0
+
+    def time(self) -> float:
+        """Return current time of the event loop."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop.time()
+
+    def _start(self) -> None:
+        """Start the scheduler and read workers."""
+        self._loop = asyncio.get_running_loop()
+        self._tasks.append(asyncio.create_task(self._run()))
+        self._adjust_read_workers()
+
+    def _adjust_read_workers(self) -> None:
+        """Start or cancel read workers to match `concurrency.limit`."""
+        limit = self.concurrency.limit
+        for index in range(limit):
+            if index not in self._read_workers:
+                self._read_workers[index] = asyncio.create_task(
+                    self._read_worker(index)
+                )
+        for index in [index for index in self._idle_workers if index >= limit]:
+            # waiting in `due.get()` - cancelling doesn't lose a due tracker
+            self._idle_workers.discard(index)
+            self._read_workers.pop(index).cancel()
+
+    def stop(self) -> None:
+        """Stop the scheduler and read workers. Drop all scheduled reads."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        for task in self._read_workers.values():
+            task.cancel()
+        self._read_workers.clear()
+        self._idle_workers.clear()
+        self._heap.clear()
+        self._due = asyncio.Queue()
+        if self._init_task is not None:
+            self._init_task.cancel()
+            self._init_task = None
+        self._init_queue.clear()
+        self._init_total = self._init_read = self._init_skipped = 0
+
+    def init_progress(self) -> InitProgress:
+        """Return progress of the init campaign."""
+        return InitProgress(
+            total=self._init_total,
+            read=self._init_read,
+            skipped=self._init_skipped,
+            eta=len(self._init_queue) * self.init_read_interval,
+        )
+
+    def queue_initial_read(self, tracker: _StateTracker) -> None:
+        """Queue the initial read of `tracker` in the init campaign."""
+        if not self._tasks:
+            self._start()
+        if self._init_task is None:
+            self._init_total = self._init_read = self._init_skipped = 0
+            self._init_task = asyncio.create_task(self._run_init_campaign())
+        self._init_queue.append((tracker, tracker.generation))
+        self._init_total += 1
+
+    async def _run_init_campaign(self) -> None:
+        """Hand initial reads to the read workers at `init_read_interval`."""
+        # let all trackers of a start be queued before logging
+        await asyncio.sleep(0)
+        logger.debug(
+            "StateUpdater reading %s initial states in about %.0f seconds",
+            self._init_total,
+            self.init_progress().eta,
+        )
+        next_log_step: float = INIT_PROGRESS_LOG_STEP
+        while self._init_queue:
+            tracker, generation = self._init_queue.popleft()
+            if generation != tracker.generation or tracker.initialized:
+                self._init_skipped += 1
+                continue
+            self._due.put_nowait((tracker, generation, True))
+            self._init_read += 1
+
+            percent = 100 * (self._init_read + self._init_skipped) / self._init_total
+            if percent >= next_log_step:
+                next_log_step = (
+                    percent // INIT_PROGRESS_LOG_STEP + 1
+                ) * INIT_PROGRESS_LOG_STEP
+                progress = self.init_progress()
+                logger.debug(
+                    "StateUpdater init campaign %.0f%% - read %s, skipped %s of %s, ETA %.0f seconds",
+                    percent,
+                    progress.read,
+                    progress.skipped,
+                    progress.total,
+                    progress.eta,
+                )
+            if self.init_read_interval:
+                await asyncio.sleep(self.init_read_interval)
+        self._init_task = None
+        logger.debug(
+            "StateUpdater init campaign finished - read %s, skipped %s",
+            self._init_read,
+            self._init_skipped,
+        )
+
+    def schedule(self, tracker: _StateTracker, delay: float) -> None:
+        """Schedule a read of `tracker` in `delay` seconds."""
+        if not self._tasks:
+            self._start()
+        deadline = tracker.deadline = self.time() + delay
+        heapq.heappush(
+            self._heap, (deadline, next(self._sequence), tracker.generation, tracker)
+        )
+        if self._heap[0][3] is tracker:
+            self._wakeup.set()
+
+    def _dispatch_due(self) -> float | None:
+        """Hand due trackers to the read workers. Return seconds until the next deadline."""
+        now = self.time()
+        while self._heap:
+            deadline, _, generation, tracker = self._heap[0]
+            if generation != tracker.generation or tracker.deadline is None:
+                heapq.heappop(self._heap)
+                continue
+            if tracker.deadline > deadline:
+                # postponed by update_received()
+                heapq.heapreplace(
+                    self._heap,
+                    (tracker.deadline, next(self._sequence), generation, tracker),
+                )
+                continue
+            if deadline > now:
+                return deadline - now
+            heapq.heappop(self._heap)
+            tracker.deadline = None
+            self._due.put_nowait((tracker, generation, False))
+        return None
+
+    async def _run(self) -> None:
+        """Wait for the next deadline or a new earlier one. Endless loop."""
         while True:
-            await asyncio.sleep(self.update_interval)
-            await self._read_state()
+            self._wakeup.clear()
+            timeout = self._dispatch_due()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _read_worker(self, index: int) -> None:
+        """Read states of due trackers until `index` exceeds the concurrency limit."""
+        due = self._due
+        concurrency = self.concurrency
+        while index < concurrency.limit:
+            self._idle_workers.add(index)
+            tracker, generation, initial = await due.get()
+            self._idle_workers.discard(index)
+            if (
+                generation != tracker.generation
+                or (initial and tracker.initialized)
+                or tracker.passive
+            ):
+                continue
+            started = self.time()
+            try:
+                success = await tracker.read_state()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("StateUpdater could not read state")
+                success = False
+            concurrency.read_finished(
+                started, self.time(), success, self._outgoing_queue_depth()
+            )
+            self._adjust_read_workers()
+            if generation == tracker.generation:
+                tracker.read_finished(initial, success)
+        if self._read_workers.get(index) is asyncio.current_task():
+            del self._read_workers[index]
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generator
 
 from xknx.core import XknxConnectionState
 
+from .timer_service import TimerService
+
 AsyncCallbackType = Callable[[], Coroutine[Any, Any, None]]
 
 if TYPE_CHECKING:
@@ -63,12 +65,18 @@ class Task:
 
 
 class TaskRegistry:
-    """Manages async tasks in XKNX."""
+    """
+    Manages async tasks in XKNX.
+
+    Delayed and periodic calls are scheduled in `timers` instead of running a task
+    each. Unregistering a name cancels the task or timer of that name.
+    """
 
     def __init__(self, xknx: XKNX) -> None:
         """Initialize TaskRegistry class."""
         self.xknx = xknx
-        self.tasks: list[Task] = []
+        self.tasks: dict[str, Task] = {}
+        self.timers = TimerService()
 
     def register(
         self,
@@ -87,16 +95,15 @@ class TaskRegistry:
         )
 
         if track_task:
-            self.tasks.append(_task)
+            self.tasks[name] = _task
 
         return _task
 
     def unregister(self, name: str) -> None:
-        """Unregister task."""
-        for task in self.tasks:
-            if task.name == name:
-                task.cancel()
-                self.tasks.remove(task)
+        """Unregister task or timer."""
+        if (task := self.tasks.pop(name, None)) is not None:
+            task.cancel()
+        self.timers.cancel(name)
 
     def start(self) -> None:
         """Start task registry."""
@@ -110,20 +117,27 @@ class TaskRegistry:
             self.connection_state_changed_cb
         )
 
-        for task in self.tasks:
+        for task in self.tasks.values():
             task.cancel()
 
-        self.tasks = []
+        self.tasks = {}
+        self.timers.stop()
 
     async def block_till_done(self) -> None:
-        """Await all tracked tasks."""
-        for task in self.tasks:
+        """Await all tracked tasks and delayed calls of timers (eg. `reset_after`)."""
+        for task in list(self.tasks.values()):
             await task
+        for timer in self.timers.delayed_timers():
+            await timer
 
     async def connection_state_changed_cb(self, state: XknxConnectionState) -> None:
         """Handle connection state changes."""
-        for task in self.tasks:
+        for task in self.tasks.values():
             if state == XknxConnectionState.CONNECTED:
                 task.reconnected()
             else:
                 task.connection_lost()
+        if state == XknxConnectionState.CONNECTED:
+            self.timers.reconnected()
+        else:
+            self.timers.connection_lost()
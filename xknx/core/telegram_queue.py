@@ -5,7 +5,14 @@ When a device wants to sends a telegram to the KNX bus, it has to queue it to th
 
 The underlaying KNXIPInterface will poll the queue and send the packets to the correct KNX/IP abstraction (Tunneling or Routing).
 
-You may register callbacks to be notified if a telegram was pushed to the queue.
+You may register callbacks to be notified if a telegram was pushed to the queue
+or consume telegrams from a TelegramStream. Callbacks registered with
+`register_telegram_send_failed_cb` are called with outgoing telegrams that could
+not be processed.
+
+While an established connection is lost, outgoing telegrams are recorded in an
+OutgoingJournal and sent when the connection is restored. This includes telegrams
+already waiting to be sent and the one being sent when the connection was lost.
 """
 from __future__ import annotations
 
@@ -17,6 +24,16 @@ from xknx.exceptions import CommunicationError, XKNXException
 from xknx.telegram import AddressFilter, Telegram, TelegramDirection
 from xknx.telegram.address import GroupAddress, InternalGroupAddress
 
+from .connection_state import XknxConnectionState
+from .group_address_state_table import GroupAddressStateTable
+from .outgoing_journal import OutgoingJournal
+from .telegram_stream import (
+    DEFAULT_STREAM_MAXSIZE,
+    StreamOverflow,
+    TelegramStream,
+    TelegramStreamRouter,
+)
+
 if TYPE_CHECKING:
     from xknx.xknx import XKNX
 
@@ -70,9 +87,24 @@ class TelegramQueue:
         """Initialize TelegramQueue class."""
         self.xknx = xknx
         self.telegram_received_cbs: list[TelegramQueue.Callback] = []
-        self.outgoing_queue: asyncio.Queue[Telegram | None] = asyncio.Queue()
+        self.telegram_send_failed_cbs: list[Callable[[Telegram], None]] = []
+        # telegram, loop time it was queued
+        self.outgoing_queue: asyncio.Queue[
+            tuple[Telegram, float] | None
+        ] = asyncio.Queue()
+        # telegram being sent by the KNX/IP interface while a journal is set
+        self._sending: tuple[Telegram, float] | None = None
+        self._send_task: asyncio.Task[None] | None = None
         self._consumer_task: Awaitable[tuple[None, None]] | None = None
         self._rate_limiter: asyncio.Task[None] | None = None
+        # set to an OutgoingJournal to hold back telegrams while an established connection
+        # is lost - by default telegrams are sent regardless of the connection state
+        self.journal: OutgoingJournal | None = None
+        # set to a GroupAddressStateTable to keep the last state of all group addresses
+        self.state_table: GroupAddressStateTable | None = None
+        self.streams = TelegramStreamRouter()
+        self._was_connected = False
+        self._connection_lost = False
 
     def register_telegram_received_cb(
         self,
@@ -97,8 +129,48 @@ class TelegramQueue:
         """Unregister callback for a telegram beeing received from KNX bus."""
         self.telegram_received_cbs.remove(telegram_received_cb)
 
+    def register_telegram_send_failed_cb(
+        self, telegram_send_failed_cb: Callable[[Telegram], None]
+    ) -> None:
+        """Register callback for an outgoing telegram that could not be processed."""
+        self.telegram_send_failed_cbs.append(telegram_send_failed_cb)
+
+    def unregister_telegram_send_failed_cb(
+        self, telegram_send_failed_cb: Callable[[Telegram], None]
+    ) -> None:
+        """Unregister callback for an outgoing telegram that could not be processed."""
+        self.telegram_send_failed_cbs.remove(telegram_send_failed_cb)
+
+    def stream(
+        self,
+        filters: list[AddressFilter | str] | None = None,
+        group_addresses: list[GroupAddress | InternalGroupAddress] | None = None,
+        maxsize: int = DEFAULT_STREAM_MAXSIZE,
+        overflow: StreamOverflow = StreamOverflow.DROP_OLDEST,
+        match_for_outgoing: bool = False,
+    ) -> TelegramStream:
+        """
+        Return an async iterator of processed telegrams with a bounded buffer.
+
+        Telegrams are buffered from this call until the stream is closed.
+        """
+        return self.streams.stream(
+            filters=filters,
+            group_addresses=group_addresses,
+            maxsize=maxsize,
+            overflow=overflow,
+            match_for_outgoing=match_for_outgoing,
+        )
+
     async def start(self) -> None:
         """Start telegram queue."""
+        self._was_connected = (
+            self.xknx.connection_manager.state == XknxConnectionState.CONNECTED
+        )
+        self._connection_lost = False
+        self.xknx.connection_manager.register_connection_state_changed_cb(
+            self._connection_state_changed
+        )
         self._consumer_task = asyncio.gather(
             self._telegram_consumer(), self._outgoing_rate_limiter()
         )
@@ -106,10 +178,59 @@ class TelegramQueue:
     async def stop(self) -> None:
         """Stop telegram queue."""
         logger.debug("Stopping TelegramQueue")
+        self.xknx.connection_manager.unregister_connection_state_changed_cb(
+            self._connection_state_changed
+        )
         # If a None object is pushed to the queue, the queue stops
         await self.xknx.telegrams.put(None)
         if self._consumer_task is not None:
             await self._consumer_task
+        if self.journal is not None:
+            self.journal.clear()
+
+    async def _connection_state_changed(self, state: XknxConnectionState) -> None:
+        """Record outgoing telegrams while an established connection is lost."""
+        if state == XknxConnectionState.CONNECTED:
+            self._was_connected = True
+            if self._connection_lost:
+                self._connection_lost = False
+                self._flush_journal()
+        elif self._was_connected and not self._connection_lost:
+            self._connection_lost = True
+            self._journal_unsent_telegrams()
+
+    def _journal_unsent_telegrams(self) -> None:
+        """Move telegrams waiting to be sent or being sent to the journal."""
+        if self.journal is None:
+            return
+        if self._send_task is not None and self._sending is not None:
+            # most likely waiting for the connection to be reestablished
+            self._send_task.cancel()
+            self.journal.add(*self._sending)
+        remaining: list[tuple[Telegram, float] | None] = []
+        while not self.outgoing_queue.empty():
+            item = self.outgoing_queue.get_nowait()
+            if item is None or isinstance(
+                item[0].destination_address, InternalGroupAddress
+            ):
+                remaining.append(item)
+                continue
+            self.journal.add(*item)
+            self.outgoing_queue.task_done()
+            self.xknx.telegrams.task_done()
+        for item in remaining:
+            self.outgoing_queue.put_nowait(item)
+
+    def _flush_journal(self) -> None:
+        """Queue telegrams recorded while the connection was lost."""
+        if self.journal is None or not (telegrams := self.journal.flush()):
+            return
+        logger.debug(
+            "Sending %s telegrams recorded while the connection was lost",
+            len(telegrams),
+        )
+        for telegram in telegrams:
+            self.xknx.telegrams.put_nowait(telegram)
 
     async def _telegram_consumer(self) -> None:
         """Endless loop for processing telegrams."""
@@ -139,19 +260,32 @@ class TelegramQueue:
                 finally:
                     self.xknx.telegrams.task_done()
             elif telegram.direction == TelegramDirection.OUTGOING:
-                self.outgoing_queue.put_nowait(telegram)
+                if (
+                    self._connection_lost
+                    and self.journal is not None
+                    and not isinstance(
+                        telegram.destination_address, InternalGroupAddress
+                    )
+                ):
+                    self.journal.add(telegram)
+                    self.xknx.telegrams.task_done()
+                    continue
+                self.outgoing_queue.put_nowait(
+                    (telegram, asyncio.get_running_loop().time())
+                )
                 # self.xknx.telegrams.task_done() for outgoing is called in _outgoing_rate_limiter.
 
     async def _outgoing_rate_limiter(self) -> None:
         """Endless loop for processing outgoing telegrams."""
         while True:
-            telegram = await self.outgoing_queue.get()
+            item = await self.outgoing_queue.get()
             # Breaking up queue if None is pushed to the queue
-            if telegram is None:
+            if item is None:
                 self.outgoing_queue.task_done()
                 if self._rate_limiter:
                     self._rate_limiter.cancel()
                 break
+            telegram, queued = item
 
             # limit rate to knx bus - defaults to 20 per second
             if self.xknx.rate_limit and not isinstance(
@@ -162,20 +296,35 @@ class TelegramQueue:
                 self._rate_limiter = asyncio.create_task(
                     asyncio.sleep(1 / self.xknx.rate_limit)
                 )
+            if (
+                self._connection_lost
+                and self.journal is not None
+                and not isinstance(telegram.destination_address, InternalGroupAddress)
+            ):
+                # connection was lost while waiting for the rate limit
+                self.journal.add(telegram, queued)
+                self.outgoing_queue.task_done()
+                self.xknx.telegrams.task_done()
+                continue
 
             try:
+                self._sending = item
                 await self.process_telegram_outgoing(telegram)
             except CommunicationError as ex:
                 if ex.should_log:
                     logger.warning(ex)
+                self._run_telegram_send_failed_cbs(telegram)
             except XKNXException as ex:
                 logger.error("Error while processing outgoing telegram %s", ex)
+                self._run_telegram_send_failed_cbs(telegram)
             except Exception:  # pylint: disable=broad-except
                 # prevent the sender Task from stalling when unexpected errors occur (eg. ValueError from creating KNXIPFrames)
                 logger.exception(
                     "Unexpected error while processing outgoing telegram %s", telegram
                 )
+                self._run_telegram_send_failed_cbs(telegram)
             finally:
+                self._sending = None
                 self.outgoing_queue.task_done()
                 self.xknx.telegrams.task_done()
 
@@ -201,19 +350,59 @@ class TelegramQueue:
         if not isinstance(telegram.destination_address, InternalGroupAddress):
             if self.xknx.knxip_interface is None:
                 raise CommunicationError("No KNXIP interface defined")
-            await self.xknx.knxip_interface.send_telegram(telegram)
+            if self.journal is None:
+                await self.xknx.knxip_interface.send_telegram(telegram)
+            elif not await self._send_journaled(telegram):
+                return
 
         await self.xknx.devices.process(telegram)
         await self._run_telegram_received_cbs(telegram)
 
+    async def _send_journaled(self, telegram: Telegram) -> bool:
+        """
+        Send a telegram in a task cancelled if the connection is lost.
+
+        Return False if the telegram was moved to the journal instead.
+        """
+        assert self.xknx.knxip_interface is not None
+        send_task = self._send_task = asyncio.create_task(
+            self.xknx.knxip_interface.send_telegram(telegram)
+        )
+        try:
+            await asyncio.wait((send_task,))
+        except asyncio.CancelledError:
+            send_task.cancel()
+            raise
+        finally:
+            self._send_task = None
+        if send_task.cancelled():
+            return False
+        send_task.result()
+        return True
+
     async def process_telegram_incoming(self, telegram: Telegram) -> None:
         """Process incoming telegram."""
         telegram_logger.debug(telegram)
         await self._run_telegram_received_cbs(telegram)
         await self.xknx.devices.process(telegram)
 
+    def _run_telegram_send_failed_cbs(self, telegram: Telegram) -> None:
+        """Run callbacks for a telegram that could not be sent. Don't propagate exceptions."""
+        for callback in self.telegram_send_failed_cbs:
+            try:
+                callback(telegram)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(
+                    "Unexpected error while processing telegram_send_failed_cb for %s",
+                    telegram,
+                )
+
     async def _run_telegram_received_cbs(self, telegram: Telegram) -> None:
-        """Run registered callbacks. Don't propagate exceptions."""
+        """Resolve pending requests and run registered callbacks. Don't propagate exceptions."""
+        self.xknx.request_correlator.process(telegram)
+        if self.state_table is not None:
+            self.state_table.update(telegram)
+        self.streams.dispatch(telegram)
         callbacks = [
             cb.callback(telegram)
             for cb in self.telegram_received_cbs
@@ -0,0 +1,236 @@
+"""
+Module for consuming processed telegrams as async iterators.
+
+A TelegramStream buffers telegrams matching its filters in a bounded buffer of
+its own. TelegramQueue hands telegrams to streams without awaiting them, so a
+slow consumer only fills its own buffer - when it is full telegrams are dropped
+according to the overflow policy of the stream.
+
+Streams are grouped by their filters: each distinct set of address filters is
+evaluated once per telegram and streams filtering for group addresses are
+looked up by the destination address of the telegram.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from enum import Enum
+import logging
+from types import TracebackType
+from typing import Hashable
+
+from xknx.exceptions import XKNXException
+from xknx.telegram import AddressFilter, Telegram, TelegramDirection
+from xknx.telegram.address import GroupAddress, InternalGroupAddress
+
+logger = logging.getLogger("xknx.log")
+
+DEFAULT_STREAM_MAXSIZE = 1000
+
+
+class StreamOverflow(Enum):
+    """Policy for telegrams received while the buffer of a stream is full."""
+
+    # drop the oldest buffered telegram
+    DROP_OLDEST = "drop_oldest"
+    # drop the received telegram
+    DROP_NEWEST = "drop_newest"
+
+
+class TelegramStream:
+    """
+    Async iterator of processed telegrams.
+
+    Handles:
+    * maxsize: Maximum number of buffered telegrams.
+    * overflow: StreamOverflow policy when the buffer is full.
+    * match_for_outgoing: Also stream outgoing telegrams.
+
+    Telemetry:
+    * received: number of telegrams matching the filters.
+    * dropped: number of telegrams dropped because the buffer was full.
+    """
+
+    def __init__(
+        self,
+        router: TelegramStreamRouter,
+        filter_key: Hashable,
+        group_addresses: tuple[GroupAddress | InternalGroupAddress, ...],
+        maxsize: int = DEFAULT_STREAM_MAXSIZE,
+        overflow: StreamOverflow = StreamOverflow.DROP_OLDEST,
+        match_for_outgoing: bool = False,
+    ) -> None:
+        """Initialize TelegramStream class."""
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.match_for_outgoing = match_for_outgoing
+        self.received = 0
+        self.dropped = 0
+        self.closed = False
+        self._router = router
+        self.filter_key = filter_key
+        self.group_addresses = group_addresses
+        self._buffer: deque[Telegram] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+
+    def __len__(self) -> int:
+        """Return number of buffered telegrams."""
+        return len(self._buffer)
+
+    def put(self, telegram: Telegram) -> None:
+        """Buffer a telegram. Doesn't block."""
+        if telegram.direction is TelegramDirection.OUTGOING and not (
+            self.match_for_outgoing
+        ):
+            return
+        self.received += 1
+        if len(self._buffer) >= self.maxsize:
+            self.dropped += 1
+            if self.overflow is StreamOverflow.DROP_NEWEST:
+                return
+            self._buffer.popleft()
+        self._buffer.append(telegram)
+        self._wakeup()
+
+    def close(self) -> None:
+        """Stop receiving telegrams. Buffered telegrams can still be consumed."""
+        if self.closed:
+            return
+        self.closed = True
+        self._router.remove(self)
+        self._wakeup()
+
+    def _wakeup(self) -> None:
+        """Wake up a waiting consumer."""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def __aiter__(self) -> TelegramStream:
+        """Return self as async iterator."""
+        return self
+
+    async def __anext__(self) -> Telegram:
+        """Return the next telegram. Stop when closed and the buffer is empty."""
+        while not self._buffer:
+            if self.closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._buffer.popleft()
+
+    async def __aenter__(self) -> TelegramStream:
+        """Return self from context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close stream when leaving context manager."""
+        self.close()
+
+
+class TelegramStreamRouter:
+    """Class for handing telegrams to TelegramStreams grouped by their filters."""
+
+    def __init__(self) -> None:
+        """Initialize TelegramStreamRouter class."""
+        self._match_all: list[TelegramStream] = []
+        self._by_group_address: dict[
+            GroupAddress | InternalGroupAddress, list[TelegramStream]
+        ] = {}
+        # address filter patterns -> filters, streams
+        self._by_filters: dict[
+            Hashable, tuple[list[AddressFilter], list[TelegramStream]]
+        ] = {}
+
+    def __len__(self) -> int:
+        """Return number of open streams."""
+        return len(self._streams())
+
+    def _streams(self) -> set[TelegramStream]:
+        """Return all open streams."""
+        streams = set(self._match_all)
+        for group in self._by_group_address.values():
+            streams.update(group)
+        for _, group in self._by_filters.values():
+            streams.update(group)
+        return streams
+
+    def stream(
+        self,
+        filters: list[AddressFilter | str] | None = None,
+        group_addresses: list[GroupAddress | InternalGroupAddress] | None = None,
+        maxsize: int = DEFAULT_STREAM_MAXSIZE,
+        overflow: StreamOverflow = StreamOverflow.DROP_OLDEST,
+        match_for_outgoing: bool = False,
+    ) -> TelegramStream:
+        """Open a stream of telegrams matching `filters` or `group_addresses`."""
+        if maxsize < 1:
+            raise XKNXException(f"Stream maxsize has to be at least 1, got {maxsize}.")
+        address_filters = [
+            AddressFilter(_filter) if isinstance(_filter, str) else _filter
+            for _filter in filters or ()
+        ]
+        filter_key = (
+            frozenset(address_filter.pattern for address_filter in address_filters)
+            if address_filters
+            else None
+        )
+        stream = TelegramStream(
+            self,
+            filter_key=filter_key,
+            group_addresses=tuple(group_addresses or ()),
+            maxsize=maxsize,
+            overflow=overflow,
+            match_for_outgoing=match_for_outgoing,
+        )
+        if filters is None and group_addresses is None:
+            self._match_all.append(stream)
+        if filter_key is not None:
+            self._by_filters.setdefault(filter_key, (address_filters, []))[1].append(
+                stream
+            )
+        for group_address in stream.group_addresses:
+            self._by_group_address.setdefault(group_address, []).append(stream)
+        return stream
+
+    def remove(self, stream: TelegramStream) -> None:
+        """Remove a closed stream."""
+        if stream in self._match_all:
+            self._match_all.remove(stream)
+        if (filter_key := stream.filter_key) is not None and (
+            group := self._by_filters.get(filter_key)
+        ):
+            group[1].remove(stream)
+            if not group[1]:
+                del self._by_filters[filter_key]
+        for group_address in stream.group_addresses:
+            if streams := self._by_group_address.get(group_address):
+                if stream in streams:
+                    streams.remove(stream)
+                if not streams:
+                    del self._by_group_address[group_address]
+
+    def dispatch(self, telegram: Telegram) -> None:
+        """Hand `telegram` to all streams it matches."""
+        if not (self._match_all or self._by_group_address or self._by_filters):
+            return
+        matched: list[TelegramStream] = list(self._match_all)
+        destination = telegram.destination_address
+        if isinstance(destination, (GroupAddress, InternalGroupAddress)):
+            matched.extend(self._by_group_address.get(destination, ()))
+            for address_filters, streams in self._by_filters.values():
+                if any(
+                    address_filter.match(destination)
+                    for address_filter in address_filters
+                ):
+                    matched.extend(streams)
+        # a stream matching multiple filters receives the telegram once
+        for stream in dict.fromkeys(matched):
+            stream.put(telegram)
@@ -0,0 +1,277 @@
+"""
+Module for delayed and periodic calls of coroutine functions.
+
+Devices schedule debounces, delayed resets and periodic jobs as named timers
+instead of running a task sleeping until it is due. All timers share a heap of
+deadlines driven by a single timer of the event loop; a task is only created
+when a timer is due and its coroutine function is called.
+
+Scheduling a timer with the name of an existing one replaces it. Cancelled and
+rescheduled timers leave their heap entry behind - outdated entries are skipped
+when they become due.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Any, Callable, Coroutine, Generator
+
+AsyncCallbackType = Callable[[], Coroutine[Any, Any, None]]
+
+logger = logging.getLogger("xknx.log")
+
+
+class Timer:
+    """Delayed or periodic call of a coroutine function scheduled by a TimerService."""
+
+    def __init__(
+        self,
+        service: TimerService,
+        name: str,
+        async_func: AsyncCallbackType,
+        delay: float,
+        interval: float | None,
+        restart_after_reconnect: bool,
+    ) -> None:
+        """Initialize Timer class."""
+        self.name = name
+        self.async_func = async_func
+        self.delay = delay
+        self.interval = interval
+        self.restart_after_reconnect = restart_after_reconnect
+        # loop time of the next call - None if not scheduled
+        self.when: float | None = None
+        self._service = service
+        self._task: asyncio.Task[None] | None = None
+        self._waiters: list[asyncio.Future[None]] = []
+
+    @property
+    def active(self) -> bool:
+        """Return if the timer is scheduled or its coroutine function is running."""
+        return self.when is not None or self._task is not None
+
+    def cancel(self) -> None:
+        """Cancel the timer and its running call."""
+        self._service.cancel(self.name, timer=self)
+
+    def __await__(self) -> Generator[None, None, None]:
+        """Wait until a delayed call has finished or the timer was cancelled."""
+        if self.active:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            yield from waiter
+
+    def _stop(self) -> None:
+        """Unschedule the timer and cancel its running call."""
+        self.when = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _finished(self) -> None:
+        """Wake up waiters."""
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    async def _run(self) -> None:
+        """Call the coroutine function. Don't propagate exceptions."""
+        try:
+            await self.async_func()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unexpected error in timer %s", self.name)
+        finally:
+            # a cancelled call may finish after the timer was restarted
+            if self._task is asyncio.current_task():
+                self._task = None
+                if self.when is None:
+                    self._service._remove(self)  # pylint: disable=protected-access
+
+
+class TimerService:
+    """
+    Class for scheduling named timers.
+
+    Telemetry:
+    * len(): number of live timers - scheduled or running.
+    """
+
+    def __init__(self) -> None:
+        """Initialize TimerService class."""
+        self._timers: dict[str, Timer] = {}
+        # deadline, sequence number as tie-breaker, timer
+        self._heap: list[tuple[float, int, Timer]] = []
+        self._sequence = itertools.count()
+        self._handle: asyncio.TimerHandle | None = None
+        self._connected = True
+
+    def __len__(self) -> int:
+        """Return number of live timers."""
+        return len(self._timers)
+
+    def __contains__(self, name: str) -> bool:
+        """Return if a timer with `name` is live."""
+        return name in self._timers
+
+    def delayed_timers(self) -> list[Timer]:
+        """Return live timers of delayed calls - periodic timers are omitted."""
+        return [timer for timer in self._timers.values() if timer.interval is None]
+
+    def call_later(
+        self,
+        name: str,
+        delay: float,
+        async_func: AsyncCallbackType,
+        restart_after_reconnect: bool = False,
+    ) -> Timer:
+        """Call `async_func` in `delay` seconds. Replaces a timer of the same name."""
+        return self._add(name, async_func, delay, None, restart_after_reconnect)
+
+    def call_periodic(
+        self,
+        name: str,
+        interval: float,
+        async_func: AsyncCallbackType,
+        delay: float = 0,
+        restart_after_reconnect: bool = False,
+    ) -> Timer:
+        """Call `async_func` every `interval` seconds starting in `delay` seconds."""
+        return self._add(name, async_func, delay, interval, restart_after_reconnect)
+
+    def reschedule(self, name: str, delay: float) -> bool:
+        """Move the next call of a live timer to `delay` seconds from now."""
+        if (timer := self._timers.get(name)) is None:
+            return False
+        self._schedule(timer, delay)
+        return True
+
+    def cancel(self, name: str, timer: Timer | None = None) -> None:
+        """Cancel the timer `name` - only if it is `timer` if given."""
+        if (live := self._timers.get(name)) is None or (
+            timer is not None and live is not timer
+        ):
+            return
+        live._stop()  # pylint: disable=protected-access
+        self._remove(live)
+
+    def stop(self) -> None:
+        """Cancel all timers."""
+        for timer in self._timers.values():
+            timer._stop()  # pylint: disable=protected-access
+            timer._finished()  # pylint: disable=protected-access
+        self._timers.clear()
+        self._heap.clear()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._connected = True
+
+    def connection_lost(self) -> None:
+        """Pause timers to be restarted after reconnect."""
+        self._connected = False
+        for timer in self._timers.values():
+            if timer.restart_after_reconnect and timer.active:
+                logger.debug("Pausing timer %s because of connection loss.", timer.name)
+                timer._stop()  # pylint: disable=protected-access
+
+    def reconnected(self) -> None:
+        """Restart paused timers."""
+        self._connected = True
+        for timer in self._timers.values():
+            if timer.restart_after_reconnect and not timer.active:
+                logger.debug(
+                    "Restarting timer %s as the connection to the bus was reestablished.",
+                    timer.name,
+                )
+                self._schedule(timer, timer.delay)
+
+    def _add(
+        self,
+        name: str,
+        async_func: AsyncCallbackType,
+        delay: float,
+        interval: float | None,
+        restart_after_reconnect: bool,
+    ) -> Timer:
+        """Register and schedule a new timer."""
+        self.cancel(name)
+        timer = self._timers[name] = Timer(
+            self, name, async_func, delay, interval, restart_after_reconnect
+        )
+        if self._connected or not restart_after_reconnect:
+            self._schedule(timer, delay)
+        return timer
+
+    def _remove(self, timer: Timer) -> None:
+        """Remove a finished or cancelled timer."""
+        if self._timers.get(timer.name) is timer:
+            del self._timers[timer.name]
+        timer._finished()  # pylint: disable=protected-access
+
+    def _schedule(self, timer: Timer, delay: float) -> None:
+        """Set the next call of `timer`. Call it right away if it is due."""
+        if delay <= 0:
+            self._call(timer)
+            if timer.interval is None:
+                return
+            delay = timer.interval
+        when = timer.when = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._heap, (when, next(self._sequence), timer))
+        if len(self._heap) > 2 * len(self._timers) + 16:
+            # drop entries of cancelled and rescheduled timers
+            self._heap = [entry for entry in self._heap if self._valid(entry)]
+            heapq.heapify(self._heap)
+        if self._handle is None or when < self._handle.when():
+            self._set_handle()
+
+    @staticmethod
+    def _call(timer: Timer) -> None:
+        """Start a call of the coroutine function of `timer`."""
+        timer.when = None
+        # pylint: disable=protected-access
+        if timer._task is not None:
+            # previous call of a periodic timer still running
+            logger.debug("Timer %s still running - skipping call", timer.name)
+            return
+        timer._task = asyncio.create_task(timer._run(), name=timer.name)
+
+    def _valid(self, entry: tuple[float, int, Timer]) -> bool:
+        """Return if a heap entry is the current deadline of a live timer."""
+        when, _, timer = entry
+        return timer.when == when and self._timers.get(timer.name) is timer
+
+    def _set_handle(self) -> None:
+        """Set the loop timer to the earliest deadline."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        heap = self._heap
+        while heap and not self._valid(heap[0]):
+            heapq.heappop(heap)
+        if heap:
+            when = heap[0][0]
+            self._handle = asyncio.get_running_loop().call_at(when, self._fire, when)
+
+    def _fire(self, deadline: float) -> None:
+        """Call due timers. Loop timer callback."""
+        self._handle = None
+        # the loop may run timers up to its clock resolution early
+        now = max(asyncio.get_running_loop().time(), deadline)
+        periodic: list[tuple[Timer, float]] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if not self._valid(entry):
+                continue
+            when, _, timer = entry
+            self._call(timer)
+            if timer.interval is not None:
+                # skip calls missed while the loop was blocked
+                delay = when + timer.interval - now
+                periodic.append((timer, delay if delay > 0 else timer.interval))
+        for timer, delay in periodic:
+            self._schedule(timer, delay)
+        self._set_handle()
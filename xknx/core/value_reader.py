@@ -2,20 +2,19 @@
 Module for reading the value of a specific KNX group address from KNX bus.
 
 The module will
+* ... register a pending request for the group address in the RequestCorrelator.
 * ... send a group_read to the selected gruop address.
-* ... register a callback for receiving telegrams within telegram queue.
-* ... check if received telegrams have the correct group address.
+* ... wait until the RequestCorrelator resolves the request with a received telegram.
 * ... store the received telegram for further processing.
 """
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING
 
 from xknx.telegram import Telegram
 from xknx.telegram.address import GroupAddress, InternalGroupAddress
-from xknx.telegram.apci import GroupValueRead, GroupValueResponse, GroupValueWrite
+from xknx.telegram.apci import GroupValueRead
 
 if TYPE_CHECKING:
     from xknx.xknx import XKNX
@@ -35,37 +34,29 @@ class ValueReader:
         """Initialize ValueReader class."""
         self.xknx = xknx
         self.group_address: GroupAddress | InternalGroupAddress = group_address
-        self.response_received_event = asyncio.Event()
         self.timeout_in_seconds: float = timeout_in_seconds
         self.received_telegram: Telegram | None = None
 
     async def read(self) -> Telegram | None:
         """Send group read and wait for response."""
-        cb_obj = self.xknx.telegram_queue.register_telegram_received_cb(
-            self.telegram_received,
-            group_addresses=[self.group_address],
-            match_for_outgoing=True,
+        response = self.xknx.request_correlator.expect_group_response(
+            self.group_address, self.timeout_in_seconds
         )
-        await self.send_group_read()
-
         try:
-            await asyncio.wait_for(
-                self.response_received_event.wait(),
-                timeout=self.timeout_in_seconds,
-            )
-        except asyncio.TimeoutError:
+            await self.send_group_read()
+            telegram = await response
+        finally:
+            # cleanup to not leave the request pending (for asyncio.CancelledError)
+            response.cancel()
+        if telegram is None:
             logger.warning(
                 "Error: KNX bus did not respond in time (%s secs) to GroupValueRead request for: %s",
                 self.timeout_in_seconds,
                 self.group_address,
             )
-        else:
-            return self.received_telegram
-        finally:
-            # cleanup to not leave callbacks (for asyncio.CancelledError)
-            self.xknx.telegram_queue.unregister_telegram_received_cb(cb_obj)
-
-        return None
+            return None
+        self.received_telegram = telegram
+        return telegram
 
     async def send_group_read(self) -> None:
         """Send group read."""
@@ -75,11 +66,3 @@ class ValueReader:
             source_address=self.xknx.current_address,
         )
         await self.xknx.telegrams.put(telegram)
-
-    async def telegram_received(self, telegram: Telegram) -> None:
-        """Test if telegram has correct group address and trigger event."""
-        if telegram.destination_address == self.group_address and isinstance(
-            telegram.payload, (GroupValueResponse, GroupValueWrite)
-        ):
-            self.received_telegram = telegram
-            self.response_received_event.set()
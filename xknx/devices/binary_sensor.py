@@ -10,12 +10,10 @@ A BinarySensor may also have Actions attached which are executed after state was
 """
 from __future__ import annotations
 
-import asyncio
-from functools import partial
 import time
 from typing import TYPE_CHECKING, Iterator, cast
 
-from xknx.core import Task
+from xknx.core import Timer
 from xknx.remote_value import GroupAddressesType, RemoteValueSwitch
 
 from .device import Device, DeviceCallbackType
@@ -51,10 +49,10 @@ class BinarySensor(Device):
         self._count_set_on = 0
         self._count_set_off = 0
         self._last_set: float | None = None
-        self._reset_task_name = f"binary_sensor.reset_{id(self)}"
-        self._context_task_name = f"binary_sensor.context_{id(self)}"
-        self._reset_task: Task | None = None
-        self._context_task: Task | None = None
+        self._reset_timer_name = f"binary_sensor.reset_{id(self)}"
+        self._context_timer_name = f"binary_sensor.context_{id(self)}"
+        self._reset_timer: Timer | None = None
+        self._context_timer: Timer | None = None
 
         self.remote_value = RemoteValueSwitch(
             xknx,
@@ -70,10 +68,10 @@ class BinarySensor(Device):
         """Iterate the devices RemoteValue classes."""
         yield self.remote_value
 
-    def _iter_tasks(self) -> Iterator[Task | None]:
-        """Iterate the device tasks."""
-        yield self._context_task
-        yield self._reset_task
+    def _iter_tasks(self) -> Iterator[Timer | None]:
+        """Iterate the device timers."""
+        yield self._context_timer
+        yield self._reset_timer
 
     @property
     def last_telegram(self) -> Telegram | None:
@@ -92,16 +90,16 @@ class BinarySensor(Device):
 
             if self.ignore_internal_state and self._context_timeout:
                 self.bump_and_get_counter(state)
-                self._context_task = self.xknx.task_registry.register(
-                    name=self._context_task_name,
-                    async_func=partial(self._counter_task, self._context_timeout),
-                ).start()
+                self._context_timer = self.xknx.task_registry.timers.call_later(
+                    self._context_timer_name,
+                    self._context_timeout,
+                    self._counter_timeout,
+                )
             else:
                 await self.after_update()
 
-    async def _counter_task(self, wait_seconds: float) -> None:
-        """Trigger after 1 second to prevent double triggers."""
-        await asyncio.sleep(wait_seconds)
+    async def _counter_timeout(self) -> None:
+        """Trigger after context_timeout to prevent double triggers."""
         await self.after_update()
 
         self._count_set_on = 0
@@ -154,16 +152,13 @@ class BinarySensor(Device):
             self._process_reset_after()
 
     def _process_reset_after(self) -> None:
-        """Create Task for resetting state if 'reset_after' is configured."""
+        """Schedule resetting state if 'reset_after' is configured."""
         if self.reset_after is not None and self.state:
-            self._reset_task = self.xknx.task_registry.register(
-                name=self._reset_task_name,
-                async_func=partial(self._reset_state, self.reset_after),
-                track_task=True,
-            ).start()
-
-    async def _reset_state(self, wait_seconds: float) -> None:
-        await asyncio.sleep(wait_seconds)
+            self._reset_timer = self.xknx.task_registry.timers.call_later(
+                self._reset_timer_name, self.reset_after, self._reset_state
+            )
+
+    async def _reset_state(self) -> None:
         await self._set_internal_state(False)
 
     def is_on(self) -> bool:
@@ -6,12 +6,10 @@ broadcasting localtime periodically.
 """
 from __future__ import annotations
 
-import asyncio
-from functools import partial
 import time
 from typing import TYPE_CHECKING, Iterator
 
-from xknx.core import Task
+from xknx.core import Timer
 from xknx.remote_value import GroupAddressesType, RemoteValueDateTime
 
 from .device import Device, DeviceCallbackType
@@ -45,31 +43,25 @@ class DateTime(Device):
             device_name=name,
             after_update_cb=self.after_update,
         )
-        self._broadcast_task: Task | None = self._create_broadcast_task(minutes=60)
+        self._broadcast_timer: Timer | None = self._create_broadcast_timer(minutes=60)
 
     def _iter_remote_values(self) -> Iterator[RemoteValueDateTime]:
         """Iterate the devices RemoteValue classes."""
         yield self._remote_value
 
-    def _iter_tasks(self) -> Iterator[Task | None]:
-        """Iterate the device tasks."""
-        yield self._broadcast_task
-
-    def _create_broadcast_task(self, minutes: int = 60) -> Task | None:
-        """Create an asyncio.Task for broadcasting local time periodically if `localtime` is set."""
-
-        async def broadcast_loop(self: "DateTime", minutes: int) -> None:
-            """Endless loop for broadcasting local time."""
-            while True:
-                await self.broadcast_localtime()
-                await asyncio.sleep(minutes * 60)
+    def _iter_tasks(self) -> Iterator[Timer | None]:
+        """Iterate the device timers."""
+        yield self._broadcast_timer
 
+    def _create_broadcast_timer(self, minutes: int = 60) -> Timer | None:
+        """Create a Timer for broadcasting local time periodically if `localtime` is set."""
         if self.localtime:
-            return self.xknx.task_registry.register(
-                name=f"datetime.broadcast_{id(self)}",
-                async_func=partial(broadcast_loop, self, minutes),
+            return self.xknx.task_registry.timers.call_periodic(
+                f"datetime.broadcast_{id(self)}",
+                interval=minutes * 60,
+                async_func=self.broadcast_localtime,
                 restart_after_reconnect=True,
-            ).start()
+            )
         return None
 
     async def broadcast_localtime(self, response: bool = False) -> None:
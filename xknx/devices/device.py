@@ -10,7 +10,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator
 
-from xknx.core import Task
+from xknx.core import Task, Timer
 from xknx.remote_value import RemoteValue
 from xknx.telegram import Telegram
 from xknx.telegram.address import DeviceGroupAddress
@@ -66,8 +66,10 @@ class Device(ABC):
         # yield from (<list all used RemoteValue instances>)
         yield from ()
 
-    def _iter_tasks(self) -> Iterator[Task | None]:  # pylint: disable=no-self-use
-        """Iterate the device tasks."""
+    def _iter_tasks(
+        self,
+    ) -> Iterator[Task | Timer | None]:  # pylint: disable=no-self-use
+        """Iterate the device tasks and timers."""
         yield from ()
 
     def register_device_updated_cb(self, device_updated_cb: DeviceCallbackType) -> None:
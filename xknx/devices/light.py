@@ -360,17 +360,17 @@ class Light(Device):
         """Run callback after all individual colors were updated or timeout passed."""
 
         async def debouncer() -> None:
-            await asyncio.sleep(Light.DEBOUNCE_TIMEOUT)
             self._reset_individual_color_debounce_telegrams()
             await asyncio.shield(self.after_update())
 
         self._individual_color_debounce_telegram_counter -= 1
         if self._individual_color_debounce_telegram_counter > 0:
-            # task registry cancels existing task
-            self.xknx.task_registry.register(
-                name=self._individual_color_debounce_task_name,
-                async_func=debouncer,
-            ).start()
+            # replaces an existing timer
+            self.xknx.task_registry.timers.call_later(
+                self._individual_color_debounce_task_name,
+                Light.DEBOUNCE_TIMEOUT,
+                debouncer,
+            )
             return
         self.xknx.task_registry.unregister(self._individual_color_debounce_task_name)
         self._reset_individual_color_debounce_telegrams()
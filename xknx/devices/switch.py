@@ -8,12 +8,10 @@ It provides functionality for
 """
 from __future__ import annotations
 
-import asyncio
-from functools import partial
 import logging
 from typing import TYPE_CHECKING, Iterator
 
-from xknx.core import Task
+from xknx.core import Timer
 from xknx.remote_value import GroupAddressesType, RemoteValueSwitch
 
 from .device import Device, DeviceCallbackType
@@ -44,8 +42,8 @@ class Switch(Device):
         super().__init__(xknx, name, device_updated_cb)
 
         self.reset_after = reset_after
-        self._reset_task_name = f"switch.reset_{id(self)}"
-        self._reset_task: Task | None = None
+        self._reset_timer_name = f"switch.reset_{id(self)}"
+        self._reset_timer: Timer | None = None
         self.respond_to_read = respond_to_read
         self.switch = RemoteValueSwitch(
             xknx,
@@ -63,9 +61,9 @@ class Switch(Device):
 
     def __del__(self) -> None:
         """Destructor. Cleaning up if this was not done before."""
-        if self._reset_task:
+        if self._reset_timer:
             try:
-                self._reset_task.cancel()
+                self._reset_timer.cancel()
             except RuntimeError:
                 pass
         super().__del__()
@@ -87,11 +85,9 @@ class Switch(Device):
         """Process incoming and outgoing GROUP WRITE telegram."""
         if await self.switch.process(telegram):
             if self.reset_after is not None and self.switch.value:
-                self._reset_task = self.xknx.task_registry.register(
-                    name=self._reset_task_name,
-                    async_func=partial(self._reset_state, self.reset_after),
-                    track_task=True,
-                ).start()
+                self._reset_timer = self.xknx.task_registry.timers.call_later(
+                    self._reset_timer_name, self.reset_after, self._reset_state
+                )
 
     async def process_group_read(self, telegram: "Telegram") -> None:
         """Process incoming GroupValueResponse telegrams."""
@@ -101,8 +97,7 @@ class Switch(Device):
         ):
             await self.switch.respond()
 
-    async def _reset_state(self, wait_seconds: float) -> None:
-        await asyncio.sleep(wait_seconds)
+    async def _reset_state(self) -> None:
         await self.set_off()
 
     def __str__(self) -> str:
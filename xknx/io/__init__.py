@@ -2,30 +2,63 @@
 This package contains all objects managing Tunneling and Routing Connections..
 
 - KNXIPInterface is the overall managing class.
+- CaptureRecorder records raw KNX/IP frames of all connections to a binary or pcapng file.
+- CaptureReplay feeds recorded telegrams into XKNX for load testing.
+- MultiGatewayInterface manages connections to multiple KNX/IP devices.
+- GatewaySimulator simulates a KNX/IP device and its TP1 bus for tests and benchmarks.
 - GatewayScanner searches for available KNX/IP devices in the local network.
+- GatewayMonitor reports KNX/IP devices appearing, disappearing or changing tunnelling slot occupancy.
 - Routing uses UDP/Multicast to communicate with KNX/IP device.
 - Tunnel uses UDP packets and builds a static tunnel with KNX/IP device.
+- TunnellingServer provides tunnelling connections for multiple clients over one upstream connection.
 """
 # flake8: noqa
-from .connection import ConnectionConfig, ConnectionType, SecureConfig
+from .capture import CapturedFrame, CaptureRecorder, read_capture
+from .capture_replay import CaptureReplay, ReplayStatistics
+from .connection import ConnectionConfig, ConnectionType, GatewayRoute, SecureConfig
 from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
-from .gateway_scanner import GatewayDescriptor, GatewayScanFilter, GatewayScanner
-from .knxip_interface import KNXIPInterface, knx_interface_factory
+from .gateway_monitor import GatewayEvent, GatewayEventType, GatewayMonitor
+from .gateway_scanner import (
+    GatewayDescriptor,
+    GatewayScanCache,
+    GatewayScanFilter,
+    GatewayScanner,
+)
+from .gateway_simulator import GatewaySimulator
+from .knxip_interface import (
+    KNXIPInterface,
+    MultiGatewayInterface,
+    knx_interface_factory,
+)
 from .routing import Routing
 from .self_description import DescriptionQuery
 from .tunnel import TCPTunnel, UDPTunnel
+from .tunnelling_server import TunnellingServer
 
 __all__ = [
+    "CapturedFrame",
+    "CaptureRecorder",
+    "CaptureReplay",
     "DEFAULT_MCAST_GRP",
     "DEFAULT_MCAST_PORT",
     "DescriptionQuery",
+    "GatewayEvent",
+    "GatewayEventType",
+    "GatewayMonitor",
+    "GatewayScanCache",
     "GatewayScanFilter",
     "GatewayScanner",
+    "GatewaySimulator",
     "ConnectionConfig",
     "SecureConfig",
     "ConnectionType",
+    "GatewayRoute",
     "KNXIPInterface",
+    "MultiGatewayInterface",
+    "ReplayStatistics",
     "Routing",
     "TCPTunnel",
+    "TunnellingServer",
     "UDPTunnel",
+    "read_capture",
 ]
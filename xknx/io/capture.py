@@ -0,0 +1,375 @@
+"""
+Record raw KNX/IP frames sent and received by all transports to a file.
+
+The native capture format is a length-prefixed binary format:
+
+* file header: magic, format version, wall clock and monotonic time of the start
+    of the recording in nanoseconds.
+* blocks, each starting with an index header: marker, frame count, byte length of
+    the frames in this block, monotonic timestamps of the first and last frame.
+    Readers can skip whole blocks to seek to a point in time.
+* frames: length of the raw frame, flags (outgoing, TCP), monotonic timestamp in
+    nanoseconds, remote IPv4 address and port, raw KNX/IP frame.
+
+Alternatively pcapng files can be written to be opened with Wireshark.
+
+Frames are encoded into an in-memory block by the thread of the transport - eg.
+the connection thread of KNXIPInterfaceThreaded - guarded by a lock. Full blocks
+are handed to a background thread writing and rotating the files.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import logging
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+from typing import BinaryIO, NamedTuple
+
+from xknx.exceptions import XKNXException
+
+logger = logging.getLogger("xknx.log")
+
+CAPTURE_MAGIC = b"XKNXCAP\x00"
+CAPTURE_VERSION = 1
+BLOCK_MARKER = b"XKIB"
+
+FLAG_OUTGOING = 0x01
+FLAG_TCP = 0x02
+
+# magic, version, wall clock start ns, monotonic start ns
+FILE_HEADER = struct.Struct(">8sHqq")
+# marker, frame count, byte length, first timestamp, last timestamp
+BLOCK_HEADER = struct.Struct(">4sIIqq")
+# frame length, flags, monotonic timestamp ns, remote ip, remote port
+FRAME_HEADER = struct.Struct(">HBq4sH")
+
+# pcapng Section Header Block, Interface Description Block and Enhanced Packet Block
+PCAPNG_SHB = struct.pack("<IIIHHqI", 0x0A0D0D0A, 28, 0x1A2B3C4D, 1, 0, -1, 28)
+# there is no link type for KNXnet/IP - frames are wrapped in IPv4/UDP headers
+# so Wireshark dissects them by the KNXnet/IP port
+LINKTYPE_IPV4 = 228
+PCAPNG_IDB = struct.pack("<IIHHII", 1, 20, LINKTYPE_IPV4, 0, 0, 20)
+PCAPNG_EPB_HEADER = struct.Struct("<IIIIIII")
+IPV4_UDP_HEADER = struct.Struct(">BBHHHBBH4s4sHHHH")
+# placeholder for the local endpoint of synthesized IPv4/UDP headers
+PCAPNG_LOCAL_ADDR = (socket.inet_aton("0.0.0.0"), 3671)
+
+# recorders frames are passed to by transports
+active_recorders: list[CaptureRecorder] = []
+
+
+def record_frame(
+    raw: bytes, outgoing: bool, remote_addr: tuple[str, int], tcp: bool = False
+) -> None:
+    """Pass a raw KNX/IP frame to all active recorders."""
+    for recorder in active_recorders:
+        recorder.record(raw, outgoing, remote_addr, tcp)
+
+
+class CapturedFrame(NamedTuple):
+    """KNX/IP frame read from a capture file."""
+
+    timestamp: float
+    outgoing: bool
+    tcp: bool
+    remote_addr: tuple[str, int]
+    raw: bytes
+
+
+class CaptureRecorder:
+    """
+    Class for recording raw KNX/IP frames of all transports.
+
+    Handles:
+    * path: File to write to. An existing file is rotated on start.
+    * pcapng: Write pcapng instead of the native capture format.
+    * max_bytes: Rotate the file when it would exceed this size. 0 to disable.
+    * backup_count: Number of rotated files to keep (`path`.1, `path`.2, ...).
+    * block_size: Bytes buffered before a block is handed to the writer thread.
+    * flush_interval: Seconds after which incomplete blocks are written.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        pcapng: bool = False,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        block_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize CaptureRecorder class."""
+        self.path = path
+        self.pcapng = pcapng
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.block_size = block_size
+        self.flush_interval = flush_interval
+        self.frames = 0
+
+        self._start_wall_ns = 0
+        self._start_monotonic_ns = 0
+        self._buffer = bytearray()
+        self._block_frames = 0
+        self._block_first_ns = 0
+        self._block_last_ns = 0
+        self._packed_addresses: dict[tuple[str, int], tuple[bytes, int]] = {}
+        # record() may be called from other threads than flush()
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the recorder is running."""
+        return self._writer is not None
+
+    async def start(self) -> None:
+        """Start recording frames of all transports."""
+        if self._writer is not None:
+            return
+        self._start_wall_ns = time.time_ns()
+        self._start_monotonic_ns = time.monotonic_ns()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="xknx capture writer", daemon=True
+        )
+        self._writer.start()
+        active_recorders.append(self)
+        self._schedule_flush()
+
+    async def stop(self) -> None:
+        """Stop recording and wait until all frames are written."""
+        if self._writer is None:
+            return
+        if self in active_recorders:
+            active_recorders.remove(self)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self.flush()
+        self._queue.put(None)
+        writer, self._writer = self._writer, None
+        await asyncio.get_running_loop().run_in_executor(None, writer.join)
+
+    def _schedule_flush(self) -> None:
+        """Write incomplete blocks every `flush_interval` seconds."""
+        self._flush_handle = asyncio.get_running_loop().call_later(
+            self.flush_interval, self._periodic_flush
+        )
+
+    def _periodic_flush(self) -> None:
+        """Flush the current block and reschedule."""
+        self.flush()
+        self._schedule_flush()
+
+    def record(
+        self, raw: bytes, outgoing: bool, remote_addr: tuple[str, int], tcp: bool
+    ) -> None:
+        """Append a raw KNX/IP frame to the current block. Thread-safe."""
+        with self._lock:
+            timestamp = time.monotonic_ns()
+            try:
+                packed_ip, port = self._packed_addresses[remote_addr]
+            except KeyError:
+                packed_ip, port = self._packed_addresses[remote_addr] = (
+                    socket.inet_aton(remote_addr[0]),
+                    remote_addr[1],
+                )
+            if self.pcapng:
+                self._encode_pcapng(raw, outgoing, packed_ip, port, timestamp)
+            else:
+                self._buffer += FRAME_HEADER.pack(
+                    len(raw),
+                    (FLAG_OUTGOING if outgoing else 0) | (FLAG_TCP if tcp else 0),
+                    timestamp,
+                    packed_ip,
+                    port,
+                )
+                self._buffer += raw
+            if not self._block_frames:
+                self._block_first_ns = timestamp
+            self._block_last_ns = timestamp
+            self._block_frames += 1
+            self.frames += 1
+            if len(self._buffer) >= self.block_size:
+                self._flush()
+
+    def _encode_pcapng(
+        self,
+        raw: bytes,
+        outgoing: bool,
+        packed_ip: bytes,
+        port: int,
+        timestamp: int,
+    ) -> None:
+        """Append an Enhanced Packet Block with IPv4/UDP headers. Lock must be held."""
+        remote = (packed_ip, port)
+        (src_ip, src_port), (dst_ip, dst_port) = (
+            (PCAPNG_LOCAL_ADDR, remote) if outgoing else (remote, PCAPNG_LOCAL_ADDR)
+        )
+        packet_length = IPV4_UDP_HEADER.size + len(raw)
+        padding = -packet_length % 4
+        timestamp_us = (
+            self._start_wall_ns + timestamp - self._start_monotonic_ns
+        ) // 1000
+        self._buffer += PCAPNG_EPB_HEADER.pack(
+            6,
+            32 + packet_length + padding,
+            0,
+            timestamp_us >> 32,
+            timestamp_us & 0xFFFFFFFF,
+            packet_length,
+            packet_length,
+        )
+        self._buffer += IPV4_UDP_HEADER.pack(
+            0x45,  # IPv4, 20 byte header
+            0,
+            packet_length,
+            0,
+            0x4000,  # don't fragment
+            64,  # TTL
+            17,  # UDP
+            0,  # checksum not calculated
+            src_ip,
+            dst_ip,
+            src_port,
+            dst_port,
+            packet_length - 20,
+            0,  # no UDP checksum
+        )
+        self._buffer += raw
+        self._buffer += bytes(padding)
+        self._buffer += (32 + packet_length + padding).to_bytes(4, "little")
+
+    def flush(self) -> None:
+        """Hand the current block to the writer thread. Thread-safe."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Hand the current block to the writer thread. Lock must be held."""
+        if not self._block_frames:
+            return
+        if self.pcapng:
+            block = bytes(self._buffer)
+        else:
+            block = (
+                BLOCK_HEADER.pack(
+                    BLOCK_MARKER,
+                    self._block_frames,
+                    len(self._buffer),
+                    self._block_first_ns,
+                    self._block_last_ns,
+                )
+                + self._buffer
+            )
+        self._buffer.clear()
+        self._block_frames = 0
+        self._queue.put(block)
+
+    def _file_header(self) -> bytes:
+        """Return the header for a new file."""
+        if self.pcapng:
+            return PCAPNG_SHB + PCAPNG_IDB
+        return FILE_HEADER.pack(
+            CAPTURE_MAGIC,
+            CAPTURE_VERSION,
+            self._start_wall_ns,
+            self._start_monotonic_ns,
+        )
+
+    def _open(self) -> BinaryIO:
+        """Open a new file and write its header. Runs in the writer thread."""
+        # pylint: disable=consider-using-with
+        file = open(self.path, "wb")
+        file.write(self._file_header())
+        return file
+
+    def _rotate(self) -> None:
+        """Rename `path` to `path`.1 and existing backups. Runs in the writer thread."""
+        if not os.path.exists(self.path):
+            return
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _write_loop(self) -> None:
+        """Write blocks from the queue to the file. Writer thread target."""
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path):
+                self._rotate()
+            file = self._open()
+        except OSError:
+            logger.exception("Could not open capture file %s", self.path)
+            # drain the queue so stop() doesn't wait forever
+            while self._queue.get() is not None:
+                pass
+            return
+        header_size = file.tell()
+        try:
+            while (block := self._queue.get()) is not None:
+                size = file.tell()
+                if (
+                    self.max_bytes
+                    and size > header_size
+                    and size + len(block) > self.max_bytes
+                ):
+                    file.close()
+                    self._rotate()
+                    file = self._open()
+                file.write(block)
+                file.flush()
+        except OSError:
+            logger.exception("Could not write capture file %s", self.path)
+        finally:
+            file.close()
+
+
+def read_capture(path: str) -> Iterator[CapturedFrame]:
+    """Yield frames of a file written by CaptureRecorder in the native format."""
+    with open(path, "rb") as file:
+        header = file.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            raise XKNXException(f"Invalid capture file: {path}")
+        magic, version, start_wall_ns, start_monotonic_ns = FILE_HEADER.unpack(header)
+        if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+            raise XKNXException(f"Invalid capture file: {path}")
+        wall_offset_ns = start_wall_ns - start_monotonic_ns
+        while block_header := file.read(BLOCK_HEADER.size):
+            if len(block_header) < BLOCK_HEADER.size:
+                logger.warning("Truncated capture file %s", path)
+                return
+            marker, frame_count, length, _, _ = BLOCK_HEADER.unpack(block_header)
+            block = file.read(length)
+            if marker != BLOCK_MARKER or len(block) < length:
+                logger.warning("Truncated capture file %s", path)
+                return
+            offset = 0
+            for _ in range(frame_count):
+                (
+                    frame_length,
+                    flags,
+                    timestamp,
+                    packed_ip,
+                    port,
+                ) = FRAME_HEADER.unpack_from(block, offset)
+                offset += FRAME_HEADER.size
+                yield CapturedFrame(
+                    timestamp=(timestamp + wall_offset_ns) / 1e9,
+                    outgoing=bool(flags & FLAG_OUTGOING),
+                    tcp=bool(flags & FLAG_TCP),
+                    remote_addr=(socket.inet_ntoa(packed_ip), port),
+                    raw=block[offset : offset + frame_length],
+                )
+                offset += frame_length
@@ -0,0 +1,219 @@
+"""
+Replay recorded KNX/IP traffic into XKNX for load testing.
+
+Incoming L_DATA_IND frames of a capture file written by CaptureRecorder are parsed
+and fed into the telegram queue of XKNX as if they were received by KNXIPInterface.
+Original inter-arrival times can be kept, scaled or ignored.
+"""
+from __future__ import annotations
+
+import asyncio
+from itertools import islice
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Callable
+
+from xknx.exceptions import CouldNotParseKNXIP
+from xknx.knxip import (
+    CEMIFrame,
+    CEMIMessageCode,
+    KNXIPFrame,
+    RoutingIndication,
+    TunnellingRequest,
+)
+from xknx.telegram import Telegram, TelegramDirection
+
+from .capture import CapturedFrame, read_capture
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+logger = logging.getLogger("xknx.log")
+
+# frames fed without waiting before yielding to the event loop when running as fast as possible
+REPLAY_BURST = 100
+# frames read from the capture file per executor job
+REPLAY_READ_BATCH = 1000
+
+
+class LatencyStatistics:
+    """Count, mean and maximum of latency samples in seconds."""
+
+    def __init__(self) -> None:
+        """Initialize LatencyStatistics class."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, latency: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    @property
+    def mean(self) -> float:
+        """Return mean latency."""
+        return self.total / self.count if self.count else 0.0
+
+    def __str__(self) -> str:
+        """Return object as readable string."""
+        return f"mean={self.mean * 1e6:.1f}us max={self.max * 1e6:.1f}us"
+
+
+class ReplayStatistics:
+    """
+    Results of a capture replay.
+
+    Telemetry:
+    * frames: frames read from the capture file.
+    * telegrams: telegrams fed into XKNX.
+    * skipped: frames not containing an incoming telegram (outgoing, control, secure).
+    * duration: seconds from feeding the first telegram until all were processed.
+    * parse_latency: time to parse a raw frame into a Telegram.
+    * schedule_lag: time telegrams were fed later than their scaled capture time.
+    * queue_latency: time from feeding a telegram until TelegramQueue processed it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize ReplayStatistics class."""
+        self.frames = 0
+        self.telegrams = 0
+        self.skipped = 0
+        self.duration = 0.0
+        self.parse_latency = LatencyStatistics()
+        self.schedule_lag = LatencyStatistics()
+        self.queue_latency = LatencyStatistics()
+
+    @property
+    def throughput(self) -> float:
+        """Return processed telegrams per second."""
+        return self.telegrams / self.duration if self.duration else 0.0
+
+    def __str__(self) -> str:
+        """Return object as readable string."""
+        return (
+            f"<ReplayStatistics frames={self.frames} telegrams={self.telegrams} "
+            f"skipped={self.skipped} duration={self.duration:.3f}s "
+            f"throughput={self.throughput:.1f}/s parse=({self.parse_latency}) "
+            f"schedule_lag=({self.schedule_lag}) queue=({self.queue_latency}) />"
+        )
+
+
+def telegram_from_frame(raw: bytes) -> Telegram | None:
+    """Return the incoming Telegram of a raw RoutingIndication or TunnellingRequest."""
+    knxipframe = KNXIPFrame()
+    try:
+        knxipframe.from_knx(raw)
+    except CouldNotParseKNXIP:
+        return None
+    cemi: CEMIFrame | None
+    if isinstance(knxipframe.body, RoutingIndication):
+        cemi = knxipframe.body.cemi
+    elif isinstance(knxipframe.body, TunnellingRequest) and isinstance(
+        knxipframe.body.pdu, CEMIFrame
+    ):
+        cemi = knxipframe.body.pdu
+    else:
+        return None
+    if cemi is None or cemi.code is not CEMIMessageCode.L_DATA_IND:
+        return None
+    telegram = cemi.telegram
+    telegram.direction = TelegramDirection.INCOMING
+    return telegram
+
+
+class CaptureReplay:
+    """
+    Class for feeding recorded telegrams into XKNX.
+
+    The telegram queue of `xknx` has to be running (eg. `await xknx.telegram_queue.start()`).
+
+    Handles:
+    * path: Capture file in the native format of CaptureRecorder.
+    * speed: Factor for replay speed. 1.0 keeps original inter-arrival times,
+        2.0 replays twice as fast. None replays as fast as possible.
+    """
+
+    def __init__(self, xknx: XKNX, path: str, speed: float | None = 1.0) -> None:
+        """Initialize CaptureReplay class."""
+        self.xknx = xknx
+        self.path = path
+        self.speed = speed
+        self.statistics = ReplayStatistics()
+        self._fed_times: dict[int, float] = {}
+
+    def _telegram_received_callback(self) -> Callable[[Telegram], None]:
+        """Return the callback of the interface or put telegrams to the queue directly."""
+        if self.xknx.knxip_interface is not None:
+            return self.xknx.knxip_interface.telegram_received
+        return self.xknx.telegrams.put_nowait
+
+    async def _telegram_processed(self, telegram: Telegram) -> None:
+        """Measure queue latency. TelegramQueue callback."""
+        if (fed_time := self._fed_times.pop(id(telegram), None)) is not None:
+            self.statistics.queue_latency.add(time.perf_counter() - fed_time)
+
+    async def _read_frames(self) -> AsyncIterator[CapturedFrame]:
+        """Yield frames of the capture file read in batches by the executor."""
+        loop = asyncio.get_running_loop()
+        frames = read_capture(self.path)
+        while batch := await loop.run_in_executor(
+            None, list, islice(frames, REPLAY_READ_BATCH)
+        ):
+            for frame in batch:
+                yield frame
+
+    async def run(self) -> ReplayStatistics:
+        """Replay the capture file and wait until all telegrams are processed."""
+        statistics = self.statistics = ReplayStatistics()
+        self._fed_times.clear()
+        telegram_received = self._telegram_received_callback()
+        callback = self.xknx.telegram_queue.register_telegram_received_cb(
+            self._telegram_processed
+        )
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        replay_start = loop.time()
+        first_frame_time: float | None = None
+        burst = 0
+        try:
+            async for frame in self._read_frames():
+                statistics.frames += 1
+                if frame.outgoing:
+                    statistics.skipped += 1
+                    continue
+                parse_start = time.perf_counter()
+                telegram = telegram_from_frame(frame.raw)
+                parse_end = time.perf_counter()
+                if telegram is None:
+                    statistics.skipped += 1
+                    continue
+                statistics.parse_latency.add(parse_end - parse_start)
+
+                if first_frame_time is None:
+                    first_frame_time = frame.timestamp
+                    start_time = parse_end
+                    replay_start = loop.time()
+                if self.speed:
+                    scheduled = (
+                        replay_start + (frame.timestamp - first_frame_time) / self.speed
+                    )
+                    if (delay := scheduled - loop.time()) > 0:
+                        await asyncio.sleep(delay)
+                    statistics.schedule_lag.add(max(0.0, loop.time() - scheduled))
+                elif (burst := burst + 1) >= REPLAY_BURST:
+                    burst = 0
+                    await asyncio.sleep(0)
+
+                self._fed_times[id(telegram)] = time.perf_counter()
+                telegram_received(telegram)
+                statistics.telegrams += 1
+            # threaded interfaces put telegrams to the queue with call_soon_threadsafe
+            await asyncio.sleep(0)
+            await self.xknx.telegrams.join()
+        finally:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(callback)
+        statistics.duration = time.perf_counter() - start_time
+        logger.info("Capture replay finished: %s", statistics)
+        return statistics
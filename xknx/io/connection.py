@@ -2,9 +2,15 @@
 from __future__ import annotations
 
 from enum import Enum, auto
+from typing import TYPE_CHECKING
+
+from xknx.telegram import AddressFilter
 
 from .const import DEFAULT_MCAST_PORT
-from .gateway_scanner import GatewayScanFilter
+from .gateway_scanner import GatewayScanCache, GatewayScanFilter
+
+if TYPE_CHECKING:
+    from .gateway_monitor import GatewayMonitor
 
 
 class ConnectionType(Enum):
@@ -15,6 +21,7 @@ class ConnectionType(Enum):
     TUNNELING = auto()
     TUNNELING_TCP = auto()
     TUNNELING_TCP_SECURE = auto()
+    MULTI_GATEWAY = auto()
 
 
 class ConnectionConfig:
@@ -27,6 +34,7 @@ class ConnectionConfig:
         * ROUTING use KNX/IP multicast routing.
         * TUNNELING connect to a specific KNX/IP tunneling device via UDP.
         * TUNNELING_TCP connect to a specific KNX/IP tunneling v2 device via TCP.
+        * MULTI_GATEWAY connect to multiple KNX/IP devices configured in `gateway_routes`.
     * local_ip: Local ip of the interface though which KNXIPInterface should connect.
     * gateway_ip: IP of KNX/IP tunneling device.
     * gateway_port: Port of KNX/IP tunneling device.
@@ -35,9 +43,18 @@ class ConnectionConfig:
         as the target IP address or port number for the response to the KNXnet/IP Client.
     * auto_reconnect: Auto reconnect to KNX/IP tunneling device if connection cannot be established.
     * auto_reconnect_wait: Wait n seconds before trying to reconnect to KNX/IP tunneling device.
+        The wait time is doubled after every round of failed attempts.
+    * auto_reconnect_max_wait: Maximum seconds to wait between reconnect attempts.
+    * alternative_gateways: For TUNNELING and TUNNELING_TCP connections, list of
+        (ip, port) tuples of KNX/IP tunneling devices to try if reconnecting fails.
     * scan_filter: For AUTOMATIC connection, limit scan with the given filter
+    * scan_cache: For AUTOMATIC connection, GatewayScanCache to reuse recently discovered
+        KNX/IP devices instead of scanning on every start.
+    * gateway_monitor: For AUTOMATIC connection, a running GatewayMonitor. Present devices
+        with the most free tunnelling slots are tried before scanning.
     * threaded: Run connection logic in separate thread to avoid concurrency issues in HA
     * secure_config: KNX Secure config to use
+    * gateway_routes: For MULTI_GATEWAY connection, list of GatewayRoute objects.
     """
 
     def __init__(
@@ -51,9 +68,14 @@ class ConnectionConfig:
         route_back: bool = False,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        auto_reconnect_max_wait: float = 60,
+        alternative_gateways: list[tuple[str, int]] | None = None,
         scan_filter: GatewayScanFilter = GatewayScanFilter(),
+        scan_cache: GatewayScanCache | None = None,
+        gateway_monitor: GatewayMonitor | None = None,
         threaded: bool = False,
         secure_config: SecureConfig | None = None,
+        gateway_routes: list[GatewayRoute] | None = None,
     ):
         """Initialize ConnectionConfig class."""
         self.connection_type = connection_type
@@ -64,9 +86,14 @@ class ConnectionConfig:
         self.route_back = route_back
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
+        self.auto_reconnect_max_wait = auto_reconnect_max_wait
+        self.alternative_gateways = alternative_gateways or []
         self.scan_filter = scan_filter
+        self.scan_cache = scan_cache
+        self.gateway_monitor = gateway_monitor
         self.threaded = threaded
         self.secure_config = secure_config
+        self.gateway_routes = gateway_routes or []
 
     def __eq__(self, other: object) -> bool:
         """Equality for ConnectionConfig class (used in unit tests)."""
@@ -104,3 +131,38 @@ class SecureConfig:
     def __eq__(self, other: object) -> bool:
         """Equality for SecureConfig class (used in unit tests)."""
         return self.__dict__ == other.__dict__
+
+
+class GatewayRoute:
+    """
+    Configuration of one connection of a MULTI_GATEWAY connection.
+
+    Handles:
+    * connection_config: ConnectionConfig used to connect to this KNX/IP device.
+        Its connection_type must not be MULTI_GATEWAY. If `threaded` is set the
+        connection runs in a thread of its own.
+    * address_filters: Group addresses routed to this connection. Uses AddressFilter patterns
+        like "1/*/*" or "2/0-3/*". A route without filters is the default route for
+        group addresses not matched by any other route and for individual addresses.
+    * rate_limit: Maximum telegrams per second sent to this connection. 0 to disable.
+    * name: Name of the connection used in log messages.
+    """
+
+    def __init__(
+        self,
+        connection_config: ConnectionConfig,
+        *,
+        address_filters: list[str | AddressFilter] | None = None,
+        rate_limit: int = 20,
+        name: str | None = None,
+    ):
+        """Initialize GatewayRoute class."""
+        self.connection_config = connection_config
+        self.address_filters = [
+            AddressFilter(address_filter)
+            if isinstance(address_filter, str)
+            else address_filter
+            for address_filter in address_filters or []
+        ]
+        self.rate_limit = rate_limit
+        self.name = name
@@ -6,6 +6,9 @@ DEFAULT_MCAST_PORT = 3671
 CONNECTION_ALIVE_TIME = 120
 CONNECTIONSTATE_REQUEST_TIMEOUT = 10
 HEARTBEAT_RATE = CONNECTION_ALIVE_TIME - (CONNECTIONSTATE_REQUEST_TIMEOUT * 5)
+# heartbeat interval after a reconnect or a missing L_DATA_CON. It is doubled
+# after every successful heartbeat until HEARTBEAT_RATE is reached again.
+HEARTBEAT_RATE_MIN = 10
 
 # Maximum time an authenticated secure session may remain unused (without
 # any communication over this session) until the session will be dropped.
@@ -0,0 +1,262 @@
+"""
+GatewayMonitor keeps track of KNX/IP devices in the local network.
+
+It scans for devices once and then periodically sends unicast DescriptionRequests
+to the known devices. Devices appearing, disappearing or changing the occupancy
+of their tunnelling slots are reported to registered callbacks.
+"""
+from __future__ import annotations
+
+import asyncio
+from enum import Enum, auto
+import logging
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from .gateway_scanner import GatewayDescriptor, GatewayScanFilter, GatewayScanner
+from .self_description import request_description
+
+if TYPE_CHECKING:
+    from xknx.xknx import XKNX
+
+logger = logging.getLogger("xknx.log")
+
+
+class GatewayEventType(Enum):
+    """Enum class for GatewayMonitor events."""
+
+    APPEARED = auto()
+    DISAPPEARED = auto()
+    SLOTS_CHANGED = auto()
+
+
+class GatewayEvent(NamedTuple):
+    """Change of a KNX/IP device reported by GatewayMonitor."""
+
+    event_type: GatewayEventType
+    gateway: GatewayDescriptor
+    previous: GatewayDescriptor | None = None
+
+
+GatewayEventCallbackType = Callable[[GatewayEvent], None]
+
+
+def free_tunnelling_slots(gateway: GatewayDescriptor) -> int | None:
+    """Return the number of usable free tunnelling slots or None if unknown."""
+    if not gateway.tunnelling_slots:
+        return None
+    return sum(
+        1 for slot in gateway.tunnelling_slots.values() if slot.usable and slot.free
+    )
+
+
+class GatewayMonitor:
+    """
+    Class for monitoring the presence of KNX/IP devices.
+
+    Handles:
+    * interval: Seconds between DescriptionRequests to known devices.
+    * scan_interval: Seconds between scans for new devices. None to scan only on start.
+    * max_missed_responses: Unanswered DescriptionRequests until a device is reported
+        as disappeared.
+    * local_ip: Only scan on the interface with this ip. Otherwise all interfaces are scanned.
+    * scan_filter: Only devices matching this filter are monitored.
+    """
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        interval: float = 30,
+        scan_interval: float | None = 600,
+        max_missed_responses: int = 2,
+        local_ip: str | None = None,
+        scan_filter: GatewayScanFilter = GatewayScanFilter(secure=None),
+        scan_timeout: float = 3.0,
+    ):
+        """Initialize GatewayMonitor class."""
+        self.xknx = xknx
+        self.interval = interval
+        self.scan_interval = scan_interval
+        self.max_missed_responses = max_missed_responses
+        self.local_ip = local_ip
+        self.scan_filter = scan_filter
+        self.scan_timeout = scan_timeout
+        # present devices by (ip_addr, port)
+        self.gateways: dict[tuple[str, int], GatewayDescriptor] = {}
+        # devices that have been seen - they are queried even when disappeared
+        self._known_gateways: dict[tuple[str, int], GatewayDescriptor] = {}
+        self._missed_responses: dict[tuple[str, int], int] = {}
+        self._gateway_event_cbs: list[GatewayEventCallbackType] = []
+        self._monitor_task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the monitor is running."""
+        return self._monitor_task is not None and not self._monitor_task.done()
+
+    def register_gateway_event_cb(
+        self, gateway_event_cb: GatewayEventCallbackType
+    ) -> None:
+        """Register callback for gateway events."""
+        self._gateway_event_cbs.append(gateway_event_cb)
+
+    def unregister_gateway_event_cb(
+        self, gateway_event_cb: GatewayEventCallbackType
+    ) -> None:
+        """Unregister callback for gateway events."""
+        if gateway_event_cb in self._gateway_event_cbs:
+            self._gateway_event_cbs.remove(gateway_event_cb)
+
+    async def start(self) -> None:
+        """Scan for devices and start monitoring them in the background."""
+        await self.scan()
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+
+    async def _monitor_loop(self) -> None:
+        """Query known devices every `interval` and scan every `scan_interval` seconds."""
+        loop = asyncio.get_running_loop()
+        next_scan = (
+            loop.time() + self.scan_interval if self.scan_interval is not None else None
+        )
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                if (
+                    next_scan is not None
+                    and self.scan_interval is not None
+                    and loop.time() >= next_scan
+                ):
+                    await self.scan()
+                    next_scan = loop.time() + self.scan_interval
+                else:
+                    await self.refresh()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Error while monitoring KNX/IP devices")
+
+    async def scan(self) -> None:
+        """Search for devices in the network and refresh known devices not found."""
+        scanner = GatewayScanner(
+            self.xknx,
+            local_ip=self.local_ip,
+            timeout_in_seconds=self.scan_timeout,
+            scan_filter=self.scan_filter,
+            all_interfaces=True,
+        )
+        found = {
+            (gateway.ip_addr, gateway.port): gateway for gateway in await scanner.scan()
+        }
+        for key, gateway in found.items():
+            self._gateway_responded(key, gateway)
+        # devices may not answer multicast search requests from every interface
+        await self._query(
+            [
+                gateway
+                for key, gateway in self._known_gateways.items()
+                if key not in found
+            ]
+        )
+
+    async def refresh(self) -> None:
+        """Send DescriptionRequests to all known devices and report changes."""
+        await self._query(list(self._known_gateways.values()))
+
+    async def _query(self, gateways: list[GatewayDescriptor]) -> None:
+        """Send DescriptionRequests to `gateways` concurrently and handle responses."""
+        responses = await asyncio.gather(
+            *(
+                request_description(
+                    gateway_ip=gateway.ip_addr,
+                    gateway_port=gateway.port,
+                    local_ip=gateway.local_ip or None,
+                )
+                for gateway in gateways
+            )
+        )
+        for gateway, response in zip(gateways, responses):
+            key = (gateway.ip_addr, gateway.port)
+            if response is None:
+                self._gateway_missed(key)
+            else:
+                self._gateway_responded(key, response)
+
+    def _gateway_responded(
+        self, key: tuple[str, int], gateway: GatewayDescriptor
+    ) -> None:
+        """Update a device that answered a request."""
+        self._missed_responses[key] = 0
+        previous = self.gateways.get(key) or self._known_gateways.get(key)
+        if previous is not None and not gateway.local_interface:
+            # DescriptionResponse doesn't know the interface it was received on
+            gateway.local_interface = previous.local_interface
+        self._known_gateways[key] = gateway
+
+        present = self.gateways.get(key)
+        self.gateways[key] = gateway
+        if present is None:
+            logger.debug("KNX/IP device appeared: %s", gateway)
+            self._notify(GatewayEvent(GatewayEventType.APPEARED, gateway, previous))
+            return
+        # not every device reports tunnelling slots in a DescriptionResponse
+        if (
+            gateway.tunnelling_slots
+            and present.tunnelling_slots
+            and gateway.tunnelling_slots != present.tunnelling_slots
+        ):
+            logger.debug(
+                "Tunnelling slots of KNX/IP device %s changed: %s free",
+                gateway,
+                free_tunnelling_slots(gateway),
+            )
+            self._notify(GatewayEvent(GatewayEventType.SLOTS_CHANGED, gateway, present))
+        elif not gateway.tunnelling_slots:
+            gateway.tunnelling_slots = present.tunnelling_slots
+
+    def _gateway_missed(self, key: tuple[str, int]) -> None:
+        """Count a missed response and report disappeared devices."""
+        missed = self._missed_responses[key] = self._missed_responses.get(key, 0) + 1
+        if missed >= self.max_missed_responses and (
+            gateway := self.gateways.pop(key, None)
+        ):
+            logger.debug("KNX/IP device disappeared: %s", gateway)
+            self._notify(GatewayEvent(GatewayEventType.DISAPPEARED, gateway))
+
+    def _notify(self, event: GatewayEvent) -> None:
+        """Call registered callbacks."""
+        for gateway_event_cb in self._gateway_event_cbs:
+            try:
+                gateway_event_cb(event)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Unexpected error in gateway event callback")
+
+    def least_loaded_gateways(
+        self, scan_filter: GatewayScanFilter | None = None
+    ) -> list[GatewayDescriptor]:
+        """
+        Return present devices matching `scan_filter` ordered by free tunnelling slots.
+
+        Devices with unknown slot occupancy are ordered after devices with free slots.
+        Devices without free tunnelling slots are last if they support routing,
+        otherwise they are omitted.
+        """
+        candidates = []
+        for gateway in self.gateways.values():
+            if scan_filter is not None and not scan_filter.match(gateway):
+                continue
+            free_slots = free_tunnelling_slots(gateway)
+            if free_slots is None:
+                candidates.append(((1, 0), gateway))
+            elif free_slots:
+                candidates.append(((2, free_slots), gateway))
+            elif gateway.supports_routing:
+                candidates.append(((0, 0), gateway))
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        return [gateway for _, gateway in candidates]
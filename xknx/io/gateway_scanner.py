@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import asyncio
 from functools import partial
+import json
 import logging
-from typing import TYPE_CHECKING, AsyncGenerator
+import time
+from typing import TYPE_CHECKING, Any, AsyncGenerator, cast
 
 from xknx.exceptions import XKNXException
 from xknx.io import util
@@ -103,6 +105,48 @@ class GatewayDescriptor:
                 self.tunnelling_slots = dib.slots
                 continue
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable dict of the GatewayDescriptor. Tunnelling slots are omitted."""
+        return {
+            "name": self.name,
+            "ip_addr": self.ip_addr,
+            "port": self.port,
+            "local_ip": self.local_ip,
+            "local_interface": self.local_interface,
+            "supports_routing": self.supports_routing,
+            "supports_tunnelling": self.supports_tunnelling,
+            "supports_tunnelling_tcp": self.supports_tunnelling_tcp,
+            "supports_secure": self.supports_secure,
+            "individual_address": (
+                str(self.individual_address) if self.individual_address else None
+            ),
+            "routing_requires_secure": self.routing_requires_secure,
+            "tunnelling_requires_secure": self.tunnelling_requires_secure,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GatewayDescriptor:
+        """Return a GatewayDescriptor from a dict created by `as_dict()`."""
+        gateway = cls(
+            ip_addr=data["ip_addr"],
+            port=data["port"],
+            local_ip=data.get("local_ip", ""),
+            local_interface=data.get("local_interface", ""),
+            name=data.get("name", "UNKNOWN"),
+            supports_routing=data.get("supports_routing", False),
+            supports_tunnelling=data.get("supports_tunnelling", False),
+            supports_tunnelling_tcp=data.get("supports_tunnelling_tcp", False),
+            supports_secure=data.get("supports_secure", False),
+            individual_address=(
+                IndividualAddress(data["individual_address"])
+                if data.get("individual_address")
+                else None
+            ),
+        )
+        gateway.routing_requires_secure = data.get("routing_requires_secure")
+        gateway.tunnelling_requires_secure = data.get("tunnelling_requires_secure")
+        return gateway
+
     def __repr__(self) -> str:
         """Return object as representation string."""
         return (
@@ -176,8 +220,107 @@ class GatewayScanFilter:
         )
 
 
+class GatewayScanCache:
+    """
+    Cache for discovered KNX/IP devices.
+
+    Handles:
+    * ttl: Seconds a discovered device is returned from the cache.
+    * path: Optional JSON file the cache is loaded from and saved to
+        so discovery results survive restarts.
+    """
+
+    def __init__(self, ttl: float = 3600, path: str | None = None):
+        """Initialize GatewayScanCache class."""
+        self.ttl = ttl
+        self.path = path
+        # (ip_addr, port): (discovery timestamp, GatewayDescriptor)
+        self._entries: dict[tuple[str, int], tuple[float, GatewayDescriptor]] = {}
+        if path is not None:
+            self.load()
+
+    def gateways(self, local_ip: str | None = None) -> list[GatewayDescriptor]:
+        """Return gateways discovered within `ttl` seconds, optionally only from `local_ip`."""
+        expired = time.time() - self.ttl
+        return [
+            gateway
+            for timestamp, gateway in self._entries.values()
+            if timestamp > expired
+            and (local_ip is None or gateway.local_ip == local_ip)
+        ]
+
+    def add(self, gateway: GatewayDescriptor, timestamp: float | None = None) -> None:
+        """Add or refresh a discovered gateway."""
+        self._entries[(gateway.ip_addr, gateway.port)] = (
+            time.time() if timestamp is None else timestamp,
+            gateway,
+        )
+
+    def clear(self) -> None:
+        """Remove all gateways from the cache."""
+        self._entries.clear()
+
+    def load(self) -> None:
+        """Load unexpired gateways from `path`."""
+        if self.path is None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+            expired = time.time() - self.ttl
+            for entry in data:
+                if entry["timestamp"] > expired:
+                    self.add(
+                        GatewayDescriptor.from_dict(entry["gateway"]),
+                        timestamp=entry["timestamp"],
+                    )
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logger.warning("Could not load gateway scan cache %s: %s", self.path, err)
+
+    def save(self) -> None:
+        """Save unexpired gateways to `path`."""
+        if self.path is None:
+            return
+        self._write(self.path, self._serialize())
+
+    async def async_save(self) -> None:
+        """Save unexpired gateways to `path` without blocking the event loop."""
+        if self.path is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, self.path, self._serialize()
+        )
+
+    def _serialize(self) -> list[dict[str, Any]]:
+        """Return unexpired gateways as JSON serializable list."""
+        expired = time.time() - self.ttl
+        return [
+            {"timestamp": timestamp, "gateway": gateway.as_dict()}
+            for timestamp, gateway in self._entries.values()
+            if timestamp > expired
+        ]
+
+    @staticmethod
+    def _write(path: str, data: list[dict[str, Any]]) -> None:
+        """Write serialized gateways to `path`."""
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+        except OSError as err:
+            logger.warning("Could not save gateway scan cache %s: %s", path, err)
+
+
 class GatewayScanner:
-    """Class for searching KNX/IP devices."""
+    """
+    Class for searching KNX/IP devices.
+
+    If `all_interfaces` is set and no `local_ip` is given, all IPv4 interfaces
+    are searched concurrently. Otherwise only the interface of `local_ip` or the
+    default interface is used.
+    With a `cache` unexpired results of previous scans are returned first.
+    """
 
     def __init__(
         self,
@@ -186,6 +329,8 @@ class GatewayScanner:
         timeout_in_seconds: float = 3.0,
         stop_on_found: int | None = None,
         scan_filter: GatewayScanFilter = GatewayScanFilter(),
+        all_interfaces: bool = False,
+        cache: GatewayScanCache | None = None,
     ):
         """Initialize GatewayScanner class."""
         self.xknx = xknx
@@ -193,16 +338,46 @@ class GatewayScanner:
         self.timeout_in_seconds = timeout_in_seconds
         self.stop_on_found = stop_on_found
         self.scan_filter = scan_filter
+        self.all_interfaces = all_interfaces
+        self.cache = cache
         self.found_gateways: dict[HPAI, GatewayDescriptor] = {}
         self._response_received_event = asyncio.Event()
 
+    def _cached_gateways(self) -> list[GatewayDescriptor]:
+        """Return cached gateways matching the scan filter and add them to found_gateways."""
+        if self.cache is None:
+            return []
+        gateways = []
+        for gateway in self.cache.gateways(local_ip=self.local_ip):
+            if not self.scan_filter.match(gateway):
+                continue
+            self.found_gateways[HPAI(gateway.ip_addr, gateway.port)] = gateway
+            gateways.append(gateway)
+            if self.stop_on_found and len(self.found_gateways) >= self.stop_on_found:
+                break
+        return gateways
+
     async def scan(self) -> list[GatewayDescriptor]:
-        """Scan and return a list of GatewayDescriptors on success."""
-        await self._scan()
+        """
+        Scan and return a list of GatewayDescriptors on success.
+
+        If there are matching cached gateways they are returned without scanning.
+        """
+        if not self._cached_gateways():
+            await self._scan()
         return list(self.found_gateways.values())
 
     async def async_scan(self) -> AsyncGenerator[GatewayDescriptor, None]:
-        """Search and yield found gateways."""
+        """
+        Search and yield found gateways.
+
+        Cached gateways are yielded first. The network is only searched
+        if iteration continues after them.
+        """
+        for cached_gateway in self._cached_gateways():
+            yield cached_gateway
+        if self.stop_on_found and len(self.found_gateways) >= self.stop_on_found:
+            return
         queue: asyncio.Queue[GatewayDescriptor | None] = asyncio.Queue()
         scan_task = asyncio.create_task(self._scan(queue=queue))
         try:
@@ -217,33 +392,61 @@ class GatewayScanner:
                 scan_task.cancel()
             await scan_task  # to bubble up exceptions
 
+    async def _local_ips(self) -> list[str]:
+        """Return the local ips to search on."""
+        if self.local_ip:
+            return [self.local_ip]
+        if self.all_interfaces:
+            # ifaddr returns IPv4 addresses as str
+            local_ips = [cast(str, link.ip) for link in util.get_local_ips()]
+            return [
+                local_ip for local_ip in local_ips if not local_ip.startswith("127.")
+            ]
+        local_ip = await util.get_default_local_ip(remote_ip=self.xknx.multicast_group)
+        return [local_ip] if local_ip is not None else []
+
     async def _scan(
         self, queue: asyncio.Queue[GatewayDescriptor | None] | None = None
     ) -> None:
-        """Scan for gateways."""
-        local_ip = self.local_ip or await util.get_default_local_ip(
-            remote_ip=self.xknx.multicast_group
-        )
-        if local_ip is None:
+        """Scan for gateways on all local ips concurrently."""
+        local_ips = await self._local_ips()
+        if not local_ips:
             if queue is not None:
                 queue.put_nowait(None)
             raise XKNXException("No usable network interface found.")
-        interface_name = util.get_local_interface_name(local_ip=local_ip)
-        logger.debug("Searching on %s / %s", interface_name, local_ip)
 
-        udp_transport = UDPTransport(
-            local_addr=(local_ip, 0),
-            remote_addr=(self.xknx.multicast_group, self.xknx.multicast_port),
-        )
-        udp_transport.register_callback(
-            partial(self._response_rec_callback, interface=interface_name, queue=queue),
-            [
-                KNXIPServiceType.SEARCH_RESPONSE,
-                KNXIPServiceType.SEARCH_RESPONSE_EXTENDED,
-            ],
-        )
+        udp_transports = []
+        for local_ip in local_ips:
+            interface_name = util.get_local_interface_name(local_ip=local_ip)
+            logger.debug("Searching on %s / %s", interface_name, local_ip)
+            udp_transport = UDPTransport(
+                local_addr=(local_ip, 0),
+                remote_addr=(self.xknx.multicast_group, self.xknx.multicast_port),
+            )
+            udp_transport.register_callback(
+                partial(
+                    self._response_rec_callback, interface=interface_name, queue=queue
+                ),
+                [
+                    KNXIPServiceType.SEARCH_RESPONSE,
+                    KNXIPServiceType.SEARCH_RESPONSE_EXTENDED,
+                ],
+            )
+            udp_transports.append(udp_transport)
         try:
-            await self._send_search_requests(udp_transport=udp_transport)
+            results = await asyncio.gather(
+                *(
+                    self._send_search_requests(udp_transport=udp_transport)
+                    for udp_transport in udp_transports
+                ),
+                return_exceptions=True,
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+            for local_ip, result in zip(local_ips, results):
+                if isinstance(result, Exception):
+                    logger.debug("Could not search on %s: %s", local_ip, result)
+            if len(errors) == len(udp_transports):
+                raise errors[0]
             await asyncio.wait_for(
                 self._response_received_event.wait(),
                 timeout=self.timeout_in_seconds,
@@ -253,9 +456,12 @@ class GatewayScanner:
         except asyncio.CancelledError:
             pass
         finally:
-            udp_transport.stop()
+            for udp_transport in udp_transports:
+                udp_transport.stop()
             if queue is not None:
                 queue.put_nowait(None)
+            if self.cache is not None:
+                await self.cache.async_save()
 
     @staticmethod
     async def _send_search_requests(udp_transport: UDPTransport) -> None:
@@ -317,9 +523,13 @@ class GatewayScanner:
         gateway.parse_dibs(knx_ip_frame.body.dibs)
 
         logger.debug("Found KNX/IP device at %s: %s", source, repr(gateway))
+        if self.cache is not None:
+            self.cache.add(gateway)
         if self.scan_filter.match(gateway):
+            # yield every device only once - it may be found on multiple interfaces or in the cache
+            already_found = knx_ip_frame.body.control_endpoint in self.found_gateways
             self.found_gateways[knx_ip_frame.body.control_endpoint] = gateway
-            if queue is not None:
+            if queue is not None and not already_found:
                 queue.put_nowait(gateway)
             if self.stop_on_found and len(self.found_gateways) >= self.stop_on_found:
                 self._response_received_event.set()
@@ -0,0 +1,544 @@
+"""
+GatewaySimulator is an in-process KNXnet/IP gateway for tests and load benchmarks.
+
+It uses the KNXIPFrame classes of xknx to speak the server side of
+
+* tunnelling over UDP and TCP,
+* tunnelling over TCP secured by a KNXnet/IP Secure session,
+* routing over UDP multicast.
+
+Telegrams of tunnelling clients, routing and simulated devices are put on a
+simulated TP1 bus which transmits one frame at a time with the timing of a
+real twisted pair line (9600 baud). Latency of TunnellingAck and L_DATA_CON
+frames as well as UDP packet loss are configurable to test timeout and
+repetition handling of clients.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import socket
+from typing import Callable, Iterator, Union
+
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PublicKey
+
+from xknx.knxip import (
+    HPAI,
+    CEMIFrame,
+    CEMIMessageCode,
+    DIBServiceFamily,
+    DIBSuppSVCFamilies,
+    KNXIPFrame,
+    KNXIPServiceType,
+    RoutingIndication,
+    SecureWrapper,
+    SessionAuthenticate,
+    SessionRequest,
+    SessionResponse,
+    SessionStatus,
+)
+from xknx.knxip.knxip_enum import SecureSessionStatusCode
+from xknx.secure.ip_secure import (
+    SessionCipher,
+    calculate_message_authentication_code_cbc,
+    decrypt_ctr,
+    derive_device_authentication_password,
+    derive_user_password,
+    encrypt_data_ctr,
+    generate_ecdh_key_pair,
+)
+from xknx.secure.util import bytes_xor, sha256_hash
+from xknx.telegram import IndividualAddress, Telegram
+
+from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
+from .secure_session import COUNTER_0_HANDSHAKE, SecureSession
+from .transport import KNXIPTransport, TCPTransport, UDPTransport
+from .tunnelling_server import (
+    DEFAULT_MAX_CLIENTS,
+    TunnellingServerConnection,
+    _TunnellingServer,
+)
+
+logger = logging.getLogger("xknx.log")
+
+TP1_BAUDRATE = 9600
+# start bit, 8 data bits, parity bit, stop bit and 2 bit times pause
+TP1_CHARACTER_BITS = 13
+# 50 bit times bus idle before a frame, 15 bit times pause and 13 for the ACK character
+TP1_FRAME_OVERHEAD_BITS = 50 + 15 + 13
+
+BusOrigin = Union[TunnellingServerConnection, UDPTransport, None]
+
+
+def tp1_transmission_time(cemi: CEMIFrame, baudrate: int = TP1_BAUDRATE) -> float:
+    """Return the time in seconds a standard frame occupies a TP1 bus."""
+    if cemi.payload is None:
+        raise TypeError()
+    # control field, source, destination, length, TPCI/APCI with data and checksum
+    octets = 8 + cemi.payload.calculated_length()
+    return (TP1_FRAME_OVERHEAD_BITS + octets * TP1_CHARACTER_BITS) / baudrate
+
+
+class _SecureSessionServer(SecureSession):
+    """Server side of a KNXnet/IP Secure session of a GatewaySimulator client."""
+
+    def __init__(
+        self,
+        remote_addr: tuple[str, int],
+        session_id: int,
+        user_passwords: dict[int, bytes],
+        device_authentication_code: bytes | None,
+    ) -> None:
+        """Initialize _SecureSessionServer class."""
+        # the user is known from SessionAuthenticate - client passwords are not used
+        super().__init__(remote_addr=remote_addr, user_id=0, user_password="")
+        self.session_id = session_id
+        self._user_passwords = user_passwords
+        self._device_authentication_code = device_authentication_code
+        self._pub_keys_xor = bytes(32)
+        # initialized when the session key is known; authenticated after SessionAuthenticate
+        self.authenticated = False
+
+    def handle_knxipframe(self, knxipframe: KNXIPFrame, source: HPAI) -> None:
+        """Handle SessionRequest and decrypt SecureWrapper frames."""
+        if isinstance(knxipframe.body, SessionRequest):
+            self._session_request_received(knxipframe.body)
+            return
+        if not self.initialized or not isinstance(knxipframe.body, SecureWrapper):
+            logger.debug("GatewaySimulator: discarding unsecured frame %s", knxipframe)
+            return
+        super().handle_knxipframe(knxipframe, source)
+
+    def _session_request_received(self, session_request: SessionRequest) -> None:
+        """Calculate the session key and answer with a SessionResponse."""
+        if not self.session_id:
+            logger.info(
+                "GatewaySimulator: no free secure session for %s", self.remote_addr
+            )
+            self.send(
+                KNXIPFrame.init_from_body(
+                    SessionStatus(status=SecureSessionStatusCode.STATUS_CLOSE)
+                )
+            )
+            if self.transport is not None:
+                self.transport.close()
+            return
+        self._private_key, self.public_key = generate_ecdh_key_pair()
+        self._peer_public_key = X25519PublicKey.from_public_bytes(
+            session_request.ecdh_client_public_key
+        )
+        self._session_key = sha256_hash(
+            self._private_key.exchange(self._peer_public_key)
+        )[:16]
+        self._cipher = SessionCipher(self._session_key)
+        self._pub_keys_xor = bytes_xor(
+            session_request.ecdh_client_public_key, self.public_key
+        )
+        message_authentication_code = bytes(16)
+        if self._device_authentication_code:
+            response_mac_cbc = calculate_message_authentication_code_cbc(
+                key=self._device_authentication_code,
+                additional_data=bytes.fromhex("06 10 09 52 00 38")
+                + self.session_id.to_bytes(2, "big")
+                + self._pub_keys_xor,
+            )
+            _, message_authentication_code = encrypt_data_ctr(
+                key=self._device_authentication_code,
+                counter_0=COUNTER_0_HANDSHAKE,
+                mac_cbc=response_mac_cbc,
+            )
+        self.send(
+            KNXIPFrame.init_from_body(
+                SessionResponse(
+                    secure_session_id=self.session_id,
+                    ecdh_server_public_key=self.public_key,
+                    message_authentication_code=message_authentication_code,
+                )
+            )
+        )
+        # every following frame is sent and received in a SecureWrapper
+        self.initialized = True
+
+    def authenticate(self, session_authenticate: SessionAuthenticate) -> bool:
+        """Verify the MAC of a SessionAuthenticate and answer with a SessionStatus."""
+        user_password = self._user_passwords.get(session_authenticate.user_id)
+        if user_password is not None:
+            authenticate_mac_cbc = calculate_message_authentication_code_cbc(
+                key=user_password,
+                additional_data=bytes.fromhex("06 10 09 53 00 18")
+                + bytes(1)  # reserved
+                + session_authenticate.user_id.to_bytes(1, "big")
+                + self._pub_keys_xor,
+                block_0=bytes(16),
+            )
+            _, mac_tr = decrypt_ctr(
+                key=user_password,
+                counter_0=COUNTER_0_HANDSHAKE,
+                mac=session_authenticate.message_authentication_code,
+            )
+            self.authenticated = mac_tr == authenticate_mac_cbc
+        if self.authenticated:
+            self.user_id = session_authenticate.user_id
+        self.send(
+            KNXIPFrame.init_from_body(
+                SessionStatus(
+                    status=SecureSessionStatusCode.STATUS_AUTHENTICATION_SUCCESS
+                    if self.authenticated
+                    else SecureSessionStatusCode.STATUS_AUTHENTICATION_FAILED
+                )
+            )
+        )
+        return self.authenticated
+
+    def start_keepalive_task(self) -> None:
+        """Do not send keepalive frames. Keeping the session alive is up to the client."""
+
+
+class GatewaySimulator(_TunnellingServer):
+    """Class for simulating a KNXnet/IP gateway and its TP1 bus in-process."""
+
+    def __init__(
+        self,
+        local_ip: str = "127.0.0.1",
+        local_port: int = DEFAULT_MCAST_PORT,
+        *,
+        tcp: bool = True,
+        udp: bool = True,
+        routing: bool = False,
+        multicast_group: str = DEFAULT_MCAST_GRP,
+        multicast_port: int = DEFAULT_MCAST_PORT,
+        individual_address: IndividualAddress | str = "1.1.0",
+        individual_addresses: list[IndividualAddress | str] | None = None,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        secure_user_passwords: dict[int, str] | None = None,
+        device_authentication_password: str | None = None,
+        ack_latency: float = 0.0,
+        confirmation_latency: float = 0.0,
+        packet_loss: float = 0.0,
+        bus_baudrate: int | None = TP1_BAUDRATE,
+        seed: int | None = None,
+        telegram_received_cb: Callable[[Telegram], None] | None = None,
+        name: str = "XKNX Gateway Simulator",
+    ):
+        """Initialize GatewaySimulator class."""
+        super().__init__(
+            local_ip=local_ip,
+            local_port=local_port,
+            tcp=tcp,
+            udp=udp,
+            individual_addresses=individual_addresses,
+            max_clients=max_clients,
+            name=name,
+        )
+        self._own_address = IndividualAddress(individual_address)
+        self.ack_latency = ack_latency
+        self.confirmation_latency = confirmation_latency
+        self.packet_loss = packet_loss
+        self.bus_baudrate = bus_baudrate
+        self.telegram_received_cb = telegram_received_cb
+        # number of frames transmitted on the simulated bus
+        self.bus_frame_count = 0
+
+        # TCP connections require a secure session if user passwords are given
+        self._secure_user_passwords: dict[int, bytes] | None = (
+            {
+                user_id: derive_user_password(password)
+                for user_id, password in secure_user_passwords.items()
+            }
+            if secure_user_passwords is not None
+            else None
+        )
+        self._device_authentication_code: bytes | None = (
+            derive_device_authentication_password(device_authentication_password)
+            if device_authentication_password
+            else None
+        )
+        # secure session id -> session of a connected TCP stream
+        self._secure_sessions: dict[int, _SecureSessionServer] = {}
+
+        self.routing_transport: UDPTransport | None = (
+            UDPTransport(
+                local_addr=(local_ip, 0),
+                remote_addr=(multicast_group, multicast_port),
+                multicast=True,
+            )
+            if routing
+            else None
+        )
+        self._random = random.Random(seed)
+        self._bus_queue: asyncio.Queue[tuple[CEMIFrame, BusOrigin]] = asyncio.Queue()
+        self._bus_task: asyncio.Task[None] | None = None
+        self._traffic_tasks: set[asyncio.Task[None]] = set()
+        self._timer_handles: set[asyncio.TimerHandle] = set()
+
+    @property
+    def own_address(self) -> IndividualAddress:
+        """Return the individual address of the simulated gateway."""
+        return self._own_address
+
+    async def start(self) -> None:
+        """Start listening for clients and start the simulated bus."""
+        await super().start()
+        if self.routing_transport is not None:
+            self.routing_transport.register_callback(
+                self._routing_indication_received,
+                [KNXIPServiceType.ROUTING_INDICATION],
+            )
+            await self.routing_transport.connect()
+            # let clients on the same host receive our multicast frames
+            sock = self.routing_transport.transport.get_extra_info("socket")  # type: ignore[union-attr]
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        self._bus_task = asyncio.create_task(self._bus_loop())
+
+    async def stop(self) -> None:
+        """Stop the simulated bus, device traffic and disconnect all clients."""
+        for task in list(self._traffic_tasks):
+            task.cancel()
+        if self._bus_task is not None:
+            self._bus_task.cancel()
+            self._bus_task = None
+        for handle in self._timer_handles:
+            handle.cancel()
+        self._timer_handles.clear()
+        if self.routing_transport is not None:
+            self.routing_transport.stop()
+        await super().stop()
+
+    def _service_families(self) -> list[DIBSuppSVCFamilies.Family]:
+        """Return the service families supported by the simulated gateway."""
+        families = super()._service_families()
+        if self.routing_transport is not None:
+            families.append(DIBSuppSVCFamilies.Family(DIBServiceFamily.ROUTING, 1))
+        return families
+
+    ####################
+    #
+    # SIMULATED DEVICES
+    #
+    ####################
+
+    def send_telegram(self, telegram: Telegram) -> None:
+        """Put a telegram of a simulated device on the bus."""
+        cemi = CEMIFrame.init_from_telegram(
+            telegram,
+            code=CEMIMessageCode.L_DATA_IND,
+            src_addr=telegram.source_address or self.own_address,
+        )
+        self._bus_queue.put_nowait((cemi, None))
+
+    def generate_traffic(
+        self,
+        rate: float,
+        telegram_factory: Callable[[int], Telegram],
+        count: int | None = None,
+    ) -> asyncio.Task[None]:
+        """
+        Send telegrams of simulated devices with `rate` telegrams per second.
+
+        `telegram_factory` is called with the index of the telegram to send.
+        Traffic runs until `count` telegrams were sent, the returned task is
+        cancelled or the simulator is stopped.
+        """
+        task = asyncio.create_task(self._traffic_loop(rate, telegram_factory, count))
+        self._traffic_tasks.add(task)
+        task.add_done_callback(self._traffic_tasks.discard)
+        return task
+
+    async def _traffic_loop(
+        self,
+        rate: float,
+        telegram_factory: Callable[[int], Telegram],
+        count: int | None,
+    ) -> None:
+        """Send telegrams from `telegram_factory` in fixed intervals."""
+        loop = asyncio.get_running_loop()
+        interval = 1 / rate
+        next_time = loop.time()
+        index = 0
+        while count is None or index < count:
+            self.send_telegram(telegram_factory(index))
+            index += 1
+            # schedule by absolute time so the rate doesn't drift
+            next_time += interval
+            await asyncio.sleep(max(0, next_time - loop.time()))
+
+    ####################
+    #
+    # SIMULATED BUS
+    #
+    ####################
+
+    async def _bus_loop(self) -> None:
+        """Transmit frames on the simulated bus one after another."""
+        while True:
+            cemi, origin = await self._bus_queue.get()
+            if self.bus_baudrate:
+                await asyncio.sleep(tp1_transmission_time(cemi, self.bus_baudrate))
+            self._frame_transmitted(cemi, origin)
+            self._bus_queue.task_done()
+
+    def _frame_transmitted(self, cemi: CEMIFrame, origin: BusOrigin) -> None:
+        """Confirm a transmitted frame and forward it to all other clients."""
+        self.bus_frame_count += 1
+        cemi.code = CEMIMessageCode.L_DATA_IND
+        cemi_raw = cemi.to_knx()
+        if self.telegram_received_cb is not None:
+            self.telegram_received_cb(cemi.telegram)
+
+        if (
+            self.routing_transport is not None
+            and origin is not self.routing_transport
+            and not self._lost()
+        ):
+            self.routing_transport.send(
+                KNXIPFrame.init_from_body(RoutingIndication(cemi=cemi))
+            )
+
+        if not isinstance(origin, TunnellingServerConnection):
+            self._send_indication(cemi_raw)
+            return
+        self._send_indication(cemi_raw, origin=origin)
+        if self.connections.get(origin.communication_channel) is origin:
+            self._call_later(
+                self.confirmation_latency, self._send_confirmation, cemi, origin
+            )
+
+    def _cemi_received(
+        self, cemi: CEMIFrame, connection: TunnellingServerConnection
+    ) -> None:
+        """Put a frame of a tunnelling client on the bus."""
+        self._bus_queue.put_nowait((cemi, connection))
+
+    def _routing_indication_received(
+        self, knxipframe: KNXIPFrame, source: HPAI, transport: KNXIPTransport
+    ) -> None:
+        """Put a frame received via routing on the bus."""
+        assert isinstance(knxipframe.body, RoutingIndication)
+        if knxipframe.body.cemi is None or self._lost():
+            return
+        self._bus_queue.put_nowait((knxipframe.body.cemi, self.routing_transport))
+
+    ####################
+    #
+    # NETWORK CONDITIONS
+    #
+    ####################
+
+    def _lost(self) -> bool:
+        """Return if an UDP datagram shall be dropped."""
+        return self.packet_loss > 0 and self._random.random() < self.packet_loss
+
+    def _call_later(
+        self, delay: float, callback: Callable[..., None], *args: object
+    ) -> None:
+        """Call `callback` after `delay` seconds or immediately if `delay` is 0."""
+        if not delay:
+            callback(*args)
+            return
+
+        def _run() -> None:
+            self._timer_handles.discard(handle)
+            callback(*args)
+
+        handle = asyncio.get_running_loop().call_later(delay, _run)
+        self._timer_handles.add(handle)
+
+    def request_received(
+        self, knxipframe: KNXIPFrame, source: HPAI, transport: KNXIPTransport
+    ) -> None:
+        """Handle incoming frames of clients. Drop UDP datagrams by `packet_loss`."""
+        if isinstance(transport, UDPTransport) and self._lost():
+            return
+        super().request_received(knxipframe, source, transport)
+
+    def _send_tunnelling_ack(
+        self, connection: TunnellingServerConnection, sequence_counter: int
+    ) -> None:
+        """Acknowledge a TunnellingRequest of an UDP client after `ack_latency`."""
+        if self._lost():
+            return
+        self._call_later(
+            self.ack_latency,
+            super()._send_tunnelling_ack,
+            connection,
+            sequence_counter,
+        )
+
+    def _send_cemi(
+        self, cemi_raw: bytes, connections: list[TunnellingServerConnection]
+    ) -> None:
+        """Send serialized cEMI frame to clients. Drop UDP datagrams by `packet_loss`."""
+        super()._send_cemi(
+            cemi_raw,
+            [
+                connection
+                for connection in connections
+                if connection.is_tcp or not self._lost()
+            ],
+        )
+
+    ####################
+    #
+    # SECURE SESSIONS
+    #
+    ####################
+
+    def create_tcp_transport(self, remote_addr: tuple[str, int]) -> TCPTransport:
+        """Return a KNXIPTransport for an accepted TCP stream."""
+        if self._secure_user_passwords is None:
+            return super().create_tcp_transport(remote_addr)
+        # 0 if all session ids are in use - the SessionRequest is refused
+        session_id = next(self._free_secure_session_ids(), 0)
+        transport = _SecureSessionServer(
+            remote_addr=remote_addr,
+            session_id=session_id,
+            user_passwords=self._secure_user_passwords,
+            device_authentication_code=self._device_authentication_code,
+        )
+        if session_id:
+            self._secure_sessions[session_id] = transport
+        transport.register_callback(self._secure_frame_received)
+        return transport
+
+    def _free_secure_session_ids(self) -> Iterator[int]:
+        """Yield unused secure session ids."""
+        return (
+            session_id
+            for session_id in range(1, 0xFFFF)
+            if session_id not in self._secure_sessions
+        )
+
+    def transport_closed(self, transport: KNXIPTransport) -> None:
+        """Remove connections and the secure session of a closed TCP stream."""
+        super().transport_closed(transport)
+        if (
+            isinstance(transport, _SecureSessionServer)
+            and self._secure_sessions.get(transport.session_id) is transport
+        ):
+            del self._secure_sessions[transport.session_id]
+
+    def _secure_frame_received(
+        self, knxipframe: KNXIPFrame, source: HPAI, transport: KNXIPTransport
+    ) -> None:
+        """Handle a frame decrypted by a secure session."""
+        assert isinstance(transport, _SecureSessionServer)
+        body = knxipframe.body
+        if isinstance(body, SessionAuthenticate):
+            if not transport.authenticate(body):
+                logger.info(
+                    "GatewaySimulator: authentication of user %s failed", body.user_id
+                )
+            return
+        if isinstance(body, SessionStatus):
+            if body.status is SecureSessionStatusCode.STATUS_CLOSE:
+                transport.authenticated = False
+            return
+        if not transport.authenticated:
+            transport.send(
+                KNXIPFrame.init_from_body(
+                    SessionStatus(status=SecureSessionStatusCode.STATUS_UNAUTHENTICATED)
+                )
+            )
+            return
+        self.request_received(knxipframe, source, transport)
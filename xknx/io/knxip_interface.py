@@ -5,14 +5,19 @@ KNXIPInterface manages KNX/IP Tunneling or Routing connections.
 * It passes KNX telegrams from the network and
 * provides callbacks after having received a telegram from the network.
 
+MultiGatewayInterface manages multiple KNXIPInterfaces - one for each KNX line -
+and routes outgoing telegrams by group address to the matching connection.
+
 """
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import threading
-from typing import TYPE_CHECKING, Awaitable, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Coroutine, TypeVar
 
+from xknx.core import ConnectionManager, XknxConnectionState
 from xknx.exceptions import (
     CommunicationError,
     InterfaceWithUserIdNotFound,
@@ -21,15 +26,14 @@ from xknx.exceptions import (
 )
 from xknx.io import util
 from xknx.secure import Keyring, load_key_ring
+from xknx.telegram import GroupAddress
 
-from .connection import ConnectionConfig, ConnectionType
+from .connection import ConnectionConfig, ConnectionType, GatewayRoute
 from .gateway_scanner import GatewayDescriptor, GatewayScanner
 from .routing import Routing
 from .tunnel import SecureTunnel, TCPTunnel, UDPTunnel, _Tunnel
 
 if TYPE_CHECKING:
-    import concurrent
-
     from xknx.telegram import Telegram
     from xknx.xknx import XKNX
 
@@ -44,6 +48,8 @@ def knx_interface_factory(
     xknx: XKNX, connection_config: ConnectionConfig
 ) -> KNXIPInterface:
     """Create KNX/IP interface from config."""
+    if connection_config.connection_type == ConnectionType.MULTI_GATEWAY:
+        return MultiGatewayInterface(xknx=xknx, connection_config=connection_config)
     if connection_config.threaded:
         return KNXIPInterfaceThreaded(xknx=xknx, connection_config=connection_config)
     return KNXIPInterface(xknx=xknx, connection_config=connection_config)
@@ -56,10 +62,12 @@ class KNXIPInterface:
         self,
         xknx: XKNX,
         connection_config: ConnectionConfig = ConnectionConfig(),
+        connection_manager: ConnectionManager | None = None,
     ):
         """Initialize KNXIPInterface class."""
         self.xknx = xknx
         self.connection_config = connection_config
+        self.connection_manager = connection_manager or xknx.connection_manager
         self._gateway_info: GatewayDescriptor | None = None
         self._interface: Interface | None = None
 
@@ -101,8 +109,12 @@ class KNXIPInterface:
                 secure_config.knxkeys_file_path is not None
                 and secure_config.knxkeys_password is not None
             ):
-                keyring: Keyring = load_key_ring(
-                    secure_config.knxkeys_file_path, secure_config.knxkeys_password
+                # file IO and password hashing shall not block the event loop
+                keyring: Keyring = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    load_key_ring,
+                    secure_config.knxkeys_file_path,
+                    secure_config.knxkeys_password,
                 )
                 if secure_config.user_id is not None:
                     user_id = secure_config.user_id
@@ -137,13 +149,33 @@ class KNXIPInterface:
         else:
             await self._start_automatic()
 
-    async def _start_automatic(self) -> None:
-        """Start GatewayScanner and connect to the found device."""
+    async def _automatic_gateways(self) -> AsyncIterator[GatewayDescriptor]:
+        """Yield monitored devices by free tunnelling slots, then scanned devices."""
+        tried: set[tuple[str, int]] = set()
+        if (gateway_monitor := self.connection_config.gateway_monitor) is not None:
+            for gateway in gateway_monitor.least_loaded_gateways(
+                self.connection_config.scan_filter
+            ):
+                if (
+                    self.connection_config.local_ip
+                    and gateway.local_ip != self.connection_config.local_ip
+                ):
+                    continue
+                tried.add((gateway.ip_addr, gateway.port))
+                yield gateway
         async for gateway in GatewayScanner(
             self.xknx,
             local_ip=self.connection_config.local_ip,
             scan_filter=self.connection_config.scan_filter,  # secure disabled by default
+            all_interfaces=True,
+            cache=self.connection_config.scan_cache,
         ).async_scan():
+            if (gateway.ip_addr, gateway.port) not in tried:
+                yield gateway
+
+    async def _start_automatic(self) -> None:
+        """Start GatewayScanner and connect to the found device."""
+        async for gateway in self._automatic_gateways():
             try:
                 if gateway.supports_tunnelling_tcp:
                     await self._start_tunnelling_tcp(
@@ -187,6 +219,9 @@ class KNXIPInterface:
             telegram_received_callback=self.telegram_received,
             auto_reconnect=self.connection_config.auto_reconnect,
             auto_reconnect_wait=self.connection_config.auto_reconnect_wait,
+            auto_reconnect_max_wait=self.connection_config.auto_reconnect_max_wait,
+            alternative_gateways=self.connection_config.alternative_gateways,
+            connection_manager=self.connection_manager,
         )
         await self._interface.connect()
 
@@ -211,10 +246,13 @@ class KNXIPInterface:
             gateway_port=gateway_port,
             auto_reconnect=self.connection_config.auto_reconnect,
             auto_reconnect_wait=self.connection_config.auto_reconnect_wait,
+            auto_reconnect_max_wait=self.connection_config.auto_reconnect_max_wait,
+            alternative_gateways=self.connection_config.alternative_gateways,
             user_id=user_id,
             user_password=user_password,
             device_authentication_password=device_authentication_password,
             telegram_received_callback=self.telegram_received,
+            connection_manager=self.connection_manager,
         )
         await self._interface.connect()
 
@@ -255,6 +293,9 @@ class KNXIPInterface:
             telegram_received_callback=self.telegram_received,
             auto_reconnect=self.connection_config.auto_reconnect,
             auto_reconnect_wait=self.connection_config.auto_reconnect_wait,
+            auto_reconnect_max_wait=self.connection_config.auto_reconnect_max_wait,
+            alternative_gateways=self.connection_config.alternative_gateways,
+            connection_manager=self.connection_manager,
         )
         await self._interface.connect()
 
@@ -266,7 +307,12 @@ class KNXIPInterface:
         util.validate_ip(local_ip, address_name="Local IP address")
 
         logger.debug("Starting Routing from %s as %s", local_ip, self.xknx.own_address)
-        self._interface = Routing(self.xknx, self.telegram_received, local_ip)
+        self._interface = Routing(
+            self.xknx,
+            self.telegram_received,
+            local_ip,
+            connection_manager=self.connection_manager,
+        )
         await self._interface.connect()
 
     async def stop(self) -> None:
@@ -301,11 +347,19 @@ class KNXIPInterfaceThreaded(KNXIPInterface):
         self,
         xknx: XKNX,
         connection_config: ConnectionConfig = ConnectionConfig(),
+        connection_manager: ConnectionManager | None = None,
     ):
         """Initialize KNXIPInterface class."""
-        super().__init__(xknx, connection_config)
+        super().__init__(xknx, connection_config, connection_manager)
         self._main_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
         self._thread_loop: asyncio.AbstractEventLoop
+        # telegrams handed off to the connection thread - guarded by _send_lock
+        self._send_lock = threading.Lock()
+        self._send_batch: list[tuple[Telegram, asyncio.Future[None]]] = []
+        self._send_wakeup_pending = False
+        # only accessed from the connection thread
+        self._thread_send_queue: asyncio.Queue[tuple[Telegram, asyncio.Future[None]]]
+        self._thread_sender_task: asyncio.Task[None]
 
         loop_loaded = threading.Event()
         self.connection_thread = threading.Thread(
@@ -321,22 +375,78 @@ class KNXIPInterfaceThreaded(KNXIPInterface):
         """Start KNX/IP interface in its own thread."""
         self._thread_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._thread_loop)
+        self._thread_send_queue = asyncio.Queue()
+        self._thread_sender_task = self._thread_loop.create_task(self._thread_sender())
         loop_loaded.set()
         self._thread_loop.run_forever()
 
-    async def _await_from_connection_thread(self, coro: Awaitable[T]) -> T:
+    async def _await_from_connection_thread(self, coro: Coroutine[Any, Any, T]) -> T:
         """Await coroutine in different thread."""
-        fut = asyncio.run_coroutine_threadsafe(coro, self._thread_loop)
-        finished = threading.Event()
+        # the result is passed back with call_soon_threadsafe - no executor thread is blocked
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self._thread_loop),
+            loop=self._main_loop,
+        )
+
+    def _send_batch_received(self) -> None:
+        """Move handed off telegrams to the send queue. Runs in the connection thread."""
+        with self._send_lock:
+            batch = self._send_batch
+            self._send_batch = []
+            self._send_wakeup_pending = False
+        for item in batch:
+            self._thread_send_queue.put_nowait(item)
+
+    async def _thread_sender(self) -> None:
+        """Send telegrams one after another. Runs in the connection thread."""
+        while True:
+            telegram, future = await self._thread_send_queue.get()
+            error: Exception | None = None
+            try:
+                if self._interface is None:
+                    raise CommunicationError("KNX/IP interface not connected")
+                await self._interface.send_telegram(telegram)
+            except asyncio.CancelledError:
+                self._main_loop.call_soon_threadsafe(
+                    self._complete_send_future,
+                    future,
+                    CommunicationError("KNX/IP interface stopped"),
+                )
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                error = err
+            self._main_loop.call_soon_threadsafe(
+                self._complete_send_future, future, error
+            )
 
-        def fut_finished_cb(_: concurrent.futures.Future[T]) -> None:
-            """Fire threading.Event when the future is finished."""
-            finished.set()
+    async def _stop_thread_sender(self) -> None:
+        """Stop sending telegrams and fail pending sends. Runs in the connection thread."""
+        self._thread_sender_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._thread_sender_task
+        with self._send_lock:
+            pending = self._send_batch
+            self._send_batch = []
+        while not self._thread_send_queue.empty():
+            pending.append(self._thread_send_queue.get_nowait())
+        for _, future in pending:
+            self._main_loop.call_soon_threadsafe(
+                self._complete_send_future,
+                future,
+                CommunicationError("KNX/IP interface stopped"),
+            )
 
-        fut.add_done_callback(fut_finished_cb)
-        # wait on that event in an executor, yielding control to _main_loop
-        await self._main_loop.run_in_executor(None, finished.wait)
-        return fut.result()
+    @staticmethod
+    def _complete_send_future(
+        future: asyncio.Future[None], error: Exception | None
+    ) -> None:
+        """Set result of a send_telegram future. Runs in the main loop."""
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
 
     async def start(self) -> None:
         """Start KNX/IP interface."""
@@ -351,6 +461,7 @@ class KNXIPInterfaceThreaded(KNXIPInterface):
         if self._interface is not None:
             await self._await_from_connection_thread(self._interface.disconnect())
             self._interface = None
+        await self._await_from_connection_thread(self._stop_thread_sender())
         self._thread_loop.call_soon_threadsafe(self._thread_loop.stop)
         self.connection_thread.join()
 
@@ -363,9 +474,15 @@ class KNXIPInterfaceThreaded(KNXIPInterface):
         if self._interface is None:
             raise CommunicationError("KNX/IP interface not connected")
 
-        return await self._await_from_connection_thread(
-            self._interface.send_telegram(telegram)
-        )
+        future: asyncio.Future[None] = self._main_loop.create_future()
+        with self._send_lock:
+            self._send_batch.append((telegram, future))
+            wakeup = not self._send_wakeup_pending
+            self._send_wakeup_pending = True
+        if wakeup:
+            # telegrams added until the connection thread runs share this wake-up
+            self._thread_loop.call_soon_threadsafe(self._send_batch_received)
+        await future
 
     async def gateway_info(self) -> GatewayDescriptor | None:
         """Get gateway descriptor from interface."""
@@ -376,3 +493,232 @@ class KNXIPInterfaceThreaded(KNXIPInterface):
                 self._interface.request_description()
             )
         return None
+
+
+class GatewayConnection:
+    """A single connection of a MultiGatewayInterface."""
+
+    def __init__(self, xknx: XKNX, route: GatewayRoute, name: str):
+        """Initialize GatewayConnection class."""
+        if route.connection_config.connection_type == ConnectionType.MULTI_GATEWAY:
+            raise XKNXException("GatewayRoute can not use a MULTI_GATEWAY connection.")
+        self.name = name
+        self.route = route
+        self.connection_manager = ConnectionManager()
+        interface_class = (
+            KNXIPInterfaceThreaded
+            if route.connection_config.threaded
+            else KNXIPInterface
+        )
+        self.interface = interface_class(
+            xknx,
+            connection_config=route.connection_config,
+            connection_manager=self.connection_manager,
+        )
+        self.outgoing_queue: asyncio.Queue[Telegram | None] = asyncio.Queue()
+        self._sender_task: asyncio.Task[None] | None = None
+        self._connect_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_default_route(self) -> bool:
+        """Return if this connection is used for unfiltered destinations."""
+        return not self.route.address_filters
+
+    def match(self, group_address: GroupAddress) -> bool:
+        """Test if the group address is routed to this connection."""
+        return any(
+            address_filter.match(group_address)
+            for address_filter in self.route.address_filters
+        )
+
+    async def start(self) -> None:
+        """Connect to the KNX/IP device and start sending queued telegrams."""
+        if self.route.connection_config.threaded:
+            # connection state changes are passed from the connection thread
+            await self.connection_manager.register_loop()
+        await self.interface.start()
+        self._start_sender()
+
+    def start_reconnect(self) -> None:
+        """
+        Retry connecting in the background after `start()` failed.
+
+        Telegrams routed to the connection are queued until it is established.
+        """
+        if self._connect_task is None or self._connect_task.done():
+            self._connect_task = asyncio.create_task(self._reconnect())
+
+    def _start_sender(self) -> None:
+        """Start sending queued telegrams."""
+        if self._sender_task is None:
+            self._sender_task = asyncio.create_task(self._outgoing_rate_limiter())
+
+    async def _reconnect(self) -> None:
+        """Try to connect until it succeeds. Doubles the wait time after each attempt."""
+        connection_config = self.route.connection_config
+        wait = float(connection_config.auto_reconnect_wait)
+        while True:
+            await asyncio.sleep(wait)
+            try:
+                await self.interface.start()
+            except XKNXException as ex:
+                logger.debug("%s: Could not connect: %s", self.name, ex)
+                wait = min(wait * 2, connection_config.auto_reconnect_max_wait)
+            else:
+                logger.info("%s: Connection established.", self.name)
+                self._start_sender()
+                return
+
+    async def stop(self) -> None:
+        """Send remaining telegrams and disconnect from the KNX/IP device."""
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+            self._connect_task = None
+        if self._sender_task is not None:
+            # If a None object is pushed to the queue, the sender stops
+            self.outgoing_queue.put_nowait(None)
+            await self._sender_task
+            self._sender_task = None
+        await self.interface.stop()
+
+    async def _outgoing_rate_limiter(self) -> None:
+        """Endless loop for sending queued telegrams to the KNX/IP device."""
+        loop = asyncio.get_running_loop()
+        next_send_time = loop.time()
+        while True:
+            telegram = await self.outgoing_queue.get()
+            if telegram is None:
+                self.outgoing_queue.task_done()
+                break
+            if self.route.rate_limit:
+                if (delay := next_send_time - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+                next_send_time = loop.time() + 1 / self.route.rate_limit
+            try:
+                await self.interface.send_telegram(telegram)
+            except CommunicationError as ex:
+                if ex.should_log:
+                    logger.warning("%s: %s", self.name, ex)
+            except XKNXException as ex:
+                logger.error(
+                    "%s: Error while processing outgoing telegram %s", self.name, ex
+                )
+            except Exception:  # pylint: disable=broad-except
+                # prevent the sender Task from stalling when unexpected errors occur
+                logger.exception(
+                    "%s: Unexpected error while processing outgoing telegram %s",
+                    self.name,
+                    telegram,
+                )
+            finally:
+                self.outgoing_queue.task_done()
+
+
+class MultiGatewayInterface(KNXIPInterface):
+    """Class for managing connections to multiple KNX/IP devices."""
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        connection_config: ConnectionConfig,
+    ):
+        """Initialize MultiGatewayInterface class."""
+        super().__init__(xknx, connection_config)
+        if not connection_config.gateway_routes:
+            raise XKNXException("No gateway routes configured.")
+        self.connections = [
+            GatewayConnection(xknx, route=route, name=route.name or f"Gateway {index}")
+            for index, route in enumerate(connection_config.gateway_routes, start=1)
+        ]
+        self._default_connection = next(
+            (
+                connection
+                for connection in self.connections
+                if connection.is_default_route
+            ),
+            None,
+        )
+        # group address raw value -> connection; routes are static so lookups are cached
+        self._route_cache: dict[int, GatewayConnection | None] = {}
+
+    async def start(self) -> None:
+        """
+        Connect to all KNX/IP devices.
+
+        Connections that can not be established are retried in the background
+        if their `auto_reconnect` is enabled. Raise `CommunicationError` only if
+        no connection could be established.
+        """
+        for connection in self.connections:
+            connection.connection_manager.register_connection_state_changed_cb(
+                self._connection_state_changed
+            )
+        results = await asyncio.gather(
+            *(connection.start() for connection in self.connections),
+            return_exceptions=True,
+        )
+        failed = [
+            (connection, result)
+            for connection, result in zip(self.connections, results)
+            if isinstance(result, BaseException)
+        ]
+        if len(failed) == len(self.connections):
+            await self.stop()
+            raise CommunicationError(
+                "No connection to a KNX/IP device could be established"
+            ) from failed[0][1]
+        for connection, result in failed:
+            logger.warning(
+                "%s: Connection could not be established: %s", connection.name, result
+            )
+            if connection.route.connection_config.auto_reconnect:
+                connection.start_reconnect()
+
+    async def stop(self) -> None:
+        """Disconnect from all KNX/IP devices."""
+        await asyncio.gather(*(connection.stop() for connection in self.connections))
+        for connection in self.connections:
+            connection.connection_manager.unregister_connection_state_changed_cb(
+                self._connection_state_changed
+            )
+
+    async def _connection_state_changed(self, _: XknxConnectionState) -> None:
+        """Forward the combined state of all connections to xknx.connection_manager."""
+        states = [
+            connection.connection_manager.state for connection in self.connections
+        ]
+        if XknxConnectionState.CONNECTED in states:
+            state = XknxConnectionState.CONNECTED
+        elif XknxConnectionState.CONNECTING in states:
+            state = XknxConnectionState.CONNECTING
+        else:
+            state = XknxConnectionState.DISCONNECTED
+        await self.connection_manager.connection_state_changed(state)
+
+    def connection_for(self, telegram: Telegram) -> GatewayConnection | None:
+        """Return the connection a telegram shall be sent to."""
+        destination = telegram.destination_address
+        if not isinstance(destination, GroupAddress):
+            return self._default_connection or self.connections[0]
+        try:
+            return self._route_cache[destination.raw]
+        except KeyError:
+            connection = next(
+                (
+                    connection
+                    for connection in self.connections
+                    if connection.match(destination)
+                ),
+                self._default_connection,
+            )
+            self._route_cache[destination.raw] = connection
+            return connection
+
+    async def send_telegram(self, telegram: Telegram) -> None:
+        """Queue telegram to be sent over the matching connection."""
+        connection = self.connection_for(telegram)
+        if connection is None:
+            raise CommunicationError(
+                f"No gateway route found for {telegram.destination_address}"
+            )
+        connection.outgoing_queue.put_nowait(telegram)
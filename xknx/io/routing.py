@@ -5,7 +5,9 @@ Routing uses UDP Multicast to broadcast and receive KNX/IP messages.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 from typing import TYPE_CHECKING, Callable
 
 from xknx.core import XknxConnectionState
@@ -16,7 +18,9 @@ from xknx.knxip import (
     CEMIMessageCode,
     KNXIPFrame,
     KNXIPServiceType,
+    RoutingBusy,
     RoutingIndication,
+    RoutingLostMessage,
 )
 from xknx.telegram import TelegramDirection
 
@@ -24,6 +28,7 @@ from .interface import Interface
 from .transport import KNXIPTransport, UDPTransport
 
 if TYPE_CHECKING:
+    from xknx.core import ConnectionManager
     from xknx.telegram import Telegram
     from xknx.xknx import XKNX
 
@@ -31,6 +36,117 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("xknx.log")
 
+# maximum rate of routing indications a device shall send
+ROUTING_MAX_RATE = 50
+# ROUTING_BUSY frames received within this time increment the busy counter only once
+BUSY_COUNTER_IGNORE_TIME = 0.010
+# random back-off after the wait time: random(0..1) * busy counter * 50 ms
+BUSY_RANDOM_WAIT_SLOT = 0.050
+# busy counter N is decremented every 5 ms after sending was resumed for N * 100 ms
+BUSY_SLOW_DURATION_SLOT = 0.100
+BUSY_COUNTER_DECREMENT_TIME = 0.005
+
+
+class RoutingFlowControl:
+    """
+    Flow control for sending routing indications.
+
+    Handles ROUTING_BUSY frames by pausing for the busy wait time plus a random
+    back-off depending on the number of recent ROUTING_BUSY frames (busy counter).
+    While the busy counter is not 0 the send rate is limited to
+    ROUTING_MAX_RATE / (busy counter + 1); the counter decreases again
+    when no ROUTING_BUSY was received for some time.
+
+    Telemetry:
+    * busy_events: number of received ROUTING_BUSY frames.
+    * lost_messages: sum of lost messages reported by ROUTING_LOST_MESSAGE frames.
+    * effective_rate: current maximum send rate in telegrams per second.
+        0 while paused; None if not limited.
+    """
+
+    def __init__(self) -> None:
+        """Initialize RoutingFlowControl class."""
+        self.busy_events = 0
+        self.lost_messages = 0
+        self._busy_counter = 0
+        self._last_busy_time: float | None = None
+        self._wait_until = 0.0
+        self._last_send_time: float | None = None
+
+    @staticmethod
+    def _time() -> float:
+        """Return current event loop time."""
+        return asyncio.get_running_loop().time()
+
+    def busy_counter(self, now: float | None = None) -> int:
+        """Return the busy counter N at loop time `now`."""
+        if self._last_busy_time is None or not self._busy_counter:
+            return 0
+        now = self._time() if now is None else now
+        # slow duration starts when sending is resumed
+        slow_end = self._wait_until + self._busy_counter * BUSY_SLOW_DURATION_SLOT
+        if now <= slow_end:
+            return self._busy_counter
+        decrements = int((now - slow_end) / BUSY_COUNTER_DECREMENT_TIME)
+        return max(0, self._busy_counter - decrements)
+
+    @property
+    def effective_rate(self) -> float | None:
+        """Return the current maximum send rate in telegrams per second."""
+        now = self._time()
+        if now < self._wait_until:
+            return 0
+        if busy_counter := self.busy_counter(now):
+            return ROUTING_MAX_RATE / (busy_counter + 1)
+        return None
+
+    def routing_busy_received(self, routing_busy: RoutingBusy) -> None:
+        """Pause sending after a ROUTING_BUSY was received."""
+        now = self._time()
+        self.busy_events += 1
+        if (
+            self._last_busy_time is None
+            or now - self._last_busy_time > BUSY_COUNTER_IGNORE_TIME
+        ):
+            self._busy_counter = self.busy_counter(now) + 1
+            self._last_busy_time = now
+        wait_until = (
+            now
+            + routing_busy.wait_time / 1000
+            + random.random() * self._busy_counter * BUSY_RANDOM_WAIT_SLOT
+        )
+        self._wait_until = max(self._wait_until, wait_until)
+        logger.debug(
+            "Routing busy. Pausing for %.3f s. Busy counter: %s",
+            self._wait_until - now,
+            self._busy_counter,
+        )
+
+    def routing_lost_message_received(
+        self, routing_lost_message: RoutingLostMessage
+    ) -> None:
+        """Count lost messages reported by a KNXnet/IP router."""
+        self.lost_messages += routing_lost_message.lost_messages
+        logger.info(
+            "KNXnet/IP router lost %s messages. Total: %s",
+            routing_lost_message.lost_messages,
+            self.lost_messages,
+        )
+
+    async def throttle(self) -> None:
+        """Wait until the next routing indication may be sent."""
+        while (delay := self._wait_until - self._time()) > 0:
+            # wait time may be extended by ROUTING_BUSY frames received meanwhile
+            await asyncio.sleep(delay)
+        now = self._time()
+        if (busy_counter := self.busy_counter(now)) and (
+            self._last_send_time is not None
+        ):
+            interval = (busy_counter + 1) / ROUTING_MAX_RATE
+            if (delay := self._last_send_time + interval - now) > 0:
+                await asyncio.sleep(delay)
+        self._last_send_time = self._time()
+
 
 class Routing(Interface):
     """Class for handling KNX/IP routing."""
@@ -40,11 +156,14 @@ class Routing(Interface):
         xknx: XKNX,
         telegram_received_callback: TelegramCallbackType,
         local_ip: str,
+        connection_manager: ConnectionManager | None = None,
     ):
         """Initialize Routing class."""
         self.xknx = xknx
+        self.connection_manager = connection_manager or xknx.connection_manager
         self.telegram_received_callback = telegram_received_callback
         self.local_ip = local_ip
+        self.flow_control = RoutingFlowControl()
 
         self.udp_transport = UDPTransport(
             local_addr=(local_ip, 0),
@@ -55,6 +174,19 @@ class Routing(Interface):
         self.udp_transport.register_callback(
             self.response_rec_callback, [KNXIPServiceType.ROUTING_INDICATION]
         )
+        self.udp_transport.register_callback(
+            self._flow_control_callback,
+            [KNXIPServiceType.ROUTING_BUSY, KNXIPServiceType.ROUTING_LOST_MESSAGE],
+        )
+
+    def _flow_control_callback(
+        self, knxipframe: KNXIPFrame, source: HPAI, _: KNXIPTransport
+    ) -> None:
+        """Handle ROUTING_BUSY and ROUTING_LOST_MESSAGE. Callback from internal udp_transport."""
+        if isinstance(knxipframe.body, RoutingBusy):
+            self.flow_control.routing_busy_received(knxipframe.body)
+        elif isinstance(knxipframe.body, RoutingLostMessage):
+            self.flow_control.routing_lost_message_received(knxipframe.body)
 
     def response_rec_callback(
         self, knxipframe: KNXIPFrame, source: HPAI, _: KNXIPTransport
@@ -82,6 +214,7 @@ class Routing(Interface):
             src_addr=self.xknx.own_address,
         )
         routing_indication = RoutingIndication(cemi=cemi)
+        await self.flow_control.throttle()
         await self.send_knxipframe(KNXIPFrame.init_from_body(routing_indication))
 
     async def send_knxipframe(self, knxipframe: KNXIPFrame) -> None:
@@ -90,7 +223,7 @@ class Routing(Interface):
 
     async def connect(self) -> bool:
         """Start routing."""
-        await self.xknx.connection_manager.connection_state_changed(
+        await self.connection_manager.connection_state_changed(
             XknxConnectionState.CONNECTING
         )
         try:
@@ -101,13 +234,13 @@ class Routing(Interface):
                 type(ex).__name__,
                 ex,
             )
-            await self.xknx.connection_manager.connection_state_changed(
+            await self.connection_manager.connection_state_changed(
                 XknxConnectionState.DISCONNECTED
             )
             # close udp transport to prevent open file descriptors
             self.udp_transport.stop()
             raise CommunicationError("Routing could not be started") from ex
-        await self.xknx.connection_manager.connection_state_changed(
+        await self.connection_manager.connection_state_changed(
             XknxConnectionState.CONNECTED
         )
         return True
@@ -115,6 +248,6 @@ class Routing(Interface):
     async def disconnect(self) -> None:
         """Stop routing."""
         self.udp_transport.stop()
-        await self.xknx.connection_manager.connection_state_changed(
+        await self.connection_manager.connection_state_changed(
             XknxConnectionState.DISCONNECTED
         )
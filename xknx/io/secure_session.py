@@ -25,10 +25,11 @@ from xknx.knxip import (
 )
 from xknx.knxip.knxip_enum import SecureSessionStatusCode
 from xknx.secure.ip_secure import (
+    SessionCipher,
+    async_derive_device_authentication_password,
+    async_derive_user_password,
     calculate_message_authentication_code_cbc,
     decrypt_ctr,
-    derive_device_authentication_password,
-    derive_user_password,
     encrypt_data_ctr,
     generate_ecdh_key_pair,
 )
@@ -46,6 +47,9 @@ COUNTER_0_HANDSHAKE = (  # used in SessionResponse and SessionAuthenticate
     b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00"
 )
 MESSAGE_TAG_TUNNELLING = bytes.fromhex("00 00")  # use 0x00 0x00 for tunneling
+SECURE_WRAPPER_HEADER = bytes.fromhex("06 10 09 50")  # without total length
+# 6 KNXnet/IP header, 2 session_id, 6 sequence_number, 6 serial_number, 2 message_tag, 16 MAC = 38
+SECURE_WRAPPER_OVERHEAD = 38
 
 
 class SecureSession(TCPTransport):
@@ -64,18 +68,18 @@ class SecureSession(TCPTransport):
             remote_addr=remote_addr,
             connection_lost_cb=connection_lost_cb,
         )
-        self._device_authentication_code: bytes | None = (
-            derive_device_authentication_password(device_authentication_password)
-            if device_authentication_password
-            else None
-        )
+        # keys are derived in `connect()` - PBKDF2 shall not block the event loop
+        self._device_authentication_password = device_authentication_password
+        self._device_authentication_code: bytes | None = None
         self.user_id = user_id
-        self._user_password = derive_user_password(user_password)
+        self._user_password_string = user_password
+        self._user_password: bytes
 
         self._private_key: X25519PrivateKey
         self.public_key: bytes
         self._peer_public_key: X25519PublicKey
         self._session_key: bytes
+        self._cipher: SessionCipher
         self.session_id: int
 
         self._sequence_number = 0
@@ -86,6 +90,7 @@ class SecureSession(TCPTransport):
 
     async def connect(self) -> None:
         """Connect transport."""
+        await self._derive_keys()
         await super().connect()
         self._private_key, self.public_key = generate_ecdh_key_pair()
         self._sequence_number = 0
@@ -124,6 +129,18 @@ class SecureSession(TCPTransport):
             self._handle_session_status, [KNXIPServiceType.SESSION_STATUS]
         )
 
+    async def _derive_keys(self) -> None:
+        """Derive keys from passwords. Derived keys are cached for reconnects."""
+        if self._device_authentication_password:
+            self._device_authentication_code = (
+                await async_derive_device_authentication_password(
+                    self._device_authentication_password
+                )
+            )
+        self._user_password = await async_derive_user_password(
+            self._user_password_string
+        )
+
     def handshake(self, session_response: SessionResponse) -> bytes:
         """
         Handshake with device.
@@ -158,6 +175,7 @@ class SecureSession(TCPTransport):
         # calculate session key
         ecdh_shared_secret = self._private_key.exchange(self._peer_public_key)
         self._session_key = sha256_hash(ecdh_shared_secret)[:16]
+        self._cipher = SessionCipher(self._session_key)
         # generate SessionAuthenticate MAC
         authenticate_header_data = bytes.fromhex("06 10 09 53 00 18")
         authenticate_mac_cbc = calculate_message_authentication_code_cbc(
@@ -225,17 +243,16 @@ class SecureSession(TCPTransport):
 
     def decrypt_frame(self, encrypted_frame: KNXIPFrame) -> KNXIPFrame:
         """Unwrap and verify KNX/IP frame from SecureWrapper."""
-        # TODO: get raw data from KNXIPFrame class directly instead of recalculating it with to_knx()
         # TODO: refactor so assert isn't needed (maybe subclass SecureWrapper from KNXIPFrame instead of being an attribute)
         assert isinstance(encrypted_frame.body, SecureWrapper)
         if encrypted_frame.body.secure_session_id != self.session_id:
             raise KNXSecureValidationError("Wrong secure session id")
 
         session_id_bytes = encrypted_frame.body.secure_session_id.to_bytes(2, "big")
-        wrapper_header = encrypted_frame.header.to_knx()
+        # the MAC covers the header bytes as received - re-encode only local frames
+        wrapper_header = encrypted_frame.header.raw or encrypted_frame.header.to_knx()
 
-        dec_frame, mac_tr = decrypt_ctr(
-            key=self._session_key,
+        dec_frame, mac_tr = self._cipher.decrypt_ctr(
             counter_0=(
                 encrypted_frame.body.sequence_information
                 + encrypted_frame.body.serial_number
@@ -245,8 +262,7 @@ class SecureSession(TCPTransport):
             mac=encrypted_frame.body.message_authentication_code,
             payload=encrypted_frame.body.encrypted_data,
         )
-        mac_cbc = calculate_message_authentication_code_cbc(
-            key=self._session_key,
+        mac_cbc = self._cipher.calculate_message_authentication_code_cbc(
             additional_data=wrapper_header + session_id_bytes,
             payload=dec_frame,
             block_0=(
@@ -288,46 +304,59 @@ class SecureSession(TCPTransport):
 
     def encrypt_frame(self, plain_frame: KNXIPFrame) -> KNXIPFrame:
         """Wrap KNX/IP frame in SecureWrapper."""
-        sequence_information = self.increment_sequence_number()
-        plain_payload = plain_frame.to_knx()  # P
-        payload_length = len(plain_payload)  # Q
-        # 6 KNXnet/IP header, 2 session_id, 6 sequence_number, 6 serial_number, 2 message_tag, 16 MAC = 38
-        total_length = 38 + payload_length
-        # TODO: get header data and total_length from SecureWrapper class
-        wrapper_header = bytes.fromhex("06 10 09 50") + total_length.to_bytes(2, "big")
-
-        mac_cbc = calculate_message_authentication_code_cbc(
-            key=self._session_key,
-            additional_data=wrapper_header + self.session_id.to_bytes(2, "big"),
-            payload=plain_payload,
-            block_0=(
-                sequence_information
-                + XKNX_SERIAL_NUMBER
-                + MESSAGE_TAG_TUNNELLING
-                + payload_length.to_bytes(2, "big")
-            ),
-        )
-        encrypted_data, mac = encrypt_data_ctr(
-            key=self._session_key,
-            counter_0=(
+        return self.encrypt_frames([plain_frame])[0]
+
+    def encrypt_frames(self, plain_frames: list[KNXIPFrame]) -> list[KNXIPFrame]:
+        """
+        Wrap multiple KNX/IP frames in SecureWrappers.
+
+        Sequence numbers are assigned in order. The CTR key stream for all frames
+        is calculated in one pass of the session cipher.
+        """
+        session_id_bytes = self.session_id.to_bytes(2, "big")
+        sequence_informations = []
+        ctr_frames = []
+        for plain_frame in plain_frames:
+            sequence_information = self.increment_sequence_number()
+            plain_payload = plain_frame.to_knx()  # P
+            payload_length = len(plain_payload)  # Q
+            total_length = SECURE_WRAPPER_OVERHEAD + payload_length
+            # TODO: get header data and total_length from SecureWrapper class
+            wrapper_header = SECURE_WRAPPER_HEADER + total_length.to_bytes(2, "big")
+            mac_cbc = self._cipher.calculate_message_authentication_code_cbc(
+                additional_data=wrapper_header + session_id_bytes,
+                payload=plain_payload,
+                block_0=(
+                    sequence_information
+                    + XKNX_SERIAL_NUMBER
+                    + MESSAGE_TAG_TUNNELLING
+                    + payload_length.to_bytes(2, "big")
+                ),
+            )
+            counter_0 = (
                 sequence_information
                 + XKNX_SERIAL_NUMBER
                 + MESSAGE_TAG_TUNNELLING
                 + bytes.fromhex("ff 00")
-            ),
-            mac_cbc=mac_cbc,
-            payload=plain_payload,
-        )
-        return KNXIPFrame.init_from_body(
-            SecureWrapper(
-                secure_session_id=self.session_id,
-                sequence_information=sequence_information,
-                serial_number=XKNX_SERIAL_NUMBER,
-                message_tag=MESSAGE_TAG_TUNNELLING,
-                encrypted_data=encrypted_data,
-                message_authentication_code=mac,
             )
-        )
+            sequence_informations.append(sequence_information)
+            ctr_frames.append((counter_0, mac_cbc, plain_payload))
+
+        return [
+            KNXIPFrame.init_from_body(
+                SecureWrapper(
+                    secure_session_id=self.session_id,
+                    sequence_information=sequence_information,
+                    serial_number=XKNX_SERIAL_NUMBER,
+                    message_tag=MESSAGE_TAG_TUNNELLING,
+                    encrypted_data=encrypted_data,
+                    message_authentication_code=mac,
+                )
+            )
+            for sequence_information, (encrypted_data, mac) in zip(
+                sequence_informations, self._cipher.encrypt_data_ctr_batch(ctr_frames)
+            )
+        ]
 
     def increment_sequence_number(self) -> bytes:
         """Increment sequence number. Return byte representation of current sequence number."""
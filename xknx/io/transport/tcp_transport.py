@@ -13,6 +13,8 @@ from typing import Callable, cast
 from xknx.exceptions import CommunicationError, CouldNotParseKNXIP, IncompleteKNXIPFrame
 from xknx.knxip import HPAI, HostProtocol, KNXIPFrame
 
+from ..capture import active_recorders, record_frame
+from ..util import LazyHex
 from .ip_transport import KNXIPTransport
 
 raw_socket_logger = logging.getLogger("xknx.raw_socket")
@@ -42,7 +44,7 @@ class TCPTransport(KNXIPTransport):
 
         def data_received(self, data: bytes) -> None:
             """Call assigned callback. Callback for datagram received."""
-            raw_socket_logger.debug("Received via tcp: %s", data.hex())
+            raw_socket_logger.debug("Received via tcp: %s", LazyHex(data))
             self.data_received_callback(data)
 
         def connection_lost(self, exc: Exception | None) -> None:
@@ -77,7 +79,7 @@ class TCPTransport(KNXIPTransport):
         except IncompleteKNXIPFrame:
             self._buffer = raw
             raw_socket_logger.debug(
-                "Incomplete KNX/IP frame. Waiting for rest: %s", raw.hex()
+                "Incomplete KNX/IP frame. Waiting for rest: %s", LazyHex(raw)
             )
             return
         except CouldNotParseKNXIP as couldnotparseknxip:
@@ -86,11 +88,15 @@ class TCPTransport(KNXIPTransport):
                 self.remote_hpai,
                 time.time(),
                 couldnotparseknxip.description,
-                raw.hex(),
+                LazyHex(raw),
             )
             if not (frame_length := knxipframe.header.total_length):
                 return
+            if active_recorders:
+                record_frame(raw[:frame_length], False, self.remote_addr, tcp=True)
         else:
+            if active_recorders:
+                record_frame(raw[:frame_length], False, self.remote_addr, tcp=True)
             knx_logger.debug(
                 "Received from %s at %s:\n%s",
                 self.remote_hpai,
@@ -136,4 +142,7 @@ class TCPTransport(KNXIPTransport):
         if self.transport is None:
             raise CommunicationError("Transport not connected")
 
-        self.transport.write(knxipframe.to_knx())
+        raw = knxipframe.to_knx()
+        if active_recorders:
+            record_frame(raw, True, self.remote_addr, tcp=True)
+        self.transport.write(raw)
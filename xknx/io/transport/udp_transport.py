@@ -16,6 +16,8 @@ from typing import Callable, cast
 from xknx.exceptions import CommunicationError, CouldNotParseKNXIP
 from xknx.knxip import HPAI, KNXIPFrame
 
+from ..capture import active_recorders, record_frame
+from ..util import LazyHex
 from .ip_transport import KNXIPTransport
 
 raw_socket_logger = logging.getLogger("xknx.raw_socket")
@@ -44,7 +46,7 @@ class UDPTransport(KNXIPTransport):
 
         def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
             """Call assigned callback. Callback for datagram received."""
-            raw_socket_logger.debug("Received from %s: %s", addr, data.hex())
+            raw_socket_logger.debug("Received from %s: %s", addr, LazyHex(data))
             if self.data_received_callback is not None:
                 self.data_received_callback(data, addr)
 
@@ -77,6 +79,8 @@ class UDPTransport(KNXIPTransport):
     def data_received_callback(self, raw: bytes, source: tuple[str, int]) -> None:
         """Parse and process KNXIP frame. Callback for having received an UDP packet."""
         if raw:
+            if active_recorders:
+                record_frame(raw, False, source)
             try:
                 knxipframe = KNXIPFrame()
                 knxipframe.from_knx(raw)
@@ -87,7 +91,7 @@ class UDPTransport(KNXIPTransport):
                     source[1],
                     time.time(),
                     couldnotparseknxip.description,
-                    raw.hex(),
+                    LazyHex(raw),
                 )
             else:
                 knx_logger.debug(
@@ -172,6 +176,8 @@ class UDPTransport(KNXIPTransport):
                     "Multicast send to specific address is invalid. %s",
                     knxipframe,
                 )
-            self.transport.sendto(knxipframe.to_knx(), self.remote_addr)
-        else:
-            self.transport.sendto(knxipframe.to_knx(), addr=_addr)
+            _addr = self.remote_addr
+        raw = knxipframe.to_knx()
+        if active_recorders:
+            record_frame(raw, True, _addr)
+        self.transport.sendto(raw, _addr)
@@ -8,6 +8,7 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 import logging
+import random
 from typing import TYPE_CHECKING, Awaitable, Callable
 
 from xknx.core import XknxConnectionState
@@ -26,7 +27,7 @@ from xknx.knxip import (
 )
 from xknx.telegram import IndividualAddress, Telegram, TelegramDirection
 
-from .const import HEARTBEAT_RATE
+from .const import HEARTBEAT_RATE, HEARTBEAT_RATE_MIN
 from .gateway_scanner import GatewayDescriptor
 from .interface import Interface
 from .request_response import Connect, ConnectionState, Disconnect, Tunnelling
@@ -35,6 +36,7 @@ from .self_description import DescriptionQuery
 from .transport import KNXIPTransport, TCPTransport, UDPTransport
 
 if TYPE_CHECKING:
+    from xknx.core import ConnectionManager
     from xknx.xknx import XKNX
 
 TelegramCallbackType = Callable[[Telegram], None]
@@ -43,12 +45,50 @@ logger = logging.getLogger("xknx.log")
 
 # See 3/6/3 EMI_IMI §4.1.5 Data Link Layer messages
 REQUEST_TO_CONFIRMATION_TIMEOUT = 3
+# reconnect delays are reduced by a random fraction of up to RECONNECT_JITTER
+# so clients losing the connection at the same time don't reconnect in lockstep
+RECONNECT_JITTER = 0.5
+
+
+class ReconnectMetrics:
+    """
+    Reconnect statistics of a tunnel.
+
+    Telemetry:
+    * reconnects: number of successful reconnects.
+    * failed_attempts: number of failed reconnect attempts.
+    * last_duration: seconds from losing the connection until the last successful
+        reconnect. None if the tunnel was not reconnected yet.
+    * total_duration: sum of seconds the tunnel was disconnected before reconnects.
+    """
+
+    def __init__(self) -> None:
+        """Initialize ReconnectMetrics class."""
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.last_duration: float | None = None
+        self.total_duration = 0.0
+
+    def reconnected(self, duration: float) -> None:
+        """Record a successful reconnect."""
+        self.reconnects += 1
+        self.last_duration = duration
+        self.total_duration += duration
 
 
 class _Tunnel(Interface):
-    """Class for handling KNX/IP tunnels."""
+    """
+    Class for handling KNX/IP tunnels.
+
+    Reconnects wait `auto_reconnect_wait` seconds, doubled after every round of
+    failed attempts up to `auto_reconnect_max_wait`, with random jitter. The first
+    attempt uses the last connected device, following attempts rotate through
+    `alternative_gateways`.
+    """
 
     transport: KNXIPTransport
+    gateway_ip: str
+    gateway_port: int
 
     def __init__(
         self,
@@ -56,11 +96,26 @@ class _Tunnel(Interface):
         telegram_received_callback: TelegramCallbackType | None = None,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        connection_manager: ConnectionManager | None = None,
+        auto_reconnect_max_wait: float = 60,
+        alternative_gateways: list[tuple[str, int]] | None = None,
     ):
         """Initialize Tunnel class."""
         self.xknx = xknx
+        self.connection_manager = connection_manager or xknx.connection_manager
         self.auto_reconnect = auto_reconnect
         self.auto_reconnect_wait = auto_reconnect_wait
+        self.auto_reconnect_max_wait = auto_reconnect_max_wait
+        self.reconnect_metrics = ReconnectMetrics()
+        # subclasses set gateway_ip and gateway_port before calling super().__init__()
+        self._gateways = [(self.gateway_ip, self.gateway_port)] + [
+            gateway
+            for gateway in alternative_gateways or []
+            if gateway != (self.gateway_ip, self.gateway_port)
+        ]
+        self._gateway_index = 0
+        self._reconnect_attempts = 0
+        self._connection_lost_time: float | None = None
 
         self.communication_channel: int | None = None
         self.local_hpai: HPAI = HPAI()
@@ -68,6 +123,8 @@ class _Tunnel(Interface):
         self.telegram_received_callback = telegram_received_callback
         self._data_endpoint_addr: tuple[str, int] | None = None
         self._heartbeat_task: asyncio.Task[None] | None = None
+        self._heartbeat_rate: float = HEARTBEAT_RATE
+        self._heartbeat_trigger = asyncio.Event()
         self._initial_connection = True
         self._is_reconnecting = False
         self._reconnect_task: asyncio.Task[None] | None = None
@@ -98,7 +155,7 @@ class _Tunnel(Interface):
 
     async def connect(self) -> bool:
         """Connect to a KNX tunneling interface. Returns True on success."""
-        await self.xknx.connection_manager.connection_state_changed(
+        await self.connection_manager.connection_state_changed(
             XknxConnectionState.CONNECTING
         )
         try:
@@ -111,7 +168,7 @@ class _Tunnel(Interface):
                 type(ex).__name__,
                 ex,
             )
-            await self.xknx.connection_manager.connection_state_changed(
+            await self.connection_manager.connection_state_changed(
                 XknxConnectionState.DISCONNECTED
             )
             if not self._initial_connection and self.auto_reconnect:
@@ -124,7 +181,7 @@ class _Tunnel(Interface):
             ) from ex
         else:
             self._tunnel_established()
-            await self.xknx.connection_manager.connection_state_changed(
+            await self.connection_manager.connection_state_changed(
                 XknxConnectionState.CONNECTED
             )
             return True
@@ -133,13 +190,19 @@ class _Tunnel(Interface):
         """Set up interface when the tunnel is ready."""
         self._initial_connection = False
         self.sequence_number = 0
+        # check a reconnected tunnel more often until it proved to be stable
+        self._heartbeat_rate = (
+            HEARTBEAT_RATE_MIN
+            if self._connection_lost_time is not None
+            else HEARTBEAT_RATE
+        )
         self.start_heartbeat()
 
     def _tunnel_lost(self) -> None:
         """Prepare for reconnection or shutdown when the connection is lost. Callback."""
         self.stop_heartbeat()
         asyncio.create_task(
-            self.xknx.connection_manager.connection_state_changed(
+            self.connection_manager.connection_state_changed(
                 XknxConnectionState.DISCONNECTED
             )
         )
@@ -149,14 +212,52 @@ class _Tunnel(Interface):
         else:
             raise CommunicationError("Tunnel connection closed.")
 
+    def _reconnect_delay(self) -> float:
+        """Return seconds to wait before the next reconnect attempt."""
+        # every round of attempts to all gateways doubles the delay
+        rounds = self._reconnect_attempts // len(self._gateways)
+        delay = min(
+            self.auto_reconnect_wait * 2.0**rounds, self.auto_reconnect_max_wait
+        )
+        return delay * (1 - RECONNECT_JITTER * random.random())
+
+    def _set_gateway(self, gateway_ip: str, gateway_port: int) -> None:
+        """Use a different KNX/IP device for following connection attempts."""
+        self.gateway_ip = gateway_ip
+        self.gateway_port = gateway_port
+        self.transport.remote_addr = (gateway_ip, gateway_port)
+
     async def _reconnect(self) -> None:
         """Reconnect to tunnel device."""
+        loop = asyncio.get_running_loop()
+        if self._connection_lost_time is None:
+            self._connection_lost_time = loop.time()
         if self.transport.transport:
             await self._disconnect_request(True)
             self.transport.stop()
-        await asyncio.sleep(self.auto_reconnect_wait)
+        await asyncio.sleep(self._reconnect_delay())
+        if self._reconnect_attempts and len(self._gateways) > 1:
+            self._gateway_index = (self._gateway_index + 1) % len(self._gateways)
+            logger.debug(
+                "Trying to reconnect to alternative KNX/IP device %s:%s",
+                *self._gateways[self._gateway_index],
+            )
+            self._set_gateway(*self._gateways[self._gateway_index])
+        self._reconnect_attempts += 1
         if await self.connect():
-            logger.info("Successfully reconnected to KNX bus.")
+            duration = loop.time() - self._connection_lost_time
+            self.reconnect_metrics.reconnected(duration)
+            logger.info(
+                "Successfully reconnected to KNX bus via %s:%s after %.1f seconds and %s attempts.",
+                self.gateway_ip,
+                self.gateway_port,
+                duration,
+                self._reconnect_attempts,
+            )
+            self._connection_lost_time = None
+            self._reconnect_attempts = 0
+        else:
+            self.reconnect_metrics.failed_attempts += 1
 
     def _stop_reconnect(self) -> None:
         """Stop reconnect task if running."""
@@ -167,11 +268,13 @@ class _Tunnel(Interface):
     async def disconnect(self) -> None:
         """Disconnect tunneling connection."""
         self.stop_heartbeat()
-        await self.xknx.connection_manager.connection_state_changed(
+        await self.connection_manager.connection_state_changed(
             XknxConnectionState.DISCONNECTED
         )
         self._data_endpoint_addr = None
         self._stop_reconnect()
+        self._connection_lost_time = None
+        self._reconnect_attempts = 0
         await self._disconnect_request(False)
         self.transport.stop()
 
@@ -269,7 +372,7 @@ class _Tunnel(Interface):
                 # TODO: How to test this?
                 if self._reconnect_task is None or self._reconnect_task.done():
                     self._tunnel_lost()
-                await self.xknx.connection_manager.connected.wait()
+                await self.connection_manager.connected.wait()
                 success = await self._tunnelling_request(telegram)
                 if not success:
                     raise CommunicationError(
@@ -300,6 +403,10 @@ class _Tunnel(Interface):
             logger.warning(
                 "L_DATA_CON Data Link Layer confirmation timed out for %s", telegram
             )
+            # early sign of a lost connection - check it now instead of waiting
+            # for the next regular heartbeat
+            self._heartbeat_rate = HEARTBEAT_RATE_MIN
+            self._heartbeat_trigger.set()
             # could return False here to retry sending the telegram (tcp without ACK)
 
     def _increase_sequence_number(self) -> None:
@@ -379,11 +486,19 @@ class _Tunnel(Interface):
 
     async def do_heartbeat(self) -> None:
         """Heartbeat: Worker task, endless loop for sending heartbeat requests."""
+        self._heartbeat_trigger.clear()
         while True:
             try:
-                await asyncio.sleep(HEARTBEAT_RATE)
+                try:
+                    await asyncio.wait_for(
+                        self._heartbeat_trigger.wait(), timeout=self._heartbeat_rate
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._heartbeat_trigger.clear()
                 if not await self._connectionstate_request():
                     await self._do_heartbeat_failed()
+                self._heartbeat_rate = min(self._heartbeat_rate * 2, HEARTBEAT_RATE)
             except CommunicationError as err:
                 logger.warning("Heartbeat to KNX bus failed. %s", err)
                 self._tunnel_lost()
@@ -414,6 +529,9 @@ class UDPTunnel(_Tunnel):
         telegram_received_callback: TelegramCallbackType | None = None,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        connection_manager: ConnectionManager | None = None,
+        auto_reconnect_max_wait: float = 60,
+        alternative_gateways: list[tuple[str, int]] | None = None,
     ):
         """Initialize Tunnel class."""
         self.gateway_ip = gateway_ip
@@ -426,6 +544,9 @@ class UDPTunnel(_Tunnel):
             telegram_received_callback=telegram_received_callback,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            connection_manager=connection_manager,
+            auto_reconnect_max_wait=auto_reconnect_max_wait,
+            alternative_gateways=alternative_gateways,
         )
 
     def _init_transport(self) -> None:
@@ -506,6 +627,9 @@ class TCPTunnel(_Tunnel):
         telegram_received_callback: TelegramCallbackType | None = None,
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
+        connection_manager: ConnectionManager | None = None,
+        auto_reconnect_max_wait: float = 60,
+        alternative_gateways: list[tuple[str, int]] | None = None,
     ):
         """Initialize Tunnel class."""
         self.gateway_ip = gateway_ip
@@ -515,6 +639,9 @@ class TCPTunnel(_Tunnel):
             telegram_received_callback=telegram_received_callback,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            connection_manager=connection_manager,
+            auto_reconnect_max_wait=auto_reconnect_max_wait,
+            alternative_gateways=alternative_gateways,
         )
         # TCP always uses 0.0.0.0:0
         self.local_hpai = HPAI(protocol=HostProtocol.IPV4_TCP)
@@ -526,6 +653,13 @@ class TCPTunnel(_Tunnel):
             connection_lost_cb=self._tunnel_lost,
         )
 
+    def _set_gateway(self, gateway_ip: str, gateway_port: int) -> None:
+        """Use a different KNX/IP device for following connection attempts."""
+        super()._set_gateway(gateway_ip, gateway_port)
+        self.transport.remote_hpai = HPAI(
+            gateway_ip, gateway_port, protocol=HostProtocol.IPV4_TCP
+        )
+
     async def setup_tunnel(self) -> None:
         """Set up tunnel before sending a ConnectionRequest."""
 
@@ -572,6 +706,9 @@ class SecureTunnel(TCPTunnel):
         auto_reconnect: bool = True,
         auto_reconnect_wait: int = 3,
         device_authentication_password: str | None = None,
+        connection_manager: ConnectionManager | None = None,
+        auto_reconnect_max_wait: float = 60,
+        alternative_gateways: list[tuple[str, int]] | None = None,
     ):
         """Initialize SecureTunnel class."""
         self._device_authentication_password = device_authentication_password
@@ -584,6 +721,9 @@ class SecureTunnel(TCPTunnel):
             telegram_received_callback=telegram_received_callback,
             auto_reconnect=auto_reconnect,
             auto_reconnect_wait=auto_reconnect_wait,
+            connection_manager=connection_manager,
+            auto_reconnect_max_wait=auto_reconnect_max_wait,
+            alternative_gateways=alternative_gateways,
         )
 
     def _init_transport(self) -> None:
@@ -0,0 +1,712 @@
+"""
+TunnellingServer provides KNXnet/IP tunnelling connections to multiple clients.
+
+All client connections are multiplexed over the single upstream connection of
+the XKNX object (`xknx.knxip_interface`) so visualisations, loggers or ETS
+don't occupy a tunnelling slot of the KNX/IP interface each.
+
+* It accepts UDP and TCP connections from KNXnet/IP tunnelling clients.
+* Telegrams sent by a client are queued to `xknx.telegrams` and confirmed with
+  L_DATA_CON after they have been sent to the bus - or with the confirm error
+  flag set if they could not be sent.
+* Telegrams from the bus, from xknx itself and from other clients are forwarded
+  to all clients as L_DATA_IND. The cEMI frame is encoded once per telegram;
+  only the connection header differs for each client.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Iterator, cast
+import weakref
+
+from xknx.exceptions import CommunicationError
+from xknx.knxip import (
+    HPAI,
+    CEMIFlags,
+    CEMIFrame,
+    CEMIMessageCode,
+    ConnectionStateRequest,
+    ConnectionStateResponse,
+    ConnectRequest,
+    ConnectRequestType,
+    ConnectResponse,
+    DescriptionRequest,
+    DescriptionResponse,
+    DIBDeviceInformation,
+    DIBServiceFamily,
+    DIBSuppSVCFamilies,
+    DisconnectRequest,
+    DisconnectResponse,
+    ErrorCode,
+    HostProtocol,
+    KNXIPFrame,
+    KNXIPHeader,
+    KNXIPServiceType,
+    TunnellingAck,
+    TunnellingRequest,
+)
+from xknx.telegram import IndividualAddress, Telegram, TelegramDirection
+
+from .const import (
+    CONNECTION_ALIVE_TIME,
+    CONNECTIONSTATE_REQUEST_TIMEOUT,
+    DEFAULT_MCAST_PORT,
+    XKNX_SERIAL_NUMBER,
+)
+from .transport import KNXIPTransport, TCPTransport, UDPTransport
+
+if TYPE_CHECKING:
+    from xknx.core import TelegramQueue
+    from xknx.xknx import XKNX
+
+logger = logging.getLogger("xknx.log")
+
+DEFAULT_MAX_CLIENTS = 32
+
+
+class TunnellingServerConnection:
+    """A tunnelling connection of a client to the TunnellingServer."""
+
+    def __init__(
+        self,
+        communication_channel: int,
+        individual_address: IndividualAddress,
+        transport: KNXIPTransport,
+        control_endpoint: tuple[str, int] | None,
+        data_endpoint: tuple[str, int] | None,
+        last_activity: float,
+    ):
+        """Initialize TunnellingServerConnection class."""
+        self.communication_channel = communication_channel
+        self.individual_address = individual_address
+        self.transport = transport
+        self.control_endpoint = control_endpoint
+        # None for TCP connections - frames are sent over the stream
+        self.data_endpoint = data_endpoint
+        self.last_activity = last_activity
+        # sequence counter expected for the next TunnellingRequest from the client
+        self.sequence_counter_in = 0
+        self._sequence_counter_out = 0
+
+    @property
+    def is_tcp(self) -> bool:
+        """Return if the client is connected via TCP."""
+        return isinstance(self.transport, TCPTransport)
+
+    def next_sequence_counter(self) -> int:
+        """Return the sequence counter for the next TunnellingRequest to the client."""
+        sequence_counter = self._sequence_counter_out
+        self._sequence_counter_out = (sequence_counter + 1) & 0xFF
+        return sequence_counter
+
+    def send(self, knxipframe: KNXIPFrame, control: bool = False) -> None:
+        """Send a KNXIPFrame to the client."""
+        self.transport.send(
+            knxipframe, addr=self.control_endpoint if control else self.data_endpoint
+        )
+
+    def send_raw(self, raw: bytes) -> None:
+        """Send serialized KNX/IP data to the data endpoint of the client."""
+        if self.transport.transport is None:
+            raise CommunicationError("Transport not connected")
+        if self.data_endpoint is None:
+            cast(asyncio.Transport, self.transport.transport).write(raw)
+        else:
+            cast(asyncio.DatagramTransport, self.transport.transport).sendto(
+                raw, self.data_endpoint
+            )
+
+    def __repr__(self) -> str:
+        """Return object as readable string."""
+        return (
+            "<TunnellingServerConnection "
+            f'communication_channel="{self.communication_channel}" '
+            f'individual_address="{self.individual_address}" '
+            f'data_endpoint="{self.data_endpoint}" />'
+        )
+
+
+class _TCPServerProtocol(asyncio.Protocol):
+    """Handle a TCP stream of one client of the TunnellingServer."""
+
+    def __init__(self, server: _TunnellingServer):
+        """Initialize _TCPServerProtocol class."""
+        self.server = server
+        self.knx_transport: TCPTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Set up a KNXIPTransport for the stream. Callback after connection was made."""
+        peername = transport.get_extra_info("peername")
+        self.knx_transport = self.server.create_tcp_transport(
+            remote_addr=(peername[0], peername[1])
+        )
+        self.knx_transport.transport = cast(asyncio.Transport, transport)
+
+    def data_received(self, data: bytes) -> None:
+        """Parse received data. Callback for data received."""
+        if self.knx_transport is not None:
+            self.knx_transport.data_received_callback(data)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Remove all tunnels of this stream. Callback for connection lost."""
+        if self.knx_transport is not None:
+            self.server.transport_closed(self.knx_transport)
+            self.knx_transport.transport = None
+
+
+class _TunnellingServer(ABC):
+    """Base class for serving KNXnet/IP tunnelling connections to multiple clients."""
+
+    def __init__(
+        self,
+        local_ip: str,
+        local_port: int = DEFAULT_MCAST_PORT,
+        tcp: bool = True,
+        udp: bool = True,
+        individual_addresses: list[IndividualAddress | str] | None = None,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        name: str = "XKNX Tunnelling Server",
+    ):
+        """Initialize _TunnellingServer class."""
+        self.local_ip = local_ip
+        self.local_port = local_port
+        self.name = name
+        # if no addresses are given every client uses the address of the upstream connection
+        self.individual_addresses = [
+            IndividualAddress(address) for address in individual_addresses or []
+        ]
+        self.max_clients = (
+            len(self.individual_addresses) if individual_addresses else max_clients
+        )
+        self.connections: dict[int, TunnellingServerConnection] = {}
+
+        self.udp_transport: UDPTransport | None = (
+            UDPTransport(
+                local_addr=(local_ip, local_port),
+                remote_addr=(local_ip, local_port),
+            )
+            if udp
+            else None
+        )
+        self._tcp_enabled = tcp
+        self._tcp_server: asyncio.AbstractServer | None = None
+        self._alive_task: asyncio.Task[None] | None = None
+
+    @property
+    @abstractmethod
+    def own_address(self) -> IndividualAddress:
+        """Return the individual address of the server."""
+
+    @abstractmethod
+    def _cemi_received(
+        self, cemi: CEMIFrame, connection: TunnellingServerConnection
+    ) -> None:
+        """Handle a L_DATA_REQ cEMI frame received from a client."""
+
+    async def start(self) -> None:
+        """Start listening for tunnelling clients."""
+        if self.udp_transport is not None:
+            self.udp_transport.register_callback(self.request_received)
+            await self.udp_transport.connect()
+            # port 0 binds to a free port - TCP shall use the same one
+            self.local_port = self.udp_transport.getsockname()[1]
+        if self._tcp_enabled:
+            loop = asyncio.get_running_loop()
+            self._tcp_server = await loop.create_server(
+                lambda: _TCPServerProtocol(self),
+                host=self.local_ip,
+                port=self.local_port,
+            )
+            self.local_port = self._tcp_server.sockets[0].getsockname()[1]
+        self._alive_task = asyncio.create_task(self._check_alive_loop())
+        logger.debug("%s listening on %s:%s", self.name, self.local_ip, self.local_port)
+
+    async def stop(self) -> None:
+        """Disconnect all clients and stop listening."""
+        if self._alive_task is not None:
+            self._alive_task.cancel()
+            self._alive_task = None
+        for connection in list(self.connections.values()):
+            self._disconnect_client(connection)
+        if self._tcp_server is not None:
+            self._tcp_server.close()
+            await self._tcp_server.wait_closed()
+            self._tcp_server = None
+        if self.udp_transport is not None:
+            self.udp_transport.stop()
+
+    def create_tcp_transport(self, remote_addr: tuple[str, int]) -> TCPTransport:
+        """Return a KNXIPTransport for an accepted TCP stream."""
+        transport = TCPTransport(remote_addr=remote_addr)
+        transport.register_callback(self.request_received)
+        return transport
+
+    ####################
+    #
+    # CONNECTION MANAGEMENT
+    #
+    ####################
+
+    def _free_communication_channels(self) -> Iterator[int]:
+        """Yield unused communication channel ids."""
+        return (channel for channel in range(1, 256) if channel not in self.connections)
+
+    def _free_individual_address(self) -> IndividualAddress | None:
+        """Return an individual address not used by any client."""
+        if not self.individual_addresses:
+            return self.own_address
+        used = {
+            connection.individual_address for connection in self.connections.values()
+        }
+        return next(
+            (address for address in self.individual_addresses if address not in used),
+            None,
+        )
+
+    def _connect_request_received(
+        self, connect_request: ConnectRequest, source: HPAI, transport: KNXIPTransport
+    ) -> None:
+        """Handle a ConnectRequest of a client."""
+        is_tcp = isinstance(transport, TCPTransport)
+        control_endpoint = (
+            None if is_tcp else self._endpoint(connect_request.control_endpoint, source)
+        )
+        data_endpoint = (
+            None if is_tcp else self._endpoint(connect_request.data_endpoint, source)
+        )
+
+        def _respond(connect_response: ConnectResponse) -> None:
+            transport.send(
+                KNXIPFrame.init_from_body(connect_response), addr=control_endpoint
+            )
+
+        if connect_request.request_type is not ConnectRequestType.TUNNEL_CONNECTION:
+            _respond(ConnectResponse(status_code=ErrorCode.E_CONNECTION_TYPE))
+            return
+        if connect_request.flags != 0x02:  # only TUNNEL_LINKLAYER is supported
+            _respond(ConnectResponse(status_code=ErrorCode.E_TUNNELLING_LAYER))
+            return
+        individual_address = self._free_individual_address()
+        communication_channel = next(self._free_communication_channels(), None)
+        if (
+            len(self.connections) >= self.max_clients
+            or individual_address is None
+            or communication_channel is None
+        ):
+            logger.info("TunnellingServer: no free connection for %s", source)
+            _respond(ConnectResponse(status_code=ErrorCode.E_NO_MORE_CONNECTIONS))
+            return
+
+        connection = TunnellingServerConnection(
+            communication_channel=communication_channel,
+            individual_address=individual_address,
+            transport=transport,
+            control_endpoint=control_endpoint,
+            data_endpoint=data_endpoint,
+            last_activity=asyncio.get_running_loop().time(),
+        )
+        self.connections[communication_channel] = connection
+        logger.debug("TunnellingServer: client connected %s", connection)
+        _respond(
+            ConnectResponse(
+                communication_channel=communication_channel,
+                data_endpoint=(
+                    HPAI(protocol=HostProtocol.IPV4_TCP)
+                    if is_tcp
+                    else HPAI(*transport.getsockname())
+                ),
+                identifier=individual_address.raw,
+            )
+        )
+
+    @staticmethod
+    def _endpoint(hpai: HPAI, source: HPAI) -> tuple[str, int]:
+        """Return address to use for an endpoint. Route back (NAT) uses the source address."""
+        if hpai.route_back:
+            return source.addr_tuple
+        return hpai.addr_tuple
+
+    def _connectionstate_request_received(
+        self,
+        connectionstate_request: ConnectionStateRequest,
+        source: HPAI,
+        transport: KNXIPTransport,
+    ) -> None:
+        """Handle a ConnectionStateRequest (heartbeat) of a client."""
+        connection = self.connections.get(
+            connectionstate_request.communication_channel_id
+        )
+        status_code = ErrorCode.E_NO_ERROR
+        if connection is None or connection.transport is not transport:
+            status_code = ErrorCode.E_CONNECTION_ID
+        else:
+            connection.last_activity = asyncio.get_running_loop().time()
+        connectionstate_response = ConnectionStateResponse(
+            communication_channel_id=connectionstate_request.communication_channel_id,
+            status_code=status_code,
+        )
+        transport.send(
+            KNXIPFrame.init_from_body(connectionstate_response),
+            addr=self._endpoint(connectionstate_request.control_endpoint, source),
+        )
+
+    def _disconnect_request_received(
+        self,
+        disconnect_request: DisconnectRequest,
+        source: HPAI,
+        transport: KNXIPTransport,
+    ) -> None:
+        """Handle a DisconnectRequest of a client."""
+        connection = self.connections.get(disconnect_request.communication_channel_id)
+        status_code = ErrorCode.E_NO_ERROR
+        if connection is None or connection.transport is not transport:
+            status_code = ErrorCode.E_CONNECTION_ID
+        else:
+            self._remove_connection(connection)
+        disconnect_response = DisconnectResponse(
+            communication_channel_id=disconnect_request.communication_channel_id,
+            status_code=status_code,
+        )
+        transport.send(
+            KNXIPFrame.init_from_body(disconnect_response),
+            addr=self._endpoint(disconnect_request.control_endpoint, source),
+        )
+
+    def _description_request_received(
+        self,
+        description_request: DescriptionRequest,
+        source: HPAI,
+        transport: KNXIPTransport,
+    ) -> None:
+        """Handle a DescriptionRequest of a client."""
+        device_information = DIBDeviceInformation()
+        device_information.individual_address = self.own_address
+        device_information.serial_number = XKNX_SERIAL_NUMBER.hex(":")
+        device_information.mac_address = "00:00:00:00:00:00"
+        device_information.name = self.name
+        service_families = DIBSuppSVCFamilies()
+        service_families.families = self._service_families()
+        description_response = DescriptionResponse()
+        description_response.dibs = [device_information, service_families]
+        transport.send(
+            KNXIPFrame.init_from_body(description_response),
+            addr=self._endpoint(description_request.control_endpoint, source),
+        )
+
+    def _service_families(self) -> list[DIBSuppSVCFamilies.Family]:
+        """Return the service families supported by the server."""
+        return [
+            DIBSuppSVCFamilies.Family(DIBServiceFamily.CORE, 1),
+            DIBSuppSVCFamilies.Family(
+                DIBServiceFamily.TUNNELING, 2 if self._tcp_enabled else 1
+            ),
+        ]
+
+    def _remove_connection(self, connection: TunnellingServerConnection) -> None:
+        """Remove a client connection."""
+        self.connections.pop(connection.communication_channel, None)
+        logger.debug("TunnellingServer: client disconnected %s", connection)
+
+    def _disconnect_client(self, connection: TunnellingServerConnection) -> None:
+        """Send DisconnectRequest to a client and remove its connection."""
+        self._remove_connection(connection)
+        disconnect_request = DisconnectRequest(
+            communication_channel_id=connection.communication_channel,
+            control_endpoint=(
+                HPAI(protocol=HostProtocol.IPV4_TCP)
+                if connection.is_tcp
+                else HPAI(*connection.transport.getsockname())
+            ),
+        )
+        try:
+            connection.send(KNXIPFrame.init_from_body(disconnect_request), control=True)
+        except CommunicationError as err:
+            logger.debug("Could not send DisconnectRequest to %s: %s", connection, err)
+
+    def transport_closed(self, transport: KNXIPTransport) -> None:
+        """Remove all connections of a closed transport (TCP stream)."""
+        for connection in list(self.connections.values()):
+            if connection.transport is transport:
+                self._remove_connection(connection)
+
+    async def _check_alive_loop(self) -> None:
+        """Endless loop removing clients that didn't send a heartbeat in time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(CONNECTIONSTATE_REQUEST_TIMEOUT)
+            deadline = loop.time() - CONNECTION_ALIVE_TIME
+            for connection in list(self.connections.values()):
+                if connection.last_activity < deadline:
+                    logger.info(
+                        "TunnellingServer: heartbeat of %s timed out", connection
+                    )
+                    self._disconnect_client(connection)
+
+    ####################
+    #
+    # INCOMING FRAMES
+    #
+    ####################
+
+    def request_received(
+        self, knxipframe: KNXIPFrame, source: HPAI, transport: KNXIPTransport
+    ) -> None:
+        """Handle incoming frames of clients. Callback from transports."""
+        body = knxipframe.body
+        if isinstance(body, TunnellingRequest):
+            self._tunnelling_request_received(body, transport)
+        elif isinstance(body, TunnellingAck):
+            if connection := self.connections.get(body.communication_channel_id):
+                connection.last_activity = asyncio.get_running_loop().time()
+        elif isinstance(body, ConnectionStateRequest):
+            self._connectionstate_request_received(body, source, transport)
+        elif isinstance(body, ConnectRequest):
+            self._connect_request_received(body, source, transport)
+        elif isinstance(body, DisconnectRequest):
+            self._disconnect_request_received(body, source, transport)
+        elif isinstance(body, DescriptionRequest):
+            self._description_request_received(body, source, transport)
+        elif isinstance(body, DisconnectResponse):
+            pass
+        else:
+            logger.debug("TunnellingServer: service not implemented: %s", knxipframe)
+
+    def _tunnelling_request_received(
+        self, tunnelling_request: TunnellingRequest, transport: KNXIPTransport
+    ) -> None:
+        """Handle a TunnellingRequest of a client."""
+        connection = self.connections.get(tunnelling_request.communication_channel_id)
+        if connection is None or connection.transport is not transport:
+            logger.debug(
+                "TunnellingServer: TunnellingRequest for unknown channel %s",
+                tunnelling_request.communication_channel_id,
+            )
+            return
+        connection.last_activity = asyncio.get_running_loop().time()
+        if not connection.is_tcp:
+            # TCP connections are reliable so there are no ACKs and sequence checks
+            sequence_counter = tunnelling_request.sequence_counter
+            if sequence_counter == (connection.sequence_counter_in - 1) & 0xFF:
+                # repeated frame - our ACK was lost
+                self._send_tunnelling_ack(connection, sequence_counter)
+                return
+            if sequence_counter != connection.sequence_counter_in:
+                logger.debug(
+                    "TunnellingServer: discarding frame with sequence counter %s from %s",
+                    sequence_counter,
+                    connection,
+                )
+                return
+            self._send_tunnelling_ack(connection, sequence_counter)
+            connection.sequence_counter_in = (sequence_counter + 1) & 0xFF
+
+        cemi = tunnelling_request.pdu
+        if (
+            not isinstance(cemi, CEMIFrame)
+            or cemi.code is not CEMIMessageCode.L_DATA_REQ
+        ):
+            logger.debug(
+                "TunnellingServer: unsupported frame from %s: %s",
+                connection,
+                tunnelling_request,
+            )
+            return
+        if not cemi.src_addr.raw:
+            cemi.src_addr = connection.individual_address
+        self._cemi_received(cemi, connection)
+
+    def _send_tunnelling_ack(
+        self, connection: TunnellingServerConnection, sequence_counter: int
+    ) -> None:
+        """Acknowledge a TunnellingRequest of an UDP client."""
+        ack = TunnellingAck(
+            communication_channel_id=connection.communication_channel,
+            sequence_counter=sequence_counter,
+        )
+        connection.send(KNXIPFrame.init_from_body(ack))
+
+    ####################
+    #
+    # OUTGOING FRAMES
+    #
+    ####################
+
+    def _send_confirmation(
+        self,
+        cemi: CEMIFrame,
+        connection: TunnellingServerConnection,
+        success: bool = True,
+    ) -> None:
+        """Confirm a cEMI frame received from a client with L_DATA_CON."""
+        cemi.code = CEMIMessageCode.L_DATA_CON
+        if not success:
+            cemi.flags |= CEMIFlags.CONFIRM_ERROR
+        self._send_cemi(cemi.to_knx(), [connection])
+
+    def _send_indication(
+        self, cemi_raw: bytes, origin: TunnellingServerConnection | None = None
+    ) -> None:
+        """Send a serialized L_DATA_IND cEMI frame to all clients but `origin`."""
+        self._send_cemi(
+            cemi_raw,
+            [
+                connection
+                for connection in self.connections.values()
+                if connection is not origin
+            ],
+        )
+
+    def _send_cemi(
+        self, cemi_raw: bytes, connections: list[TunnellingServerConnection]
+    ) -> None:
+        """Send serialized cEMI frame in a TunnellingRequest to every given client."""
+        header = KNXIPHeader()
+        header.service_type_ident = KNXIPServiceType.TUNNELLING_REQUEST
+        header.total_length = (
+            KNXIPHeader.HEADERLENGTH + TunnellingRequest.HEADER_LENGTH + len(cemi_raw)
+        )
+        header_raw = header.to_knx()
+        for connection in connections:
+            try:
+                connection.send_raw(
+                    header_raw
+                    + bytes(
+                        (
+                            TunnellingRequest.HEADER_LENGTH,
+                            connection.communication_channel,
+                            connection.next_sequence_counter(),
+                            0x00,  # Reserved
+                        )
+                    )
+                    + cemi_raw
+                )
+            except CommunicationError as err:
+                logger.debug(
+                    "TunnellingServer: could not send to %s: %s", connection, err
+                )
+
+
+class TunnellingServer(_TunnellingServer):
+    """Class for serving tunnelling clients over the connection of a XKNX object."""
+
+    def __init__(
+        self,
+        xknx: XKNX,
+        local_ip: str,
+        local_port: int = DEFAULT_MCAST_PORT,
+        tcp: bool = True,
+        udp: bool = True,
+        individual_addresses: list[IndividualAddress | str] | None = None,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        name: str = "XKNX Tunnelling Server",
+    ):
+        """Initialize TunnellingServer class."""
+        super().__init__(
+            local_ip=local_ip,
+            local_port=local_port,
+            tcp=tcp,
+            udp=udp,
+            individual_addresses=individual_addresses,
+            max_clients=max_clients,
+            name=name,
+        )
+        self.xknx = xknx
+        self._telegram_cb: TelegramQueue.Callback | None = None
+        # id(telegram) -> (weak reference to the telegram, client connection,
+        # cEMI frame received from the client) - removed when the telegram is
+        # garbage collected so its id can't match a later telegram
+        self._pending_confirmations: dict[
+            int,
+            tuple[weakref.ref[Telegram], TunnellingServerConnection, CEMIFrame],
+        ] = {}
+
+    @property
+    def own_address(self) -> IndividualAddress:
+        """Return the individual address of the upstream connection."""
+        return self.xknx.current_address
+
+    async def start(self) -> None:
+        """Start listening for tunnelling clients."""
+        await super().start()
+        self._telegram_cb = self.xknx.telegram_queue.register_telegram_received_cb(
+            self._telegram_processed, match_for_outgoing=True
+        )
+        self.xknx.telegram_queue.register_telegram_send_failed_cb(
+            self._telegram_send_failed
+        )
+
+    async def stop(self) -> None:
+        """Disconnect all clients and stop listening."""
+        if self._telegram_cb is not None:
+            self.xknx.telegram_queue.unregister_telegram_received_cb(self._telegram_cb)
+            self.xknx.telegram_queue.unregister_telegram_send_failed_cb(
+                self._telegram_send_failed
+            )
+            self._telegram_cb = None
+        await super().stop()
+
+    def _remove_connection(self, connection: TunnellingServerConnection) -> None:
+        """Remove a client connection and its pending confirmations."""
+        super()._remove_connection(connection)
+        for key, (_, pending_connection, _) in list(
+            self._pending_confirmations.items()
+        ):
+            if pending_connection is connection:
+                del self._pending_confirmations[key]
+
+    def _cemi_received(
+        self, cemi: CEMIFrame, connection: TunnellingServerConnection
+    ) -> None:
+        """Queue a telegram received from a client to be sent by XKNX."""
+        telegram = cemi.telegram
+        telegram.direction = TelegramDirection.OUTGOING
+        key = id(telegram)
+        self._pending_confirmations[key] = (
+            weakref.ref(telegram, lambda _: self._pending_confirmations.pop(key, None)),
+            connection,
+            cemi,
+        )
+        self.xknx.telegrams.put_nowait(telegram)
+
+    def _pop_pending_confirmation(
+        self, telegram: Telegram
+    ) -> tuple[TunnellingServerConnection, CEMIFrame] | None:
+        """Return and remove client connection and cEMI frame of a client telegram."""
+        pending = self._pending_confirmations.get(id(telegram))
+        if pending is None or pending[0]() is not telegram:
+            return None
+        del self._pending_confirmations[id(telegram)]
+        return pending[1], pending[2]
+
+    def _telegram_send_failed(self, telegram: Telegram) -> None:
+        """Confirm a client telegram that could not be sent with an error."""
+        if pending := self._pop_pending_confirmation(telegram):
+            connection, cemi = pending
+            self._send_confirmation(cemi, connection, success=False)
+
+    async def _telegram_processed(self, telegram: Telegram) -> None:
+        """Forward a telegram processed by the TelegramQueue to clients."""
+        if not self.connections:
+            return
+        origin: TunnellingServerConnection | None = None
+        if pending := self._pop_pending_confirmation(telegram):
+            origin, cemi = pending
+            self._send_confirmation(cemi, origin)
+
+        source_address = telegram.source_address
+        if source_address is None or not source_address.raw:
+            # telegrams sent by xknx devices have no source address set
+            source_address = self.xknx.current_address
+        try:
+            indication = CEMIFrame.init_from_telegram(
+                telegram,
+                code=CEMIMessageCode.L_DATA_IND,
+                src_addr=source_address,
+            )
+            cemi_raw = indication.to_knx()
+        except (TypeError, ValueError) as err:
+            logger.debug("TunnellingServer: can not forward %s: %s", telegram, err)
+            return
+        self._send_indication(cemi_raw, origin=origin)
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 import ipaddress
 import logging
 import socket
+import time
 from typing import cast
 
 import ifaddr
@@ -15,6 +17,23 @@ from .const import DEFAULT_MCAST_GRP, DEFAULT_MCAST_PORT
 
 logger = logging.getLogger("xknx.log")
 
+# seconds network adapters returned by `get_local_ips()` are cached
+LOCAL_IPS_CACHE_TIME = 60
+
+
+class LazyHex:
+    """Render bytes as hex string only when a log record is emitted."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize LazyHex class."""
+        self.data = data
+
+    def __str__(self) -> str:
+        """Return hex representation of data."""
+        return self.data.hex()
+
 
 async def get_default_local_ip(remote_ip: str = DEFAULT_MCAST_GRP) -> str | None:
     """Return the local ip used for communication with remote_ip."""
@@ -34,9 +53,24 @@ async def get_default_local_ip(remote_ip: str = DEFAULT_MCAST_GRP) -> str | None
             return None
 
 
-def get_local_ips() -> list[ifaddr.IP]:
-    """Return list of local IPv4 addresses."""
-    return [ip for iface in ifaddr.get_adapters() for ip in iface.ips if ip.is_IPv4]
+@lru_cache(maxsize=1)
+def _local_ipv4_addresses(_time_slot: int) -> tuple[ifaddr.IP, ...]:
+    """Return IPv4 addresses of all network adapters. Cached per time slot."""
+    return tuple(
+        ip for iface in ifaddr.get_adapters() for ip in iface.ips if ip.is_IPv4
+    )
+
+
+def get_local_ips(refresh: bool = False) -> list[ifaddr.IP]:
+    """
+    Return list of local IPv4 addresses.
+
+    Network adapters are enumerated at most once per LOCAL_IPS_CACHE_TIME seconds
+    unless `refresh` is set.
+    """
+    if refresh:
+        _local_ipv4_addresses.cache_clear()
+    return list(_local_ipv4_addresses(int(time.monotonic() // LOCAL_IPS_CACHE_TIME)))
 
 
 def get_local_interface_name(local_ip: str) -> str:
@@ -20,6 +20,8 @@ class KNXIPHeader:
         self.service_type_ident = KNXIPServiceType.ROUTING_INDICATION
         self.b4_reserve = 0
         self.total_length = 0  # to be set later
+        # received header bytes - eg. for verifying the MAC of SecureWrapper frames
+        self.raw: bytes | None = None
 
     def from_knx(self, data: bytes) -> int:
         """Parse/deserialize from KNX/IP raw data."""
@@ -39,6 +41,7 @@ class KNXIPHeader:
                 f"KNXIPServiceType unknown: {hex(data[2] * 256 + data[3])}"
             )
         self.b4_reserve = data[4]
+        self.raw = bytes(data[: KNXIPHeader.HEADERLENGTH])
         return KNXIPHeader.HEADERLENGTH
 
     def set_length(self, body: KNXIPBody) -> None:
@@ -67,5 +70,11 @@ class KNXIPHeader:
         )
 
     def __eq__(self, other: object) -> bool:
-        """Equal operator."""
-        return self.__dict__ == other.__dict__
+        """Equal operator. Ignores received raw data."""
+        if not isinstance(other, KNXIPHeader):
+            return NotImplemented
+        return (
+            self.service_type_ident == other.service_type_ident
+            and self.b4_reserve == other.b4_reserve
+            and self.total_length == other.total_length
+        )
@@ -0,0 +1,66 @@
+"""
+Module for Serialization and Deserialization of KNX Routing Busy.
+
+A ROUTING_BUSY is sent by a KNXnet/IP router (eg. a line coupler) whose incoming
+queue is about to overflow. Receiving devices shall pause sending routing
+indications for the given wait time and resume slowly afterwards.
+"""
+from __future__ import annotations
+
+from typing import Final
+
+from xknx.exceptions import CouldNotParseKNXIP
+
+from .body import KNXIPBody
+from .knxip_enum import KNXIPServiceType
+
+
+class RoutingBusy(KNXIPBody):
+    """Representation of a KNX Routing Busy."""
+
+    SERVICE_TYPE = KNXIPServiceType.ROUTING_BUSY
+    LENGTH: Final = 6
+
+    def __init__(
+        self,
+        device_state: int = 0,
+        wait_time: int = 100,
+        control_field: int = 0,
+    ):
+        """Initialize RoutingBusy object."""
+        # bit 0: KNX fault, bit 1: IP fault
+        self.device_state = device_state
+        # routing busy wait time in milliseconds
+        self.wait_time = wait_time
+        # 0x0000 - all devices shall react on the frame
+        self.control_field = control_field
+
+    def calculated_length(self) -> int:
+        """Get length of KNX/IP body."""
+        return RoutingBusy.LENGTH
+
+    def from_knx(self, raw: bytes) -> int:
+        """Parse/deserialize from KNX/IP raw data."""
+        if len(raw) != RoutingBusy.LENGTH or raw[0] != RoutingBusy.LENGTH:
+            raise CouldNotParseKNXIP("RoutingBusy has wrong length")
+        self.device_state = raw[1]
+        self.wait_time = int.from_bytes(raw[2:4], "big")
+        self.control_field = int.from_bytes(raw[4:6], "big")
+        return RoutingBusy.LENGTH
+
+    def to_knx(self) -> bytes:
+        """Serialize to KNX/IP raw data."""
+        return (
+            bytes((RoutingBusy.LENGTH, self.device_state))
+            + self.wait_time.to_bytes(2, "big")
+            + self.control_field.to_bytes(2, "big")
+        )
+
+    def __repr__(self) -> str:
+        """Return object as readable string."""
+        return (
+            "<RoutingBusy "
+            f'device_state="{self.device_state}" '
+            f'wait_time="{self.wait_time}" '
+            f'control_field="{self.control_field}" />'
+        )
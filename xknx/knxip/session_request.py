@@ -24,11 +24,11 @@ class SessionRequest(KNXIPBody):
 
     def __init__(
         self,
-        control_endpoint: HPAI = HPAI(protocol=HostProtocol.IPV4_TCP),
+        control_endpoint: HPAI | None = None,
         ecdh_client_public_key: bytes = bytes(32),
     ):
         """Initialize SessionRequest object."""
-        self.control_endpoint = control_endpoint
+        self.control_endpoint = control_endpoint or HPAI(protocol=HostProtocol.IPV4_TCP)
         self.ecdh_client_public_key = ecdh_client_public_key
 
     def calculated_length(self) -> int:
@@ -192,6 +192,29 @@ class RemoteValue(ABC, Generic[DPTPayloadT, ValueT]):
                 await self.after_update_cb()
         return True
 
+    def restore(self, telegram: Telegram) -> bool:
+        """
+        Restore the value from a telegram of a state snapshot.
+
+        Neither calls after_update_cb nor resets the StateUpdater.
+        Return if the value was restored.
+        """
+        if not isinstance(telegram.payload, (GroupValueWrite, GroupValueResponse)):
+            return False
+        try:
+            self._value = self.from_knx(self.payload_valid(telegram.payload.value))
+        except (ConversionError, CouldNotParseTelegram) as err:
+            logger.debug(
+                "Can not restore %s for %s - %s: %s",
+                telegram,
+                self.device_name,
+                self.feature_name,
+                err,
+            )
+            return False
+        self.telegram = telegram
+        return True
+
     async def _send(
         self, payload: DPTArray | DPTBinary, response: bool = False
     ) -> None:
@@ -240,14 +263,10 @@ class RemoteValue(ABC, Generic[DPTPayloadT, ValueT]):
     async def read_state(self, wait_for_result: bool = False) -> None:
         """Send GroupValueRead telegram for state address to KNX bus."""
         if self.group_address_state is not None:
-            # pylint: disable=import-outside-toplevel
-            # TODO: send a ReadRequest and start a timeout from here instead of ValueReader
-            #       cancel timeout form process(); delete ValueReader
-            from xknx.core import ValueReader
-
-            value_reader = ValueReader(self.xknx, self.group_address_state)
             if wait_for_result:
-                telegram = await value_reader.read()
+                telegram = await self.xknx.group_read_table.read(
+                    self.group_address_state
+                )
                 if telegram is not None:
                     await self.process(telegram)
                 else:
@@ -258,7 +277,9 @@ class RemoteValue(ABC, Generic[DPTPayloadT, ValueT]):
                         self.feature_name,
                     )
             else:
-                await value_reader.send_group_read()
+                await self.xknx.group_read_table.send_group_read(
+                    self.group_address_state
+                )
 
     @property
     def unit_of_measurement(self) -> str | None:
@@ -1,12 +1,11 @@
 """Encryption and Decryption functions for KNX/IP Datagrams."""
 from __future__ import annotations
 
-from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
-from .util import byte_pad
+from .util import async_derive_key, byte_pad, bytes_xor, derive_key
 
 
 def calculate_message_authentication_code_cbc(
@@ -68,26 +67,146 @@ def encrypt_data_ctr(
     return (encrypted_data, mac)
 
 
+class SessionCipher:
+    """
+    AES context for the session key of a KNXnet/IP Secure session.
+
+    The AES key is prepared once and reused for every frame. CBC-MAC and CTR
+    are calculated with a single ECB encryptor instead of setting up a new
+    Cipher for every call.
+    """
+
+    BLOCK_SIZE = 16
+
+    def __init__(self, key: bytes) -> None:
+        """Initialize SessionCipher class."""
+        self._encryptor = Cipher(algorithms.AES(key), modes.ECB()).encryptor()
+
+    def calculate_message_authentication_code_cbc(
+        self,
+        additional_data: bytes,
+        payload: bytes = b"",
+        block_0: bytes = bytes(16),
+    ) -> bytes:
+        """Calculate the message authentication code (MAC) for a message with AES-CBC."""
+        blocks = byte_pad(
+            block_0
+            + len(additional_data).to_bytes(2, "big")
+            + additional_data
+            + payload,
+            block_size=self.BLOCK_SIZE,
+        )
+        y_block = bytes(self.BLOCK_SIZE)
+        for pos in range(0, len(blocks), self.BLOCK_SIZE):
+            y_block = self._encryptor.update(
+                bytes_xor(y_block, blocks[pos : pos + self.BLOCK_SIZE])
+            )
+        return y_block
+
+    @classmethod
+    def _counter_blocks(cls, counter_0: bytes, length: int) -> bytes:
+        """Return counter blocks for `length` bytes of CTR key stream."""
+        counter = int.from_bytes(counter_0, "big")
+        return b"".join(
+            ((counter + index) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF).to_bytes(
+                cls.BLOCK_SIZE, "big"
+            )
+            for index in range(-(-length // cls.BLOCK_SIZE))
+        )
+
+    @classmethod
+    def _apply_key_stream(
+        cls, key_stream: bytes, mac: bytes, payload: bytes
+    ) -> tuple[bytes, bytes]:
+        """XOR MAC with the first block of the key stream and payload with the rest."""
+        return (
+            bytes_xor(
+                payload, key_stream[cls.BLOCK_SIZE : cls.BLOCK_SIZE + len(payload)]
+            ),
+            bytes_xor(mac, key_stream[: cls.BLOCK_SIZE]),
+        )
+
+    def encrypt_data_ctr(
+        self, counter_0: bytes, mac_cbc: bytes, payload: bytes = b""
+    ) -> tuple[bytes, bytes]:
+        """
+        Encrypt data with AES-CTR.
+
+        Returns a tuple of encrypted data (if there is any) and encrypted MAC.
+        """
+        return self.encrypt_data_ctr_batch([(counter_0, mac_cbc, payload)])[0]
+
+    def encrypt_data_ctr_batch(
+        self, frames: list[tuple[bytes, bytes, bytes]]
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Encrypt multiple (counter_0, mac_cbc, payload) items with AES-CTR.
+
+        The key stream of all items is calculated in one call to the encryptor.
+        Returns a list of tuples of encrypted data and encrypted MAC.
+        """
+        counter_blocks = [
+            self._counter_blocks(counter_0, self.BLOCK_SIZE + len(payload))
+            for counter_0, _, payload in frames
+        ]
+        key_stream = self._encryptor.update(b"".join(counter_blocks))
+        result = []
+        pos = 0
+        for (_, mac_cbc, payload), blocks in zip(frames, counter_blocks):
+            result.append(
+                self._apply_key_stream(
+                    key_stream[pos : pos + len(blocks)], mac_cbc, payload
+                )
+            )
+            pos += len(blocks)
+        return result
+
+    def decrypt_ctr(
+        self, counter_0: bytes, mac: bytes, payload: bytes = b""
+    ) -> tuple[bytes, bytes]:
+        """
+        Decrypt data from SecureWrapper.
+
+        Returns a tuple of (KNX/IP frame bytes, MAC TR for verification).
+        """
+        key_stream = self._encryptor.update(
+            self._counter_blocks(counter_0, self.BLOCK_SIZE + len(payload))
+        )
+        return self._apply_key_stream(key_stream, mac, payload)
+
+
+DEVICE_AUTHENTICATION_CODE_SALT = b"device-authentication-code.1.secure.ip.knx.org"
+USER_PASSWORD_SALT = b"user-password.1.secure.ip.knx.org"
+
+
 def derive_device_authentication_password(device_authentication_password: str) -> bytes:
     """Derive device authentication password."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=16,
-        salt=b"device-authentication-code.1.secure.ip.knx.org",
-        iterations=65536,
+    return derive_key(
+        device_authentication_password.encode("latin-1"),
+        salt=DEVICE_AUTHENTICATION_CODE_SALT,
+    )
+
+
+async def async_derive_device_authentication_password(
+    device_authentication_password: str,
+) -> bytes:
+    """Derive device authentication password without blocking the event loop."""
+    return await async_derive_key(
+        device_authentication_password.encode("latin-1"),
+        salt=DEVICE_AUTHENTICATION_CODE_SALT,
     )
-    return kdf.derive(device_authentication_password.encode("latin-1"))
 
 
 def derive_user_password(password_string: str) -> bytes:
     """Derive user password."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=16,
-        salt=b"user-password.1.secure.ip.knx.org",
-        iterations=65536,
+    return derive_key(password_string.encode("latin-1"), salt=USER_PASSWORD_SALT)
+
+
+async def async_derive_user_password(password_string: str) -> bytes:
+    """Derive user password without blocking the event loop."""
+    return await async_derive_key(
+        password_string.encode("latin-1"), salt=USER_PASSWORD_SALT
     )
-    return kdf.derive(password_string.encode("latin-1"))
 
 
 def generate_ecdh_key_pair() -> tuple[X25519PrivateKey, bytes]:
@@ -5,23 +5,21 @@ import abc
 from abc import ABC
 import base64
 import enum
+from functools import cached_property
 from itertools import chain
 import logging
-from typing import Any
-from xml.dom.minidom import Attr, Document, parse
-from xml.etree.ElementTree import Element, ElementTree
+from typing import Mapping
 import xml.sax
 from xml.sax.handler import ContentHandler
 from xml.sax.xmlreader import AttributesImpl
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from xknx.exceptions.exception import InvalidSecureConfiguration, InvalidSignature
 from xknx.telegram import GroupAddress, IndividualAddress
 
-from .util import sha256_hash
+from .util import derive_key, sha256_hash
 
 logger = logging.getLogger("xknx.core")
 
@@ -37,22 +35,44 @@ class InterfaceType(enum.Enum):
 class AttributeReader(ABC):
     """Abstract base class for modelling attribute reader capabilities."""
 
+    _password_hash: bytes
+    _initialization_vector: bytes
+
     @abc.abstractmethod
-    def parse_xml(self, node: Document) -> None:
-        """Parse all needed attributes from the given node map."""
+    def parse_xml(self, attributes: Mapping[str, str]) -> None:
+        """Parse all needed attributes from the given attribute map."""
 
     def decrypt_attributes(
         self, password_hash: bytes, initialization_vector: bytes
     ) -> None:
-        """Decrypt attribute data."""
-
-    @staticmethod
-    def get_attribute_value(attribute: Attr | Any) -> Any:
-        """Get a given attribute value from an attribute document."""
-        if isinstance(attribute, Attr):
-            return attribute.value
-
-        return attribute
+        """Set the key for attribute data. Attributes are decrypted on first access."""
+        self._password_hash = password_hash
+        self._initialization_vector = initialization_vector
+
+    def _decrypt_attribute(self, value: str | None) -> bytes:
+        """Decrypt an encrypted attribute value."""
+        if value is None:
+            return b""
+        try:
+            return decrypt_aes128cbc(
+                base64.b64decode(value),
+                self._password_hash,
+                self._initialization_vector,
+            )
+        except ValueError as err:
+            raise InvalidSecureConfiguration(
+                f"Could not decrypt keyring attribute: {err}"
+            ) from err
+
+    def _decrypt_password(self, value: str | None) -> str:
+        """Decrypt an encrypted password attribute value."""
+        decrypted = self._decrypt_attribute(value)
+        try:
+            return extract_password(decrypted)
+        except ValueError as err:
+            raise InvalidSecureConfiguration(
+                f"Could not decrypt keyring attribute: {err}"
+            ) from err
 
 
 class XMLAssignedGroupAddress(AttributeReader):
@@ -61,15 +81,10 @@ class XMLAssignedGroupAddress(AttributeReader):
     address: GroupAddress
     senders: list[str]
 
-    def parse_xml(self, node: Document) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
-        self.address = GroupAddress(
-            self.get_attribute_value(attributes.get("Address", None))
-        )
-        self.senders = str(
-            self.get_attribute_value(attributes.get("Senders", ""))
-        ).split(" ")
+    def parse_xml(self, attributes: Mapping[str, str]) -> None:
+        """Parse all needed attributes from the given attribute map."""
+        self.address = GroupAddress(attributes.get("Address"))
+        self.senders = attributes.get("Senders", "").split(" ")
 
 
 class XMLInterface(AttributeReader):
@@ -79,76 +94,49 @@ class XMLInterface(AttributeReader):
     host: IndividualAddress
     user_id: int
     password: str
-    decrypted_password: str
-    decrypted_authentication: str
     individual_address: IndividualAddress
-    authentication: str
-    group_addresses: list[XMLAssignedGroupAddress] = []
-
-    def parse_xml(self, node: Document) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
-        self.type = InterfaceType(self.get_attribute_value(attributes.get("Type")))
-        self.host = IndividualAddress(self.get_attribute_value(attributes.get("Host")))
-        self.user_id = int(self.get_attribute_value(attributes.get("UserID")) or 2)
-        self.password = self.get_attribute_value(attributes.get("Password"))
-        self.individual_address = IndividualAddress(
-            self.get_attribute_value(attributes.get("IndividualAddress"))
-        )
-        self.authentication = self.get_attribute_value(attributes.get("Authentication"))
+    authentication: str | None
+    group_addresses: list[XMLAssignedGroupAddress]
+
+    def __init__(self) -> None:
+        """Initialize XMLInterface class."""
+        self.group_addresses = []
 
-        for assigned_ga in filter(lambda x: x.nodeType != 3, node.childNodes):
-            group_address: XMLAssignedGroupAddress = XMLAssignedGroupAddress()
-            group_address.parse_xml(assigned_ga)
-            self.group_addresses.append(group_address)
+    def parse_xml(self, attributes: Mapping[str, str]) -> None:
+        """Parse all needed attributes from the given attribute map."""
+        self.type = InterfaceType(attributes.get("Type"))
+        self.host = IndividualAddress(attributes.get("Host"))
+        self.user_id = int(attributes.get("UserID") or 2)
+        self.password = attributes.get("Password")  # type: ignore[assignment]
+        self.individual_address = IndividualAddress(attributes.get("IndividualAddress"))
+        self.authentication = attributes.get("Authentication")
 
-    def decrypt_attributes(
-        self, password_hash: bytes, initialization_vector: bytes
-    ) -> None:
-        """Decryt attributes."""
-
-        if self.password is not None:
-            self.decrypted_password = extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.password),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
+    @cached_property
+    def decrypted_password(self) -> str:
+        """Return the decrypted user password."""
+        return self._decrypt_password(self.password)
 
-        if self.authentication is not None:
-            self.decrypted_authentication = extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.authentication),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
+    @cached_property
+    def decrypted_authentication(self) -> str:
+        """Return the decrypted device authentication code."""
+        return self._decrypt_password(self.authentication)
 
 
 class XMLBackbone(AttributeReader):
     """Backbone in a knxkeys file."""
 
     multicast_address: str
-    key: str
-    decrypted_key: bytes
+    key: str | None
 
-    def parse_xml(self, node: Document) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
-        self.multicast_address = self.get_attribute_value(
-            attributes.get("MulticastAddress")
-        )
-        self.key = self.get_attribute_value(attributes.get("Key"))
+    def parse_xml(self, attributes: Mapping[str, str]) -> None:
+        """Parse all needed attributes from the given attribute map."""
+        self.multicast_address = attributes.get("MulticastAddress")  # type: ignore[assignment]
+        self.key = attributes.get("Key")
 
-    def decrypt_attributes(
-        self, password_hash: bytes, initialization_vector: bytes
-    ) -> None:
-        """Decrypt attribute data."""
-        if self.key:
-            self.decrypted_key = decrypt_aes128cbc(
-                base64.b64decode(self.key), password_hash, initialization_vector
-            )
+    @cached_property
+    def decrypted_key(self) -> bytes:
+        """Return the decrypted backbone key."""
+        return self._decrypt_attribute(self.key)
 
 
 class XMLGroupAddress(AttributeReader):
@@ -157,72 +145,54 @@ class XMLGroupAddress(AttributeReader):
     address: GroupAddress
     key: str
 
-    def parse_xml(self, node: Document) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
-        self.address = GroupAddress(self.get_attribute_value(attributes.get("Address")))
-        self.key = self.get_attribute_value(attributes.get("Key"))
+    def parse_xml(self, attributes: Mapping[str, str]) -> None:
+        """Parse all needed attributes from the given attribute map."""
+        self.address = GroupAddress(attributes.get("Address"))
+        self.key = attributes.get("Key")  # type: ignore[assignment]
 
 
 class XMLDevice(AttributeReader):
     """Device in a knxkeys file."""
 
     individual_address: IndividualAddress
-    tool_key: str
-    decrypted_tool_key: bytes
-    management_password: str
-    decrypted_management_password: str
-    decrypted_authentication: str
-    authentication: str
+    tool_key: str | None
+    management_password: str | None
+    authentication: str | None
     sequence_number: int
 
-    def parse_xml(self, node: Document) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
-        self.individual_address = IndividualAddress(
-            self.get_attribute_value(attributes.get("IndividualAddress"))
-        )
-        self.tool_key = self.get_attribute_value(attributes.get("ToolKey"))
-        self.management_password = self.get_attribute_value(
-            attributes.get("ManagementPassword")
-        )
-        self.authentication = self.get_attribute_value(attributes.get("Authentication"))
-        self.sequence_number = int(
-            self.get_attribute_value(attributes.get("SequenceNumber", 0))
-        )
+    def parse_xml(self, attributes: Mapping[str, str]) -> None:
+        """Parse all needed attributes from the given attribute map."""
+        self.individual_address = IndividualAddress(attributes.get("IndividualAddress"))
+        self.tool_key = attributes.get("ToolKey")
+        self.management_password = attributes.get("ManagementPassword")
+        self.authentication = attributes.get("Authentication")
+        self.sequence_number = int(attributes.get("SequenceNumber", 0))
 
-    def decrypt_attributes(
-        self, password_hash: bytes, initialization_vector: bytes
-    ) -> None:
-        """Decrypt attributes."""
-        if self.tool_key is not None:
-            self.decrypted_tool_key = decrypt_aes128cbc(
-                base64.b64decode(self.tool_key), password_hash, initialization_vector
-            )
+    @cached_property
+    def decrypted_tool_key(self) -> bytes:
+        """Return the decrypted tool key."""
+        return self._decrypt_attribute(self.tool_key)
 
-        if self.authentication is not None:
-            self.decrypted_authentication = extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.authentication),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
+    @cached_property
+    def decrypted_authentication(self) -> str:
+        """Return the decrypted device authentication code."""
+        return self._decrypt_password(self.authentication)
 
-        if self.management_password is not None:
-            self.decrypted_management_password = extract_password(
-                decrypt_aes128cbc(
-                    base64.b64decode(self.management_password),
-                    password_hash,
-                    initialization_vector,
-                )
-            )
+    @cached_property
+    def decrypted_management_password(self) -> str:
+        """Return the decrypted management password."""
+        return self._decrypt_password(self.management_password)
 
 
 class Keyring(AttributeReader):
-    """Class for loading and decrypting knxkeys XML files."""
+    """
+    Class for loading and decrypting knxkeys XML files.
+
+    Secrets are decrypted when they are accessed. Interfaces, devices and
+    group addresses are indexed for lookups.
+    """
 
-    backbone: XMLBackbone
+    backbone: XMLBackbone | None
     interfaces: list[XMLInterface]
     group_addresses: list[XMLGroupAddress]
     devices: list[XMLDevice]
@@ -233,63 +203,73 @@ class Keyring(AttributeReader):
 
     def __init__(self) -> None:
         """Initialize the Keyring."""
+        self.backbone = None
         self.interfaces = []
         self.devices = []
         self.group_addresses = []
+        self._interfaces_by_user_id: dict[int, XMLInterface] = {}
+        self._interfaces_by_individual_address: dict[
+            IndividualAddress, XMLInterface
+        ] = {}
+        self._devices_by_individual_address: dict[IndividualAddress, XMLDevice] = {}
+        self._group_addresses_by_address: dict[GroupAddress, XMLGroupAddress] = {}
+
+    def add_interface(self, interface: XMLInterface) -> None:
+        """Add an interface to the keyring."""
+        self.interfaces.append(interface)
+        # first match wins, like a linear search would
+        self._interfaces_by_user_id.setdefault(interface.user_id, interface)
+        self._interfaces_by_individual_address.setdefault(
+            interface.individual_address, interface
+        )
+
+    def add_device(self, device: XMLDevice) -> None:
+        """Add a device to the keyring."""
+        self.devices.append(device)
+        self._devices_by_individual_address.setdefault(
+            device.individual_address, device
+        )
+
+    def add_group_address(self, group_address: XMLGroupAddress) -> None:
+        """Add a group address to the keyring."""
+        self.group_addresses.append(group_address)
+        self._group_addresses_by_address.setdefault(
+            group_address.address, group_address
+        )
 
     def get_device_by_interface(self, interface: XMLInterface) -> XMLDevice | None:
         """Get the device for a given interface."""
-        for device in self.devices:
-            if device.individual_address == interface.host:
-                return device
+        return self._devices_by_individual_address.get(interface.host)
 
-        return None
+    def get_device_by_individual_address(
+        self, individual_address: IndividualAddress
+    ) -> XMLDevice | None:
+        """Get the device with the given individual address."""
+        return self._devices_by_individual_address.get(individual_address)
 
     def get_interface_by_user_id(self, user_id: int) -> XMLInterface | None:
         """Get the interface with the given user id."""
-        for interface in self.interfaces:
-            if interface.user_id == user_id:
-                return interface
-
-        return None
-
-    def parse_xml(self, node: Document) -> None:
-        """Parse all needed attributes from the given node map."""
-        attributes = node.attributes
-        self.created_by = self.get_attribute_value(attributes.get("CreatedBy"))
-        self.created = self.get_attribute_value(attributes.get("Created"))
-        self.signature = base64.b64decode(
-            self.get_attribute_value(attributes.get("Signature"))
-        )
-        self.xmlns = self.get_attribute_value(attributes.get("xmlns"))
-
-        for sub_node in filter(lambda x: x.nodeType != 3, node.childNodes):
-            if sub_node.nodeName == "Interface":
-                interface: XMLInterface = XMLInterface()
-                interface.parse_xml(sub_node)
-                if interface.password is not None:
-                    self.interfaces.append(interface)
-            if sub_node.nodeName == "Backbone":
-                backbone: XMLBackbone = XMLBackbone()
-                backbone.parse_xml(sub_node)
-                self.backbone = backbone
-            if sub_node.nodeName == "GroupAddresses":
-                ga_doc: Document
-                for ga_doc in filter(lambda x: x.nodeType != 3, sub_node.childNodes):
-                    xml_ga: XMLGroupAddress = XMLGroupAddress()
-                    xml_ga.parse_xml(ga_doc)
-                    self.group_addresses.append(xml_ga)
-            if sub_node.nodeName == "Devices":
-                device_doc: Document
-                for device_doc in filter(
-                    lambda x: x.nodeType != 3, sub_node.childNodes
-                ):
-                    device: XMLDevice = XMLDevice()
-                    device.parse_xml(device_doc)
-                    self.devices.append(device)
+        return self._interfaces_by_user_id.get(user_id)
+
+    def get_interface_by_individual_address(
+        self, individual_address: IndividualAddress
+    ) -> XMLInterface | None:
+        """Get the interface with the given individual address."""
+        return self._interfaces_by_individual_address.get(individual_address)
+
+    def get_group_address(self, address: GroupAddress) -> XMLGroupAddress | None:
+        """Get the group address entry for the given group address."""
+        return self._group_addresses_by_address.get(address)
+
+    def parse_xml(self, attributes: Mapping[str, str]) -> None:
+        """Parse all needed attributes from the attribute map of the Keyring element."""
+        self.created_by = attributes.get("CreatedBy")  # type: ignore[assignment]
+        self.created = attributes.get("Created")  # type: ignore[assignment]
+        self.signature = base64.b64decode(attributes.get("Signature", ""))
+        self.xmlns = attributes.get("xmlns")  # type: ignore[assignment]
 
     def decrypt(self, password: str) -> None:
-        """Decrypt all data."""
+        """Set the key for decrypting all data. Secrets are decrypted on first access."""
         hashed_password = hash_keyring_password(password.encode("utf-8"))
         initialization_vector = sha256_hash(self.created.encode("utf-8"))[:16]
 
@@ -302,78 +282,120 @@ class Keyring(AttributeReader):
 
 def load_key_ring(path: str, password: str, validate_signature: bool = True) -> Keyring:
     """Load a .knxkeys file from the given path."""
-
-    if validate_signature:
-        if not verify_keyring_signature(path, password):
-            raise InvalidSignature()
-
-    keyring: Keyring = Keyring()
+    handler = KeyringSAXContentHandler(password)
     try:
         with open(path, encoding="utf-8") as file:
-            dom: Document = parse(file)
-            keyring.parse_xml(dom.getElementsByTagName("Keyring")[0])
-
-        keyring.decrypt(password)
-
-        return keyring
+            parser = xml.sax.make_parser()
+            parser.setContentHandler(handler)
+            parser.parse(file)
     except Exception as exception:
         logger.exception("There was an error during loading the knxkeys file.")
         raise InvalidSecureConfiguration() from exception
 
+    keyring = handler.keyring
+    if validate_signature:
+        if handler.signature != keyring.signature:
+            raise InvalidSignature()
+    elif keyring.interfaces:
+        # other secrets are decrypted on access - fail early on a wrong password
+        _ = keyring.interfaces[0].decrypted_password
+    return keyring
+
 
 class KeyringSAXContentHandler(ContentHandler):
-    """SAX parser for keyring signature verification."""
+    """
+    SAX parser for keyring files.
+
+    Builds the Keyring and calculates its signature in a single pass.
+    """
 
     _attribute_blacklist = ["xmlns", "Signature"]
 
     def __init__(self, keyring_password: str):
         """Initialize."""
+        self.keyring_password = keyring_password
         self.hashed_password = hash_keyring_password(keyring_password.encode("utf-8"))
-        self.output = bytearray()
+        self.keyring = Keyring()
+        self.signature = b""
+        self._digest = hashes.Hash(hashes.SHA256())
+        self._parent_elements: list[str] = []
+        self._interface: XMLInterface | None = None
         super().__init__()
 
     def endDocument(self) -> None:
         """Receive notification of the end of a document."""
         self.append_string(base64.b64encode(self.hashed_password))
+        self.signature = self._digest.finalize()[:16]
+        self.keyring.decrypt(self.keyring_password)
 
     def startElement(self, name: str, attrs: AttributesImpl) -> None:
         """Start Element."""
-        self.output.append(1)
+        self._digest.update(b"\x01")
         self.append_string(name)
 
-        for attr_name, attr_value in sorted(attrs.items()):  # type: ignore[no-untyped-call]
+        attributes: dict[str, str] = dict(attrs.items())
+        for attr_name, attr_value in sorted(attributes.items()):
             if attr_name not in self._attribute_blacklist:
                 self.append_string(attr_name)
                 self.append_string(attr_value)
 
+        self._build_keyring(name, attributes)
+        self._parent_elements.append(name)
+
     def endElement(self, name: str) -> None:
         """Receive notification of the end of an element."""
-        self.output.append(2)
+        self._digest.update(b"\x02")
+        self._parent_elements.pop()
+        if name == "Interface":
+            self._interface = None
+
+    def _build_keyring(self, name: str, attrs: Mapping[str, str]) -> None:
+        """Add the element to the Keyring model."""
+        parent = self._parent_elements[-1] if self._parent_elements else None
+        if name == "Keyring" and parent is None:
+            self.keyring.parse_xml(attrs)
+        elif name == "Interface" and parent == "Keyring":
+            interface = XMLInterface()
+            interface.parse_xml(attrs)
+            if interface.password is not None:
+                self.keyring.add_interface(interface)
+            self._interface = interface
+        elif name == "Group" and parent == "Interface" and self._interface:
+            assigned_group_address = XMLAssignedGroupAddress()
+            assigned_group_address.parse_xml(attrs)
+            self._interface.group_addresses.append(assigned_group_address)
+        elif name == "Backbone" and parent == "Keyring":
+            backbone = XMLBackbone()
+            backbone.parse_xml(attrs)
+            self.keyring.backbone = backbone
+        elif name == "Group" and parent == "GroupAddresses":
+            group_address = XMLGroupAddress()
+            group_address.parse_xml(attrs)
+            self.keyring.add_group_address(group_address)
+        elif name == "Device" and parent == "Devices":
+            device = XMLDevice()
+            device.parse_xml(attrs)
+            self.keyring.add_device(device)
 
     def append_string(self, value: str | bytes) -> None:
-        """Append a string to a byte array for signature verification."""
-        self.output.append(len(value))
-
+        """Append a string to the signature data."""
         if isinstance(value, str):
-            self.output.extend(value.encode("utf-8"))
-        if isinstance(value, bytes):
-            self.output.extend(value)
+            value_bytes = value.encode("utf-8")
+        else:
+            value_bytes = value
+        # length of the string, not of its encoded bytes
+        self._digest.update(bytes([len(value)]) + value_bytes)
 
 
 def verify_keyring_signature(path: str, password: str) -> bool:
     """Verify the signature of the given knxkeys file."""
     handler = KeyringSAXContentHandler(password)
-    signature: bytes
-    with open(path, encoding="utf-8") as file:
-        element: Element = ElementTree().parse(file)
-        signature = base64.b64decode(element.attrib.get("Signature", ""))
-
     with open(path, encoding="utf-8") as file:
         parser = xml.sax.make_parser()
-        parser.setContentHandler(handler)  # type: ignore[no-untyped-call]
-        parser.parse(file)  # type: ignore[no-untyped-call]
+        parser.setContentHandler(handler)
+        parser.parse(file)
 
-    return sha256_hash(handler.output)[:16] == signature
+    return handler.signature == handler.keyring.signature
 
 
 def decrypt_aes128cbc(
@@ -387,14 +409,7 @@ def decrypt_aes128cbc(
 
 def hash_keyring_password(password: bytes) -> bytes:
     """Hash a given keyring password."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=16,
-        salt=b"1.keyring.ets.knx.org",
-        iterations=65_536,
-    )
-
-    return kdf.derive(password)
+    return derive_key(password, salt=b"1.keyring.ets.knx.org")
 
 
 def extract_password(data: bytes) -> str:
@@ -403,5 +418,7 @@ def extract_password(data: bytes) -> str:
         return ""
 
     length: int = data[-1]
+    if not 0 < length <= len(data) - 8 or data[-length:] != bytes([length]) * length:
+        raise ValueError("Invalid padding")
     res: bytes = data[8:-length]
     return res.decode("utf-8")
@@ -1,5 +1,13 @@
 """Utilities for KNX Secure."""
+from __future__ import annotations
+
+import asyncio
+
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+# derived keys by sha256(password, salt, iterations, length)
+_derived_key_cache: dict[bytes, bytes] = {}
 
 
 def bytes_xor(a: bytes, b: bytes) -> bytes:  # pylint: disable=invalid-name
@@ -25,3 +33,48 @@ def sha256_hash(data: bytes) -> bytes:
     digest = hashes.Hash(hashes.SHA256())
     digest.update(data)
     return digest.finalize()
+
+
+def _derived_key_cache_key(
+    password: bytes, salt: bytes, iterations: int, length: int
+) -> bytes:
+    """Return the cache key for a derived key. The password is not stored."""
+    return sha256_hash(
+        sha256_hash(password)
+        + sha256_hash(salt)
+        + iterations.to_bytes(4, "big")
+        + length.to_bytes(2, "big")
+    )
+
+
+def derive_key(
+    password: bytes, salt: bytes, iterations: int = 65_536, length: int = 16
+) -> bytes:
+    """
+    Derive a key with PBKDF2-HMAC-SHA256.
+
+    Derived keys are cached for the lifetime of the process so secure
+    sessions and keyrings using the same password don't derive it again.
+    """
+    cache_key = _derived_key_cache_key(password, salt, iterations, length)
+    if (key := _derived_key_cache.get(cache_key)) is None:
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=length,
+            salt=salt,
+            iterations=iterations,
+        )
+        key = _derived_key_cache[cache_key] = kdf.derive(password)
+    return key
+
+
+async def async_derive_key(
+    password: bytes, salt: bytes, iterations: int = 65_536, length: int = 16
+) -> bytes:
+    """Derive a key with PBKDF2-HMAC-SHA256 in an executor if it is not cached."""
+    cache_key = _derived_key_cache_key(password, salt, iterations, length)
+    if (key := _derived_key_cache.get(cache_key)) is not None:
+        return key
+    return await asyncio.get_running_loop().run_in_executor(
+        None, derive_key, password, salt, iterations, length
+    )
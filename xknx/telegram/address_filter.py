@@ -41,6 +41,7 @@ class AddressFilter:
 
     def __init__(self, pattern: str) -> None:
         """Initialize AddressFilter class."""
+        self.pattern = pattern
         self.level_filters: list[AddressFilter.LevelFilter] = []
         self.internal_group_address_pattern: str | None = None
         self._parse_pattern(pattern)
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 import os
+import queue
 import signal
 from sys import platform
 from types import TracebackType
@@ -12,6 +14,9 @@ from typing import Awaitable, Callable
 
 from xknx.core import (
     ConnectionManager,
+    GroupReadTable,
+    RequestCorrelator,
+    StateSnapshot,
     TaskRegistry,
     TelegramQueue,
     XknxConnectionState,
@@ -31,6 +36,52 @@ from .__version__ import __version__ as VERSION
 
 logger = logging.getLogger("xknx.log")
 
+LOG_NAMESPACES = (
+    "xknx.log",
+    "xknx.knx",
+    "xknx.raw_socket",
+    "xknx.telegram",
+    "xknx.state_updater",
+)
+
+
+class LogQueueListener(QueueListener):
+    """
+    QueueListener writing records of the XKNX loggers from a background thread.
+
+    While the listener is running the loggers pass records to a QueueHandler.
+    While it is stopped records are passed to the handler directly.
+    Starting and stopping multiple times is allowed.
+    """
+
+    def __init__(self, handler: logging.Handler) -> None:
+        """Initialize LogQueueListener class."""
+        _queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self.queue_handler = QueueHandler(_queue)
+        self.queue_handler.setLevel(logging.DEBUG)
+        super().__init__(_queue, handler, respect_handler_level=True)
+
+    def start(self) -> None:
+        """Start the listener thread if it is not running."""
+        if self._thread is None:
+            super().start()
+            _replace_log_handler(self.handlers[0], self.queue_handler)
+
+    def stop(self) -> None:
+        """Write queued records and stop the listener thread if it is running."""
+        # QueueListener.stop() fails if not started before Python 3.12
+        if self._thread is not None:
+            _replace_log_handler(self.queue_handler, self.handlers[0])
+            super().stop()
+
+
+def _replace_log_handler(old: logging.Handler, new: logging.Handler) -> None:
+    """Replace a handler of the XKNX loggers."""
+    for log_namespace in LOG_NAMESPACES:
+        _logger = logging.getLogger(log_namespace)
+        _logger.removeHandler(old)
+        _logger.addHandler(new)
+
 
 class XKNX:
     """Class for reading and writing KNX/IP packets."""
@@ -53,6 +104,8 @@ class XKNX:
         state_updater: TrackerOptionType = False,
         daemon_mode: bool = False,
         connection_config: ConnectionConfig = ConnectionConfig(),
+        state_snapshot_path: str | None = None,
+        log_queued: bool = False,
     ) -> None:
         """Initialize XKNX class."""
         self.devices = Devices()
@@ -62,6 +115,13 @@ class XKNX:
         self.state_updater = StateUpdater(self, default_tracker_option=state_updater)
         self.connection_manager = ConnectionManager()
         self.task_registry = TaskRegistry(self)
+        self.request_correlator = RequestCorrelator()
+        self.group_read_table = GroupReadTable(self)
+        self.state_snapshot: StateSnapshot | None = (
+            StateSnapshot(self, state_snapshot_path)
+            if state_snapshot_path is not None
+            else None
+        )
         self.knxip_interface: KNXIPInterface | None = None
         self.started = asyncio.Event()
         self.own_address = IndividualAddress(own_address)
@@ -74,8 +134,9 @@ class XKNX:
         self.current_address = IndividualAddress(0)
 
         GroupAddress.address_format = address_format  # for global string representation
+        self.log_listener: LogQueueListener | None = None
         if log_directory is not None:
-            self.setup_logging(log_directory)
+            self.log_listener = self.setup_logging(log_directory, queued=log_queued)
 
         if telegram_received_cb is not None:
             self.telegram_queue.register_telegram_received_cb(telegram_received_cb)
@@ -113,9 +174,13 @@ class XKNX:
 
     async def start(self) -> None:
         """Start XKNX module. Connect to KNX/IP devices and start state updater."""
+        if self.log_listener is not None:
+            self.log_listener.start()
         if self.connection_config.threaded:
             await self.connection_manager.register_loop()
         self.task_registry.start()
+        if self.state_snapshot is not None:
+            await self.state_snapshot.start()
         self.knxip_interface = knx_interface_factory(
             xknx=self,
             connection_config=self.connection_config,
@@ -148,7 +213,11 @@ class XKNX:
         self.state_updater.stop()
         await self.join()
         await self.telegram_queue.stop()
+        if self.state_snapshot is not None:
+            await self.state_snapshot.stop()
         await self._stop_knxip_interface_if_exists()
+        if self.log_listener is not None:
+            self.log_listener.stop()
         self.started.clear()
 
     async def loop_until_sigint(self) -> None:
@@ -167,13 +236,22 @@ class XKNX:
         await self.sigint_received.wait()
 
     @staticmethod
-    def setup_logging(log_directory: str) -> None:
-        """Configure logging to file."""
+    def setup_logging(
+        log_directory: str, queued: bool = False
+    ) -> LogQueueListener | None:
+        """
+        Configure logging to file.
+
+        If `queued` is True, records are passed to a LogQueueListener running the
+        file handler in a background thread so disk I/O doesn't block the event loop.
+        The started listener is returned. XKNX stops it in `stop()` and starts it
+        again in `start()`; it is stopped at interpreter exit at the latest.
+        """
         if not os.path.isdir(log_directory):
             logger.warning("The provided log directory does not exist.")
-            return
+            return None
 
-        _handler = TimedRotatingFileHandler(
+        _file_handler = TimedRotatingFileHandler(
             filename=f"{log_directory}{os.sep}xknx.log",
             when="midnight",
             backupCount=7,
@@ -183,15 +261,14 @@ class XKNX:
             "%(asctime)s | %(name)s | %(levelname)s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
-        _handler.setFormatter(_formatter)
-        _handler.setLevel(logging.DEBUG)
-
-        for log_namespace in [
-            "xknx.log",
-            "xknx.knx",
-            "xknx.raw_socket",
-            "xknx.telegram",
-            "xknx.state_updater",
-        ]:
-            _logger = logging.getLogger(log_namespace)
-            _logger.addHandler(_handler)
+        _file_handler.setFormatter(_formatter)
+        _file_handler.setLevel(logging.DEBUG)
+
+        for log_namespace in LOG_NAMESPACES:
+            logging.getLogger(log_namespace).addHandler(_file_handler)
+        if not queued:
+            return None
+        _listener = LogQueueListener(_file_handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+        return _listener